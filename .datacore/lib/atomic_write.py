@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Atomic File Writes (DIP-0004)
+
+Crash-safe file replacement for everything that rewrites source files
+(writeback engine, knowledge processor, sync adapters):
+- Content goes to a temp file in the target's directory, is fsynced, then
+  renamed over the target and the directory is fsynced (symlinks are
+  resolved first, so the link survives)
+- Readers see either the old or the new file, never a truncated one
+- No full-file backup copies are needed
+
+Optional intent log (write_intents table, in whichever DB the caller
+passes) records a write before its temp file is created. The caller
+deletes the intent in the same transaction as its own DB updates
+(complete_intent), so an intent that survives a crash means "file may
+have changed, DB was not told". recover_intents() finishes or discards those writes on startup and
+hands each payload back to the caller.
+
+Usage:
+    from atomic_write import atomic_write, complete_intent, recover_intents
+
+    atomic_write(path, content)                     # plain atomic write
+
+    intent_id = atomic_write(path, content, conn=conn, payload={...})
+    ...update DB...
+    complete_intent(cursor, intent_id)
+    conn.commit()
+
+    recover_intents(conn, on_recover=apply_db_side)  # on startup
+"""
+
+import hashlib
+import json
+import os
+import secrets
+import stat
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Callable, Union
+
+
+DEFAULT_FILE_MODE = 0o644
+
+
+def init_intent_log(conn):
+    """Create the write_intents table if needed."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS write_intents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            path TEXT NOT NULL,
+            temp_path TEXT NOT NULL,
+            checksum TEXT NOT NULL,
+            base_checksum TEXT,
+            payload TEXT,
+            created_at TEXT
+        )
+    """)
+
+
+def _checksum(data: bytes) -> str:
+    return hashlib.md5(data).hexdigest()
+
+
+def _file_checksum(path: Path) -> Optional[str]:
+    try:
+        with open(path, 'rb') as f:
+            return _checksum(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def _fsync_dir(directory: Path):
+    """Persist a rename by fsyncing its directory (no-op where unsupported)."""
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _temp_path(path: Path) -> Path:
+    """Unused temp file name next to `path` (created later with O_EXCL)."""
+    while True:
+        temp_path = path.parent / f'.{path.name}.{secrets.token_hex(4)}.tmp'
+        if not temp_path.exists():
+            return temp_path
+
+
+def _write_temp(path: Path, temp_path: Path, data: bytes):
+    """Write data to a new fsynced temp file, with the mode of `path`."""
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = DEFAULT_FILE_MODE
+
+    fd = os.open(str(temp_path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write(
+    path: Union[str, Path],
+    content: str,
+    conn=None,
+    payload: Dict[str, Any] = None,
+    base_checksum: str = None,
+    encoding: str = 'utf-8'
+) -> Optional[int]:
+    """Atomically replace `path` with `content`.
+
+    A symlinked `path` keeps its link: the file it points to is replaced.
+
+    Args:
+        path: Target file (parent directory must exist)
+        content: New file content
+        conn: DB connection for the intent log, or None for no logging.
+            The intent is committed before the temp file is created, so
+            the connection must not hold uncommitted work.
+        payload: JSON-serializable data handed back by recover_intents()
+        base_checksum: MD5 of the content being replaced, if the caller
+            already knows it (otherwise read from disk when logging)
+        encoding: Text encoding
+
+    Returns:
+        Intent ID to pass to complete_intent(), or None without conn
+    """
+    path = Path(os.path.realpath(path))
+    data = content.encode(encoding)
+    temp_path = _temp_path(path)
+
+    # Log first: any temp file a crash can leave behind has an intent
+    intent_id = None
+    if conn is not None:
+        if base_checksum is None:
+            base_checksum = _file_checksum(path)
+        init_intent_log(conn)
+        cursor = conn.execute("""
+            INSERT INTO write_intents (path, temp_path, checksum, base_checksum, payload, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (
+            str(path),
+            str(temp_path),
+            _checksum(data),
+            base_checksum,
+            json.dumps(payload) if payload is not None else None,
+            datetime.now().isoformat()
+        ))
+        intent_id = cursor.lastrowid
+        conn.commit()
+
+    try:
+        _write_temp(path, temp_path, data)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        if intent_id is not None:
+            complete_intent(conn, intent_id)
+            conn.commit()
+        raise
+
+    _fsync_dir(path.parent)
+    return intent_id
+
+
+def complete_intent(cursor, intent_id: Optional[int]):
+    """Drop an intent; call inside the transaction that records the write."""
+    if intent_id is not None:
+        cursor.execute("DELETE FROM write_intents WHERE id = ?", (intent_id,))
+
+
+def recover_intents(
+    conn,
+    on_recover: Callable[[Any, Dict[str, Any]], None] = None,
+    older_than: float = None
+) -> List[Dict[str, Any]]:
+    """Finish or discard writes interrupted by a crash.
+
+    - Temp file still present and complete, target unchanged since the
+      write began: renamed into place (replayed)
+    - Otherwise a leftover temp file is deleted (rolled back), so edits
+      made to the target after the crash are never overwritten
+    - Temp file gone: the rename already happened or never will
+
+    Args:
+        conn: DB connection holding the intent log
+        on_recover: Called as on_recover(cursor, intent) before the intent
+            is dropped, in the same transaction, so callers can apply
+            their DB side for the write
+        older_than: Only recover intents logged at least this many seconds
+            ago, leaving writes another process still has in flight
+
+    Returns list of dicts: id, path, payload, applied (True if the target
+    now holds the intended content).
+    """
+    init_intent_log(conn)
+    query = "SELECT * FROM write_intents"
+    params = []
+    if older_than is not None:
+        query += " WHERE created_at <= ?"
+        params.append((datetime.now() - timedelta(seconds=older_than)).isoformat())
+    rows = conn.execute(query + " ORDER BY id", params).fetchall()
+
+    recovered = []
+    for row in rows:
+        path = Path(row['path'])
+        temp_path = Path(row['temp_path'])
+
+        if temp_path.exists():
+            if (_file_checksum(temp_path) == row['checksum']
+                    and _file_checksum(path) == row['base_checksum']):
+                os.replace(temp_path, path)
+                _fsync_dir(path.parent)
+            else:
+                temp_path.unlink(missing_ok=True)
+
+        intent = {
+            'id': row['id'],
+            'path': str(path),
+            'payload': json.loads(row['payload']) if row['payload'] else None,
+            'applied': _file_checksum(path) == row['checksum'],
+        }
+
+        cursor = conn.cursor()
+        if on_recover:
+            on_recover(cursor, intent)
+        complete_intent(cursor, row['id'])
+        conn.commit()
+
+        recovered.append(intent)
+
+    return recovered
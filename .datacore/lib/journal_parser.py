@@ -17,12 +17,15 @@ Usage:
     python journal_parser.py --scan --space SPACE
     python journal_parser.py --sync [--space SPACE]
     python journal_parser.py --sessions --date YYYY-MM-DD
+    python journal_parser.py --migrate [--space SPACE]
 """
 
+import os
 import re
 import sys
 import yaml
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, date
 from typing import Optional, Dict, List, Any, Tuple
@@ -33,6 +36,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 from zettel_db import (
     get_connection, init_database, SPACES, DATA_ROOT
 )
+from journal_rollups import (
+    refresh_rollups, needs_rollup_backfill, rebuild_rollups, get_rollup_totals
+)
 
 
 def compute_checksum(content: str) -> str:
@@ -273,9 +279,14 @@ def extract_trading_data(content: str) -> Optional[Dict[str, Any]]:
     return trading_data if trading_data else None
 
 
-def parse_journal_file(file_path: Path, space: str = None) -> Dict[str, Any]:
+def parse_journal_file(file_path: Path, space: str = None, content: str = None) -> Dict[str, Any]:
     """Parse a journal file.
 
+    Args:
+        file_path: Journal file path
+        space: Space the journal belongs to
+        content: File content, if already read (avoids a second read)
+
     Returns dict with:
     - date: Journal date
     - type: journal or team-journal
@@ -284,9 +295,11 @@ def parse_journal_file(file_path: Path, space: str = None) -> Dict[str, Any]:
     - trading_data: Trading metrics if present
     - word_count: Total word count
     - file_checksum: MD5 of file content
+    - modified_at: File mtime (ISO format)
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    if content is None:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
 
     frontmatter, body = parse_frontmatter(content)
     file_checksum = compute_checksum(content)
@@ -323,6 +336,7 @@ def parse_journal_file(file_path: Path, space: str = None) -> Dict[str, Any]:
         'decisions': decisions,
         'trading_data': trading_data,
         'file_checksum': file_checksum,
+        'modified_at': datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
         'source_file': str(file_path),
     }
 
@@ -336,9 +350,279 @@ def get_space_from_path(path: Path) -> str:
     return 'personal'
 
 
+# Tables derived from a journal file, in delete order (children first)
+JOURNAL_DERIVED_TABLES = [
+    'accomplishments', 'files_modified', 'decisions', 'trading_entries',
+    'sessions', 'journal_entries',
+]
+
+# Below this many files, process startup costs more than parallel parsing saves
+PARALLEL_PARSE_THRESHOLD = 16
+
+# Journals written per transaction during bulk indexing
+JOURNAL_WRITE_BATCH = 500
+
+
+def delete_journal_rows(cursor, source_files: List[str]):
+    """Delete every row derived from the given journal files."""
+    params = [(source_file,) for source_file in source_files]
+    for table in JOURNAL_DERIVED_TABLES:
+        cursor.executemany(f"DELETE FROM {table} WHERE source_file = ?", params)
+
+
+def _next_id(cursor, table: str) -> int:
+    """Next unused id for an AUTOINCREMENT table (never reuses deleted ids)."""
+    cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,))
+    row = cursor.fetchone()
+    seq = row[0] if row else 0
+    cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+    return max(seq, cursor.fetchone()[0]) + 1
+
+
+def write_parsed_journals(conn, parsed_journals: List[Dict[str, Any]], space: str):
+    """Bulk-write parsed journals in a single transaction.
+
+    Replaces all rows previously derived from each journal. Row IDs for
+    journal entries and sessions are assigned client-side under an
+    IMMEDIATE lock, so children can be inserted with executemany instead
+    of one INSERT per row waiting on lastrowid. Rollup buckets for both the
+    old and new journal dates are refreshed in the same transaction.
+    """
+    if not parsed_journals:
+        return
+
+    cursor = conn.cursor()
+    now = datetime.now().isoformat()
+
+    try:
+        cursor.execute("BEGIN IMMEDIATE")
+
+        source_files = [p['source_file'] for p in parsed_journals]
+        affected_dates = {p['date'] for p in parsed_journals}
+        for i in range(0, len(source_files), JOURNAL_WRITE_BATCH):
+            chunk = source_files[i:i + JOURNAL_WRITE_BATCH]
+            cursor.execute(f"""
+                SELECT date FROM journal_entries
+                WHERE source_file IN ({','.join('?' * len(chunk))})
+            """, chunk)
+            affected_dates.update(row['date'] for row in cursor.fetchall())
+
+        delete_journal_rows(cursor, source_files)
+
+        journal_id = _next_id(cursor, 'journal_entries')
+        session_id = _next_id(cursor, 'sessions')
+
+        journal_rows = []
+        session_rows = []
+        accomplishment_rows = []
+        file_rows = []
+        decision_rows = []
+        trading_rows = []
+        checksum_rows = []
+
+        for parsed in parsed_journals:
+            source_file = parsed['source_file']
+            entry_space = parsed['space'] or space
+
+            journal_rows.append((
+                journal_id, parsed['date'], entry_space, parsed['type'],
+                parsed['content'], parsed['word_count'], parsed['session_count'],
+                source_file, now, now
+            ))
+
+            for session in parsed['sessions']:
+                session_rows.append((
+                    session_id, journal_id, session['title'], session['goal'],
+                    entry_space, session['session_type'], session['content'],
+                    source_file, now
+                ))
+                accomplishment_rows.extend(
+                    (session_id, accomplishment, source_file, now)
+                    for accomplishment in session['accomplishments']
+                )
+                file_rows.extend(
+                    (session_id, f['file_path'], f['change_type'], source_file, now)
+                    for f in session['files_modified']
+                )
+                session_id += 1
+
+            decision_rows.extend(
+                (
+                    None,  # No file reference for journal decisions
+                    decision['description'],
+                    decision.get('rationale'),
+                    1 if decision.get('reversible', True) else 0,
+                    source_file,
+                    now
+                )
+                for decision in parsed['decisions']
+            )
+
+            td = parsed['trading_data']
+            if td:
+                trading_rows.append((
+                    journal_id,
+                    parsed['date'],
+                    td.get('emotional_state'),
+                    str(td.get('framework_violations')) if td.get('framework_violations') else None,
+                    td.get('pnl_realized'),
+                    td.get('imr'),
+                    td.get('phs'),
+                    source_file,
+                    now
+                ))
+
+            checksum_rows.append((source_file, parsed['file_checksum'], now, parsed['modified_at']))
+            journal_id += 1
+
+        cursor.executemany("""
+            INSERT INTO journal_entries
+            (id, date, space, type, content, word_count, session_count, source_file, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, journal_rows)
+
+        cursor.executemany("""
+            INSERT INTO sessions
+            (id, journal_id, title, goal, space, session_type, content, source_file, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, session_rows)
+
+        cursor.executemany("""
+            INSERT INTO accomplishments (session_id, description, source_file, created_at)
+            VALUES (?, ?, ?, ?)
+        """, accomplishment_rows)
+
+        cursor.executemany("""
+            INSERT INTO files_modified (session_id, file_path, change_type, source_file, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, file_rows)
+
+        cursor.executemany("""
+            INSERT INTO decisions
+            (file_id, description, rationale, reversible, source_file, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, decision_rows)
+
+        cursor.executemany("""
+            INSERT INTO trading_entries
+            (journal_id, date, emotional_state, framework_violations,
+             pnl_realized, imr, phs, source_file, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, trading_rows)
+
+        cursor.executemany("""
+            INSERT OR REPLACE INTO file_checksums (path, checksum, indexed_at, modified_at)
+            VALUES (?, ?, ?, ?)
+        """, checksum_rows)
+
+        refresh_rollups(cursor, affected_dates)
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def _parse_journal_worker(task: Tuple[Path, str, Optional[str]]) -> Optional[Dict[str, Any]]:
+    """Parse one journal, skipping it if its checksum is unchanged.
+
+    Runs in a worker process; errors are returned rather than raised so one
+    bad file does not abort the whole batch.
+    """
+    file_path, space, stored_checksum = task
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        if stored_checksum is not None and compute_checksum(content) == stored_checksum:
+            return None  # File unchanged
+        return parse_journal_file(file_path, space, content=content)
+    except Exception as e:
+        return {'source_file': str(file_path), 'error': str(e)}
+
+
+def parse_journal_files(
+    file_paths: List[Path],
+    space: str,
+    stored_checksums: Optional[Dict[str, str]] = None,
+    workers: Optional[int] = None
+):
+    """Parse journal files, in parallel worker processes for large sets.
+
+    Args:
+        file_paths: Journal files to parse
+        space: Space the journals belong to
+        stored_checksums: path -> checksum; matching files are skipped
+        workers: Worker process count (default: CPU count, 1 = serial)
+
+    Yields parsed journal dicts (or {'source_file', 'error'}) in input order.
+    """
+    stored_checksums = stored_checksums or {}
+    tasks = [(path, space, stored_checksums.get(str(path))) for path in file_paths]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) < PARALLEL_PARSE_THRESHOLD:
+        results = map(_parse_journal_worker, tasks)
+        yield from (r for r in results if r is not None)
+        return
+
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(_parse_journal_worker, tasks, chunksize=chunksize):
+            if result is not None:
+                yield result
+
+
+def index_journal_files(
+    file_paths: List[Path],
+    space: str,
+    stored_checksums: Optional[Dict[str, str]] = None,
+    workers: Optional[int] = None,
+    verbose: bool = False
+) -> Dict[str, int]:
+    """Parse journals in parallel and bulk-write them in batches.
+
+    Returns dict with counts: journals, sessions, decisions, errors.
+    """
+    totals = {'journals': 0, 'sessions': 0, 'decisions': 0, 'errors': 0}
+
+    conn = get_connection(space)
+    batch = []
+
+    def flush():
+        write_parsed_journals(conn, batch, space)
+        batch.clear()
+
+    try:
+        for parsed in parse_journal_files(file_paths, space, stored_checksums, workers):
+            if 'error' in parsed:
+                totals['errors'] += 1
+                print(f"    Error processing {Path(parsed['source_file']).name}: {parsed['error']}")
+                continue
+
+            batch.append(parsed)
+            totals['journals'] += 1
+            totals['sessions'] += parsed['session_count']
+            totals['decisions'] += len(parsed['decisions'])
+
+            if verbose and parsed['session_count'] > 0:
+                print(f"    {Path(parsed['source_file']).name}: {parsed['session_count']} sessions")
+
+            if len(batch) >= JOURNAL_WRITE_BATCH:
+                flush()
+        flush()
+    finally:
+        conn.close()
+
+    return totals
+
+
 def index_journal_file(file_path: Path, space: str = None) -> Dict[str, int]:
     """Parse and index a journal file to the database.
 
+    Idempotent: all rows previously derived from this file (entry, sessions,
+    accomplishments, files modified, decisions, trading entries) are replaced
+    in a single transaction.
+
     Returns dict with counts.
     """
     if space is None:
@@ -346,119 +630,130 @@ def index_journal_file(file_path: Path, space: str = None) -> Dict[str, int]:
 
     parsed = parse_journal_file(file_path, space)
 
+    conn = get_connection(space)
+    try:
+        write_parsed_journals(conn, [parsed], space)
+    finally:
+        conn.close()
+
+    return {
+        'sessions': len(parsed['sessions']),
+        'decisions': len(parsed['decisions']),
+        'has_trading': 1 if parsed['trading_data'] else 0,
+    }
+
+
+def needs_provenance_migration(space: str = None) -> bool:
+    """Check for journal-derived rows indexed before source_file existed."""
     conn = get_connection(space)
     cursor = conn.cursor()
 
-    source_file = str(file_path)
-    now = datetime.now().isoformat()
+    legacy = False
+    for table in ['sessions', 'accomplishments', 'files_modified', 'trading_entries']:
+        cursor.execute(f"SELECT 1 FROM {table} WHERE source_file IS NULL LIMIT 1")
+        if cursor.fetchone():
+            legacy = True
+            break
 
-    # Clear existing entries for this file
-    cursor.execute("DELETE FROM journal_entries WHERE source_file = ?", (source_file,))
+    conn.close()
+    return legacy
 
-    # Index journal entry
-    cursor.execute("""
-        INSERT INTO journal_entries
-        (date, space, type, content, word_count, session_count, source_file, created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        parsed['date'],
-        parsed['space'] or space,
-        parsed['type'],
-        parsed['content'],
-        parsed['word_count'],
-        parsed['session_count'],
-        source_file,
-        now,
-        now
-    ))
-    journal_id = cursor.lastrowid
-
-    # Index sessions
-    for session in parsed['sessions']:
+
+def migrate_journal_provenance(space: str = None) -> Dict[str, int]:
+    """One-off cleanup of duplicate/orphaned journal rows in existing DBs.
+
+    Older indexers deleted only the journal_entries row on reindex, leaving
+    orphaned sessions, accomplishments, files_modified and trading_entries,
+    and appended decisions with no provenance on every run. This:
+    - deletes rows whose parent journal entry / session no longer exists
+    - deletes journal decisions without provenance (cannot be attributed)
+    - backfills source_file on the surviving rows
+    - invalidates journal checksums so the next sync re-derives decisions
+
+    Returns dict with counts of deleted rows per table.
+    """
+    conn = get_connection(space)
+    cursor = conn.cursor()
+
+    deleted = {}
+
+    try:
         cursor.execute("""
-            INSERT INTO sessions
-            (journal_id, title, goal, space, session_type, content, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            journal_id,
-            session['title'],
-            session['goal'],
-            parsed['space'] or space,
-            session['session_type'],
-            session['content'],
-            now
-        ))
-        session_id = cursor.lastrowid
-
-        # Index accomplishments
-        for accomplishment in session['accomplishments']:
-            cursor.execute("""
-                INSERT INTO accomplishments (session_id, description, created_at)
-                VALUES (?, ?, ?)
-            """, (session_id, accomplishment, now))
+            DELETE FROM sessions
+            WHERE journal_id IS NULL
+               OR journal_id NOT IN (SELECT id FROM journal_entries)
+        """)
+        deleted['sessions'] = cursor.rowcount
+
+        for table in ['accomplishments', 'files_modified']:
+            cursor.execute(f"""
+                DELETE FROM {table}
+                WHERE session_id IS NULL
+                   OR session_id NOT IN (SELECT id FROM sessions)
+            """)
+            deleted[table] = cursor.rowcount
 
-        # Index files modified
-        for file_info in session['files_modified']:
-            cursor.execute("""
-                INSERT INTO files_modified (session_id, file_path, change_type, created_at)
-                VALUES (?, ?, ?, ?)
-            """, (session_id, file_info['file_path'], file_info['change_type'], now))
+        cursor.execute("""
+            DELETE FROM trading_entries
+            WHERE journal_id IS NULL
+               OR journal_id NOT IN (SELECT id FROM journal_entries)
+        """)
+        deleted['trading_entries'] = cursor.rowcount
 
-    # Index decisions
-    for decision in parsed['decisions']:
         cursor.execute("""
-            INSERT INTO decisions
-            (file_id, description, rationale, reversible, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            None,  # No file reference for journal decisions
-            decision['description'],
-            decision.get('rationale'),
-            1 if decision.get('reversible', True) else 0,
-            now
-        ))
-
-    # Index trading data if present
-    if parsed['trading_data']:
-        td = parsed['trading_data']
+            DELETE FROM decisions
+            WHERE source_file IS NULL AND session_id IS NULL AND file_id IS NULL
+        """)
+        deleted['decisions'] = cursor.rowcount
+
+        # Backfill provenance on surviving rows
         cursor.execute("""
-            INSERT INTO trading_entries
-            (journal_id, date, emotional_state, framework_violations,
-             pnl_realized, imr, phs, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            journal_id,
-            parsed['date'],
-            td.get('emotional_state'),
-            str(td.get('framework_violations')) if td.get('framework_violations') else None,
-            td.get('pnl_realized'),
-            td.get('imr'),
-            td.get('phs'),
-            now
-        ))
-
-    # Update file checksum
-    cursor.execute("""
-        INSERT OR REPLACE INTO file_checksums (path, checksum, indexed_at, modified_at)
-        VALUES (?, ?, ?, ?)
-    """, (
-        source_file,
-        parsed['file_checksum'],
-        now,
-        datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
-    ))
-
-    conn.commit()
-    conn.close()
+            UPDATE sessions SET source_file = (
+                SELECT j.source_file FROM journal_entries j WHERE j.id = sessions.journal_id
+            ) WHERE source_file IS NULL
+        """)
+        cursor.execute("""
+            UPDATE trading_entries SET source_file = (
+                SELECT j.source_file FROM journal_entries j WHERE j.id = trading_entries.journal_id
+            ) WHERE source_file IS NULL
+        """)
+        for table in ['accomplishments', 'files_modified']:
+            cursor.execute(f"""
+                UPDATE {table} SET source_file = (
+                    SELECT s.source_file FROM sessions s WHERE s.id = {table}.session_id
+                ) WHERE source_file IS NULL
+            """)
+
+        # Force reindex of journals so decisions are rebuilt with provenance
+        cursor.execute("""
+            DELETE FROM file_checksums
+            WHERE path IN (SELECT source_file FROM journal_entries)
+        """)
 
-    return {
-        'sessions': len(parsed['sessions']),
-        'decisions': len(parsed['decisions']),
-        'has_trading': 1 if parsed['trading_data'] else 0,
-    }
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    return deleted
+
+
+def list_journal_files(space: str) -> List[Path]:
+    """List dated journal files (YYYY-MM-DD.md) for a space."""
+    journal_path = SPACES[space].get('journal_path')
+    if not journal_path or not journal_path.exists():
+        return []
+
+    return sorted(
+        file_path for file_path in journal_path.glob('*.md')
+        if not file_path.name.startswith('.')
+        and extract_date_from_filename(file_path.name)
+    )
 
 
-def scan_journal_files(space: str, verbose: bool = True) -> Dict[str, int]:
+def scan_journal_files(space: str, verbose: bool = True, workers: int = None) -> Dict[str, int]:
     """Scan all journal files in a space."""
     if space not in SPACES:
         print(f"Unknown space: {space}")
@@ -466,44 +761,27 @@ def scan_journal_files(space: str, verbose: bool = True) -> Dict[str, int]:
 
     journal_path = SPACES[space].get('journal_path')
 
-    totals = {'journals': 0, 'sessions': 0, 'decisions': 0}
-
     if not journal_path or not journal_path.exists():
         if verbose:
             print(f"  No journal path for {space}")
-        return totals
+        return {'journals': 0, 'sessions': 0, 'decisions': 0}
 
     if verbose:
         print(f"\n  Scanning: {journal_path.relative_to(DATA_ROOT)}")
 
-    for file_path in sorted(journal_path.glob('*.md')):
-        if file_path.name.startswith('.'):
-            continue
-
-        # Check if filename matches date pattern
-        if not extract_date_from_filename(file_path.name):
-            continue
-
-        try:
-            counts = index_journal_file(file_path, space)
-            totals['journals'] += 1
-            totals['sessions'] += counts['sessions']
-            totals['decisions'] += counts['decisions']
+    return index_journal_files(list_journal_files(space), space, workers=workers, verbose=verbose)
 
-            if verbose and counts['sessions'] > 0:
-                print(f"    {file_path.name}: {counts['sessions']} sessions")
-        except Exception as e:
-            print(f"    Error processing {file_path.name}: {e}")
 
-    return totals
-
-
-def sync_journals_to_db(space: str = None, full: bool = False) -> Dict[str, Any]:
+def sync_journals_to_db(space: str = None, full: bool = False, workers: int = None) -> Dict[str, Any]:
     """Sync journal files to database.
 
+    Changed files are detected and parsed in worker processes, then written
+    in bulk batches.
+
     Args:
         space: Specific space to sync, or None for all
         full: If True, re-index all files. If False, only changed files.
+        workers: Parser process count (default: CPU count, 1 = serial)
 
     Returns sync stats.
     """
@@ -524,45 +802,39 @@ def sync_journals_to_db(space: str = None, full: bool = False) -> Dict[str, Any]
         # Ensure DB is initialized
         init_database(sp)
 
-        journal_path = SPACES[sp].get('journal_path')
+        # Clean up rows left behind by pre-provenance indexing
+        if needs_provenance_migration(sp):
+            migrate_journal_provenance(sp)
 
-        if not journal_path or not journal_path.exists():
-            continue
+        # Build rollups for journals indexed before they existed
+        conn = get_connection(sp)
+        backfill = needs_rollup_backfill(conn.cursor())
+        conn.close()
+        if backfill:
+            rebuild_rollups(sp)
 
-        for file_path in journal_path.glob('*.md'):
-            if file_path.name.startswith('.'):
-                continue
+        file_paths = list_journal_files(sp)
+        if not file_paths:
+            continue
 
-            if not extract_date_from_filename(file_path.name):
-                continue
+        stats['files_scanned'] += len(file_paths)
 
-            stats['files_scanned'] += 1
+        # Load stored checksums in one query (unless full sync)
+        stored_checksums = {}
+        if not full:
+            conn = get_connection(sp)
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT path, checksum FROM file_checksums
+                WHERE path IN (SELECT source_file FROM journal_entries)
+            """)
+            stored_checksums = {row['path']: row['checksum'] for row in cursor.fetchall()}
+            conn.close()
 
-            # Check if file changed (unless full sync)
-            if not full:
-                conn = get_connection(sp)
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT checksum FROM file_checksums WHERE path = ?",
-                    (str(file_path),)
-                )
-                row = cursor.fetchone()
-                conn.close()
-
-                if row:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        current_checksum = compute_checksum(f.read())
-                    if row['checksum'] == current_checksum:
-                        continue  # File unchanged
-
-            # Index the file
-            try:
-                counts = index_journal_file(file_path, sp)
-                stats['files_updated'] += 1
-                stats['journals'] += 1
-                stats['sessions'] += counts['sessions']
-            except Exception as e:
-                print(f"Error indexing {file_path}: {e}")
+        counts = index_journal_files(file_paths, sp, stored_checksums, workers)
+        stats['files_updated'] += counts['journals']
+        stats['journals'] += counts['journals']
+        stats['sessions'] += counts['sessions']
 
         stats['spaces_synced'].append(sp)
 
@@ -606,52 +878,20 @@ def get_recent_sessions(days: int = 7, space: str = None) -> List[Dict[str, Any]
 
 
 def get_session_stats(date_from: str = None, date_to: str = None, space: str = None) -> Dict[str, Any]:
-    """Get aggregate session statistics."""
-    conn = get_connection(space)
-    cursor = conn.cursor()
-
-    where_clause = "1=1"
-    params = []
-
-    if date_from:
-        where_clause += " AND j.date >= ?"
-        params.append(date_from)
-    if date_to:
-        where_clause += " AND j.date <= ?"
-        params.append(date_to)
-
-    cursor.execute(f"""
-        SELECT
-            COUNT(DISTINCT j.id) as journal_count,
-            COUNT(s.id) as session_count,
-            SUM(j.word_count) as total_words
-        FROM journal_entries j
-        LEFT JOIN sessions s ON s.journal_id = j.id
-        WHERE {where_clause}
-    """, params)
+    """Get aggregate session statistics.
 
-    row = cursor.fetchone()
+    Reads day/month rollup buckets, so cost does not grow with the number
+    of sessions in the range.
+    """
+    totals = get_rollup_totals(date_from, date_to, space)
 
-    stats = {
-        'journal_count': row['journal_count'] or 0,
-        'session_count': row['session_count'] or 0,
-        'total_words': row['total_words'] or 0,
+    return {
+        'journal_count': totals['journal_count'],
+        'session_count': totals['session_count'],
+        'total_words': totals['total_words'],
+        'by_session_type': totals['by_session_type'],
     }
 
-    # Session types breakdown
-    cursor.execute(f"""
-        SELECT s.session_type, COUNT(*) as count
-        FROM sessions s
-        JOIN journal_entries j ON s.journal_id = j.id
-        WHERE {where_clause}
-        GROUP BY s.session_type
-    """, params)
-
-    stats['by_session_type'] = {row['session_type']: row['count'] for row in cursor.fetchall()}
-
-    conn.close()
-    return stats
-
 
 def print_stats(stats: Dict[str, Any]):
     """Print sync statistics."""
@@ -677,11 +917,13 @@ if __name__ == "__main__":
     parser.add_argument('--sessions', action='store_true', help='List sessions')
     parser.add_argument('--date', help='Filter by date (YYYY-MM-DD)')
     parser.add_argument('--stats', action='store_true', help='Show session statistics')
+    parser.add_argument('--migrate', action='store_true', help='Clean up duplicate/orphaned journal rows')
+    parser.add_argument('--workers', '-j', type=int, help='Parser processes (default: CPU count)')
 
     args = parser.parse_args()
 
     if args.sync:
-        stats = sync_journals_to_db(args.space, args.full)
+        stats = sync_journals_to_db(args.space, args.full, args.workers)
         print_stats(stats)
 
     elif args.scan:
@@ -689,7 +931,7 @@ if __name__ == "__main__":
             print("Usage: python journal_parser.py --scan --space SPACE")
             sys.exit(1)
         init_database(args.space)
-        totals = scan_journal_files(args.space)
+        totals = scan_journal_files(args.space, workers=args.workers)
         print(f"\nTotal: {totals['journals']} journals, {totals['sessions']} sessions")
 
     elif args.sessions:
@@ -716,6 +958,16 @@ if __name__ == "__main__":
             for stype, count in stats['by_session_type'].items():
                 print(f"  {stype}: {count}")
 
+    elif args.migrate:
+        spaces = [args.space] if args.space else list(SPACES.keys())
+        for sp in spaces:
+            init_database(sp)
+            deleted = migrate_journal_provenance(sp)
+            print(f"\n=== Journal Migration ({sp}) ===")
+            for table, count in deleted.items():
+                print(f"  {table}: {count} removed")
+        print("\nRun --sync to reindex journals with provenance.")
+
     elif args.path:
         file_path = Path(args.path)
         if not file_path.exists():
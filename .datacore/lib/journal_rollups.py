@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Journal Rollups (DIP-0004)
+
+Maintains daily, weekly and monthly aggregates of journal data so reviews
+over months of journals read a few bucket rows instead of every session,
+accomplishment and trading entry:
+- Journal, session and accomplishment counts, word totals
+- Session counts by type
+- Trading metrics: PnL total, IMR/PHS/emotional state averages,
+  framework violation counts
+
+Buckets are refreshed incrementally by journal_parser whenever a journal
+day is reindexed (same transaction as the journal rows).
+
+Usage:
+    python journal_rollups.py rebuild [--space SPACE]
+    python journal_rollups.py show [--period week] [--days 90] [--space SPACE]
+"""
+
+import ast
+import sys
+from pathlib import Path
+from datetime import datetime, date, timedelta
+from typing import Optional, Dict, List, Any, Iterable
+
+# Add lib to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from zettel_db import get_connection, SPACES
+
+
+PERIODS = ['day', 'week', 'month']
+
+ROLLUP_COLUMNS = [
+    'journal_count', 'session_count', 'total_words', 'accomplishment_count',
+    'trading_count', 'pnl_total', 'imr_sum', 'imr_count', 'phs_sum',
+    'phs_count', 'emotional_sum', 'emotional_count', 'violation_count',
+]
+
+# Keep IN (...) lists under SQLite's bound-parameter limit
+SQL_CHUNK = 500
+
+
+def _chunks(items: List[Any], size: int = SQL_CHUNK) -> Iterable[List[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def period_start(day: date, period: str) -> date:
+    """First day of the bucket containing `day` (weeks start Monday)."""
+    if period == 'week':
+        return day - timedelta(days=day.weekday())
+    if period == 'month':
+        return day.replace(day=1)
+    return day
+
+
+def period_end(start: date, period: str) -> date:
+    """First day after the bucket starting at `start`."""
+    if period == 'week':
+        return start + timedelta(days=7)
+    if period == 'month':
+        return (start + timedelta(days=32)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def _count_violations(value: Optional[str]) -> int:
+    """Count framework violations stored as a stringified list."""
+    if not value:
+        return 0
+    try:
+        parsed = ast.literal_eval(value)
+        return len(parsed) if isinstance(parsed, (list, tuple)) else 1
+    except (ValueError, SyntaxError):
+        return 1
+
+
+def _refresh_days(cursor, days: List[str], now: str):
+    """Recompute daily buckets from raw journal rows."""
+    placeholders = ','.join('?' * len(days))
+    rollups = {d: dict.fromkeys(ROLLUP_COLUMNS, 0) for d in days}
+    session_types = []
+
+    cursor.execute(f"""
+        SELECT date, COUNT(*) AS journal_count, SUM(word_count) AS total_words
+        FROM journal_entries
+        WHERE date IN ({placeholders})
+        GROUP BY date
+    """, days)
+    for row in cursor.fetchall():
+        rollups[row['date']]['journal_count'] = row['journal_count']
+        rollups[row['date']]['total_words'] = row['total_words'] or 0
+
+    cursor.execute(f"""
+        SELECT j.date, s.session_type, COUNT(*) AS count
+        FROM sessions s
+        JOIN journal_entries j ON s.journal_id = j.id
+        WHERE j.date IN ({placeholders})
+        GROUP BY j.date, s.session_type
+    """, days)
+    for row in cursor.fetchall():
+        rollups[row['date']]['session_count'] += row['count']
+        session_types.append(('day', row['date'], row['session_type'] or 'general', row['count']))
+
+    cursor.execute(f"""
+        SELECT j.date, COUNT(*) AS count
+        FROM accomplishments a
+        JOIN sessions s ON a.session_id = s.id
+        JOIN journal_entries j ON s.journal_id = j.id
+        WHERE j.date IN ({placeholders})
+        GROUP BY j.date
+    """, days)
+    for row in cursor.fetchall():
+        rollups[row['date']]['accomplishment_count'] = row['count']
+
+    cursor.execute(f"""
+        SELECT date, emotional_state, pnl_realized, imr, phs, framework_violations
+        FROM trading_entries
+        WHERE date IN ({placeholders})
+    """, days)
+    for row in cursor.fetchall():
+        bucket = rollups[row['date']]
+        bucket['trading_count'] += 1
+        bucket['pnl_total'] += row['pnl_realized'] or 0
+        for key, column in [('imr', 'imr'), ('phs', 'phs'), ('emotional', 'emotional_state')]:
+            if row[column] is not None:
+                bucket[f'{key}_sum'] += row[column]
+                bucket[f'{key}_count'] += 1
+        bucket['violation_count'] += _count_violations(row['framework_violations'])
+
+    cursor.execute(f"DELETE FROM journal_rollups WHERE period = 'day' AND period_start IN ({placeholders})", days)
+    cursor.execute(
+        f"DELETE FROM journal_rollup_session_types WHERE period = 'day' AND period_start IN ({placeholders})",
+        days
+    )
+
+    cursor.executemany(f"""
+        INSERT INTO journal_rollups (period, period_start, {', '.join(ROLLUP_COLUMNS)}, updated_at)
+        VALUES ('day', ?, {', '.join('?' * len(ROLLUP_COLUMNS))}, ?)
+    """, [
+        (d, *(bucket[c] for c in ROLLUP_COLUMNS), now)
+        for d, bucket in rollups.items()
+        if bucket['journal_count'] or bucket['trading_count']
+    ])
+    cursor.executemany("""
+        INSERT INTO journal_rollup_session_types (period, period_start, session_type, session_count)
+        VALUES (?, ?, ?, ?)
+    """, session_types)
+
+
+def _refresh_bucket(cursor, period: str, start: date, now: str):
+    """Recompute one week/month bucket from its daily buckets."""
+    params = (start.isoformat(), period_end(start, period).isoformat())
+
+    cursor.execute(
+        "DELETE FROM journal_rollups WHERE period = ? AND period_start = ?",
+        (period, start.isoformat())
+    )
+    cursor.execute(
+        "DELETE FROM journal_rollup_session_types WHERE period = ? AND period_start = ?",
+        (period, start.isoformat())
+    )
+
+    sums = ', '.join(f'SUM({c})' for c in ROLLUP_COLUMNS)
+    cursor.execute(f"""
+        INSERT INTO journal_rollups (period, period_start, {', '.join(ROLLUP_COLUMNS)}, updated_at)
+        SELECT ?, ?, {sums}, ?
+        FROM journal_rollups
+        WHERE period = 'day' AND period_start >= ? AND period_start < ?
+        HAVING COUNT(*) > 0
+    """, (period, start.isoformat(), now, *params))
+
+    cursor.execute("""
+        INSERT INTO journal_rollup_session_types (period, period_start, session_type, session_count)
+        SELECT ?, ?, session_type, SUM(session_count)
+        FROM journal_rollup_session_types
+        WHERE period = 'day' AND period_start >= ? AND period_start < ?
+        GROUP BY session_type
+    """, (period, start.isoformat(), *params))
+
+
+def refresh_rollups(cursor, dates: Iterable[Any]):
+    """Refresh day/week/month buckets touching the given journal dates.
+
+    Call inside the transaction that changed the journal rows, with both
+    the old and new dates of every reindexed journal.
+    """
+    days = sorted({str(d)[:10] for d in dates if d})
+    if not days:
+        return
+
+    now = datetime.now().isoformat()
+
+    for chunk in _chunks(days):
+        _refresh_days(cursor, chunk, now)
+
+    parsed_days = []
+    for d in days:
+        try:
+            parsed_days.append(date.fromisoformat(d))
+        except ValueError:
+            continue  # Malformed journal date; only the daily bucket applies
+
+    for period in ['week', 'month']:
+        for start in sorted({period_start(d, period) for d in parsed_days}):
+            _refresh_bucket(cursor, period, start, now)
+
+
+def needs_rollup_backfill(cursor) -> bool:
+    """Check for journals indexed before rollups existed."""
+    cursor.execute("SELECT 1 FROM journal_rollups LIMIT 1")
+    if cursor.fetchone():
+        return False
+    cursor.execute("SELECT 1 FROM journal_entries LIMIT 1")
+    return cursor.fetchone() is not None
+
+
+def rebuild_rollups(space: str = None) -> int:
+    """Rebuild all rollups from raw journal rows.
+
+    Returns number of journal dates rolled up.
+    """
+    conn = get_connection(space)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("DELETE FROM journal_rollups")
+        cursor.execute("DELETE FROM journal_rollup_session_types")
+        cursor.execute("SELECT DISTINCT date FROM journal_entries")
+        dates = [row['date'] for row in cursor.fetchall()]
+        refresh_rollups(cursor, dates)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    return len(dates)
+
+
+def _range_filter(date_from: Optional[str], date_to: Optional[str]):
+    """Build a WHERE clause covering [date_from, date_to] with the fewest rows.
+
+    Whole months inside the range come from month buckets; the partial
+    months at either end come from day buckets.
+    """
+    start = date.fromisoformat(date_from[:10]) if date_from else None
+    end = date.fromisoformat(date_to[:10]) if date_to else None
+
+    # First whole month in range, and first day after the last whole month
+    first_month = None
+    if start is None:
+        first_month = date.min
+    else:
+        first_month = start if start.day == 1 else period_end(period_start(start, 'month'), 'month')
+
+    if end is None:
+        month_stop = None
+    elif period_end(end, 'day') == period_end(period_start(end, 'month'), 'month'):
+        month_stop = period_end(period_start(end, 'month'), 'month')
+    else:
+        month_stop = period_start(end, 'month')
+
+    if month_stop is not None and first_month >= month_stop:
+        # No whole month in range: days only
+        clause = "period = 'day'"
+        params = []
+        if start:
+            clause += " AND period_start >= ?"
+            params.append(start.isoformat())
+        if end:
+            clause += " AND period_start <= ?"
+            params.append(end.isoformat())
+        return clause, params
+
+    clauses = ["(period = 'month' AND period_start >= ?" + (" AND period_start < ?)" if month_stop else ")")]
+    params = [first_month.isoformat()] + ([month_stop.isoformat()] if month_stop else [])
+
+    if start and start < first_month:
+        clauses.append("(period = 'day' AND period_start >= ? AND period_start < ?)")
+        params.extend([start.isoformat(), first_month.isoformat()])
+    if month_stop and end and end >= month_stop:
+        clauses.append("(period = 'day' AND period_start >= ? AND period_start <= ?)")
+        params.extend([month_stop.isoformat(), end.isoformat()])
+
+    return ' OR '.join(clauses), params
+
+
+def get_rollup_totals(
+    date_from: str = None,
+    date_to: str = None,
+    space: str = None
+) -> Dict[str, Any]:
+    """Aggregate journal metrics over a date range from rollup buckets.
+
+    Args:
+        date_from: Inclusive start date (YYYY-MM-DD), or None for all
+        date_to: Inclusive end date (YYYY-MM-DD), or None for all
+        space: Space database to query
+
+    Returns dict with raw sums/counts (see ROLLUP_COLUMNS) plus
+    by_session_type.
+    """
+    where_clause, params = _range_filter(date_from, date_to)
+
+    conn = get_connection(space)
+    cursor = conn.cursor()
+
+    sums = ', '.join(f'COALESCE(SUM({c}), 0) AS {c}' for c in ROLLUP_COLUMNS)
+    cursor.execute(f"SELECT {sums} FROM journal_rollups WHERE {where_clause}", params)
+    totals = dict(cursor.fetchone())
+
+    cursor.execute(f"""
+        SELECT session_type, SUM(session_count) AS count
+        FROM journal_rollup_session_types
+        WHERE {where_clause}
+        GROUP BY session_type
+    """, params)
+    totals['by_session_type'] = {row['session_type']: row['count'] for row in cursor.fetchall()}
+
+    conn.close()
+    return totals
+
+
+def get_rollup_series(
+    period: str = 'week',
+    date_from: str = None,
+    date_to: str = None,
+    space: str = None
+) -> List[Dict[str, Any]]:
+    """Get per-bucket journal metrics (e.g. one row per week) for trends.
+
+    Returns list of bucket dicts (oldest first) with averages computed and
+    by_session_type attached.
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Unknown period: {period}. Valid: {PERIODS}")
+
+    where_clause = "period = ?"
+    params = [period]
+    if date_from:
+        where_clause += " AND period_start >= ?"
+        params.append(period_start(date.fromisoformat(date_from[:10]), period).isoformat())
+    if date_to:
+        where_clause += " AND period_start <= ?"
+        params.append(date_to[:10])
+
+    conn = get_connection(space)
+    cursor = conn.cursor()
+
+    cursor.execute(f"""
+        SELECT * FROM journal_rollups
+        WHERE {where_clause}
+        ORDER BY period_start
+    """, params)
+    buckets = {row['period_start']: dict(row) for row in cursor.fetchall()}
+
+    cursor.execute(f"""
+        SELECT period_start, session_type, session_count
+        FROM journal_rollup_session_types
+        WHERE {where_clause}
+    """, params)
+    for bucket in buckets.values():
+        bucket['by_session_type'] = {}
+    for row in cursor.fetchall():
+        if row['period_start'] in buckets:
+            buckets[row['period_start']]['by_session_type'][row['session_type']] = row['session_count']
+
+    conn.close()
+
+    results = []
+    for bucket in buckets.values():
+        for key in ['imr', 'phs', 'emotional']:
+            count = bucket[f'{key}_count']
+            bucket[f'avg_{key}'] = round(bucket[f'{key}_sum'] / count, 1) if count else None
+        results.append(bucket)
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Journal Rollups")
+    parser.add_argument('command', choices=['rebuild', 'show'])
+    parser.add_argument('--space', '-s', choices=list(SPACES.keys()), help='Space to operate on')
+    parser.add_argument('--period', '-p', choices=PERIODS, default='week')
+    parser.add_argument('--days', '-d', type=int, default=90)
+
+    args = parser.parse_args()
+
+    if args.command == 'rebuild':
+        count = rebuild_rollups(args.space)
+        print(f"Rebuilt rollups for {count} journal dates")
+
+    elif args.command == 'show':
+        date_from = (date.today() - timedelta(days=args.days)).isoformat()
+        series = get_rollup_series(args.period, date_from=date_from, space=args.space)
+        print(f"\n=== Journal Rollups ({args.period}, last {args.days} days) ===")
+        for b in series:
+            print(f"  {b['period_start']}: {b['journal_count']} journals, "
+                  f"{b['session_count']} sessions, {b['accomplishment_count']} accomplishments")
+            if b['trading_count']:
+                print(f"      PnL: {b['pnl_total']:,.2f}  IMR: {b['avg_imr']}  "
+                      f"PHS: {b['avg_phs']}  violations: {b['violation_count']}")
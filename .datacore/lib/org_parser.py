@@ -6,7 +6,7 @@ Parses org-mode files to extract:
 - Tasks (TODO items with properties)
 - Projects (PROJECT entries)
 - Inbox entries (items in inbox.org)
-- Habits (recurring tasks)
+- Habits (recurring tasks with :STYLE: habit, LOGBOOK history)
 
 Core Principle: Parse org files, index to DB, support write-back.
 
@@ -14,13 +14,14 @@ Usage:
     python org_parser.py <file_path>
     python org_parser.py --scan --space SPACE
     python org_parser.py --sync [--space SPACE]
+    python org_parser.py --habits [--space SPACE]
 """
 
 import re
 import sys
 import hashlib
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, date
 from typing import Optional, Dict, List, Any, Tuple
 
 # Add lib to path for imports
@@ -40,6 +41,14 @@ SCHEDULED_PATTERN = re.compile(r'SCHEDULED:\s*<([^>]+)>')
 DEADLINE_PATTERN = re.compile(r'DEADLINE:\s*<([^>]+)>')
 CLOSED_PATTERN = re.compile(r'CLOSED:\s*\[([^\]]+)\]')
 PROPERTY_PATTERN = re.compile(r':([A-Z_]+):\s*(.+)')
+LOGBOOK_STATE_PATTERN = re.compile(
+    r'^-\s+State\s+"([A-Z]+)"\s+(?:from\s+"([A-Z]*)"\s+)?\[([^\]]+)\]'
+)
+REPEATER_PATTERN = re.compile(r'([.+]?\+)(\d+)([hdwmy])')
+
+# Repeater unit -> days (hourly habits still count once per day)
+REPEATER_UNIT_DAYS = {'h': 1, 'd': 1, 'w': 7, 'm': 30, 'y': 365}
+REPEATER_UNIT_NAMES = {'d': 'daily', 'w': 'weekly', 'm': 'monthly', 'y': 'yearly'}
 
 
 def compute_checksum(content: str) -> str:
@@ -47,6 +56,15 @@ def compute_checksum(content: str) -> str:
     return hashlib.md5(content.encode('utf-8')).hexdigest()
 
 
+def heading_checksum(level: int, title: str) -> str:
+    """Per-heading hash used to verify a task's indexed line on writeback.
+
+    Covers level and title only, so state/priority/tag edits made by
+    writeback do not invalidate it.
+    """
+    return compute_checksum(f"{level} {title}")
+
+
 def parse_heading(line: str) -> Optional[Dict[str, Any]]:
     """Parse an org-mode heading line.
 
@@ -129,6 +147,126 @@ def parse_properties(lines: List[str], start_idx: int) -> Tuple[Dict[str, str],
     return properties, idx
 
 
+def parse_logbook(lines: List[str], start_idx: int) -> Tuple[List[Dict[str, str]], int]:
+    """Parse a :LOGBOOK: drawer.
+
+    Returns (state_changes, end_index). Each state change is a dict with
+    state, from_state and timestamp. CLOCK lines are ignored.
+    """
+    changes = []
+    idx = start_idx
+
+    # Find :LOGBOOK: (blank lines allowed before it)
+    while idx < len(lines):
+        line = lines[idx].strip()
+        if line == ':LOGBOOK:':
+            idx += 1
+            break
+        elif line:
+            return changes, start_idx
+        idx += 1
+    else:
+        return changes, start_idx
+
+    # Parse entries until :END:
+    while idx < len(lines):
+        line = lines[idx].strip()
+        if line == ':END:':
+            idx += 1
+            break
+
+        state_match = LOGBOOK_STATE_PATTERN.match(line)
+        if state_match:
+            changes.append({
+                'state': state_match.group(1),
+                'from_state': state_match.group(2) or None,
+                'timestamp': state_match.group(3),
+            })
+        idx += 1
+
+    return changes, idx
+
+
+def parse_repeater(timestamp: Optional[str]) -> Tuple[Optional[str], int]:
+    """Extract repeater cookie from a timestamp (e.g. '.+1d', '++1w').
+
+    Returns (repeater, interval_days). Defaults to daily when absent.
+    """
+    if not timestamp:
+        return None, 1
+
+    match = REPEATER_PATTERN.search(timestamp)
+    if not match:
+        return None, 1
+
+    count = int(match.group(2)) or 1
+    unit = match.group(3)
+    return match.group(0), count * REPEATER_UNIT_DAYS[unit]
+
+
+def compute_habit_stats(completions: List[str], interval_days: int = 1) -> Dict[str, Any]:
+    """Compute streaks and the completion bitmap for a habit.
+
+    Args:
+        completions: Completion dates (YYYY-MM-DD), any order, may repeat
+        interval_days: Repeater interval; gaps up to this keep a streak alive
+
+    Returns dict with: streak (ending at the last completion), longest_streak,
+    total_completions, last_completion, bitmap_start, completion_bitmap.
+    """
+    days = sorted({date.fromisoformat(d) for d in completions})
+    if not days:
+        return {
+            'streak': 0,
+            'longest_streak': 0,
+            'total_completions': 0,
+            'last_completion': None,
+            'bitmap_start': None,
+            'completion_bitmap': None,
+        }
+
+    interval = max(interval_days, 1)
+    longest = run = 1
+    bits = 1
+    for prev, cur in zip(days, days[1:]):
+        run = run + 1 if (cur - prev).days <= interval else 1
+        longest = max(longest, run)
+        bits |= 1 << (cur - days[0]).days
+
+    return {
+        'streak': run,
+        'longest_streak': longest,
+        'total_completions': len(days),
+        'last_completion': days[-1].isoformat(),
+        'bitmap_start': days[0].isoformat(),
+        'completion_bitmap': bits.to_bytes((bits.bit_length() + 7) // 8, 'little'),
+    }
+
+
+def decode_completion_bitmap(
+    bitmap: Optional[bytes],
+    bitmap_start: Optional[str],
+    end_date: date,
+    days: int = 90
+) -> List[int]:
+    """Decode a completion bitmap into a per-day 0/1 list.
+
+    Returns `days` entries, oldest first, ending at end_date (inclusive).
+    """
+    if not bitmap or not bitmap_start:
+        return [0] * days
+
+    bits = int.from_bytes(bitmap, 'little')
+    offset = (end_date - date.fromisoformat(bitmap_start)).days - days + 1
+
+    # Shift the window into place; days before bitmap_start are zero
+    if offset >= 0:
+        window = bits >> offset
+    else:
+        window = bits << -offset
+    return [(window >> i) & 1 for i in range(days)]
+
+
 def parse_planning(line: str) -> Dict[str, str]:
     """Parse SCHEDULED/DEADLINE/CLOSED line."""
     result = {}
@@ -148,17 +286,36 @@ def parse_planning(line: str) -> Dict[str, str]:
     return result
 
 
-def parse_org_file(file_path: Path, space: str = None) -> Dict[str, Any]:
+def parse_effort(effort_str: str) -> Optional[int]:
+    """Parse an EFFORT property (e.g., "0:30" -> 30 minutes)."""
+    if ':' in effort_str:
+        parts = effort_str.split(':')
+        try:
+            return int(parts[0]) * 60 + int(parts[1])
+        except ValueError:
+            return None
+    try:
+        return int(effort_str)
+    except ValueError:
+        return None
+
+
+def parse_org_file(file_path: Path, space: str = None, content: str = None) -> Dict[str, Any]:
     """Parse an org-mode file.
 
+    Pass `content` to parse text already in memory (e.g. after writeback)
+    instead of reading the file.
+
     Returns dict with:
     - tasks: List of task dicts
     - projects: List of project dicts
     - inbox_entries: List of inbox entry dicts (if inbox.org)
+    - habits: List of habit dicts (:STYLE: habit entries)
     - file_checksum: MD5 of file content
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    if content is None:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
 
     lines = content.split('\n')
     file_checksum = compute_checksum(content)
@@ -167,6 +324,7 @@ def parse_org_file(file_path: Path, space: str = None) -> Dict[str, Any]:
     tasks = []
     projects = []
     inbox_entries = []
+    habits = []
 
     # Track parent hierarchy
     parent_stack = []  # [(level, task_index)]
@@ -185,6 +343,7 @@ def parse_org_file(file_path: Path, space: str = None) -> Dict[str, Any]:
                 'priority': heading['priority'],
                 'title': heading['title'],
                 'tags': heading['tags'],
+                'checksum': heading_checksum(heading['level'], heading['title']),
                 'scheduled': None,
                 'deadline': None,
                 'closed': None,
@@ -212,21 +371,15 @@ def parse_org_file(file_path: Path, space: str = None) -> Dict[str, Any]:
                     task['properties'] = props
                     task['category'] = props.get('CATEGORY')
                     if 'EFFORT' in props:
-                        # Parse effort (e.g., "0:30" -> 30 minutes)
-                        effort_str = props['EFFORT']
-                        if ':' in effort_str:
-                            parts = effort_str.split(':')
-                            try:
-                                task['effort'] = int(parts[0]) * 60 + int(parts[1])
-                            except ValueError:
-                                pass
-                        else:
-                            try:
-                                task['effort'] = int(effort_str)
-                            except ValueError:
-                                pass
+                        task['effort'] = parse_effort(props['EFFORT'])
                     idx = new_idx - 1
 
+            # Check for logbook drawer (state change history)
+            logbook, new_idx = parse_logbook(lines, idx + 1)
+            if new_idx > idx + 1:
+                task['logbook'] = logbook
+                idx = new_idx - 1
+
             # Update parent hierarchy
             while parent_stack and parent_stack[-1][0] >= heading['level']:
                 parent_stack.pop()
@@ -248,6 +401,27 @@ def parse_org_file(file_path: Path, space: str = None) -> Dict[str, Any]:
                 tasks.append(task)
                 parent_stack.append((heading['level'], len(tasks) - 1))
 
+            # Habits: :STYLE: habit entries with repeater + completion history
+            if task['properties'].get('STYLE', '').lower() == 'habit':
+                repeater, interval_days = parse_repeater(task['scheduled'])
+                completions = [
+                    entry['timestamp'][:10] for entry in task.get('logbook', [])
+                    if entry['state'] == 'DONE'
+                ]
+                last_repeat = task['properties'].get('LAST_REPEAT')
+                if last_repeat:
+                    completions.append(last_repeat.strip('[]<>')[:10])
+                if task['closed']:
+                    completions.append(task['closed'][:10])
+                habits.append({
+                    'line_number': task['line_number'],
+                    'name': task['title'],
+                    'repeater': repeater,
+                    'interval_days': interval_days,
+                    'last_repeat': last_repeat,
+                    'completions': completions,
+                })
+
             # For inbox.org, capture entries under "* Inbox" heading
             if file_name == 'inbox.org' and heading['level'] == 2:
                 # Level 2 under * Inbox are inbox entries
@@ -265,6 +439,7 @@ def parse_org_file(file_path: Path, space: str = None) -> Dict[str, Any]:
         'tasks': tasks,
         'projects': projects,
         'inbox_entries': inbox_entries,
+        'habits': habits,
         'file_checksum': file_checksum,
         'source_file': str(file_path),
     }
@@ -282,7 +457,7 @@ def get_space_from_path(path: Path) -> str:
 def index_org_file(file_path: Path, space: str = None) -> Dict[str, int]:
     """Parse and index an org file to the database.
 
-    Returns dict with counts: tasks, projects, inbox_entries
+    Returns dict with counts: tasks, projects, inbox_entries, habits
     """
     if space is None:
         space = get_space_from_path(file_path)
@@ -299,6 +474,7 @@ def index_org_file(file_path: Path, space: str = None) -> Dict[str, int]:
     cursor.execute("DELETE FROM tasks WHERE source_file = ?", (source_file,))
     cursor.execute("DELETE FROM projects WHERE source_file = ?", (source_file,))
     cursor.execute("DELETE FROM inbox_entries WHERE source_file = ?", (source_file,))
+    cursor.execute("DELETE FROM habits WHERE source_file = ?", (source_file,))
 
     # Index tasks
     task_id_map = {}  # line_number -> db_id
@@ -324,7 +500,7 @@ def index_org_file(file_path: Path, space: str = None) -> Dict[str, int]:
             space,
             source_file,
             task['line_number'],
-            parsed['file_checksum'],
+            task['checksum'],
             now,
             now
         ))
@@ -372,6 +548,39 @@ def index_org_file(file_path: Path, space: str = None) -> Dict[str, int]:
             now
         ))
 
+    # Index habits (streaks and bitmap computed once per file change)
+    for habit in parsed['habits']:
+        habit_stats = compute_habit_stats(habit['completions'], habit['interval_days'])
+        frequency = habit['repeater']
+        repeater_match = REPEATER_PATTERN.search(frequency or '')
+        if repeater_match and repeater_match.group(2) == '1':
+            frequency = REPEATER_UNIT_NAMES.get(repeater_match.group(3), frequency)
+        cursor.execute("""
+            INSERT INTO habits
+            (name, frequency, last_completion, streak, total_completions,
+             space, source_file, line_number, repeater, interval_days,
+             last_repeat, longest_streak, bitmap_start, completion_bitmap,
+             created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            habit['name'],
+            frequency,
+            habit_stats['last_completion'],
+            habit_stats['streak'],
+            habit_stats['total_completions'],
+            space,
+            source_file,
+            habit['line_number'],
+            habit['repeater'],
+            habit['interval_days'],
+            habit['last_repeat'],
+            habit_stats['longest_streak'],
+            habit_stats['bitmap_start'],
+            habit_stats['completion_bitmap'],
+            now,
+            now
+        ))
+
     # Update file checksum
     cursor.execute("""
         INSERT OR REPLACE INTO file_checksums (path, checksum, indexed_at, modified_at)
@@ -390,6 +599,7 @@ def index_org_file(file_path: Path, space: str = None) -> Dict[str, int]:
         'tasks': len(parsed['tasks']),
         'projects': len(parsed['projects']),
         'inbox_entries': len(parsed['inbox_entries']),
+        'habits': len(parsed['habits']),
     }
 
 
@@ -397,11 +607,11 @@ def scan_org_files(space: str, verbose: bool = True) -> Dict[str, int]:
     """Scan all org files in a space."""
     if space not in SPACES:
         print(f"Unknown space: {space}")
-        return {'tasks': 0, 'projects': 0, 'inbox_entries': 0}
+        return {'tasks': 0, 'projects': 0, 'inbox_entries': 0, 'habits': 0}
 
     org_paths = SPACES[space].get('org_paths', [])
 
-    totals = {'tasks': 0, 'projects': 0, 'inbox_entries': 0}
+    totals = {'tasks': 0, 'projects': 0, 'inbox_entries': 0, 'habits': 0}
 
     for org_path in org_paths:
         if not org_path.exists():
@@ -445,6 +655,7 @@ def sync_org_to_db(space: str = None, full: bool = False) -> Dict[str, Any]:
         'tasks': 0,
         'projects': 0,
         'inbox_entries': 0,
+        'habits': 0,
     }
 
     spaces_to_sync = [space] if space else list(SPACES.keys())
@@ -492,6 +703,7 @@ def sync_org_to_db(space: str = None, full: bool = False) -> Dict[str, Any]:
                     stats['tasks'] += counts['tasks']
                     stats['projects'] += counts['projects']
                     stats['inbox_entries'] += counts['inbox_entries']
+                    stats['habits'] += counts['habits']
                 except Exception as e:
                     print(f"Error indexing {file_path}: {e}")
 
@@ -567,6 +779,53 @@ def get_tasks_by_category(category: str, space: str = None) -> List[Dict[str, An
     return results
 
 
+def get_habits(space: str = None, days: int = 90, today: date = None) -> List[Dict[str, Any]]:
+    """Get habits with current streak, completion rate and recent history.
+
+    Streaks are precomputed at index time; the current streak is the stored
+    streak if the last completion is still within the repeater interval.
+
+    Args:
+        space: Space to query
+        days: Length of the history window
+        today: Reference date (defaults to today)
+
+    Returns list of habit dicts with `history` (0/1 per day, oldest first)
+    and `completion_rate` over the window.
+    """
+    today = today or date.today()
+
+    conn = get_connection(space)
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        SELECT id, name, frequency, repeater, interval_days, last_completion,
+               last_repeat, longest_streak, total_completions, bitmap_start,
+               completion_bitmap, space, source_file, line_number,
+               CASE
+                   WHEN last_completion IS NOT NULL
+                    AND julianday(?) - julianday(last_completion) <= interval_days
+                   THEN streak ELSE 0
+               END AS current_streak
+        FROM habits
+        ORDER BY source_file, line_number
+    """, (today.isoformat(),))
+
+    results = []
+    for row in cursor.fetchall():
+        habit = dict(row)
+        history = decode_completion_bitmap(
+            habit.pop('completion_bitmap'), habit['bitmap_start'], today, days
+        )
+        expected = max(days // max(habit['interval_days'] or 1, 1), 1)
+        habit['history'] = history
+        habit['completion_rate'] = round(min(sum(history) / expected, 1.0), 2)
+        results.append(habit)
+
+    conn.close()
+    return results
+
+
 def print_stats(stats: Dict[str, Any]):
     """Print sync statistics."""
     print(f"\n{'='*50}")
@@ -578,6 +837,7 @@ def print_stats(stats: Dict[str, Any]):
     print(f"Tasks indexed: {stats['tasks']}")
     print(f"Projects indexed: {stats['projects']}")
     print(f"Inbox entries: {stats['inbox_entries']}")
+    print(f"Habits indexed: {stats['habits']}")
 
 
 if __name__ == "__main__":
@@ -591,6 +851,7 @@ if __name__ == "__main__":
     parser.add_argument('--space', '-s', choices=list(SPACES.keys()), help='Space to operate on')
     parser.add_argument('--ai-tasks', action='store_true', help='List AI-tagged tasks')
     parser.add_argument('--inbox', action='store_true', help='List inbox entries')
+    parser.add_argument('--habits', action='store_true', help='List habits with streaks')
 
     args = parser.parse_args()
 
@@ -621,6 +882,15 @@ if __name__ == "__main__":
         for e in entries:
             print(f"  - {e['text']}")
 
+    elif args.habits:
+        habits = get_habits(args.space)
+        print(f"\n=== Habits ({len(habits)}) ===")
+        for h in habits:
+            recent = ''.join('x' if d else '.' for d in h['history'][-14:])
+            print(f"  {h['name']} [{h['frequency'] or 'daily'}]")
+            print(f"       Streak: {h['current_streak']} (best {h['longest_streak']}), "
+                  f"90d rate: {h['completion_rate']:.0%}  {recent}")
+
     elif args.path:
         file_path = Path(args.path)
         if not file_path.exists():
@@ -633,6 +903,7 @@ if __name__ == "__main__":
         print(f"  Tasks: {counts['tasks']}")
         print(f"  Projects: {counts['projects']}")
         print(f"  Inbox entries: {counts['inbox_entries']}")
+        print(f"  Habits: {counts['habits']}")
 
     else:
         parser.print_help()
@@ -7,7 +7,8 @@ Provides clean Python APIs for accessing indexed content.
 
 Categories:
 - Tasks: Actionable items, AI-delegated tasks, by tag/state
-- Sessions: Recent work, by type
+- Sessions: Recent work, by type, day/week/month rollups
+- Habits: Streaks, completion rates, 90-day history
 - System: Agents, commands, DIPs, specs
 - Learning: Patterns, corrections, preferences
 - Search: Full-text search across content
@@ -22,23 +23,239 @@ Usage:
 
     tasks = get_ai_tasks(space='personal')
     results = search_content('bidirectional sync')
+
+    # Everything /today needs, from one consistent snapshot
+    briefing = get_briefing(space='personal')
+
+    # Large results stream in keyset pages (namedtuples, bounded memory)
+    for task in iter_search_tasks('sync', limit=100):
+        print(task.id, task.heading)
+
+    # Results are cached until the space's database changes
+    get_cache_stats()   # {'hits': ..., 'misses': ..., 'entries': ...}
+
+    # Same queries via the query daemon (queryd.py), if it is running
+    from queryd import call
+    tasks = call('get_ai_tasks', space='personal')
 """
 
+import functools
+import inspect
+import os
+import sqlite3
 import sys
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Iterator, List, Any
 
 # Add lib to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from zettel_db import get_connection, SPACES
+from zettel_db import get_connection, get_db_path, iter_rows, iter_orphans, iter_unresolved_links, SPACES
+from journal_rollups import get_rollup_totals, get_rollup_series
+
+CACHE_MAX_ENTRIES = 512     # cached results kept (least recently used evicted)
+CACHE_MAX_ROWS = 20000      # total rows held across cached results
+
+
+# =============================================================================
+# RESULT CACHE
+# =============================================================================
+
+class QueryCache:
+    """LRU cache of query results, invalidated when the database changes.
+
+    Keys are (function, arguments, today, version of the space's
+    database). The version is the database file's identity (device and
+    inode) plus its data_version, read from one long-lived probe
+    connection per database. data_version changes whenever any other
+    connection commits and the identity changes when the file is
+    replaced (rebuild), so a cached result is reused exactly until the
+    next write (index sync, writeback, rebuild) or until midnight for
+    date-relative queries.
+
+    Hits return copies, so callers may modify results freely.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, max_rows: int = CACHE_MAX_ROWS):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[tuple, tuple]' = OrderedDict()  # key -> (result, rows, copier)
+        self._rows = 0
+        # space -> (path source, db path, (st_dev, st_ino), cursor)
+        self._probes: Dict[Optional[str], tuple] = {}
+        self._lock = threading.Lock()
+
+    def version(self, space: str = None) -> Optional[tuple]:
+        """(st_dev, st_ino, data_version) of a space's database, None if it doesn't exist."""
+        # Probes are reopened if the space is pointed elsewhere (SPACES path
+        # replaced) or the file is replaced (a probe on the old inode would
+        # never see another change)
+        source = SPACES[space]['path'] if space in SPACES else None
+        probe = self._probes.get(space)
+        db_path = probe[1] if probe is not None and probe[0] is source else get_db_path(space)
+        try:
+            stat = os.stat(db_path)
+        except FileNotFoundError:
+            self._close_probe(space)
+            return None
+        file_id = (stat.st_dev, stat.st_ino)
+
+        if probe is None or probe[0] is not source or probe[2] != file_id:
+            self._close_probe(space)
+            probe = (source, db_path, file_id, sqlite3.connect(db_path, check_same_thread=False).cursor())
+            self._probes[space] = probe
+        return file_id + (probe[3].execute("PRAGMA data_version").fetchone()[0],)
+
+    def _close_probe(self, space: Optional[str]):
+        probe = self._probes.pop(space, None)
+        if probe is not None:
+            probe[3].connection.close()
+
+    def get(self, key: tuple):
+        """Cached (True, result) for key, or (False, None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return True, entry[2](entry[0])
+
+    def put(self, key: tuple, result: Any) -> Any:
+        """Store a result, evicting least recently used entries over the limits.
+
+        Returns a copy for the caller (the stored result is never handed out).
+        """
+        rows = len(result) if isinstance(result, list) else 1
+        if rows > self.max_rows:
+            return result
+        copier = _result_copier(result)
+        with self._lock:
+            if key in self._entries:
+                self._rows -= self._entries.pop(key)[1]
+            self._entries[key] = (result, rows, copier)
+            self._rows += rows
+            while len(self._entries) > self.max_entries or self._rows > self.max_rows:
+                _, (_, evicted_rows, _) = self._entries.popitem(last=False)
+                self._rows -= evicted_rows
+                self.evictions += 1
+        return copier(result)
+
+    def clear(self):
+        """Drop all cached results and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._rows = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'entries': len(self._entries),
+            'rows': self._rows,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'max_entries': self.max_entries,
+            'max_rows': self.max_rows,
+        }
+
+
+_cache = QueryCache()
+
+
+def _copy_result(value: Any) -> Any:
+    """Copy of a query result's lists and dicts (other values are immutable)."""
+    if isinstance(value, list):
+        return [_copy_result(item) if isinstance(item, (list, dict)) else item for item in value]
+    if isinstance(value, dict):
+        return {
+            key: _copy_result(item) if isinstance(item, (list, dict)) else item
+            for key, item in value.items()
+        }
+    return value
+
+
+def _copy_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [dict(row) for row in rows]
+
+
+def _result_copier(result: Any):
+    """Cheapest correct copy function for a result, chosen once when it is cached."""
+    if isinstance(result, list) and all(
+        isinstance(row, dict) and not any(isinstance(v, (list, dict)) for v in row.values())
+        for row in result
+    ):
+        return _copy_rows  # Plain rows: one dict() per row
+    return _copy_result
+
+
+def cached_query(function):
+    """Cache a read-only query on the database of its `space` argument."""
+    signature = inspect.signature(function)
+    names = list(signature.parameters)
+    space_index = names.index('space')
+    space_default = signature.parameters['space'].default
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _cache.enabled:
+            return function(*args, **kwargs)
+        # space is keyed on its own, so positional and keyword calls share entries
+        key_args, key_kwargs = args, kwargs
+        if len(args) == space_index + 1:
+            space, key_args = args[space_index], args[:space_index]
+        elif len(args) > space_index:
+            space = args[space_index]
+        else:
+            space = kwargs.get('space', space_default)
+            key_kwargs = {name: value for name, value in kwargs.items() if name != 'space'}
+        try:
+            version = _cache.version(space)
+            key = (function.__name__, key_args, tuple(sorted(key_kwargs.items())),
+                   time.strftime('%Y-%m-%d'), space, version)
+            hash(key)
+        except (TypeError, ValueError, sqlite3.Error):
+            return function(*args, **kwargs)  # Unhashable args or unknown space
+        if version is None:
+            return function(*args, **kwargs)
+
+        found, result = _cache.get(key)
+        if not found:
+            result = _cache.put(key, function(*args, **kwargs))
+        return result
+
+    return wrapper
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Get query cache size and hit/miss counters."""
+    return _cache.stats()
+
+
+def clear_cache() -> Dict[str, Any]:
+    """Drop cached query results; returns the stats before clearing."""
+    stats = _cache.stats()
+    _cache.clear()
+    return stats
 
 
 # =============================================================================
 # TASK QUERIES
 # =============================================================================
 
+@cached_query
 def get_ai_tasks(space: str = None, status: str = 'TODO') -> List[Dict[str, Any]]:
     """Get tasks tagged for AI processing.
 
@@ -61,6 +278,7 @@ def get_ai_tasks(space: str = None, status: str = 'TODO') -> List[Dict[str, Any]
     return results
 
 
+@cached_query
 def get_tasks_by_tag(tag: str, space: str = None, include_done: bool = False) -> List[Dict[str, Any]]:
     """Get tasks with a specific tag."""
     conn = get_connection(space)
@@ -83,6 +301,7 @@ def get_tasks_by_tag(tag: str, space: str = None, include_done: bool = False) ->
     return results
 
 
+@cached_query
 def get_actionable_tasks(space: str = None, limit: int = 20) -> List[Dict[str, Any]]:
     """Get tasks ready for action (NEXT or TODO without blockers)."""
     conn = get_connection(space)
@@ -106,6 +325,7 @@ def get_actionable_tasks(space: str = None, limit: int = 20) -> List[Dict[str, A
     return results
 
 
+@cached_query
 def get_waiting_tasks(space: str = None) -> List[Dict[str, Any]]:
     """Get tasks in WAITING state."""
     conn = get_connection(space)
@@ -124,6 +344,7 @@ def get_waiting_tasks(space: str = None) -> List[Dict[str, Any]]:
     return results
 
 
+@cached_query
 def get_scheduled_tasks(
     date_from: str = None,
     date_to: str = None,
@@ -157,12 +378,14 @@ def get_scheduled_tasks(
     return results
 
 
+@cached_query
 def get_overdue_tasks(space: str = None) -> List[Dict[str, Any]]:
     """Get tasks past their scheduled date."""
     today = datetime.now().strftime('%Y-%m-%d')
     return get_scheduled_tasks(date_to=today, space=space)
 
 
+@cached_query
 def get_task_stats(space: str = None) -> Dict[str, Any]:
     """Get aggregate task statistics."""
     conn = get_connection(space)
@@ -205,6 +428,7 @@ def get_task_stats(space: str = None) -> Dict[str, Any]:
 # PROJECT QUERIES
 # =============================================================================
 
+@cached_query
 def get_active_projects(space: str = None) -> List[Dict[str, Any]]:
     """Get active projects with task counts."""
     conn = get_connection(space)
@@ -227,6 +451,7 @@ def get_active_projects(space: str = None) -> List[Dict[str, Any]]:
     return results
 
 
+@cached_query
 def get_project_tasks(project_id: int, space: str = None) -> List[Dict[str, Any]]:
     """Get all tasks for a project."""
     conn = get_connection(space)
@@ -247,6 +472,7 @@ def get_project_tasks(project_id: int, space: str = None) -> List[Dict[str, Any]
 # SESSION QUERIES
 # =============================================================================
 
+@cached_query
 def get_recent_sessions(days: int = 7, space: str = None) -> List[Dict[str, Any]]:
     """Get sessions from the last N days."""
     conn = get_connection(space)
@@ -265,6 +491,7 @@ def get_recent_sessions(days: int = 7, space: str = None) -> List[Dict[str, Any]
     return results
 
 
+@cached_query
 def get_sessions_by_type(
     session_type: str,
     days: int = 30,
@@ -288,6 +515,7 @@ def get_sessions_by_type(
     return results
 
 
+@cached_query
 def get_accomplishments(days: int = 7, space: str = None) -> List[Dict[str, Any]]:
     """Get accomplishments from recent sessions."""
     conn = get_connection(space)
@@ -307,10 +535,217 @@ def get_accomplishments(days: int = 7, space: str = None) -> List[Dict[str, Any]
     return results
 
 
+def _days_ago(days: int) -> str:
+    """Start of a rollup window: date('now', '-N days') as SQLite computes it (UTC)."""
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d')
+
+
+@cached_query
+def get_session_summary(days: int = 30, space: str = None) -> Dict[str, Any]:
+    """Get session, accomplishment and word counts for the last N days.
+
+    Reads day/month rollup buckets instead of scanning raw rows, so it
+    stays cheap for quarterly or yearly windows.
+    """
+    date_from = _days_ago(days)
+    totals = get_rollup_totals(date_from, space=space)
+
+    return {
+        'journal_count': totals['journal_count'],
+        'session_count': totals['session_count'],
+        'accomplishment_count': totals['accomplishment_count'],
+        'total_words': totals['total_words'],
+        'by_session_type': totals['by_session_type'],
+    }
+
+
+@cached_query
+def get_activity_rollups(
+    period: str = 'week',
+    days: int = 90,
+    space: str = None
+) -> List[Dict[str, Any]]:
+    """Get per-day/week/month journal and trading metrics for trends."""
+    date_from = _days_ago(days)
+    return get_rollup_series(period, date_from=date_from, space=space)
+
+
+# =============================================================================
+# HABIT QUERIES
+# =============================================================================
+
+@cached_query
+def get_habits(space: str = None, days: int = 90) -> List[Dict[str, Any]]:
+    """Get habits with current streak, completion rate and daily history.
+
+    Reads the indexed habits table (populated by org_parser); logbooks
+    are not reparsed.
+    """
+    from org_parser import get_habits as _get_habits
+    return _get_habits(space, days=days)
+
+
+# =============================================================================
+# BRIEFING
+# =============================================================================
+
+# Open tasks with their project, shared by every task section of a briefing
+_BRIEFING_TASKS_CTE = """
+    briefing_tasks AS (
+        SELECT t.*, p.name as project_name
+        FROM tasks t
+        LEFT JOIN projects p ON t.project_id = p.id
+        WHERE t.state NOT IN ('DONE', 'CANCELLED')
+    )
+"""
+
+# Sessions in the briefing window, shared by sessions and accomplishments
+_BRIEFING_SESSIONS_CTE = """
+    briefing_sessions AS (
+        SELECT s.*, j.date
+        FROM sessions s
+        JOIN journal_entries j ON s.journal_id = j.id
+        WHERE j.date >= date(:date, :window) AND j.date <= :date
+    )
+"""
+
+# Filter and order of each task section, as in the single-section queries
+_BRIEFING_TASK_SECTIONS = {
+    'ai_tasks': "WHERE tags LIKE '%:AI:%' AND state = 'TODO' ORDER BY priority, created_at",
+    'actionable': """
+        WHERE state IN ('NEXT', 'TODO')
+        ORDER BY CASE state WHEN 'NEXT' THEN 0 ELSE 1 END, priority, scheduled, created_at
+        LIMIT :limit
+    """,
+    'waiting': "WHERE state = 'WAITING' ORDER BY scheduled, created_at",
+    'overdue': "WHERE scheduled IS NOT NULL AND scheduled <= :date ORDER BY scheduled, priority",
+}
+
+
+@cached_query
+def get_briefing(
+    space: str = None,
+    date: str = None,
+    days: int = 7,
+    actionable_limit: int = 20
+) -> Dict[str, Any]:
+    """Get the daily briefing dataset as of one consistent snapshot.
+
+    Computes what get_ai_tasks, get_actionable_tasks, get_waiting_tasks,
+    get_overdue_tasks, get_active_projects, get_recent_sessions,
+    get_accomplishments and get_task_stats return, in one read
+    transaction on one connection, so a sync running meanwhile can't
+    make sections disagree. Dates are relative to `date` (default today)
+    instead of now; sessions after `date` are excluded.
+
+    Returns:
+        Dict with date, one key per section, and task_stats
+    """
+    date = date or datetime.now().strftime('%Y-%m-%d')
+    params = {'date': date, 'window': f'-{days} days', 'limit': actionable_limit}
+    conn = get_connection(space)
+    cursor = conn.cursor()
+
+    cursor.execute("BEGIN")
+    try:
+        briefing = {'date': date}
+        for section, condition in _BRIEFING_TASK_SECTIONS.items():
+            cursor.execute(f"WITH {_BRIEFING_TASKS_CTE} SELECT * FROM briefing_tasks {condition}", params)
+            briefing[section] = [dict(row) for row in cursor.fetchall()]
+
+        cursor.execute("""
+            SELECT
+                p.*,
+                COUNT(t.id) as total_tasks,
+                SUM(CASE WHEN t.state = 'DONE' THEN 1 ELSE 0 END) as done_tasks
+            FROM projects p
+            LEFT JOIN tasks t ON t.project_id = p.id
+            WHERE p.status = 'active'
+            GROUP BY p.id
+            ORDER BY p.name
+        """)
+        briefing['projects'] = [dict(row) for row in cursor.fetchall()]
+
+        cursor.execute(f"""
+            WITH {_BRIEFING_SESSIONS_CTE}
+            SELECT * FROM briefing_sessions
+            ORDER BY date DESC, id DESC
+        """, params)
+        briefing['sessions'] = [dict(row) for row in cursor.fetchall()]
+
+        cursor.execute(f"""
+            WITH {_BRIEFING_SESSIONS_CTE}
+            SELECT a.description, s.title as session_title, s.date
+            FROM accomplishments a
+            JOIN briefing_sessions s ON a.session_id = s.id
+            ORDER BY s.date DESC, s.id, a.id
+        """, params)
+        briefing['accomplishments'] = [dict(row) for row in cursor.fetchall()]
+
+        # All task stats in one scan
+        cursor.execute("""
+            SELECT
+                state,
+                COUNT(*) as count,
+                SUM(tags LIKE '%:AI:%') as ai_count,
+                SUM(scheduled IS NOT NULL AND scheduled < :date
+                    AND state NOT IN ('DONE', 'CANCELLED')) as overdue_count
+            FROM tasks
+            GROUP BY state
+        """, params)
+        rows = cursor.fetchall()
+    finally:
+        conn.rollback()
+        conn.close()
+
+    by_state = {row['state']: row['count'] for row in rows}
+    briefing['task_stats'] = {
+        'by_state': by_state,
+        'total': sum(by_state.values()),
+        'ai_delegated': sum(row['ai_count'] or 0 for row in rows),
+        'overdue': sum(row['overdue_count'] or 0 for row in rows),
+    }
+    return briefing
+
+
+def _briefing_multi_call(space: str = None, days: int = 7) -> Dict[str, Any]:
+    """The briefing assembled from one call per section (for comparison)."""
+    return {
+        'ai_tasks': get_ai_tasks(space),
+        'actionable': get_actionable_tasks(space),
+        'waiting': get_waiting_tasks(space),
+        'overdue': get_overdue_tasks(space),
+        'projects': get_active_projects(space),
+        'sessions': get_recent_sessions(days, space),
+        'accomplishments': get_accomplishments(days, space),
+        'task_stats': get_task_stats(space),
+    }
+
+
+def _benchmark_briefing(space: str = None, days: int = 7, runs: int = 50) -> Dict[str, float]:
+    """Time get_briefing against the multi-call path, uncached (ms per briefing)."""
+    enabled = _cache.enabled
+    _cache.enabled = False
+    try:
+        timings = {}
+        for name, build in (('multi_call', lambda: _briefing_multi_call(space, days)),
+                            ('get_briefing', lambda: get_briefing(space, days=days))):
+            build()  # Warm up (imports, page cache)
+            started = time.perf_counter()
+            for _ in range(runs):
+                build()
+            timings[name] = (time.perf_counter() - started) / runs * 1000
+    finally:
+        _cache.enabled = enabled
+    timings['speedup'] = timings['multi_call'] / timings['get_briefing'] if timings['get_briefing'] else 0
+    return timings
+
+
 # =============================================================================
 # SYSTEM QUERIES
 # =============================================================================
 
+@cached_query
 def get_agents(space: str = None) -> List[Dict[str, Any]]:
     """Get all registered agents."""
     conn = get_connection(space)
@@ -327,6 +762,7 @@ def get_agents(space: str = None) -> List[Dict[str, Any]]:
     return results
 
 
+@cached_query
 def get_commands(space: str = None) -> List[Dict[str, Any]]:
     """Get all registered commands."""
     conn = get_connection(space)
@@ -343,6 +779,7 @@ def get_commands(space: str = None) -> List[Dict[str, Any]]:
     return results
 
 
+@cached_query
 def get_dips(space: str = None) -> List[Dict[str, Any]]:
     """Get all DIPs (Datacore Improvement Proposals)."""
     conn = get_connection(space)
@@ -358,6 +795,7 @@ def get_dips(space: str = None) -> List[Dict[str, Any]]:
     return results
 
 
+@cached_query
 def get_specs(space: str = None) -> List[Dict[str, Any]]:
     """Get all specs."""
     conn = get_connection(space)
@@ -377,6 +815,7 @@ def get_specs(space: str = None) -> List[Dict[str, Any]]:
 # LEARNING QUERIES
 # =============================================================================
 
+@cached_query
 def get_patterns(category: str = None, space: str = None) -> List[Dict[str, Any]]:
     """Get learning patterns, optionally filtered by category."""
     conn = get_connection(space)
@@ -400,6 +839,7 @@ def get_patterns(category: str = None, space: str = None) -> List[Dict[str, Any]
     return results
 
 
+@cached_query
 def get_corrections(space: str = None) -> List[Dict[str, Any]]:
     """Get learning corrections (mistakes to avoid)."""
     conn = get_connection(space)
@@ -416,6 +856,7 @@ def get_corrections(space: str = None) -> List[Dict[str, Any]]:
     return results
 
 
+@cached_query
 def get_preferences(space: str = None) -> List[Dict[str, Any]]:
     """Get user preferences."""
     conn = get_connection(space)
@@ -436,6 +877,7 @@ def get_preferences(space: str = None) -> List[Dict[str, Any]]:
 # SEARCH QUERIES
 # =============================================================================
 
+@cached_query
 def search_content(
     query: str,
     content_type: str = None,
@@ -507,6 +949,7 @@ def search_content(
     return results[:limit]
 
 
+@cached_query
 def search_tasks(
     query: str,
     space: str = None,
@@ -533,10 +976,57 @@ def search_tasks(
     return results
 
 
+def iter_search_tasks(
+    query: str,
+    space: str = None,
+    include_done: bool = False,
+    after: int = None,
+    limit: int = None
+) -> Iterator[tuple]:
+    """Stream tasks matching heading content, by task id.
+
+    Yields namedtuples of the task columns plus project_name; pass the
+    last row's id as `after` to resume.
+    """
+    done_filter = "" if include_done else "AND t.state NOT IN ('DONE', 'CANCELLED')"
+    return iter_rows(space, f"""
+        SELECT t.*, p.name as project_name
+        FROM tasks t
+        LEFT JOIN projects p ON t.project_id = p.id
+        WHERE t.heading LIKE ? {done_filter} {{keyset}}
+    """, (f'%{query}%',), key='t.id', after=after, limit=limit)
+
+
 # =============================================================================
 # LINK QUERIES
 # =============================================================================
 
+def iter_backlinks(
+    target_path: str,
+    space: str = None,
+    after: int = None,
+    limit: int = None
+) -> Iterator[tuple]:
+    """Stream links to a file, by link id.
+
+    Yields (id, source_path, source_title, link_type, syntax) namedtuples;
+    pass the last id as `after` to resume.
+    """
+    return iter_rows(space, """
+        SELECT
+            l.id,
+            f.path as source_path,
+            f.title as source_title,
+            l.link_type,
+            l.syntax
+        FROM links l
+        JOIN files f ON l.source_id = f.id
+        JOIN files target ON l.target_id = target.id
+        WHERE target.path = ? {keyset}
+    """, (target_path,), key='l.id', after=after, limit=limit)
+
+
+@cached_query
 def get_backlinks(target_path: str, space: str = None) -> List[Dict[str, Any]]:
     """Get all files that link to a given file."""
     conn = get_connection(space)
@@ -559,6 +1049,7 @@ def get_backlinks(target_path: str, space: str = None) -> List[Dict[str, Any]]:
     return results
 
 
+@cached_query
 def get_outgoing_links(source_path: str, space: str = None) -> List[Dict[str, Any]]:
     """Get all links from a file."""
     conn = get_connection(space)
@@ -582,6 +1073,7 @@ def get_outgoing_links(source_path: str, space: str = None) -> List[Dict[str, An
     return results
 
 
+@cached_query
 def get_unresolved_links(space: str = None) -> List[Dict[str, Any]]:
     """Get links that point to non-existent files."""
     conn = get_connection(space)
@@ -608,6 +1100,7 @@ def get_unresolved_links(space: str = None) -> List[Dict[str, Any]]:
 # TRADING QUERIES (Module-specific)
 # =============================================================================
 
+@cached_query
 def get_trading_entries(
     days: int = 30,
     space: str = None
@@ -629,32 +1122,26 @@ def get_trading_entries(
     return results
 
 
+@cached_query
 def get_trading_stats(days: int = 30, space: str = None) -> Dict[str, Any]:
-    """Get trading statistics."""
-    conn = get_connection(space)
-    cursor = conn.cursor()
+    """Get trading statistics.
 
-    cursor.execute("""
-        SELECT
-            COUNT(*) as entry_count,
-            AVG(emotional_state) as avg_emotional_state,
-            SUM(pnl_realized) as total_pnl,
-            AVG(imr) as avg_imr,
-            AVG(phs) as avg_phs
-        FROM trading_entries te
-        JOIN journal_entries j ON te.journal_id = j.id
-        WHERE j.date >= date('now', ?)
-    """, (f'-{days} days',))
+    Computed from rollup buckets (sums and counts), not trading_entries.
+    """
+    date_from = _days_ago(days)
+    totals = get_rollup_totals(date_from, space=space)
 
-    row = cursor.fetchone()
-    conn.close()
+    def average(key: str) -> float:
+        count = totals[f'{key}_count']
+        return round(totals[f'{key}_sum'] / count, 1) if count else 0
 
     return {
-        'entry_count': row['entry_count'] or 0,
-        'avg_emotional_state': round(row['avg_emotional_state'] or 0, 1),
-        'total_pnl': row['total_pnl'] or 0,
-        'avg_imr': round(row['avg_imr'] or 0, 1),
-        'avg_phs': round(row['avg_phs'] or 0, 1),
+        'entry_count': totals['trading_count'],
+        'avg_emotional_state': average('emotional'),
+        'total_pnl': totals['pnl_total'],
+        'avg_imr': average('imr'),
+        'avg_phs': average('phs'),
+        'framework_violations': totals['violation_count'],
     }
 
 
@@ -662,6 +1149,7 @@ def get_trading_stats(days: int = 30, space: str = None) -> Dict[str, Any]:
 # DATABASE HEALTH
 # =============================================================================
 
+@cached_query
 def get_database_stats(space: str = None) -> Dict[str, Any]:
     """Get database statistics for health monitoring."""
     conn = get_connection(space)
@@ -705,18 +1193,84 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Query Library CLI")
     parser.add_argument('query_type', choices=[
         'ai-tasks', 'actionable', 'waiting', 'overdue', 'task-stats',
-        'sessions', 'accomplishments',
+        'sessions', 'accomplishments', 'session-summary', 'rollups', 'trading-stats',
+        'habits',
         'agents', 'commands', 'dips',
         'patterns', 'corrections',
-        'search', 'db-stats'
+        'search', 'db-stats',
+        'search-tasks', 'backlinks', 'unresolved', 'orphans',
+        'briefing'
     ])
     parser.add_argument('--space', '-s', choices=list(SPACES.keys()))
     parser.add_argument('--query', '-q', help='Search query')
     parser.add_argument('--days', '-d', type=int, default=7)
+    parser.add_argument('--period', '-p', choices=['day', 'week', 'month'], default='week')
+    parser.add_argument('--path', help='Target file path (backlinks)')
+    parser.add_argument('--limit', '-n', type=int, help='Maximum rows (streamed queries)')
+    parser.add_argument('--after', help='Resume after this key (streamed queries)')
+    parser.add_argument('--date', help='Briefing date (YYYY-MM-DD, default today)')
+    parser.add_argument('--benchmark', type=int, metavar='RUNS',
+                        help='Time briefing against the per-section calls')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
 
     args = parser.parse_args()
 
+    if args.query_type == 'briefing':
+        if args.benchmark:
+            timings = _benchmark_briefing(args.space, args.days, args.benchmark)
+            print(f"Per-section calls: {timings['multi_call']:.2f} ms")
+            print(f"get_briefing:      {timings['get_briefing']:.2f} ms ({timings['speedup']:.1f}x)")
+            sys.exit(0)
+        briefing = get_briefing(args.space, args.date, args.days)
+        if args.json:
+            print(json.dumps(briefing, indent=2, default=str))
+            sys.exit(0)
+        print(f"Briefing for {briefing['date']}")
+        for section in ('overdue', 'actionable', 'waiting', 'ai_tasks'):
+            print(f"\n{section.replace('_', ' ').title()} ({len(briefing[section])}):")
+            for task in briefing[section]:
+                print(f"- [{task['state']}] {task['heading']}")
+        print(f"\nActive projects ({len(briefing['projects'])}):")
+        for project in briefing['projects']:
+            print(f"- {project['name']}: {project['done_tasks'] or 0}/{project['total_tasks']} done")
+        print(f"\nSessions: {len(briefing['sessions'])}, "
+              f"accomplishments: {len(briefing['accomplishments'])} (last {args.days} days)")
+        stats = briefing['task_stats']
+        print(f"Tasks: {stats['total']} total, {stats['ai_delegated']} AI, {stats['overdue']} overdue")
+        sys.exit(0)
+
+    # Streamed queries print rows as they are read (JSON Lines with --json)
+    if args.query_type in ('search-tasks', 'backlinks', 'unresolved', 'orphans'):
+        if args.query_type == 'search-tasks':
+            if not args.query:
+                print("--query required for search-tasks")
+                sys.exit(1)
+            after = int(args.after) if args.after else None
+            rows = iter_search_tasks(args.query, args.space, after=after, limit=args.limit)
+        elif args.query_type == 'backlinks':
+            if not args.path:
+                print("--path required for backlinks")
+                sys.exit(1)
+            after = int(args.after) if args.after else None
+            rows = iter_backlinks(args.path, args.space, after=after, limit=args.limit)
+        elif args.query_type == 'unresolved':
+            rows = iter_unresolved_links(args.space, after=args.after, limit=args.limit)
+        else:
+            rows = iter_orphans(args.space, after=args.after, limit=args.limit)
+
+        for row in rows:
+            if args.json:
+                print(json.dumps(row._asdict(), default=str))
+            elif args.query_type == 'search-tasks':
+                print(f"{row.id}: [{row.state}] {row.heading}")
+            elif args.query_type == 'backlinks':
+                print(f"{row.id}: {row.source_title} ({row.source_path})")
+            elif args.query_type == 'unresolved':
+                print(f"[{row.reference_count}x] {row.target_title}")
+            else:
+                print(f"{row.id}: [{row.space}/{row.type}] {row.title}")
+        sys.exit(0)
+
     result = None
 
     if args.query_type == 'ai-tasks':
@@ -733,6 +1287,14 @@ if __name__ == "__main__":
         result = get_recent_sessions(args.days, args.space)
     elif args.query_type == 'accomplishments':
         result = get_accomplishments(args.days, args.space)
+    elif args.query_type == 'session-summary':
+        result = get_session_summary(args.days, args.space)
+    elif args.query_type == 'rollups':
+        result = get_activity_rollups(args.period, args.days, args.space)
+    elif args.query_type == 'trading-stats':
+        result = get_trading_stats(args.days, args.space)
+    elif args.query_type == 'habits':
+        result = get_habits(args.space)
     elif args.query_type == 'agents':
         result = get_agents(args.space)
     elif args.query_type == 'commands':
@@ -762,6 +1324,9 @@ if __name__ == "__main__":
                     print(f"- {item['title']}")
                 elif 'description' in item:
                     print(f"- {item['description']}")
+                elif 'period_start' in item:
+                    print(f"- {item['period_start']}: {item['session_count']} sessions, "
+                          f"{item['accomplishment_count']} accomplishments")
                 elif 'name' in item:
                     print(f"- {item['name']}: {item.get('description', '')[:60]}")
                 else:
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+Query Daemon (datacore-queryd)
+
+Serves query_library functions over a local Unix socket as JSON-RPC 2.0,
+so agents and commands making many queries (/today, /gtd-daily-start)
+don't each pay for interpreter startup, module imports and opening SQLite.
+
+Key Concepts:
+- One long-running process keeps query_library imported and one SQLite
+  connection per space open across requests
+- Newline-delimited JSON-RPC over QUERYD_SOCKET; a client may send many
+  requests on one connection
+- Requests are served one at a time from a single thread (the warm
+  connections are never shared between threads)
+- The thin client (call()) falls back to calling query_library directly
+  when no daemon is listening, so callers work either way
+
+Protocol:
+    -> {"jsonrpc": "2.0", "id": 1, "method": "get_ai_tasks", "params": {"space": "personal"}}
+    <- {"jsonrpc": "2.0", "id": 1, "result": [...]}
+
+    Methods are the public query_library functions, plus queryd.ping and
+    queryd.shutdown. params may be an object (keyword arguments) or an
+    array (positional arguments).
+
+Usage:
+    python queryd.py --serve                          # Run the daemon
+    python queryd.py --status                         # Is it running?
+    python queryd.py --stop                           # Stop it
+    python queryd.py get_actionable_tasks space=personal limit=5
+
+    from queryd import call
+    tasks = call('get_ai_tasks', space='personal')
+"""
+
+import json
+import os
+import socket
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Same location as zettel_db.DATA_ROOT; not imported so the client stays light
+QUERYD_SOCKET = Path.home() / 'Data' / '.datacore' / 'state' / 'queryd.sock'
+CLIENT_TIMEOUT = 30.0    # seconds to wait for a daemon response
+SERVER_POLL = 0.5        # seconds between shutdown checks while idle
+MAX_REQUEST_BYTES = 1 << 20
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class QueryError(Exception):
+    """Error returned by a query (from the daemon or a direct call)."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+def _request(sock_path: Path, method: str, params: Any, timeout: float) -> Any:
+    """Send one request to the daemon and return its result."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(sock_path))
+        payload = {'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params}
+        sock.sendall(json.dumps(payload).encode() + b'\n')
+
+        buffer = b''
+        while not buffer.endswith(b'\n'):
+            chunk = sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("Daemon closed the connection")
+            buffer += chunk
+
+    response = json.loads(buffer)
+    if 'error' in response:
+        raise QueryError(response['error']['code'], response['error']['message'])
+    return response.get('result')
+
+
+def _materialize(result: Any) -> Any:
+    """Streamed query results (iter_*) as a list of dicts; pass limit= to bound them."""
+    if isinstance(result, types.GeneratorType):
+        return [row._asdict() if hasattr(row, '_asdict') else row for row in result]
+    return result
+
+
+def call_direct(method: str, *args, **kwargs) -> Any:
+    """Run a query_library function in this process."""
+    import query_library
+
+    function = query_methods(query_library).get(method)
+    if function is None:
+        raise QueryError(METHOD_NOT_FOUND, f"Unknown query: {method}")
+    return function(*args, **kwargs)
+
+
+def call(method: str, *args, sock_path: Path = None, timeout: float = CLIENT_TIMEOUT, **kwargs) -> Any:
+    """Run a query via the daemon, or directly if no daemon is running.
+
+    Results from the daemon have been through JSON (non-JSON values such
+    as dates arrive as strings).
+    """
+    if args and kwargs:
+        raise QueryError(INVALID_PARAMS, "Pass positional or keyword arguments, not both")
+
+    path = sock_path or QUERYD_SOCKET
+    if hasattr(socket, 'AF_UNIX') and path.exists():
+        try:
+            return _request(path, method, list(args) if args else kwargs, timeout)
+        except (ConnectionRefusedError, FileNotFoundError):
+            pass  # Stale socket: no daemon behind it
+    return _materialize(call_direct(method, *args, **kwargs))
+
+
+def daemon_running(sock_path: Path = None) -> bool:
+    """Whether a daemon answers on the socket."""
+    path = sock_path or QUERYD_SOCKET
+    if not hasattr(socket, 'AF_UNIX') or not path.exists():
+        return False
+    try:
+        _request(path, 'queryd.ping', {}, timeout=2.0)
+        return True
+    except (OSError, ValueError, QueryError):
+        return False
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+
+def query_methods(module) -> Dict[str, Any]:
+    """Public functions defined in query_library, by name."""
+    return {
+        name: value
+        for name, value in vars(module).items()
+        if callable(value) and not name.startswith('_')
+        and getattr(value, '__module__', None) == module.__name__
+    }
+
+
+class _WarmConnection:
+    """A pooled connection whose close() keeps it open for the next request."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def close(self):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class ConnectionPool:
+    """One open SQLite connection per space (None = root database).
+
+    Each request checks the database file's identity; a connection opened
+    before the file was replaced (rebuild) is reopened on the new file.
+    """
+
+    def __init__(self, connect, db_path):
+        self._connect = connect
+        self._db_path = db_path
+        self._connections: Dict[Optional[str], _WarmConnection] = {}
+        self._file_ids: Dict[Optional[str], tuple] = {}
+
+    def _file_id(self, space: Optional[str]) -> Optional[tuple]:
+        try:
+            stat = os.stat(self._db_path(space))
+        except FileNotFoundError:
+            return None
+        return (stat.st_dev, stat.st_ino)
+
+    def get_connection(self, space: str = None) -> _WarmConnection:
+        file_id = self._file_id(space)
+        if space in self._connections and (file_id is None or self._file_ids[space] != file_id):
+            self._connections.pop(space)._conn.close()
+        if space not in self._connections:
+            self._connections[space] = _WarmConnection(self._connect(space))
+            self._file_ids[space] = self._file_id(space)
+        return self._connections[space]
+
+    def close_all(self):
+        for conn in self._connections.values():
+            conn._conn.close()
+        self._connections.clear()
+        self._file_ids.clear()
+
+
+class QueryServer:
+    """JSON-RPC dispatcher over query_library with warm connections."""
+
+    def __init__(self):
+        import inspect
+        import journal_rollups
+        import org_parser
+        import query_library
+        import zettel_db
+
+        self.pool = ConnectionPool(zettel_db.get_connection, zettel_db.get_db_path)
+        # Route the query modules' connections through the pool
+        for module in (query_library, journal_rollups, org_parser):
+            module.get_connection = self.pool.get_connection
+
+        self.methods = query_methods(query_library)
+        self.signatures = {name: inspect.signature(fn) for name, fn in self.methods.items()}
+        self.started = time.time()
+        self.requests = 0
+        self.stopping = False
+
+    def dispatch(self, method: str, params: Any) -> Any:
+        """Run one method; raises QueryError for protocol errors."""
+        if method == 'queryd.ping':
+            return {
+                'pid': os.getpid(),
+                'uptime': round(time.time() - self.started, 1),
+                'requests': self.requests,
+                'connections': len(self.pool._connections),
+                'cache': self.methods['get_cache_stats'](),
+            }
+        if method == 'queryd.shutdown':
+            self.stopping = True
+            return True
+
+        function = self.methods.get(method)
+        if function is None:
+            raise QueryError(METHOD_NOT_FOUND, f"Unknown query: {method}")
+
+        args, kwargs = (params, {}) if isinstance(params, list) else ([], params or {})
+        if not isinstance(kwargs, dict):
+            raise QueryError(INVALID_PARAMS, "params must be an object or array")
+        try:
+            self.signatures[method].bind(*args, **kwargs)
+        except TypeError as e:
+            raise QueryError(INVALID_PARAMS, str(e))
+
+        return _materialize(function(*args, **kwargs))
+
+    def handle(self, line: bytes) -> Dict[str, Any]:
+        """Turn one request line into a response object."""
+        self.requests += 1
+        request_id = None
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                raise QueryError(PARSE_ERROR, f"Invalid JSON: {e}")
+            if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+                raise QueryError(INVALID_REQUEST, "Expected an object with a method")
+            request_id = request.get('id')
+            result = self.dispatch(request['method'], request.get('params'))
+            return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+        except QueryError as e:
+            return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': e.code, 'message': str(e)}}
+        except Exception as e:
+            return {'jsonrpc': '2.0', 'id': request_id,
+                    'error': {'code': INTERNAL_ERROR, 'message': f"{type(e).__name__}: {e}"}}
+
+
+def _bind_socket(sock_path: Path) -> socket.socket:
+    """Bind the daemon socket, replacing a stale one; fails if a daemon is live."""
+    sock_path.parent.mkdir(parents=True, exist_ok=True)
+    if sock_path.exists():
+        if daemon_running(sock_path):
+            raise RuntimeError(f"Query daemon already running ({sock_path})")
+        sock_path.unlink()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(sock_path))
+    os.chmod(sock_path, 0o600)
+    sock.listen(16)
+    sock.setblocking(False)
+    return sock
+
+
+def serve(sock_path: Path = None, verbose: bool = False) -> Dict[str, int]:
+    """Serve queries until SIGINT/SIGTERM or queryd.shutdown.
+
+    Returns dict with counts over the daemon's lifetime.
+    """
+    import selectors
+    import signal
+    import threading
+
+    path = sock_path or QUERYD_SOCKET
+    server = QueryServer()
+    listener = _bind_socket(path)
+    selector = selectors.DefaultSelector()
+    selector.register(listener, selectors.EVENT_READ)
+    buffers: Dict[socket.socket, bytes] = {}
+
+    def request_stop(signum, frame):
+        server.stopping = True
+
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+    def drop(conn):
+        selector.unregister(conn)
+        buffers.pop(conn, None)
+        conn.close()
+
+    try:
+        while not server.stopping:
+            for key, _ in selector.select(timeout=SERVER_POLL):
+                if key.fileobj is listener:
+                    try:
+                        conn, _ = listener.accept()
+                    except BlockingIOError:
+                        continue
+                    conn.settimeout(CLIENT_TIMEOUT)  # bounds sendall to a stuck client
+                    selector.register(conn, selectors.EVENT_READ)
+                    buffers[conn] = b''
+                    continue
+
+                conn = key.fileobj
+                try:
+                    chunk = conn.recv(65536)
+                except OSError:
+                    chunk = b''
+                if not chunk:
+                    drop(conn)
+                    continue
+
+                buffers[conn] += chunk
+                if len(buffers[conn]) > MAX_REQUEST_BYTES:
+                    drop(conn)
+                    continue
+
+                while b'\n' in buffers.get(conn, b''):
+                    line, buffers[conn] = buffers[conn].split(b'\n', 1)
+                    if not line.strip():
+                        continue
+                    started = time.monotonic()
+                    response = server.handle(line)
+                    try:
+                        conn.sendall(json.dumps(response, default=str).encode() + b'\n')
+                    except OSError:
+                        drop(conn)
+                        break
+                    if verbose:
+                        status = 'error' if 'error' in response else 'ok'
+                        print(f"  {line[:80].decode(errors='replace')} -> {status} "
+                              f"({(time.monotonic() - started) * 1000:.1f}ms)")
+    finally:
+        for conn in list(buffers):
+            drop(conn)
+        selector.close()
+        listener.close()
+        path.unlink(missing_ok=True)
+        server.pool.close_all()
+
+    return {'requests': server.requests}
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _parse_value(text: str) -> Any:
+    """CLI argument value: JSON if it parses (numbers, true, null), else a string."""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='datacore-queryd', description="Query daemon for query_library")
+    parser.add_argument('method', nargs='?', help='Query to run (a query_library function)')
+    parser.add_argument('params', nargs='*', metavar='key=value', help='Query arguments')
+    parser.add_argument('--serve', action='store_true', help='Run the daemon')
+    parser.add_argument('--status', action='store_true', help='Show whether the daemon is running')
+    parser.add_argument('--stop', action='store_true', help='Stop the running daemon')
+    parser.add_argument('--direct', action='store_true', help='Run the query in this process')
+    parser.add_argument('--socket', type=Path, default=QUERYD_SOCKET, help='Socket path')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Log each request (--serve)')
+
+    args = parser.parse_args()
+
+    if args.serve:
+        print(f"Query daemon listening on {args.socket} (Ctrl-C to stop)")
+        try:
+            totals = serve(args.socket, verbose=args.verbose)
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"\nQuery daemon stopped after {totals['requests']} requests")
+
+    elif args.status:
+        if daemon_running(args.socket):
+            info = _request(args.socket, 'queryd.ping', {}, timeout=2.0)
+            print(f"Running (pid {info['pid']}, up {info['uptime']}s, {info['requests']} requests)")
+            cache = info['cache']
+            print(f"Cache: {cache['entries']} results, {cache['hits']} hits / {cache['misses']} misses")
+        else:
+            print("Not running")
+            sys.exit(1)
+
+    elif args.stop:
+        if not daemon_running(args.socket):
+            print("Not running")
+            sys.exit(1)
+        _request(args.socket, 'queryd.shutdown', {}, timeout=2.0)
+        print("Stopping")
+
+    elif args.method:
+        kwargs = {}
+        for item in args.params:
+            key, sep, value = item.partition('=')
+            if not sep:
+                parser.error(f"Expected key=value, got {item!r}")
+            kwargs[key] = _parse_value(value)
+        try:
+            if args.direct:
+                result = call_direct(args.method, **kwargs)
+            else:
+                result = call(args.method, sock_path=args.socket, **kwargs)
+        except QueryError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        except Exception as e:  # Direct mode raises the query's own errors
+            print(f"Error: {type(e).__name__}: {e}")
+            sys.exit(1)
+        print(json.dumps(result, indent=2, default=str))
+
+    else:
+        parser.print_help()
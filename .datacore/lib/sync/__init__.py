@@ -28,6 +28,7 @@ from .conflict import (
     ConflictDetector,
     ConflictResolver,
     ConflictQueue,
+    ThreeWayResult,
     load_conflict_config,
 )
 
@@ -51,5 +52,6 @@ __all__ = [
     "ConflictDetector",
     "ConflictResolver",
     "ConflictQueue",
+    "ThreeWayResult",
     "load_conflict_config",
 ]
@@ -80,6 +80,9 @@ try:
 except ImportError:
     pass  # Calendar adapter not available (missing dependencies)
 
+from .fixture import FixtureAdapter
+register_adapter("fixture", FixtureAdapter)  # Offline replay (tests, benchmarks)
+
 # Future adapters:
 # from .asana import AsanaAdapter
 # from .linear import LinearAdapter
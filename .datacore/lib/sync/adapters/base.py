@@ -17,7 +17,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class TaskState(Enum):
@@ -154,6 +154,7 @@ class ExternalTask:
     labels: List[str] = field(default_factory=list)
     assignee: Optional[str] = None
     due_date: Optional[datetime] = None
+    milestone: Optional[str] = None
 
     # Raw data for adapter-specific handling
     raw: Dict[str, Any] = field(default_factory=dict)
@@ -248,6 +249,28 @@ class TaskSyncAdapter(ABC):
         """
         pass
 
+    def pull_since_cursor(self, cursor: Optional[str]) -> Tuple[List[TaskChange], Optional[str]]:
+        """
+        Fetch changes after a cursor returned by a previous pull.
+
+        The cursor is opaque to the engine, which persists it once the
+        changes are applied. The default cursor is the ISO timestamp of the
+        newest change seen; adapters with native cursors override this.
+
+        Args:
+            cursor: Cursor from the last applied pull, or None for a full pull.
+
+        Returns:
+            Tuple of (changes, cursor to resume from next time).
+        """
+        since = datetime.fromisoformat(cursor) if cursor else None
+        changes = self.pull_changes(since)
+
+        newest = max((change.timestamp for change in changes), default=None)
+        if newest is None or (since is not None and newest <= since):
+            return changes, cursor
+        return changes, newest.isoformat()
+
     @abstractmethod
     def push_changes(self, changes: List[TaskChange]) -> SyncResult:
         """
@@ -316,6 +339,14 @@ class TaskSyncAdapter(ABC):
         """
         pass
 
+    def external_id_for(self, task: ExternalTask) -> str:
+        """
+        Full external ID for a pulled task (stored as EXTERNAL_ID in org).
+
+        Override in subclasses whose IDs carry more than the task ID.
+        """
+        return f"{self.name}:{task.id}"
+
     def map_state_to_external(self, state: TaskState) -> str:
         """
         Map org-mode state to external system state.
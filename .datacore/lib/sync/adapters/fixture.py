@@ -0,0 +1,254 @@
+"""
+Fixture Adapter for offline sync runs.
+
+DIP-0010: External Sync Architecture
+
+Replays a recorded or synthetic stream of external changes instead of
+calling a service, so the sync pipeline can be tested and benchmarked
+without GitHub or Google. Pushes are kept in memory.
+
+Configuration (sync.adapters.fixture, or the dict passed in):
+
+    path: recorded stream (JSON written by record_changes())
+    synthetic:            # used when no path is given
+      kind: issues        # or "events" (timed items with due_date)
+      count: 1000
+      seed: 0
+      closed_ratio: 0.1
+    page_size: 0          # changes per pull (0 = the whole stream)
+    latency: 0.0          # seconds per pull/push call
+    item_latency: 0.0     # additional seconds per change returned/pushed
+
+Usage:
+    from sync.adapters.fixture import FixtureAdapter, synthetic_issues
+
+    adapter = FixtureAdapter({"synthetic": {"count": 10000}})
+    changes, cursor = adapter.pull_since_cursor(None)
+"""
+
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base import (
+    ExternalTask,
+    ExternalTaskRef,
+    OrgTask,
+    TaskChange,
+    SyncResult,
+    TaskSyncAdapter,
+    ChangeType,
+)
+
+SYNTHETIC_LABELS = ["bug", "docs", "ai-task", "priority-high", "priority-low", "research"]
+SYNTHETIC_ASSIGNEES = ["alice", "bob", "carol", None, None]
+SYNTHETIC_START = datetime(2025, 1, 1, 9, 0)
+
+
+def synthetic_issues(
+    count: int,
+    seed: int = 0,
+    closed_ratio: float = 0.1,
+    start: datetime = SYNTHETIC_START
+) -> List[ExternalTask]:
+    """
+    Generate issue-like external tasks with deterministic content.
+
+    Issues are numbered 1..count with increasing updated_at, a mix of
+    labels and assignees, and `closed_ratio` of them closed.
+    """
+    rng = random.Random(seed)
+    tasks = []
+    for number in range(1, count + 1):
+        created = start + timedelta(minutes=number)
+        tasks.append(ExternalTask(
+            id=str(number),
+            title=f"Synthetic issue {number}",
+            state="closed" if rng.random() < closed_ratio else "open",
+            url=f"https://example.invalid/issues/{number}",
+            created_at=created,
+            updated_at=created + timedelta(hours=rng.randint(0, 72)),
+            body=f"Generated issue {number}",
+            labels=rng.sample(SYNTHETIC_LABELS, rng.randint(0, 2)),
+            assignee=rng.choice(SYNTHETIC_ASSIGNEES),
+        ))
+    return tasks
+
+
+def synthetic_events(
+    count: int,
+    seed: int = 0,
+    start: datetime = SYNTHETIC_START
+) -> List[ExternalTask]:
+    """Generate calendar-like external items, each with a start time as due_date."""
+    rng = random.Random(seed)
+    tasks = []
+    for number in range(1, count + 1):
+        begins = start + timedelta(days=number // 8, hours=8 + number % 8)
+        tasks.append(ExternalTask(
+            id=f"event-{number}",
+            title=f"Synthetic event {number}",
+            state="cancelled" if rng.random() < 0.05 else "confirmed",
+            url=f"https://example.invalid/events/{number}",
+            created_at=begins - timedelta(days=7),
+            updated_at=begins - timedelta(days=rng.randint(1, 6)),
+            due_date=begins,
+        ))
+    return tasks
+
+
+def _task_to_dict(task: ExternalTask) -> Dict[str, Any]:
+    """JSON-ready dict of an external task."""
+    data = dict(task.__dict__)
+    for key in ("created_at", "updated_at", "due_date"):
+        if data.get(key):
+            data[key] = data[key].isoformat()
+    return data
+
+
+def _task_from_dict(data: Dict[str, Any]) -> ExternalTask:
+    """External task from a recorded dict."""
+    data = dict(data)
+    for key in ("created_at", "updated_at", "due_date"):
+        if data.get(key):
+            data[key] = datetime.fromisoformat(data[key])
+    return ExternalTask(**data)
+
+
+def record_changes(changes: List[TaskChange], path: Path):
+    """
+    Record pulled changes (e.g. from a real adapter) for later replay.
+
+    Only changes carrying an external task are recorded.
+    """
+    stream = [
+        {
+            "change_type": change.change_type.value,
+            "timestamp": change.timestamp.isoformat(),
+            "task": _task_to_dict(change.external_task),
+        }
+        for change in changes
+        if change.external_task is not None
+    ]
+    Path(path).write_text(json.dumps({"changes": stream}, indent=2, default=str))
+
+
+def load_changes(path: Path) -> List[TaskChange]:
+    """Load a stream written by record_changes()."""
+    data = json.loads(Path(path).read_text())
+    return [
+        TaskChange(
+            change_type=ChangeType(entry.get("change_type", ChangeType.UPDATED.value)),
+            external_task=_task_from_dict(entry["task"]),
+            timestamp=datetime.fromisoformat(entry["timestamp"]) if entry.get("timestamp") else datetime.now(),
+        )
+        for entry in data.get("changes", [])
+    ]
+
+
+class FixtureAdapter(TaskSyncAdapter):
+    """
+    Adapter replaying a fixed stream of changes.
+
+    The cursor is the position in the stream, so resumed pulls continue
+    where the last applied pull ended and a fully consumed stream returns
+    nothing more. Pushed changes are appended to `pushed`.
+    """
+
+    def __init__(self, config: Dict = None, changes: Optional[List[TaskChange]] = None):
+        """
+        Initialize the adapter.
+
+        Args:
+            config: Adapter settings (see module docstring)
+            changes: Stream to replay; overrides path/synthetic config
+        """
+        self.config = config or {}
+        self.latency = float(self.config.get("latency", 0))
+        self.item_latency = float(self.config.get("item_latency", 0))
+        self.page_size = int(self.config.get("page_size", 0))
+        self.pull_errors: List[str] = []
+        self.pushed: List[TaskChange] = []
+        self._created: Dict[str, OrgTask] = {}
+
+        if changes is not None:
+            self.changes = list(changes)
+        elif self.config.get("path"):
+            self.changes = load_changes(Path(self.config["path"]).expanduser())
+        else:
+            self.changes = self._synthetic_changes(self.config.get("synthetic", {}))
+
+    @staticmethod
+    def _synthetic_changes(settings: Dict[str, Any]) -> List[TaskChange]:
+        """Build the configured synthetic stream."""
+        count = int(settings.get("count", 0))
+        seed = int(settings.get("seed", 0))
+        if settings.get("kind", "issues") == "events":
+            tasks = synthetic_events(count, seed)
+        else:
+            tasks = synthetic_issues(count, seed, float(settings.get("closed_ratio", 0.1)))
+        return [
+            TaskChange(change_type=ChangeType.UPDATED, external_task=task, timestamp=task.updated_at)
+            for task in tasks
+        ]
+
+    @property
+    def name(self) -> str:
+        return "fixture"
+
+    def _wait(self, items: int):
+        """Simulate service latency."""
+        delay = self.latency + self.item_latency * items
+        if delay > 0:
+            time.sleep(delay)
+
+    def is_configured(self) -> bool:
+        return True
+
+    def test_connection(self) -> Tuple[bool, str]:
+        return True, f"Replaying {len(self.changes)} changes"
+
+    def pull_changes(self, since: Optional[datetime] = None) -> List[TaskChange]:
+        """Changes in the stream newer than `since`."""
+        changes = [c for c in self.changes if since is None or c.timestamp > since]
+        self._wait(len(changes))
+        return changes
+
+    def pull_since_cursor(self, cursor: Optional[str]) -> Tuple[List[TaskChange], Optional[str]]:
+        """Next page of the stream after position `cursor`."""
+        start = int(cursor) if cursor else 0
+        end = len(self.changes) if self.page_size <= 0 else min(len(self.changes), start + self.page_size)
+        changes = self.changes[start:end]
+        self._wait(len(changes))
+        return changes, str(end)
+
+    def push_changes(self, changes: List[TaskChange]) -> SyncResult:
+        """Accept every change."""
+        self._wait(len(changes))
+        self.pushed.extend(changes)
+        return SyncResult(
+            success=True,
+            items_processed=len(changes),
+            items_updated=len(changes),
+            changes=list(changes),
+        )
+
+    def create_task(self, task: OrgTask) -> Optional[ExternalTaskRef]:
+        external_id = f"{self.name}:created-{len(self._created) + 1}"
+        self._created[external_id] = task
+        return ExternalTaskRef.from_external_id(external_id)
+
+    def update_task(self, ref: ExternalTaskRef, task: OrgTask) -> bool:
+        return True
+
+    def close_task(self, ref: ExternalTaskRef) -> bool:
+        return True
+
+    def find_matching_task(self, task: OrgTask) -> Optional[ExternalTaskRef]:
+        for external_id, created in self._created.items():
+            if created.title == task.title:
+                return ExternalTaskRef.from_external_id(external_id)
+        return None
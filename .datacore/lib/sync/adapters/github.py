@@ -11,12 +11,15 @@ import json
 import os
 import subprocess
 import re
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+from ..issue_index import IssueIndex, DEFAULT_FUZZY_THRESHOLD
 from .base import (
     TaskSyncAdapter,
     OrgTask,
@@ -29,6 +32,22 @@ from .base import (
     ChangeType,
 )
 
+ISSUE_FIELDS = "number,title,state,url,createdAt,updatedAt,body,labels,assignees,milestone"
+
+# GraphQL selection matching ISSUE_FIELDS
+GRAPHQL_ISSUE_NODE = """
+        number title state url createdAt updatedAt body
+        labels(first: 20) { nodes { name } }
+        assignees(first: 5) { nodes { login } }
+        milestone { title }
+"""
+
+GRAPHQL_PAGE_SIZE = 100
+GRAPHQL_REPOS_PER_QUERY = 10
+
+# Seconds before find_matching_task retries refreshing a repo that failed
+REFRESH_RETRY_INTERVAL = 300
+
 
 def load_label_mapping_from_registry() -> Dict[str, str]:
     """Load label mapping from tags.yaml registry."""
@@ -58,6 +77,13 @@ class GitHubAdapter(TaskSyncAdapter):
               repos:
                 - owner: datacore-one
                   repo: datacore
+              # Pull via GraphQL (default) or "rest" (gh issue list)
+              api: graphql
+              # Repos per GraphQL request, and requests in parallel
+              repos_per_query: 10
+              max_concurrency: 4
+              # Fuzzy title similarity (0-1) for matching existing issues
+              match_threshold: 0.9
               # Label mappings loaded from tags.yaml registry
               # Override specific mappings here if needed:
               # label_mapping:
@@ -73,6 +99,20 @@ class GitHubAdapter(TaskSyncAdapter):
         """
         self.config = config
         self.repos = config.get("repos", [])
+        self.api = config.get("api", "graphql")
+        self.repos_per_query = max(1, int(config.get("repos_per_query", GRAPHQL_REPOS_PER_QUERY)))
+        self.max_concurrency = max(1, int(config.get("max_concurrency", 4)))
+
+        self.match_threshold = float(config.get("match_threshold", DEFAULT_FUZZY_THRESHOLD))
+
+        # Repos that failed during the last pull_changes()
+        self.pull_errors: List[str] = []
+        self._failed_repos: set = set()
+
+        # Local issue cache for find_matching_task (opened on first use)
+        self._issue_index: Optional[IssueIndex] = None
+        # Repo -> monotonic time its last index refresh failed
+        self._refresh_failed_at: Dict[str, float] = {}
 
         # Load label mapping: config overrides > tags.yaml registry > defaults
         default_mapping = {
@@ -107,6 +147,17 @@ class GitHubAdapter(TaskSyncAdapter):
     def name(self) -> str:
         return "github"
 
+    @property
+    def issue_index(self) -> IssueIndex:
+        """Local issue index, refreshed by pulls."""
+        if self._issue_index is None:
+            self._issue_index = IssueIndex()
+        return self._issue_index
+
+    @issue_index.setter
+    def issue_index(self, index: IssueIndex):
+        self._issue_index = index
+
     def is_configured(self) -> bool:
         """Check if adapter is properly configured."""
         return bool(self.repos)
@@ -161,6 +212,8 @@ class GitHubAdapter(TaskSyncAdapter):
         assignees = issue_data.get("assignees", [])
         assignee = assignees[0]["login"] if assignees else None
 
+        milestone = (issue_data.get("milestone") or {}).get("title")
+
         return ExternalTask(
             id=str(issue_data["number"]),
             title=issue_data["title"],
@@ -171,6 +224,7 @@ class GitHubAdapter(TaskSyncAdapter):
             body=issue_data.get("body", "") or "",
             labels=labels,
             assignee=assignee,
+            milestone=milestone,
             raw={"owner": owner, "repo": repo, **issue_data}
         )
 
@@ -178,6 +232,10 @@ class GitHubAdapter(TaskSyncAdapter):
         """Create external ID in format 'github:owner/repo#number'."""
         return f"github:{owner}/{repo}#{number}"
 
+    def external_id_for(self, task: ExternalTask) -> str:
+        """External ID of a pulled issue, from the repo it was pulled from."""
+        return self._make_external_id(task.raw["owner"], task.raw["repo"], int(task.id))
+
     def _parse_external_id(self, external_id: str) -> tuple[str, str, int] | None:
         """Parse external ID to (owner, repo, number)."""
         match = re.match(r"github:([^/]+)/([^#]+)#(\d+)", external_id)
@@ -185,51 +243,317 @@ class GitHubAdapter(TaskSyncAdapter):
             return match.group(1), match.group(2), int(match.group(3))
         return None
 
-    def pull_changes(self, since: Optional[datetime] = None) -> List[TaskChange]:
-        """Fetch issues from configured repos."""
+    def _pull_repo(self, repo_config: Dict[str, Any], since: Optional[datetime]) -> List[TaskChange]:
+        """Fetch open and closed issues for one repo via `gh issue list` (api: rest)."""
         changes = []
+        owner = repo_config["owner"]
+        repo = repo_config["repo"]
 
-        for repo_config in self.repos:
-            owner = repo_config["owner"]
-            repo = repo_config["repo"]
+        # Build query - get open and recently closed issues
+        args = [
+            "issue", "list",
+            "-R", f"{owner}/{repo}",
+            "--json", ISSUE_FIELDS,
+            "--limit", "100"
+        ]
 
-            # Build query - get open and recently closed issues
-            args = [
-                "issue", "list",
-                "-R", f"{owner}/{repo}",
-                "--json", "number,title,state,url,createdAt,updatedAt,body,labels,assignees",
-                "--limit", "100"
+        # Get open issues
+        success, stdout, stderr = self._run_gh(args + ["--state", "open"])
+        if not success:
+            self._record_pull_error(owner, repo, stderr.strip() or "gh failed")
+            return changes
+        if stdout:
+            issues = json.loads(stdout)
+            for issue_data in issues:
+                task = self._parse_issue(issue_data, owner, repo)
+                if since is None or task.updated_at > since:
+                    changes.append(TaskChange(
+                        change_type=ChangeType.UPDATED,
+                        external_task=task,
+                        timestamp=task.updated_at
+                    ))
+
+        # Get recently closed issues
+        success, stdout, stderr = self._run_gh(args + ["--state", "closed"])
+        if not success:
+            self._record_pull_error(owner, repo, stderr.strip() or "gh failed")
+        elif stdout:
+            issues = json.loads(stdout)
+            for issue_data in issues:
+                task = self._parse_issue(issue_data, owner, repo)
+                if since is None or task.updated_at > since:
+                    changes.append(TaskChange(
+                        change_type=ChangeType.CLOSED,
+                        external_task=task,
+                        timestamp=task.updated_at,
+                        new_state="closed"
+                    ))
+
+        return changes
+
+    def _record_pull_error(self, owner: str, repo: str, message: str):
+        """Note a repo that failed to pull."""
+        self.pull_errors.append(f"{owner}/{repo}: {message}")
+        self._failed_repos.add(f"{owner}/{repo}")
+
+    def _issue_change(self, task: ExternalTask) -> TaskChange:
+        """Wrap a pulled issue as UPDATED (open) or CLOSED."""
+        if task.state == "closed":
+            return TaskChange(
+                change_type=ChangeType.CLOSED,
+                external_task=task,
+                timestamp=task.updated_at,
+                new_state="closed"
+            )
+        return TaskChange(
+            change_type=ChangeType.UPDATED,
+            external_task=task,
+            timestamp=task.updated_at
+        )
+
+    def _build_issues_query(
+        self,
+        repos: List[Dict[str, Any]],
+        cursors: Dict[int, Optional[str]],
+        since: Optional[str]
+    ) -> str:
+        """
+        Build one GraphQL query covering several repos.
+
+        Each repo is aliased r<index>; `cursors` maps index to the page
+        cursor to resume from (None for the first page).
+        """
+        issue_args = [
+            f"first: {GRAPHQL_PAGE_SIZE}",
+            "orderBy: {field: UPDATED_AT, direction: ASC}",
+        ]
+        if since:
+            issue_args.append(f"filterBy: {{since: {json.dumps(since)}}}")
+
+        parts = []
+        for index, cursor in cursors.items():
+            repo_config = repos[index]
+            args = list(issue_args)
+            if cursor:
+                args.append(f"after: {json.dumps(cursor)}")
+            parts.append(
+                f"  r{index}: repository(owner: {json.dumps(repo_config['owner'])}, "
+                f"name: {json.dumps(repo_config['repo'])}) {{\n"
+                f"    issues({', '.join(args)}) {{\n"
+                f"      pageInfo {{ hasNextPage endCursor }}\n"
+                f"      nodes {{{GRAPHQL_ISSUE_NODE}      }}\n"
+                f"    }}\n"
+                f"  }}"
+            )
+
+        return "query {\n" + "\n".join(parts) + "\n}"
+
+    def _graphql_node_to_issue(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a GraphQL issue node to the gh --json shape."""
+        return {
+            **node,
+            "labels": (node.get("labels") or {}).get("nodes", []),
+            "assignees": (node.get("assignees") or {}).get("nodes", []),
+        }
+
+    def _pull_repos_graphql(
+        self,
+        repos: List[Dict[str, Any]],
+        since: Optional[datetime]
+    ) -> List[TaskChange]:
+        """
+        Fetch issues for a batch of repos with paginated GraphQL queries.
+
+        All repos share each request; repos drop out of later requests as
+        their pages run out. With `since`, filterBy limits the response to
+        issues updated at or after it, so unchanged issues never cross the
+        wire.
+        """
+        since_utc = None
+        if since is not None:
+            since_utc = since.astimezone(timezone.utc)
+        since_arg = since_utc.strftime("%Y-%m-%dT%H:%M:%SZ") if since_utc else None
+
+        changes_by_repo: Dict[int, List[TaskChange]] = {i: [] for i in range(len(repos))}
+        cursors: Dict[int, Optional[str]] = {i: None for i in range(len(repos))}
+
+        while cursors:
+            query = self._build_issues_query(repos, cursors, since_arg)
+            success, stdout, stderr = self._run_gh(["api", "graphql", "-f", f"query={query}"], timeout=60)
+
+            if not success or not stdout:
+                for index in cursors:
+                    repo_config = repos[index]
+                    self._record_pull_error(
+                        repo_config["owner"], repo_config["repo"], stderr.strip() or "gh api failed"
+                    )
+                break
+
+            response = json.loads(stdout)
+            data = response.get("data") or {}
+            errors = response.get("errors") or []
+
+            next_cursors: Dict[int, Optional[str]] = {}
+            for index in cursors:
+                repo_config = repos[index]
+                owner, repo = repo_config["owner"], repo_config["repo"]
+                repository = data.get(f"r{index}")
+
+                if not repository:
+                    messages = [
+                        e.get("message", "") for e in errors
+                        if f"r{index}" in (e.get("path") or [])
+                    ]
+                    self._record_pull_error(owner, repo, "; ".join(messages) or "not found")
+                    continue
+
+                issues = repository["issues"]
+                for node in issues.get("nodes") or []:
+                    task = self._parse_issue(self._graphql_node_to_issue(node), owner, repo)
+                    # filterBy.since is inclusive and second-granular
+                    if since_utc is not None and task.updated_at <= since_utc:
+                        continue
+                    changes_by_repo[index].append(self._issue_change(task))
+
+                page_info = issues.get("pageInfo") or {}
+                if page_info.get("hasNextPage"):
+                    next_cursors[index] = page_info.get("endCursor")
+
+            cursors = next_cursors
+
+        changes = []
+        for index in range(len(repos)):
+            changes.extend(changes_by_repo[index])
+        return changes
+
+    def pull_changes(self, since: Optional[datetime] = None) -> List[TaskChange]:
+        """
+        Fetch issues from configured repos.
+
+        With the GraphQL API (default) repos are batched repos_per_query
+        to a request and paged until exhausted; only issues updated since
+        `since` are requested. Batches (or, with api: rest, single repos)
+        run concurrently up to max_concurrency gh processes. A repo that
+        fails is recorded in self.pull_errors and skipped; changes from the
+        other repos are still returned, in repo order. Pulled issues are
+        written to the local issue index.
+        """
+        self.pull_errors = []
+        self._failed_repos = set()
+        changes = self._pull_repos(self.repos, since)
+        self._index_pulled(self.repos, changes, full=since is None)
+        return changes
+
+    def _pull_repos(self, repo_configs: List[Dict[str, Any]], since: Optional[datetime]) -> List[TaskChange]:
+        """Pull a set of repos, batched and concurrent per the api setting."""
+        if self.api == "rest":
+            batches = [[repo_config] for repo_config in repo_configs]
+        else:
+            batches = [
+                repo_configs[i:i + self.repos_per_query]
+                for i in range(0, len(repo_configs), self.repos_per_query)
             ]
 
-            # Get open issues
-            success, stdout, stderr = self._run_gh(args + ["--state", "open"])
-            if success and stdout:
-                issues = json.loads(stdout)
-                for issue_data in issues:
-                    task = self._parse_issue(issue_data, owner, repo)
-                    if since is None or task.updated_at > since:
-                        changes.append(TaskChange(
-                            change_type=ChangeType.UPDATED,
-                            external_task=task,
-                            timestamp=task.updated_at
-                        ))
-
-            # Get recently closed issues
-            success, stdout, stderr = self._run_gh(args + ["--state", "closed"])
-            if success and stdout:
-                issues = json.loads(stdout)
-                for issue_data in issues:
-                    task = self._parse_issue(issue_data, owner, repo)
-                    if since is None or task.updated_at > since:
-                        changes.append(TaskChange(
-                            change_type=ChangeType.CLOSED,
-                            external_task=task,
-                            timestamp=task.updated_at,
-                            new_state="closed"
-                        ))
+        def pull_batch(repos: List[Dict[str, Any]]) -> List[TaskChange]:
+            try:
+                if self.api == "rest":
+                    return self._pull_repo(repos[0], since)
+                return self._pull_repos_graphql(repos, since)
+            except Exception as e:
+                for repo_config in repos:
+                    self._record_pull_error(repo_config.get("owner"), repo_config.get("repo"), str(e))
+                return []
+
+        if len(batches) <= 1:
+            results = [pull_batch(batch) for batch in batches]
+        else:
+            workers = min(self.max_concurrency, len(batches))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gh-pull") as executor:
+                results = list(executor.map(pull_batch, batches))
 
+        changes = []
+        for batch_changes in results:
+            changes.extend(batch_changes)
         return changes
 
+    def _index_pulled(self, repo_configs: List[Dict[str, Any]], changes: List[TaskChange], full: bool):
+        """Write pulled issues to the issue index.
+
+        After a full pull (no `since`), repos that pulled cleanly are
+        marked refreshed so find_matching_task trusts the index for them.
+        """
+        issues = []
+        for change in changes:
+            task = change.external_task
+            owner, repo = task.raw.get("owner"), task.raw.get("repo")
+            issues.append({
+                "external_id": self._make_external_id(owner, repo, task.id),
+                "scope": f"{owner}/{repo}",
+                "title": task.title,
+                "state": task.state,
+                "updated_at": task.updated_at,
+                "url": task.url,
+            })
+        self.issue_index.upsert_many(self.name, issues)
+
+        if full:
+            scopes = [f"{r['owner']}/{r['repo']}" for r in repo_configs]
+            self.issue_index.mark_refreshed(
+                self.name, [scope for scope in scopes if scope not in self._failed_repos]
+            )
+
+    def refresh_issue_index(self, repo_configs: Optional[List[Dict[str, Any]]] = None):
+        """Fully pull repos (default: all configured) into the issue index."""
+        repo_configs = self.repos if repo_configs is None else repo_configs
+        self._failed_repos = set()
+        changes = self._pull_repos(repo_configs, None)
+        self._index_pulled(repo_configs, changes, full=True)
+
+    def pull_since_cursor(self, cursor: Optional[str]) -> Tuple[List[TaskChange], Optional[str]]:
+        """
+        Fetch changes after a per-repo cursor.
+
+        The cursor is a JSON object of "owner/repo" to the newest issue
+        updatedAt seen there. A repo that fails keeps its old position, so
+        its window is pulled again next time rather than skipped; newly
+        configured repos start with a full pull.
+        """
+        previous = json.loads(cursor) if cursor else {}
+        self.pull_errors = []
+        self._failed_repos = set()
+
+        # Repos resuming from the same point share requests
+        groups: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        for repo_config in self.repos:
+            scope = f"{repo_config['owner']}/{repo_config['repo']}"
+            groups.setdefault(previous.get(scope), []).append(repo_config)
+
+        changes = []
+        for since_iso, repo_configs in groups.items():
+            since = datetime.fromisoformat(since_iso) if since_iso else None
+            group_changes = self._pull_repos(repo_configs, since)
+            self._index_pulled(repo_configs, group_changes, full=since is None)
+            changes.extend(group_changes)
+
+        positions = {
+            scope: datetime.fromisoformat(since_iso)
+            for scope, since_iso in previous.items()
+            if any(f"{r['owner']}/{r['repo']}" == scope for r in self.repos)
+        }
+        for change in changes:
+            task = change.external_task
+            scope = f"{task.raw.get('owner')}/{task.raw.get('repo')}"
+            if scope in self._failed_repos:
+                continue
+            if scope not in positions or task.updated_at > positions[scope]:
+                positions[scope] = task.updated_at
+
+        if not positions:
+            return changes, None
+        return changes, json.dumps(
+            {scope: position.isoformat() for scope, position in sorted(positions.items())}
+        )
+
     def push_changes(self, changes: List[TaskChange]) -> SyncResult:
         """Push org-mode changes to GitHub."""
         result = SyncResult(success=True)
@@ -320,6 +644,14 @@ class GitHubAdapter(TaskSyncAdapter):
             if match:
                 number = int(match.group(1))
                 external_id = self._make_external_id(owner, repo, number)
+                self.issue_index.upsert_many(self.name, [{
+                    "external_id": external_id,
+                    "scope": f"{owner}/{repo}",
+                    "title": task.title,
+                    "state": "open",
+                    "updated_at": datetime.now(timezone.utc),
+                    "url": url,
+                }])
                 return ExternalTaskRef(
                     adapter="github",
                     external_id=external_id,
@@ -385,6 +717,8 @@ class GitHubAdapter(TaskSyncAdapter):
             "-R", f"{owner}/{repo}"
         ])
 
+        if success:
+            self.issue_index.set_state(ref.external_id, "closed")
         return success
 
     def _reopen_task(self, ref: ExternalTaskRef) -> bool:
@@ -400,40 +734,53 @@ class GitHubAdapter(TaskSyncAdapter):
             "-R", f"{owner}/{repo}"
         ])
 
+        if success:
+            self.issue_index.set_state(ref.external_id, "open")
         return success
 
     def find_matching_task(self, task: OrgTask) -> Optional[ExternalTaskRef]:
-        """Search for existing issue matching org task."""
+        """
+        Find an existing open issue matching an org task.
+
+        Looks the title up in the local issue index: an exact normalized
+        title first, then the closest title scoring at least
+        match_threshold. Repos that have never been pulled are fully
+        pulled into the index once, in one batched request. A repo whose
+        refresh fails is not retried for REFRESH_RETRY_INTERVAL seconds;
+        until then it is matched against whatever the index holds.
+        """
         if not self.repos:
             return None
 
-        # Search by title in each repo
-        search_title = task.title.replace('"', '\\"')
-
-        for repo_config in self.repos:
-            owner = repo_config["owner"]
-            repo = repo_config["repo"]
-
-            # Search issues
-            success, stdout, _ = self._run_gh([
-                "issue", "list",
-                "-R", f"{owner}/{repo}",
-                "--search", f'"{search_title}" in:title',
-                "--json", "number,title,url",
-                "--limit", "5"
+        scopes = [f"{r['owner']}/{r['repo']}" for r in self.repos]
+        now = time.monotonic()
+        missing = {
+            scope for scope in self.issue_index.unrefreshed_scopes(self.name, scopes)
+            if scope not in self._refresh_failed_at
+            or now - self._refresh_failed_at[scope] >= REFRESH_RETRY_INTERVAL
+        }
+        if missing:
+            self.refresh_issue_index([
+                r for r in self.repos if f"{r['owner']}/{r['repo']}" in missing
             ])
+            for scope in missing:
+                if scope in self._failed_repos:
+                    self._refresh_failed_at[scope] = now
+                else:
+                    self._refresh_failed_at.pop(scope, None)
 
-            if success and stdout:
-                issues = json.loads(stdout)
-                for issue in issues:
-                    # Check for exact or close title match
-                    if issue["title"].lower() == task.title.lower():
-                        external_id = self._make_external_id(owner, repo, issue["number"])
-                        return ExternalTaskRef(
-                            adapter="github",
-                            external_id=external_id,
-                            url=issue["url"]
-                        )
+        match = self.issue_index.find_match(
+            self.name,
+            task.title,
+            scopes=scopes,
+            threshold=self.match_threshold,
+        )
+        if match:
+            return ExternalTaskRef(
+                adapter="github",
+                external_id=match["external_id"],
+                url=match["url"] or ""
+            )
 
         return None
 
@@ -442,7 +789,7 @@ class GitHubAdapter(TaskSyncAdapter):
         success, stdout, _ = self._run_gh([
             "issue", "view", str(number),
             "-R", f"{owner}/{repo}",
-            "--json", "number,title,state,url,createdAt,updatedAt,body,labels,assignees"
+            "--json", ISSUE_FIELDS
         ])
 
         if success and stdout:
@@ -5,6 +5,11 @@ DIP-0010: External Sync Architecture - Phase 3
 
 Syncs calendar.org entries with Google Calendar events.
 
+Events are pulled incrementally with Calendar API sync tokens into a local
+event cache (sync state database); reads and org-file generation are
+served from the cache, and calendar.org is only rewritten when the
+events it shows have changed.
+
 Usage:
     from sync.adapters.calendar import GoogleCalendarAdapter
 
@@ -13,14 +18,20 @@ Usage:
         events = adapter.pull_changes()
 """
 
+import hashlib
+import json
 import os
 import pickle
 import re
+import sqlite3
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from atomic_write import atomic_write
+
 from .base import (
     OrgCalendarEntry,
     OrgEntry,
@@ -42,6 +53,19 @@ SCOPES = [
     'https://www.googleapis.com/auth/calendar.events',
 ]
 
+# events.list page size (API maximum is 2500)
+PAGE_SIZE = 250
+
+# How far back and ahead the full sync reaches; once less than half the
+# lookahead is left, the next refresh resyncs with a new window
+DEFAULT_LOOKBACK_DAYS = 1
+DEFAULT_LOOKAHEAD_DAYS = 90
+
+# Tombstones are dropped once a cursor consumer has seen them, or after this
+TOMBSTONE_RETENTION_DAYS = 7
+
+SYNC_HASH_PREFIX = "#+SYNC_HASH: "
+
 
 @dataclass
 class CalendarEvent:
@@ -65,6 +89,321 @@ class CalendarEvent:
     raw: Dict[str, Any] = field(default_factory=dict)
 
 
+def _event_bounds(event: Dict) -> Tuple[Optional[str], Optional[str]]:
+    """Start/end of a raw API event as UTC ISO strings (sortable)."""
+    bounds = []
+    for key in ('start', 'end'):
+        data = event.get(key) or {}
+        if 'dateTime' in data:
+            moment = datetime.fromisoformat(data['dateTime'].replace('Z', '+00:00'))
+        elif 'date' in data:
+            # All-day events start at local midnight
+            moment = datetime.strptime(data['date'], '%Y-%m-%d').astimezone()
+        else:
+            bounds.append(None)
+            continue
+        bounds.append(moment.astimezone(timezone.utc).isoformat())
+    return bounds[0], bounds[1]
+
+
+class CalendarEventCache:
+    """
+    Local copy of a calendar's events, kept current with sync tokens.
+
+    Every applied batch gets the next sequence number; rows remember the
+    batch that last changed them, so "changes since sequence N" is exact
+    and cancelled events stay visible as tombstones until pruned.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize event cache.
+
+        Args:
+            db_path: Path to database. If None, uses default location.
+        """
+        if db_path:
+            self.db_path = Path(db_path)
+        else:
+            data_dir = Path(os.environ.get("DATA_DIR", os.path.expanduser("~/Data")))
+            self.db_path = data_dir / ".datacore" / "state" / "sync_history.db"
+
+        self._ensure_tables()
+
+    def _ensure_tables(self):
+        """Ensure cache tables exist."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS calendar_events (
+                    calendar_id TEXT NOT NULL,
+                    event_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    start_utc TEXT,
+                    end_utc TEXT,
+                    updated TEXT,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (calendar_id, event_id)
+                )
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_calendar_events_seq
+                ON calendar_events(calendar_id, seq)
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_calendar_events_start
+                ON calendar_events(calendar_id, status, start_utc)
+            """)
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS calendar_sync (
+                    calendar_id TEXT PRIMARY KEY,
+                    sync_token TEXT,
+                    seq INTEGER NOT NULL DEFAULT 0,
+                    synced_at TEXT
+                )
+            """)
+
+            # End of the full sync's time window
+            try:
+                conn.execute("ALTER TABLE calendar_sync ADD COLUMN window_end TEXT")
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+
+            # When each sequence number was applied (maps times to seqs)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS calendar_batches (
+                    calendar_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    applied_at TEXT NOT NULL,
+                    PRIMARY KEY (calendar_id, seq)
+                )
+            """)
+
+            conn.commit()
+
+    @contextmanager
+    def _get_connection(self):
+        """Get database connection with row factory."""
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def get_sync_state(self, calendar_id: str) -> Tuple[Optional[str], int]:
+        """Return (sync token, latest sequence) for a calendar."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT sync_token, seq FROM calendar_sync WHERE calendar_id = ?",
+                (calendar_id,)
+            ).fetchone()
+        if not row:
+            return None, 0
+        return row["sync_token"], row["seq"]
+
+    def get_window_end(self, calendar_id: str) -> Optional[datetime]:
+        """End of the time window the last full sync covered, if bounded."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT window_end FROM calendar_sync WHERE calendar_id = ?",
+                (calendar_id,)
+            ).fetchone()
+        if not row or not row["window_end"]:
+            return None
+        return datetime.fromisoformat(row["window_end"])
+
+    def apply(
+        self,
+        calendar_id: str,
+        items: List[Dict],
+        sync_token: Optional[str],
+        full: bool,
+        window_end: Optional[datetime] = None
+    ) -> int:
+        """
+        Apply one sync result and its new token in a single transaction.
+
+        Args:
+            calendar_id: Calendar the items belong to
+            items: Raw API events (cancelled ones are tombstoned)
+            sync_token: nextSyncToken to resume from
+            full: Items are the complete event set; cached events missing
+                from it are marked cancelled
+            window_end: timeMax of a full sync (kept until the next one)
+
+        Returns:
+            Number of events that changed.
+        """
+        with self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT seq, window_end FROM calendar_sync WHERE calendar_id = ?", (calendar_id,)
+            ).fetchone()
+            seq = (row["seq"] if row else 0) + 1
+            if full:
+                window = window_end.isoformat() if window_end else None
+            else:
+                window = row["window_end"] if row else None
+
+            cached = {
+                r["event_id"]: (r["status"], r["updated"])
+                for r in conn.execute(
+                    "SELECT event_id, status, updated FROM calendar_events WHERE calendar_id = ?",
+                    (calendar_id,)
+                )
+            }
+
+            changed = 0
+            seen = set()
+            for event in items:
+                event_id = event['id']
+                status = event.get('status', 'confirmed')
+                seen.add(event_id)
+
+                if status == 'cancelled':
+                    if cached.get(event_id, ('cancelled',))[0] == 'cancelled':
+                        continue
+                    conn.execute("""
+                        UPDATE calendar_events SET status = 'cancelled', seq = ?
+                        WHERE calendar_id = ? AND event_id = ?
+                    """, (seq, calendar_id, event_id))
+                    changed += 1
+                    continue
+
+                if cached.get(event_id) == (status, event.get('updated')):
+                    continue
+
+                start_utc, end_utc = _event_bounds(event)
+                conn.execute("""
+                    INSERT OR REPLACE INTO calendar_events
+                    (calendar_id, event_id, seq, status, start_utc, end_utc, updated, data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    calendar_id, event_id, seq, status, start_utc, end_utc,
+                    event.get('updated'), json.dumps(event)
+                ))
+                changed += 1
+
+            if full:
+                gone = [
+                    event_id for event_id, (status, _) in cached.items()
+                    if event_id not in seen and status != 'cancelled'
+                ]
+                conn.executemany("""
+                    UPDATE calendar_events SET status = 'cancelled', seq = ?
+                    WHERE calendar_id = ? AND event_id = ?
+                """, [(seq, calendar_id, event_id) for event_id in gone])
+                changed += len(gone)
+
+            now = datetime.now(timezone.utc).isoformat()
+            if changed:
+                conn.execute(
+                    "INSERT INTO calendar_batches (calendar_id, seq, applied_at) VALUES (?, ?, ?)",
+                    (calendar_id, seq, now)
+                )
+            else:
+                seq -= 1
+
+            conn.execute("""
+                INSERT OR REPLACE INTO calendar_sync (calendar_id, sync_token, seq, synced_at, window_end)
+                VALUES (?, ?, ?, ?, ?)
+            """, (calendar_id, sync_token, seq, datetime.now().isoformat(), window))
+            conn.commit()
+
+        return changed
+
+    def prune_tombstones(
+        self,
+        calendar_id: str,
+        seen_seq: int = 0,
+        retention: timedelta = timedelta(days=TOMBSTONE_RETENTION_DAYS)
+    ) -> int:
+        """
+        Delete tombstones a consumer has seen or that are past retention.
+
+        Args:
+            calendar_id: Calendar to prune
+            seen_seq: Sequence a cursor consumer has consumed through
+            retention: Tombstones from batches older than this go too
+
+        Returns:
+            Number of tombstones deleted.
+        """
+        cutoff = (datetime.now(timezone.utc) - retention).isoformat()
+        with self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            expired = conn.execute("""
+                SELECT COALESCE(MAX(seq), 0) FROM calendar_batches
+                WHERE calendar_id = ? AND applied_at <= ?
+            """, (calendar_id, cutoff)).fetchone()[0]
+            deleted = conn.execute("""
+                DELETE FROM calendar_events
+                WHERE calendar_id = ? AND status = 'cancelled' AND seq <= ?
+            """, (calendar_id, max(seen_seq, expired))).rowcount
+            # Keep the newest expired batch so older times still map to a seq
+            conn.execute(
+                "DELETE FROM calendar_batches WHERE calendar_id = ? AND seq < ?",
+                (calendar_id, expired)
+            )
+            conn.commit()
+        return deleted
+
+    def changed_since(self, calendar_id: str, seq: int) -> List[sqlite3.Row]:
+        """Events (including cancellations) changed after sequence `seq`."""
+        with self._get_connection() as conn:
+            return conn.execute("""
+                SELECT * FROM calendar_events
+                WHERE calendar_id = ? AND seq > ?
+                ORDER BY start_utc
+            """, (calendar_id, seq)).fetchall()
+
+    def changed_after(self, calendar_id: str, since: datetime) -> List[sqlite3.Row]:
+        """
+        Events changed after `since`, by start time.
+
+        Live events must also have been updated after `since`; tombstones
+        from batches applied after it are always included.
+        """
+        since = since.astimezone(timezone.utc)
+        with self._get_connection() as conn:
+            return conn.execute("""
+                SELECT * FROM calendar_events
+                WHERE calendar_id = ?
+                  AND seq > COALESCE((
+                      SELECT MAX(seq) FROM calendar_batches
+                      WHERE calendar_id = ? AND applied_at <= ?
+                  ), 0)
+                  AND (status = 'cancelled' OR updated > ?)
+                ORDER BY start_utc
+            """, (
+                calendar_id,
+                calendar_id,
+                since.isoformat(),
+                # API timestamps are UTC RFC 3339 ("...T09:00:00.000Z")
+                since.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z',
+            )).fetchall()
+
+    def events_between(self, calendar_id: str, time_min: datetime, time_max: datetime) -> List[sqlite3.Row]:
+        """Live events overlapping [time_min, time_max), by start time."""
+        with self._get_connection() as conn:
+            return conn.execute("""
+                SELECT * FROM calendar_events
+                WHERE calendar_id = ? AND status != 'cancelled'
+                  AND start_utc < ? AND (end_utc IS NULL OR end_utc > ?)
+                ORDER BY start_utc
+            """, (
+                calendar_id,
+                time_max.astimezone(timezone.utc).isoformat(),
+                time_min.astimezone(timezone.utc).isoformat(),
+            )).fetchall()
+
+
 class GoogleCalendarAdapter(TaskSyncAdapter):
     """
     Google Calendar adapter for syncing calendar.org with Google Calendar.
@@ -73,18 +412,23 @@ class GoogleCalendarAdapter(TaskSyncAdapter):
         OrgCalendarEntry (calendar.org) <-> Google Calendar Event
     """
 
-    def __init__(self, calendar_id: str = "primary", config: Dict = None):
+    def __init__(self, calendar_id: Optional[str] = None, config: Dict = None):
         """
         Initialize the adapter.
 
         Args:
-            calendar_id: Google Calendar ID (default: "primary")
-            config: Optional configuration dict
+            calendar_id: Google Calendar ID (default: config's calendar_id,
+                else "primary")
+            config: Adapter settings (calendar_id, lookback_days,
+                lookahead_days)
         """
-        self.calendar_id = calendar_id
         self.config = config or {}
+        self.calendar_id = calendar_id or self.config.get("calendar_id", "primary")
+        self.lookback_days = int(self.config.get("lookback_days", DEFAULT_LOOKBACK_DAYS))
+        self.lookahead_days = int(self.config.get("lookahead_days", DEFAULT_LOOKAHEAD_DAYS))
         self._service = None
         self._credentials = None
+        self._event_cache: Optional[CalendarEventCache] = None
 
     @property
     def name(self) -> str:
@@ -94,6 +438,17 @@ class GoogleCalendarAdapter(TaskSyncAdapter):
     def org_file(self) -> str:
         return "calendar.org"
 
+    @property
+    def event_cache(self) -> CalendarEventCache:
+        """Local event cache (opened on first use)."""
+        if self._event_cache is None:
+            self._event_cache = CalendarEventCache()
+        return self._event_cache
+
+    @event_cache.setter
+    def event_cache(self, cache: CalendarEventCache):
+        self._event_cache = cache
+
     def is_configured(self) -> bool:
         """Check if adapter is properly configured."""
         return CLIENT_SECRETS_FILE.exists() and TOKEN_FILE.exists()
@@ -150,57 +505,144 @@ class GoogleCalendarAdapter(TaskSyncAdapter):
         self._service = build('calendar', 'v3', credentials=creds)
         return self._service
 
-    def pull_changes(self, since: Optional[datetime] = None) -> List[TaskChange]:
+    def _list_events(
+        self,
+        service,
+        sync_token: Optional[str],
+        window_end: Optional[datetime] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
         """
-        Fetch events from Google Calendar.
+        List every page of events, incrementally when given a sync token.
 
-        Args:
-            since: Only fetch events updated after this time
+        A full sync covers lookback_days before now through `window_end`,
+        so recurring events aren't expanded without bound.
 
         Returns:
-            List of TaskChange objects
+            Tuple of (raw events, nextSyncToken)
+        """
+        params = {
+            'calendarId': self.calendar_id,
+            'singleEvents': True,
+            'maxResults': PAGE_SIZE,
+        }
+        if sync_token:
+            params['syncToken'] = sync_token
+        else:
+            time_min = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
+            params['timeMin'] = time_min.strftime('%Y-%m-%dT%H:%M:%SZ')
+            params['timeMax'] = window_end.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+        items = []
+        while True:
+            result = service.events().list(**params).execute()
+            items.extend(result.get('items', []))
+            page_token = result.get('nextPageToken')
+            if not page_token:
+                return items, result.get('nextSyncToken')
+            params['pageToken'] = page_token
+
+    def refresh_cache(self) -> int:
+        """
+        Bring the event cache up to date.
+
+        Uses the stored sync token, so only events changed since the last
+        refresh are downloaded. An expired token (HTTP 410), or a full-sync
+        window with less than half of lookahead_days left, falls back to a
+        full sync, which also tombstones events deleted in the meantime.
+        Tombstones past TOMBSTONE_RETENTION_DAYS are pruned.
+
+        Returns:
+            Number of cached events that changed.
         """
         service = self._get_service()
         if not service:
-            return []
-
-        changes = []
+            return 0
 
-        # Default: get events for next 14 days
-        now = datetime.utcnow()
-        time_min = now.isoformat() + 'Z'
-        time_max = (now + timedelta(days=14)).isoformat() + 'Z'
+        now = datetime.now(timezone.utc)
+        window_end = now + timedelta(days=self.lookahead_days)
+        sync_token, _ = self.event_cache.get_sync_state(self.calendar_id)
+        cached_end = self.event_cache.get_window_end(self.calendar_id)
+        if cached_end is None or cached_end < now + timedelta(days=self.lookahead_days / 2):
+            sync_token = None
 
         try:
-            events_result = service.events().list(
-                calendarId=self.calendar_id,
-                timeMin=time_min,
-                timeMax=time_max,
-                maxResults=100,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
+            items, next_token = self._list_events(service, sync_token, window_end)
+        except Exception as e:
+            if not sync_token or getattr(getattr(e, 'resp', None), 'status', None) != 410:
+                raise
+            sync_token = None
+            items, next_token = self._list_events(service, None, window_end)
 
-            events = events_result.get('items', [])
+        changed = self.event_cache.apply(
+            self.calendar_id, items, next_token, full=sync_token is None, window_end=window_end
+        )
+        self.event_cache.prune_tombstones(self.calendar_id)
+        return changed
+
+    def _row_to_entry(self, row) -> OrgCalendarEntry:
+        """Convert a cached event row to OrgCalendarEntry."""
+        return self._event_to_org_entry(self._parse_event(json.loads(row["data"])))
+
+    def _row_to_change(self, row) -> TaskChange:
+        """Convert a cached event row to a TaskChange (DELETED if cancelled)."""
+        event = json.loads(row["data"])
+        cal_event = self._parse_event(event)
+
+        change = TaskChange(
+            change_type=ChangeType.DELETED if row["status"] == "cancelled" else ChangeType.UPDATED,
+            external_task=None,  # We use org_task for calendar
+            org_task=None,
+            timestamp=cal_event.updated_at,
+        )
+        # Store the org entry in a custom attribute
+        change.calendar_entry = self._event_to_org_entry(cal_event)
+        return change
 
-            for event in events:
-                cal_event = self._parse_event(event)
-                org_entry = self._event_to_org_entry(cal_event)
+    def pull_changes(self, since: Optional[datetime] = None) -> List[TaskChange]:
+        """
+        Fetch events from Google Calendar.
 
-                change = TaskChange(
-                    change_type=ChangeType.UPDATED,
-                    external_task=None,  # We use org_task for calendar
-                    org_task=None,
-                    timestamp=cal_event.updated_at,
-                )
-                # Store the org entry in a custom attribute
-                change.calendar_entry = org_entry
-                changes.append(change)
+        Args:
+            since: Only return events updated after this time (including
+                cancellations). If None, return the next 14 days of events.
 
+        Returns:
+            List of TaskChange objects
+        """
+        try:
+            self.refresh_cache()
         except Exception as e:
             print(f"Error pulling calendar events: {e}")
+            return []
+
+        if since is None:
+            now = datetime.now(timezone.utc)
+            rows = self.event_cache.events_between(self.calendar_id, now, now + timedelta(days=14))
+        else:
+            if since.tzinfo is None:
+                since = since.astimezone()
+            rows = self.event_cache.changed_after(self.calendar_id, since)
+
+        return [self._row_to_change(row) for row in rows]
+
+    def pull_since_cursor(self, cursor: Optional[str]) -> Tuple[List[TaskChange], Optional[str]]:
+        """
+        Fetch events changed after a cursor.
+
+        The cursor is the event cache sequence number consumed last, so it
+        stays exact across sync-token expiry and full resyncs. Tombstones
+        the cursor has moved past are pruned.
+        """
+        self.refresh_cache()
+        since_seq = int(cursor) if cursor else 0
+        self.event_cache.prune_tombstones(self.calendar_id, seen_seq=since_seq)
+
+        rows = self.event_cache.changed_since(self.calendar_id, since_seq)
+        if not cursor:
+            rows = [row for row in rows if row["status"] != "cancelled"]
 
-        return changes
+        _, seq = self.event_cache.get_sync_state(self.calendar_id)
+        return [self._row_to_change(row) for row in rows], str(seq) if seq else cursor
 
     def pull_events(self, days: int = 14) -> List[OrgCalendarEntry]:
         """
@@ -212,35 +654,14 @@ class GoogleCalendarAdapter(TaskSyncAdapter):
         Returns:
             List of OrgCalendarEntry objects
         """
-        service = self._get_service()
-        if not service:
-            return []
-
-        entries = []
-
-        now = datetime.utcnow()
-        time_min = now.isoformat() + 'Z'
-        time_max = (now + timedelta(days=days)).isoformat() + 'Z'
-
         try:
-            events_result = service.events().list(
-                calendarId=self.calendar_id,
-                timeMin=time_min,
-                timeMax=time_max,
-                maxResults=100,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-
-            for event in events_result.get('items', []):
-                cal_event = self._parse_event(event)
-                org_entry = self._event_to_org_entry(cal_event)
-                entries.append(org_entry)
-
+            self.refresh_cache()
         except Exception as e:
             print(f"Error pulling calendar events: {e}")
 
-        return entries
+        now = datetime.now(timezone.utc)
+        rows = self.event_cache.events_between(self.calendar_id, now, now + timedelta(days=days))
+        return [self._row_to_entry(row) for row in rows]
 
     def push_changes(self, changes: List[TaskChange]) -> SyncResult:
         """Push changes to Google Calendar."""
@@ -454,10 +875,42 @@ class GoogleCalendarAdapter(TaskSyncAdapter):
 
         return event
 
+    def _entries_hash(self, entries: List[OrgCalendarEntry]) -> str:
+        """Fingerprint of the events an org file shows."""
+        fingerprint = [
+            [
+                entry.external_id,
+                entry.title,
+                entry.timestamp.isoformat() if entry.timestamp else None,
+                entry.end_time.isoformat() if entry.end_time else None,
+                entry.location,
+                entry.attendees,
+                entry.body,
+            ]
+            for entry in entries
+        ]
+        return hashlib.md5(json.dumps(fingerprint).encode('utf-8')).hexdigest()
+
+    def _org_file_hash(self, org_file_path: str) -> Optional[str]:
+        """Read the SYNC_HASH header written by the last sync, if any."""
+        try:
+            with open(org_file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.startswith(SYNC_HASH_PREFIX):
+                        return line[len(SYNC_HASH_PREFIX):].strip()
+                    if not line.startswith('#+'):
+                        break
+        except FileNotFoundError:
+            pass
+        return None
+
     def sync_to_org_file(self, org_file_path: str, days: int = 14) -> int:
         """
         Sync calendar events to an org file.
 
+        The file is only rewritten when the set of events it shows has
+        changed (tracked by a #+SYNC_HASH: header).
+
         Args:
             org_file_path: Path to the org file
             days: Number of days to sync
@@ -470,12 +923,17 @@ class GoogleCalendarAdapter(TaskSyncAdapter):
         if not entries:
             return 0
 
+        entries_hash = self._entries_hash(entries)
+        if self._org_file_hash(org_file_path) == entries_hash:
+            return len(entries)
+
         # Generate org content
         lines = [
             "#+TITLE: Calendar",
             "#+FILETAGS: :calendar:",
             "#+STARTUP: overview",
             f"#+LAST_SYNC: [{datetime.now().strftime('%Y-%m-%d %a %H:%M')}]",
+            f"{SYNC_HASH_PREFIX}{entries_hash}",
             "",
             "* Upcoming Events",
         ]
@@ -483,9 +941,8 @@ class GoogleCalendarAdapter(TaskSyncAdapter):
         for entry in entries:
             lines.extend(self._entry_to_org_lines(entry))
 
-        # Write to file
-        with open(org_file_path, 'w') as f:
-            f.write('\n'.join(lines))
+        # Write to file (atomic: never leaves a truncated calendar.org)
+        atomic_write(org_file_path, '\n'.join(lines))
 
         return len(entries)
 
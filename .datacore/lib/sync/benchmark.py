@@ -0,0 +1,294 @@
+"""
+Sync Benchmark - End-to-end SyncEngine run over a synthetic workload.
+
+DIP-0010: Task Sync Architecture
+
+Builds a throwaway space whose next_actions.org holds tasks linked to part
+of a synthetic issue stream, records a baseline sync, edits some tasks in
+org, then replays the stream through a FixtureAdapter and times one full
+sync() (pull -> route -> conflict detection -> writeback -> diff -> push
+-> commit). Each stage reports calls, wall time and, unless disabled,
+memory allocated (net) and peak allocation, via tracemalloc. Stages don't
+overlap; "other" is the part of sync() outside them.
+
+Usage:
+    python sync/benchmark.py                      # 10k issues
+    python sync/benchmark.py --issues 2000 --json
+    python sync/benchmark.py --latency 0.2 --no-alloc
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add lib to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import zettel_db
+from org_parser import index_org_file
+import sync.engine as engine_module
+from sync.adapters import ChangeType, TaskChange
+from sync.adapters.fixture import FixtureAdapter, synthetic_issues
+from sync.conflict import ConflictDetector, ConflictResolver
+from sync.engine import SyncEngine
+
+BENCH_SPACE = "personal"
+
+# Stages in pipeline order: pull_all, task index reads, routing, conflict
+# detection, org writeback, snapshot diff, push_all, and the final commit
+# of cursors, snapshots and history
+STAGES = ["pull", "index", "route", "detect", "writeback", "diff", "push", "commit"]
+
+
+class StageRecorder:
+    """Accumulates time and allocations of wrapped calls, per stage."""
+
+    def __init__(self, track_allocations: bool = True):
+        self.track_allocations = track_allocations
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._restore: List[Callable[[], None]] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """Measure one call of a stage."""
+        stats = self.stages.setdefault(name, {"calls": 0, "seconds": 0.0})
+        if self.track_allocations:
+            stats.setdefault("alloc_kib", 0.0)
+            stats.setdefault("peak_kib", 0.0)
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats["seconds"] += time.perf_counter() - started
+            stats["calls"] += 1
+            if self.track_allocations:
+                current, peak = tracemalloc.get_traced_memory()
+                stats["alloc_kib"] += (current - before) / 1024
+                stats["peak_kib"] = max(stats["peak_kib"], (peak - before) / 1024)
+
+    def wrap(self, owner: Any, attr: str, name: str):
+        """Replace owner.attr with a version measured as stage `name`."""
+        original = getattr(owner, attr)
+
+        def measured(*args, **kwargs):
+            with self.stage(name):
+                return original(*args, **kwargs)
+
+        setattr(owner, attr, measured)
+        self._restore.append(lambda: setattr(owner, attr, original))
+
+    def restore(self):
+        """Undo every wrap()."""
+        while self._restore:
+            self._restore.pop()()
+
+
+@contextmanager
+def isolated_space(root: Path):
+    """Point the benchmark space (index and org files) at `root`."""
+    space = zettel_db.SPACES[BENCH_SPACE]
+    original = space["path"]
+    space["path"] = root / original.name
+    try:
+        yield space["path"]
+    finally:
+        space["path"] = original
+
+
+def _org_entry(number: int, title: str) -> str:
+    return f"** TODO {title}\n:PROPERTIES:\n:EXTERNAL_ID: fixture:{number}\n:END:\n"
+
+
+def _make_engine(data_dir: Path, adapter: FixtureAdapter) -> SyncEngine:
+    """Engine over the benchmark data dir with only the fixture adapter."""
+    engine = SyncEngine(data_dir=str(data_dir))
+    engine.config = {"sync": {"tasks": {"space": BENCH_SPACE}}}
+    engine.adapters = {"fixture": adapter}
+    engine.conflict_detector = ConflictDetector()
+    engine.conflict_resolver = ConflictResolver()
+    return engine
+
+
+def run_benchmark(
+    issues: int = 10000,
+    linked_ratio: float = 0.5,
+    external_edit_ratio: float = 0.2,
+    org_edit_ratio: float = 0.05,
+    latency: float = 0.0,
+    seed: int = 0,
+    track_allocations: bool = True,
+    data_dir: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Run the benchmark once.
+
+    Args:
+        issues: Synthetic issues in the pulled stream
+        linked_ratio: Share of issues already linked to org tasks
+        external_edit_ratio: Share of linked issues renamed externally
+        org_edit_ratio: Share of linked tasks renamed in org (about half
+            of them are also renamed externally, and conflict)
+        latency: Simulated seconds per adapter call
+        seed: Synthetic data seed
+        track_allocations: Measure allocations with tracemalloc
+        data_dir: Keep the workspace here instead of a temp dir
+
+    Returns:
+        Dict with workload, per-stage results and sync() stats
+    """
+    root = Path(data_dir) if data_dir else Path(tempfile.mkdtemp(prefix="sync-bench-"))
+    linked = int(issues * linked_ratio)
+    external_edits = set(range(1, int(linked * external_edit_ratio) + 1))
+    # Org edits straddle the end of the external edits: about half conflict
+    org_count = int(linked * org_edit_ratio)
+    first = max(1, len(external_edits) - org_count // 2 + 1)
+    org_edits = set(range(first, min(linked, first + org_count - 1) + 1))
+
+    try:
+        with isolated_space(root) as space_path:
+            zettel_db.init_database(BENCH_SPACE)
+            org_dir = space_path / "org"
+            org_dir.mkdir(parents=True, exist_ok=True)
+            next_actions = org_dir / "next_actions.org"
+            inbox = org_dir / "inbox.org"
+
+            # Linked tasks, baseline snapshots, then org-side edits
+            next_actions.write_text("#+TITLE: Next Actions\n\n* Work\n" + "".join(
+                _org_entry(n, f"Synthetic issue {n}") for n in range(1, linked + 1)
+            ))
+            inbox.write_text("#+TITLE: Inbox\n\n* Inbox\n")
+            for org_file in (next_actions, inbox):
+                index_org_file(org_file, BENCH_SPACE)
+            _make_engine(root, FixtureAdapter(changes=[])).sync()
+
+            next_actions.write_text("#+TITLE: Next Actions\n\n* Work\n" + "".join(
+                _org_entry(n, f"Synthetic issue {n} (org)" if n in org_edits else f"Synthetic issue {n}")
+                for n in range(1, linked + 1)
+            ))
+            index_org_file(next_actions, BENCH_SPACE)
+
+            stream = synthetic_issues(issues, seed=seed)
+            for task in stream:
+                if int(task.id) in external_edits:
+                    task.title = f"{task.title} (external)"
+            adapter = FixtureAdapter(
+                {"latency": latency},
+                changes=[
+                    TaskChange(change_type=ChangeType.UPDATED, external_task=task, timestamp=task.updated_at)
+                    for task in stream
+                ],
+            )
+
+            engine = _make_engine(root, adapter)
+            recorder = StageRecorder(track_allocations)
+            recorder.wrap(engine, "pull_all", "pull")
+            recorder.wrap(engine, "_load_org_tasks", "index")
+            recorder.wrap(engine.router, "route_many", "route")
+            recorder.wrap(engine.conflict_detector, "detect_batch", "detect")
+            recorder.wrap(engine_module, "queue_writes", "writeback")
+            recorder.wrap(engine_module, "execute_pending_writes", "writeback")
+            recorder.wrap(engine_module, "diff_org_tasks", "diff")
+            recorder.wrap(engine, "push_all", "push")
+            recorder.wrap(engine, "commit_pull", "commit")
+            recorder.wrap(engine.snapshots, "save_many", "commit")
+
+            if track_allocations:
+                tracemalloc.start()
+            try:
+                started = time.perf_counter()
+                stats = engine.sync()
+                total = time.perf_counter() - started
+            finally:
+                recorder.restore()
+                if track_allocations:
+                    tracemalloc.stop()
+
+        staged = sum(stage["seconds"] for stage in recorder.stages.values())
+        return {
+            "workload": {
+                "issues": issues,
+                "linked": linked,
+                "external_edits": len(external_edits),
+                "org_edits": len(org_edits),
+                "conflicts": len(external_edits & org_edits),
+                "latency": latency,
+            },
+            "stages": {
+                **{name: recorder.stages.get(name, {"calls": 0, "seconds": 0.0}) for name in STAGES},
+                "other": {"calls": 1, "seconds": max(0.0, total - staged)},
+            },
+            "total_seconds": total,
+            "issues_per_second": issues / total if total else None,
+            "sync": {
+                "pulled": stats["pull"]["count"],
+                "applied": stats["pull"]["applied"],
+                "held": stats["pull"]["held"],
+                "pushed": stats["push"]["count"],
+                "errors": stats["pull"]["errors"] + stats["push"]["errors"],
+            },
+        }
+    finally:
+        if data_dir is None:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def print_report(report: Dict[str, Any]):
+    """Print a benchmark report as a table."""
+    workload = report["workload"]
+    print(f"Workload: {workload['issues']} issues, {workload['linked']} linked, "
+          f"{workload['external_edits']} external / {workload['org_edits']} org edits "
+          f"({workload['conflicts']} conflicting), latency {workload['latency']}s")
+    print()
+    print(f"  {'stage':<10} {'calls':>6} {'ms':>10} {'share':>7} {'alloc KiB':>11} {'peak KiB':>10}")
+    total = report["total_seconds"]
+    for name, stage in report["stages"].items():
+        alloc = f"{stage['alloc_kib']:>11.0f}" if "alloc_kib" in stage else f"{'-':>11}"
+        peak = f"{stage['peak_kib']:>10.0f}" if "peak_kib" in stage else f"{'-':>10}"
+        share = stage["seconds"] / total * 100 if total else 0
+        print(f"  {name:<10} {stage['calls']:>6} {stage['seconds'] * 1000:>10.1f} {share:>6.1f}% {alloc} {peak}")
+    print()
+    result = report["sync"]
+    print(f"Total: {total:.2f}s ({report['issues_per_second']:.0f} issues/s); "
+          f"applied {result['applied']} writes, pushed {result['pushed']}, held {result['held']}, "
+          f"{len(result['errors'])} errors")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark a full sync over synthetic issues")
+    parser.add_argument("--issues", type=int, default=10000, help="Issues in the pulled stream")
+    parser.add_argument("--linked", type=float, default=0.5, help="Share already linked in org")
+    parser.add_argument("--external-edits", type=float, default=0.2, help="Share of linked renamed externally")
+    parser.add_argument("--org-edits", type=float, default=0.05, help="Share of linked renamed in org")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per adapter call")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed")
+    parser.add_argument("--no-alloc", action="store_true", help="Skip allocation tracking (faster)")
+    parser.add_argument("--keep", metavar="DIR", help="Build the workspace in DIR and keep it")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        issues=args.issues,
+        linked_ratio=args.linked,
+        external_edit_ratio=args.external_edits,
+        org_edit_ratio=args.org_edits,
+        latency=args.latency,
+        seed=args.seed,
+        track_allocations=not args.no_alloc,
+        data_dir=Path(args.keep) if args.keep else None,
+    )
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
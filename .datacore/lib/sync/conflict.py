@@ -10,6 +10,7 @@ and resolves conflicts based on configurable strategies.
 import hashlib
 import json
 import os
+import re
 import sqlite3
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -97,6 +98,96 @@ class ConflictResolution:
     notes: str = ""
 
 
+@dataclass
+class ThreeWayResult:
+    """Outcome of comparing an org task and external task with their base."""
+    external_id: str
+    org_task: OrgTask
+    external_task: ExternalTask
+    to_org: Dict[str, Any] = field(default_factory=dict)       # External-only changes (external values)
+    to_external: Dict[str, Any] = field(default_factory=dict)  # Org-only changes (org values)
+    conflict: Optional[Conflict] = None                         # Fields changed on both sides
+
+
+# Fields compared three-way: both sides carry them, so each can be hashed
+# at sync time and compared with its own base afterwards
+THREE_WAY_FIELDS = {
+    "state": ConflictType.STATE,
+    "title": ConflictType.TITLE,
+    "priority": ConflictType.PRIORITY,
+    "deadline": ConflictType.DEADLINE,
+}
+
+CLOSED_EXTERNAL_STATES = ("closed", "done", "completed", "resolved")
+
+
+def _normalize_title(title: str) -> str:
+    """Normalize title for comparison (drops prefixes like [WIP])."""
+    title = re.sub(r'^\[.*?\]\s*', '', title or '')
+    return title.lower().strip()
+
+
+def _canonical_values(closed: bool, title: str, priority: Optional[str], deadline: Optional[str]) -> Dict[str, Any]:
+    return {
+        "state": "closed" if closed else "open",
+        "title": _normalize_title(title),
+        "priority": priority,
+        "deadline": deadline,
+    }
+
+
+def org_field_values(task: OrgTask) -> Dict[str, Any]:
+    """Comparable values of an org task's three-way fields."""
+    return _canonical_values(
+        task.state in (TaskState.DONE, TaskState.CANCELLED),
+        task.title,
+        task.priority.value if task.priority else None,
+        task.deadline.strftime("%Y-%m-%d") if task.deadline else None,
+    )
+
+
+def snapshot_field_values(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Comparable values of a last-synced org snapshot (sync.org_state)."""
+    return _canonical_values(
+        snapshot.get("state") in (TaskState.DONE.value, TaskState.CANCELLED.value),
+        snapshot.get("title"),
+        snapshot.get("priority"),
+        snapshot.get("deadline"),
+    )
+
+
+def external_field_values(task: ExternalTask) -> Dict[str, Any]:
+    """Comparable values of an external task's three-way fields."""
+    priority = _priority_from_labels(task.labels)
+    return _canonical_values(
+        task.state.lower() in CLOSED_EXTERNAL_STATES,
+        task.title,
+        priority.value if priority else None,
+        task.due_date.strftime("%Y-%m-%d") if task.due_date else None,
+    )
+
+
+def field_hashes(values: Dict[str, Any]) -> Dict[str, str]:
+    """Hash each three-way field value (stored as the base at sync time)."""
+    return {
+        name: hashlib.md5(json.dumps(values.get(name)).encode()).hexdigest()[:16]
+        for name in THREE_WAY_FIELDS
+    }
+
+
+def _priority_from_labels(labels: List[str]) -> Optional[Priority]:
+    """Extract priority from external labels."""
+    for label in labels:
+        label_lower = label.lower()
+        if "high" in label_lower or label == "p1" or label == "priority-high":
+            return Priority.A
+        if "medium" in label_lower or label == "p2" or label == "priority-medium":
+            return Priority.B
+        if "low" in label_lower or label == "p3" or label == "priority-low":
+            return Priority.C
+    return None
+
+
 class ConflictDetector:
     """
     Detects conflicts between org-mode tasks and external tasks.
@@ -179,6 +270,124 @@ class ConflictDetector:
             fields=conflicts
         )
 
+    def _raw_values(self, org_task: OrgTask, external_task: ExternalTask) -> Dict[str, Tuple[Any, Any]]:
+        """(org value, external value) of each three-way field, as displayed."""
+        external_priority = _priority_from_labels(external_task.labels)
+        return {
+            "state": (org_task.state.value, external_task.state),
+            "title": (org_task.title, external_task.title),
+            "priority": (
+                org_task.priority.value if org_task.priority else None,
+                external_priority.value if external_priority else None,
+            ),
+            "deadline": (
+                org_task.deadline.strftime("%Y-%m-%d") if org_task.deadline else None,
+                external_task.due_date.strftime("%Y-%m-%d") if external_task.due_date else None,
+            ),
+        }
+
+    def detect_three_way(
+        self,
+        org_task: OrgTask,
+        external_task: ExternalTask,
+        base: Dict[str, Any]
+    ) -> ThreeWayResult:
+        """
+        Compare both sides of a synced task against their last-synced base.
+
+        `base` is the task's snapshot from the last sync (see
+        sync.org_state.task_snapshot): the org values, plus hashes of the
+        external values under "external". Per field, a side has changed if
+        its hash differs from its base:
+
+        - Neither side changed, or both now agree: nothing to do
+        - Only external changed: reported in `to_org`
+        - Only org changed: reported in `to_external`
+        - Both changed to different values: a conflict field
+
+        Args:
+            org_task: Current org task
+            external_task: Current external task
+            base: Snapshot from the last sync
+
+        Returns:
+            ThreeWayResult
+        """
+        org_hashes = field_hashes(org_field_values(org_task))
+        external_hashes = field_hashes(external_field_values(external_task))
+        org_base = field_hashes(snapshot_field_values(base))
+        # Without a recorded external base, assume both sides agreed
+        external_base = {**org_base, **base.get("external", {})}
+        raw = self._raw_values(org_task, external_task)
+
+        result = ThreeWayResult(
+            external_id=org_task.external_id or f"external:{external_task.id}",
+            org_task=org_task,
+            external_task=external_task,
+        )
+        conflicts = []
+        for name, conflict_type in THREE_WAY_FIELDS.items():
+            if org_hashes[name] == external_hashes[name]:
+                continue
+            org_changed = org_hashes[name] != org_base[name]
+            external_changed = external_hashes[name] != external_base[name]
+            org_value, external_value = raw[name]
+
+            if external_changed and not org_changed:
+                result.to_org[name] = external_value
+            elif org_changed and not external_changed:
+                result.to_external[name] = org_value
+            elif org_changed and external_changed:
+                conflicts.append(ConflictField(
+                    field_name=name,
+                    conflict_type=conflict_type,
+                    org_value=org_value,
+                    external_value=external_value,
+                    last_synced_value=base.get(name),
+                ))
+
+        if conflicts:
+            result.conflict = Conflict(
+                external_id=result.external_id,
+                org_task_id=org_task.id,
+                org_task=org_task,
+                external_task=external_task,
+                fields=conflicts
+            )
+        return result
+
+    def detect_batch(
+        self,
+        pairs: List[Tuple[OrgTask, ExternalTask]],
+        bases: Dict[str, Dict[str, Any]]
+    ) -> List[ThreeWayResult]:
+        """
+        Three-way compare many synced tasks in one pass.
+
+        Pairs without a base (never synced) are compared two-way with
+        detect(); any difference there is reported as a conflict.
+
+        Args:
+            pairs: (org task, external task) for each pulled synced task
+            bases: Last-synced snapshots by external_id
+
+        Returns:
+            ThreeWayResult per pair, in order
+        """
+        results = []
+        for org_task, external_task in pairs:
+            base = bases.get(org_task.external_id)
+            if base is not None:
+                results.append(self.detect_three_way(org_task, external_task, base))
+                continue
+            results.append(ThreeWayResult(
+                external_id=org_task.external_id or f"external:{external_task.id}",
+                org_task=org_task,
+                external_task=external_task,
+                conflict=self.detect(org_task, external_task),
+            ))
+        return results
+
     def _check_state_conflict(
         self,
         org_task: OrgTask,
@@ -228,10 +437,7 @@ class ConflictDetector:
 
     def _normalize_title(self, title: str) -> str:
         """Normalize title for comparison."""
-        import re
-        # Remove common prefixes like [TEST], [WIP], etc.
-        title = re.sub(r'^\[.*?\]\s*', '', title)
-        return title.lower().strip()
+        return _normalize_title(title)
 
     def _check_description_conflict(
         self,
@@ -287,15 +493,7 @@ class ConflictDetector:
 
     def _extract_priority_from_labels(self, labels: List[str]) -> Optional[Priority]:
         """Extract priority from external labels."""
-        for label in labels:
-            label_lower = label.lower()
-            if "high" in label_lower or label == "p1" or label == "priority-high":
-                return Priority.A
-            if "medium" in label_lower or label == "p2" or label == "priority-medium":
-                return Priority.B
-            if "low" in label_lower or label == "p3" or label == "priority-low":
-                return Priority.C
-        return None
+        return _priority_from_labels(labels)
 
     def _check_deadline_conflict(
         self,
@@ -509,7 +707,7 @@ class ConflictQueue:
         self._ensure_tables()
 
     def _ensure_tables(self):
-        """Ensure conflict tables exist."""
+        """Ensure conflict tables exist (and migrate older queues)."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         with self._get_connection() as conn:
@@ -528,9 +726,47 @@ class ConflictQueue:
                 )
             """)
 
+            # One row per conflicting field, so stats and filters by type
+            # never decode conflict_data
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_conflicts_unresolved
-                ON sync_conflicts(resolved, detected_at DESC)
+                CREATE TABLE IF NOT EXISTS sync_conflict_fields (
+                    conflict_id INTEGER NOT NULL,
+                    field_name TEXT NOT NULL,
+                    conflict_type TEXT NOT NULL,
+                    PRIMARY KEY (conflict_id, field_name)
+                )
+            """)
+
+            # Adapter and repeat detection (idempotent)
+            for column_def in [
+                "adapter TEXT",
+                "last_detected_at TEXT",
+                "occurrences INTEGER DEFAULT 1",
+            ]:
+                try:
+                    conn.execute(f"ALTER TABLE sync_conflicts ADD COLUMN {column_def}")
+                except sqlite3.OperationalError:
+                    pass  # Column already exists
+
+            conn.execute("""
+                UPDATE sync_conflicts
+                SET adapter = substr(external_id, 1, instr(external_id, ':') - 1)
+                WHERE adapter IS NULL AND instr(external_id, ':') > 0
+            """)
+
+            # Collapse duplicates queued before add() upserted, keeping the newest
+            conn.execute("""
+                DELETE FROM sync_conflicts
+                WHERE resolved = 0 AND id NOT IN (
+                    SELECT MAX(id) FROM sync_conflicts WHERE resolved = 0 GROUP BY external_id
+                )
+            """)
+
+            # Unresolved conflicts, most recently seen first (get_unresolved)
+            conn.execute("DROP INDEX IF EXISTS idx_conflicts_unresolved")
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_conflicts_recent
+                ON sync_conflicts(resolved, COALESCE(last_detected_at, detected_at) DESC)
             """)
 
             conn.execute("""
@@ -538,6 +774,39 @@ class ConflictQueue:
                 ON sync_conflicts(external_id)
             """)
 
+            # At most one open conflict per item: the upsert target for add()
+            conn.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_conflicts_open
+                ON sync_conflicts(external_id) WHERE resolved = 0
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_conflicts_adapter
+                ON sync_conflicts(adapter, resolved)
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_conflict_fields_type
+                ON sync_conflict_fields(conflict_type, conflict_id)
+            """)
+
+            # Backfill field rows for conflicts stored before the child table
+            backfill = []
+            for row in conn.execute("""
+                SELECT id, conflict_data FROM sync_conflicts c
+                WHERE NOT EXISTS (SELECT 1 FROM sync_conflict_fields f WHERE f.conflict_id = c.id)
+            """):
+                try:
+                    data = json.loads(row["conflict_data"])
+                except ValueError:
+                    continue
+                for f in data.get("fields", []):
+                    backfill.append((row["id"], f.get("field_name", ""), f.get("conflict_type", "unknown")))
+            conn.executemany("""
+                INSERT OR IGNORE INTO sync_conflict_fields (conflict_id, field_name, conflict_type)
+                VALUES (?, ?, ?)
+            """, backfill)
+
             conn.commit()
 
     @contextmanager
@@ -552,7 +821,12 @@ class ConflictQueue:
 
     def add(self, conflict: Conflict) -> int:
         """
-        Add conflict to queue.
+        Add conflict to queue, or refresh the item's open conflict.
+
+        An item has at most one unresolved conflict: when it conflicts
+        again (e.g. on every sync until someone resolves it) its open row
+        is updated with the latest fields and values, keeping its first
+        detection time and counting the repeat.
 
         Returns:
             ID of the conflict record
@@ -578,45 +852,81 @@ class ConflictQueue:
                 "url": conflict.external_task.url if conflict.external_task else None,
             } if conflict.external_task else None,
         }
+        adapter = conflict.external_id.split(":")[0] if ":" in conflict.external_id else None
+        detected_at = conflict.detected_at.isoformat()
 
         with self._get_connection() as conn:
-            cursor = conn.execute("""
+            conn.execute("""
                 INSERT INTO sync_conflicts
-                (external_id, org_task_id, detected_at, conflict_data)
-                VALUES (?, ?, ?, ?)
+                (external_id, org_task_id, detected_at, conflict_data, adapter, last_detected_at, occurrences)
+                VALUES (?, ?, ?, ?, ?, ?, 1)
+                ON CONFLICT(external_id) WHERE resolved = 0 DO UPDATE SET
+                    org_task_id = excluded.org_task_id,
+                    conflict_data = excluded.conflict_data,
+                    adapter = excluded.adapter,
+                    last_detected_at = excluded.last_detected_at,
+                    occurrences = occurrences + 1
             """, (
                 conflict.external_id,
                 conflict.org_task_id,
-                conflict.detected_at.isoformat(),
-                json.dumps(conflict_data)
+                detected_at,
+                json.dumps(conflict_data),
+                adapter,
+                detected_at,
             ))
+            conflict_id = conn.execute(
+                "SELECT id FROM sync_conflicts WHERE external_id = ? AND resolved = 0",
+                (conflict.external_id,)
+            ).fetchone()["id"]
+
+            conn.execute("DELETE FROM sync_conflict_fields WHERE conflict_id = ?", (conflict_id,))
+            conn.executemany("""
+                INSERT OR REPLACE INTO sync_conflict_fields (conflict_id, field_name, conflict_type)
+                VALUES (?, ?, ?)
+            """, [(conflict_id, f.field_name, f.conflict_type.value) for f in conflict.fields])
             conn.commit()
-            conflict.id = cursor.lastrowid
-            return cursor.lastrowid
 
-    def get_unresolved(self, limit: int = 50) -> List[Conflict]:
+        conflict.id = conflict_id
+        return conflict_id
+
+    def get_unresolved(
+        self,
+        limit: int = 50,
+        conflict_type: Optional[ConflictType] = None,
+        adapter: Optional[str] = None
+    ) -> List[Conflict]:
         """
         Get unresolved conflicts.
 
         Args:
             limit: Max number to return
+            conflict_type: Only conflicts with a field of this type
+            adapter: Only conflicts from this adapter (e.g. "github")
 
         Returns:
-            List of unresolved Conflict objects
+            List of unresolved Conflict objects, most recently detected first
         """
-        conflicts = []
+        clauses = ["resolved = 0"]
+        params: List[Any] = []
+        if adapter:
+            clauses.append("adapter = ?")
+            params.append(adapter)
+        if conflict_type:
+            clauses.append("""id IN (
+                SELECT conflict_id FROM sync_conflict_fields WHERE conflict_type = ?
+            )""")
+            params.append(conflict_type.value)
 
         with self._get_connection() as conn:
-            for row in conn.execute("""
-                SELECT * FROM sync_conflicts
-                WHERE resolved = 0
-                ORDER BY detected_at DESC
-                LIMIT ?
-            """, (limit,)):
-                conflict = self._row_to_conflict(row)
-                conflicts.append(conflict)
-
-        return conflicts
+            return [
+                self._row_to_conflict(row)
+                for row in conn.execute(f"""
+                    SELECT * FROM sync_conflicts
+                    WHERE {" AND ".join(clauses)}
+                    ORDER BY COALESCE(last_detected_at, detected_at) DESC
+                    LIMIT ?
+                """, (*params, limit))
+            ]
 
     def get_by_external_id(self, external_id: str) -> Optional[Conflict]:
         """Get most recent conflict for an external ID."""
@@ -703,57 +1013,74 @@ class ConflictQueue:
             "unresolved": 0,
             "resolved_today": 0,
             "by_type": {},
+            "by_adapter": {},
             "oldest_unresolved": None,
         }
 
+        today = datetime.now().date().isoformat()
+
         with self._get_connection() as conn:
-            # Unresolved count
-            row = conn.execute(
-                "SELECT COUNT(*) as count FROM sync_conflicts WHERE resolved = 0"
-            ).fetchone()
-            stats["unresolved"] = row["count"]
-
-            # Resolved today
-            today = datetime.now().date().isoformat()
             row = conn.execute("""
-                SELECT COUNT(*) as count FROM sync_conflicts
-                WHERE resolved = 1 AND resolved_at LIKE ?
-            """, (f"{today}%",)).fetchone()
-            stats["resolved_today"] = row["count"]
+                SELECT
+                    COALESCE(SUM(resolved = 0), 0) AS unresolved,
+                    COALESCE(SUM(resolved = 1 AND resolved_at >= ?), 0) AS resolved_today,
+                    MIN(CASE WHEN resolved = 0 THEN detected_at END) AS oldest_unresolved
+                FROM sync_conflicts
+            """, (today,)).fetchone()
+            stats["unresolved"] = row["unresolved"]
+            stats["resolved_today"] = row["resolved_today"]
+            stats["oldest_unresolved"] = row["oldest_unresolved"]
+
+            stats["by_type"] = {
+                row["conflict_type"]: row["count"]
+                for row in conn.execute("""
+                    SELECT f.conflict_type, COUNT(*) AS count
+                    FROM sync_conflict_fields f
+                    JOIN sync_conflicts c ON c.id = f.conflict_id
+                    WHERE c.resolved = 0
+                    GROUP BY f.conflict_type
+                """)
+            }
+
+            stats["by_adapter"] = {
+                row["adapter"] or "unknown": row["count"]
+                for row in conn.execute("""
+                    SELECT adapter, COUNT(*) AS count
+                    FROM sync_conflicts
+                    WHERE resolved = 0
+                    GROUP BY adapter
+                """)
+            }
 
-            # By conflict type
-            for row in conn.execute("""
-                SELECT conflict_data FROM sync_conflicts WHERE resolved = 0
-            """):
-                data = json.loads(row["conflict_data"])
-                for field in data.get("fields", []):
-                    ctype = field.get("conflict_type", "unknown")
-                    stats["by_type"][ctype] = stats["by_type"].get(ctype, 0) + 1
+        return stats
 
-            # Oldest unresolved
-            row = conn.execute("""
-                SELECT detected_at FROM sync_conflicts
-                WHERE resolved = 0
-                ORDER BY detected_at ASC
-                LIMIT 1
-            """).fetchone()
-            if row:
-                stats["oldest_unresolved"] = row["detected_at"]
+    def cleanup(self, days: int = 30) -> int:
+        """
+        Remove old resolved conflicts and their field rows.
 
-        return stats
+        Args:
+            days: Remove conflicts resolved longer ago than this
 
-    def cleanup(self, days: int = 30):
-        """Remove old resolved conflicts."""
+        Returns:
+            Number of conflicts removed
+        """
         from datetime import timedelta
 
         cutoff = (datetime.now() - timedelta(days=days)).isoformat()
 
         with self._get_connection() as conn:
             conn.execute("""
+                DELETE FROM sync_conflict_fields
+                WHERE conflict_id IN (
+                    SELECT id FROM sync_conflicts WHERE resolved = 1 AND resolved_at < ?
+                )
+            """, (cutoff,))
+            removed = conn.execute("""
                 DELETE FROM sync_conflicts
                 WHERE resolved = 1 AND resolved_at < ?
-            """, (cutoff,))
+            """, (cutoff,)).rowcount
             conn.commit()
+            return removed
 
 
 def load_conflict_config() -> Dict[str, ConflictStrategy]:
@@ -837,6 +1164,10 @@ if __name__ == "__main__":
             print("  By type:")
             for ctype, count in stats['by_type'].items():
                 print(f"    - {ctype}: {count}")
+        if stats['by_adapter']:
+            print("  By adapter:")
+            for adapter, count in stats['by_adapter'].items():
+                print(f"    - {adapter}: {count}")
 
     elif args.resolve:
         if not args.strategy:
@@ -5,10 +5,13 @@ DIP-0010: Task Sync Architecture
 """
 
 import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import yaml
 
@@ -22,10 +25,25 @@ from sync.adapters import (
     TaskChange,
     SyncResult,
     ChangeType,
+    TaskState,
     get_adapter,
     list_adapters,
 )
 
+from sync.history import SyncHistory
+from sync.router import TaskRouter
+from sync.org_state import (
+    SnapshotStore,
+    load_synced_tasks,
+    find_unlinked_tasks,
+    diff_org_tasks,
+    task_snapshot,
+)
+from sync.issue_index import normalize_title
+
+from zettel_db import get_connection, get_db_path, SPACES
+from writeback_engine import queue_writes, execute_pending_writes
+
 from sync.conflict import (
     ConflictDetector,
     ConflictResolver,
@@ -34,8 +52,16 @@ from sync.conflict import (
     ConflictResolution,
     ConflictStrategy,
     load_conflict_config,
+    field_hashes,
+    org_field_values,
+    external_field_values,
 )
 
+DEFAULT_PULL_CONCURRENCY = 4
+DEFAULT_PULL_TIMEOUT = 60  # seconds per adapter
+DEFAULT_SYNC_SPACE = "personal"
+DEFAULT_APPEND_LEVEL = 2  # new tasks land under the file's last category
+
 
 class SyncEngine:
     """
@@ -68,6 +94,16 @@ class SyncEngine:
         self.config: Dict[str, Any] = {}
         self._last_sync: Optional[datetime] = None
 
+        # Per-adapter outcome and changes of the most recent pull_all()
+        self.last_pull: Dict[str, Dict[str, Any]] = {}
+        self.pulled_changes: Dict[str, List[TaskChange]] = {}
+
+        # Cursors from the last resumed pull, persisted by commit_pull()
+        self._pending_cursors: Dict[str, Optional[str]] = {}
+        self._history: Optional[SyncHistory] = None
+        self._snapshots: Optional[SnapshotStore] = None
+        self._router: Optional[TaskRouter] = None
+
         # Conflict resolution (Phase 2)
         self.conflict_detector: Optional[ConflictDetector] = None
         self.conflict_resolver: Optional[ConflictResolver] = None
@@ -102,6 +138,9 @@ class SyncEngine:
         # Initialize conflict resolution
         self._init_conflict_resolution()
 
+        # Resume conflict detection from the last recorded pull
+        self._last_sync = self.history.get_last_sync(direction="pull")
+
         return True
 
     def _deep_merge(self, base: dict, override: dict):
@@ -124,7 +163,7 @@ class SyncEngine:
             adapter_class = get_adapter(adapter_name)
             if adapter_class:
                 try:
-                    self.adapters[adapter_name] = adapter_class(adapter_config)
+                    self.adapters[adapter_name] = adapter_class(config=adapter_config)
                 except Exception as e:
                     print(f"Warning: Failed to initialize {adapter_name} adapter: {e}")
 
@@ -138,6 +177,27 @@ class SyncEngine:
         self.conflict_resolver = ConflictResolver(conflict_config)
         self.conflict_queue = ConflictQueue()
 
+    @property
+    def history(self) -> SyncHistory:
+        """Sync history and state (cursors) for this data dir."""
+        if self._history is None:
+            self._history = SyncHistory(str(self.config_dir / "state" / "sync_history.db"))
+        return self._history
+
+    @property
+    def snapshots(self) -> SnapshotStore:
+        """Last-synced state of linked org tasks (same database as history)."""
+        if self._snapshots is None:
+            self._snapshots = SnapshotStore(str(self.config_dir / "state" / "sync_history.db"))
+        return self._snapshots
+
+    @property
+    def router(self) -> TaskRouter:
+        """Router placing pulled tasks in org files (sync.routing)."""
+        if self._router is None:
+            self._router = TaskRouter(self.config.get("sync", {}), data_dir=str(self.data_dir))
+        return self._router
+
     def is_enabled(self) -> bool:
         """Check if sync is enabled in config."""
         sync_config = self.config.get("sync", {})
@@ -152,30 +212,178 @@ class SyncEngine:
         """List initialized adapter names."""
         return list(self.adapters.keys())
 
-    def pull_all(self, since: Optional[datetime] = None) -> List[TaskChange]:
+    def _pull_settings(self) -> Tuple[int, float]:
+        """Get (max concurrent adapters, default per-adapter timeout)."""
+        tasks_config = self.config.get("sync", {}).get("tasks", {})
+        concurrency = int(tasks_config.get("pull_concurrency", DEFAULT_PULL_CONCURRENCY))
+        timeout = float(tasks_config.get("pull_timeout", DEFAULT_PULL_TIMEOUT))
+        return max(1, concurrency), timeout
+
+    def _adapter_timeout(self, adapter_name: str, default: float) -> float:
+        """Per-adapter pull deadline (sync.adapters.<name>.pull_timeout)."""
+        adapter_config = self.config.get("sync", {}).get("adapters", {}).get(adapter_name, {})
+        return float(adapter_config.get("pull_timeout", default))
+
+    def pull_all(
+        self,
+        since: Optional[datetime] = None,
+        resume: bool = False,
+        only: Optional[Iterable[str]] = None
+    ) -> List[TaskChange]:
         """
         Pull changes from all configured adapters.
 
+        With resume=True each adapter continues from its persisted cursor
+        (see TaskSyncAdapter.pull_since_cursor) instead of `since`. The new
+        cursors are held until commit_pull() is called after the changes
+        have been applied.
+
+        Adapters are pulled concurrently (sync.tasks.pull_concurrency) and
+        each gets its own deadline (sync.adapters.<name>.pull_timeout, else
+        sync.tasks.pull_timeout), counted from when its pull starts rather
+        than from when it was queued. An adapter that fails or misses its
+        deadline is reported in self.last_pull and the others' changes are
+        still returned.
+
         Args:
             since: Only fetch changes after this time.
+            resume: Pull from each adapter's persisted cursor.
+            only: Adapter names to pull (default: all)
 
         Returns:
             Combined list of changes from all adapters.
         """
-        all_changes = []
+        self.last_pull = {}
+        self.pulled_changes = {}
+        self._pending_cursors = {}
+        only = set(only) if only is not None else None
+        adapters = [
+            (adapter_name, adapter)
+            for adapter_name, adapter in self.adapters.items()
+            if adapter.is_configured() and (only is None or adapter_name in only)
+        ]
+        if not adapters:
+            return []
 
-        for adapter_name, adapter in self.adapters.items():
-            if not adapter.is_configured():
-                continue
+        concurrency, default_timeout = self._pull_settings()
+
+        cursors = {
+            adapter_name: self.history.get_cursor(adapter_name)
+            for adapter_name, _ in adapters
+        } if resume else {}
 
+        finished = queue.Queue()
+        outcomes: Dict[str, Tuple[str, Any]] = {}
+
+        def timed_pull(adapter_name: str, adapter: TaskSyncAdapter):
+            begin = time.monotonic()
             try:
-                changes = adapter.pull_changes(since)
-                all_changes.extend(changes)
+                if resume:
+                    changes, cursor = adapter.pull_since_cursor(cursors[adapter_name])
+                else:
+                    changes, cursor = adapter.pull_changes(since), None
+                outcomes.setdefault(adapter_name, ("ok", (changes, cursor, time.monotonic() - begin)))
             except Exception as e:
-                print(f"Error pulling from {adapter_name}: {e}")
+                outcomes.setdefault(adapter_name, ("error", e))
+            finished.put(adapter_name)
+
+        # Each pull runs in a daemon thread so one that never returns can't
+        # hold up interpreter exit. Its deadline starts when its thread does,
+        # and a timed-out pull frees its slot for the next adapter.
+        waiting = list(adapters)
+        running: Dict[str, Tuple[float, float]] = {}
+        while waiting or running:
+            while waiting and len(running) < concurrency:
+                adapter_name, adapter = waiting.pop(0)
+                timeout = self._adapter_timeout(adapter_name, default_timeout)
+                running[adapter_name] = (time.monotonic() + timeout, timeout)
+                threading.Thread(
+                    target=timed_pull,
+                    args=(adapter_name, adapter),
+                    name=f"sync-pull-{adapter_name}",
+                    daemon=True,
+                ).start()
+
+            next_deadline = min(deadline for deadline, _ in running.values())
+            try:
+                running.pop(finished.get(timeout=max(0.0, next_deadline - time.monotonic())), None)
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            for adapter_name, (deadline, timeout) in list(running.items()):
+                if now >= deadline and outcomes.setdefault(adapter_name, ("timeout", timeout))[0] == "timeout":
+                    del running[adapter_name]
+
+        all_changes = []
+        for adapter_name, adapter in adapters:
+            report: Dict[str, Any] = {"status": "ok", "count": 0, "errors": []}
+            status, outcome = outcomes[adapter_name]
+            if status == "ok":
+                changes, cursor, elapsed = outcome
+                all_changes.extend(changes)
+                self.pulled_changes[adapter_name] = changes
+                if resume:
+                    self._pending_cursors[adapter_name] = cursor
+                report["count"] = len(changes)
+                report["duration_ms"] = round(elapsed * 1000, 1)
+            elif status == "timeout":
+                report["status"] = "timeout"
+                report["errors"].append(f"No response within {outcome:.0f}s")
+                print(f"Error pulling from {adapter_name}: timed out")
+            else:
+                report["status"] = "error"
+                report["errors"].append(str(outcome))
+                print(f"Error pulling from {adapter_name}: {outcome}")
+
+            # Adapters may report partial failures (e.g. one repo of many)
+            adapter_errors = getattr(adapter, "pull_errors", None)
+            if report["status"] == "ok" and isinstance(adapter_errors, list) and adapter_errors:
+                report["status"] = "partial"
+                report["errors"].extend(adapter_errors)
+
+            self.last_pull[adapter_name] = report
 
         return all_changes
 
+    def commit_pull(self, conn=None):
+        """
+        Persist cursors from the last resumed pull, once its changes are applied.
+
+        Cursors and the pull history rows are written in one transaction.
+        If the process dies before this commits, the next pull resumes
+        from the old cursors and repeats the window (changes are state
+        updates, so reapplying them is a no-op); a window is never
+        skipped.
+
+        Args:
+            conn: Open SyncHistory.transaction() to join, so callers can
+                commit other sync state together with the cursors
+        """
+        if not self.last_pull:
+            return
+
+        if conn is None:
+            with self.history.transaction() as conn:
+                self.commit_pull(conn=conn)
+            return
+
+        for adapter_name, cursor in self._pending_cursors.items():
+            self.history.set_cursor(adapter_name, cursor, conn=conn)
+
+        for adapter_name, report in self.last_pull.items():
+            self.history.record(
+                "pull",
+                adapter_name,
+                items_processed=report["count"],
+                items_failed=0 if report["status"] == "ok" else len(report["errors"]),
+                errors=report["errors"],
+                duration_ms=int(report.get("duration_ms", 0)),
+                conn=conn
+            )
+
+        self._pending_cursors = {}
+
     def push_all(self, changes: List[TaskChange]) -> SyncResult:
         """
         Push changes to all relevant adapters.
@@ -318,31 +526,356 @@ class SyncEngine:
         stats["enabled"] = True
         return stats
 
-    def sync(self) -> Dict[str, Any]:
+    def _sync_space(self) -> str:
+        """Space whose org files hold synced tasks (sync.tasks.space)."""
+        return self.config.get("sync", {}).get("tasks", {}).get("space", DEFAULT_SYNC_SPACE)
+
+    def _load_org_tasks(self, space: str) -> Dict[str, OrgTask]:
+        """Linked org tasks of a space, from its task index."""
+        if not get_db_path(space).exists():
+            return {}
+        conn = get_connection(space)
+        try:
+            return load_synced_tasks(conn)
+        finally:
+            conn.close()
+
+    def _pulled_writes(
+        self,
+        adapter: TaskSyncAdapter,
+        org_task: OrgTask,
+        updates: Dict[str, Any]
+    ) -> List[Tuple[List[str], Dict[str, Any]]]:
+        """
+        Writebacks applying external values to a linked org task.
+
+        Args:
+            adapter: Adapter the values came from
+            org_task: Task to update
+            updates: External values by field (state, title, priority);
+                other fields have no writeback and are left alone
+
+        Returns:
+            List of (snapshot fields written, write), state change first
+        """
+        writes = []
+        closed = (TaskState.DONE, TaskState.CANCELLED)
+
+        if "state" in updates:
+            new_state = adapter.map_state_from_external(updates["state"])
+            if (new_state in closed) != (org_task.state in closed):
+                writes.append((["state"], {
+                    "table_name": "tasks",
+                    "record_id": int(org_task.id),
+                    "target_file": org_task.file_path,
+                    "operation": "update_state",
+                    "changes": {
+                        "heading": org_task.title,
+                        "old_state": org_task.state.value,
+                        "new_state": new_state.value,
+                    },
+                }))
+
+        heading_changes = {}
+        if "title" in updates:
+            heading_changes["new_title"] = updates["title"]
+        if "priority" in updates:
+            heading_changes["new_priority"] = updates["priority"]
+        if heading_changes:
+            fields = [name for name in ("title", "priority") if name in updates]
+            writes.append((fields, {
+                "table_name": "tasks",
+                "record_id": int(org_task.id),
+                "target_file": org_task.file_path,
+                "operation": "update_heading",
+                "changes": {"heading": org_task.title, **heading_changes},
+            }))
+
+        return writes
+
+    def apply_pulled(
+        self,
+        space: str,
+        org_tasks: Dict[str, OrgTask],
+        snapshots: Dict[str, Dict[str, Any]]
+    ) -> Tuple[int, Dict[str, Dict[str, Any]], Set[str], List[str]]:
+        """
+        Apply the last pull's changes to org in one batched writeback.
+
+        - Linked tasks with a snapshot are compared three-way against it
+          (ConflictDetector.detect_batch). External-only changes to state,
+          title and priority are written to org; org-only changes are left
+          for the push; fields changed on both sides go through conflict
+          resolution. A task whose conflict needs human review is held:
+          not written, pushed or re-snapshotted until it is resolved.
+        - Linked tasks never synced before follow the external open/closed
+          state
+        - A new open item is linked to an unlinked open task with the same
+          title, or appended to the file its routing rule names
+          (sync.tasks.append_level sets the heading level)
+
+        All writes are queued together and applied per file. An adapter
+        with a failed write keeps its old cursor, so its window is pulled
+        again next time.
+
+        Args:
+            space: Space the org tasks live in
+            org_tasks: Linked tasks (external_id -> OrgTask)
+            snapshots: Last-synced snapshots (external_id -> snapshot)
+
+        Returns:
+            Tuple of (writes applied, new snapshots of pulled tasks, held
+            external_ids, errors). Snapshots keep the previous org values
+            of fields the pull didn't write, so org-only changes still
+            show up as changes to push.
+        """
+        planned = []  # (adapter_name, external_id, snapshot fields, write)
+
+        pulled: Dict[str, Tuple[str, ExternalTask]] = {}
+        for adapter_name, changes in self.pulled_changes.items():
+            adapter = self.adapters.get(adapter_name)
+            for change in changes:
+                if adapter is None or change.external_task is None:
+                    continue  # e.g. calendar entries, written by their adapter
+                pulled[adapter.external_id_for(change.external_task)] = (adapter_name, change.external_task)
+
+        detector = self.conflict_detector or ConflictDetector()
+        results = {
+            result.external_id: result
+            for result in detector.detect_batch(
+                [(org_tasks[eid], task) for eid, (_, task) in pulled.items() if eid in org_tasks and eid in snapshots],
+                snapshots
+            )
+        }
+
+        held: Set[str] = set()
+        new_items: Dict[str, Tuple[str, ExternalTask]] = {}
+        for external_id, (adapter_name, external_task) in pulled.items():
+            adapter = self.adapters[adapter_name]
+            org_task = org_tasks.get(external_id)
+            if org_task is None:
+                if adapter.map_state_from_external(external_task.state) == TaskState.TODO:
+                    new_items[external_id] = (adapter_name, external_task)
+                continue
+
+            result = results.get(external_id)
+            if result is None:
+                updates = {"state": external_task.state}
+            else:
+                updates = dict(result.to_org)
+                if result.conflict:
+                    resolution = self.resolve_conflict(result.conflict) if self.conflict_resolver else None
+                    if resolution is None or resolution.needs_human_review:
+                        held.add(external_id)
+                        continue
+                    updates.update(resolution.org_changes)
+
+            for fields, write in self._pulled_writes(adapter, org_task, updates):
+                planned.append((adapter_name, external_id, fields, write))
+
+        if new_items:
+            conn = get_connection(space)
+            try:
+                unlinked = find_unlinked_tasks(conn, [task.title for _, task in new_items.values()])
+            finally:
+                conn.close()
+
+            by_adapter: Dict[str, List[Tuple[str, ExternalTask]]] = {}
+            for external_id, (adapter_name, external_task) in new_items.items():
+                by_adapter.setdefault(adapter_name, []).append((external_id, external_task))
+            routings = {}
+            for adapter_name, items in by_adapter.items():
+                batch = self.router.route_many([task for _, task in items], adapter_name)
+                routings.update(zip([external_id for external_id, _ in items], batch))
+
+            level = int(self.config.get("sync", {}).get("tasks", {}).get("append_level", DEFAULT_APPEND_LEVEL))
+            for external_id, (adapter_name, external_task) in new_items.items():
+                routing = routings[external_id]
+                org_task = self.router.external_to_org(external_task, adapter_name, external_id, routing)
+                match = unlinked.pop(normalize_title(external_task.title), None)
+
+                if match:
+                    for prop in ("EXTERNAL_ID", "EXTERNAL_URL"):
+                        planned.append((adapter_name, external_id, [], {
+                            "table_name": "tasks",
+                            "record_id": int(match.id),
+                            "target_file": match.file_path,
+                            "operation": "update_property",
+                            "changes": {
+                                "heading": match.title,
+                                "property": prop,
+                                "new_value": org_task.properties[prop],
+                            },
+                        }))
+                    continue
+
+                target = self.router.get_org_file_path(routing["destination"], SPACES[space]["path"].name)
+                planned.append((adapter_name, external_id, [], {
+                    "table_name": "files",
+                    "record_id": 0,
+                    "target_file": str(target),
+                    "operation": "append",
+                    "changes": {"content": self.router.format_org_entry(org_task, level)},
+                }))
+
+        applied = 0
+        written_fields: Dict[str, Set[str]] = {}
+        failed: Set[str] = set()
+        errors = []
+        # Queued already claimed, so the writeback worker can't apply them first
+        write_ids = queue_writes(space, [write for _, _, _, write in planned], claim=True)
+        if write_ids:
+            planned_by_id = dict(zip(write_ids, planned))
+            for write_id, status, message in execute_pending_writes(space, write_ids, claimed=True):
+                adapter_name, external_id, fields, write = planned_by_id[write_id]
+                if status == "completed":
+                    applied += 1
+                    written_fields.setdefault(external_id, set()).update(fields)
+                else:
+                    failed.add(external_id)
+                    errors.append(f"{adapter_name}: {external_id}: {message}")
+                    self._pending_cursors.pop(adapter_name, None)
+
+            # Writeback keeps the index current, so re-read rather than reparse
+            org_tasks = self._load_org_tasks(space)
+
+        new_snapshots = {}
+        for external_id, (_, external_task) in pulled.items():
+            if external_id in held or external_id in failed or external_id not in org_tasks:
+                continue
+            external_hashes = field_hashes(external_field_values(external_task))
+            current = task_snapshot(org_tasks[external_id], external_hashes)
+            previous = snapshots.get(external_id)
+            if previous is None:
+                new_snapshots[external_id] = current
+                continue
+            snapshot = {**previous, "external": external_hashes}
+            for name in written_fields.get(external_id, ()):
+                snapshot[name] = current[name]
+            new_snapshots[external_id] = snapshot
+
+        return applied, new_snapshots, held, errors
+
+    def _pushed_snapshot(
+        self,
+        task: OrgTask,
+        previous: Optional[Dict[str, Any]],
+        fields: Iterable[str]
+    ) -> Dict[str, Any]:
+        """Snapshot of an org task after `fields` were pushed (or need no push)."""
+        org_hashes = field_hashes(org_field_values(task))
+        external = dict(previous.get("external", org_hashes)) if previous else dict(org_hashes)
+        external.update({name: org_hashes[name] for name in fields if name in org_hashes})
+        return task_snapshot(task, external)
+
+    def sync(self, only: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Perform full bidirectional sync.
 
+        1. Pull external changes from each adapter's persisted cursor
+        2. Apply them to org in one batched writeback (apply_pulled)
+        3. Diff linked org tasks (from the task index) against their
+           last-synced snapshots and push what changed, per adapter
+        4. Commit cursors, snapshots and history in one transaction
+
+        When nothing changed on either side no org file is written and no
+        push is made.
+
+        Args:
+            only: Adapter names to sync (default: all). Org changes for
+                other adapters are left for their own sync.
+
         Returns:
             Dict with sync statistics.
         """
+        only = set(only) if only is not None else None
         stats = {
             "success": True,
-            "pull": {"count": 0, "errors": []},
+            "pull": {"count": 0, "applied": 0, "held": 0, "errors": []},
             "push": {"count": 0, "errors": []},
             "timestamp": datetime.now().isoformat(),
         }
 
-        # Pull external changes
+        space = self._sync_space()
+        snapshots = self.snapshots.load()
+        org_tasks = self._load_org_tasks(space)
+        pulled_snapshots: Dict[str, Dict[str, Any]] = {}
+        held: Set[str] = set()
+
+        # Pull external changes from each adapter's persisted cursor
         try:
-            changes = self.pull_all(self._last_sync)
+            changes = self.pull_all(resume=True, only=only)
             stats["pull"]["count"] = len(changes)
-            # TODO: Route changes to org-mode via router
+            stats["pull"]["adapters"] = self.last_pull
+            for adapter_name, report in self.last_pull.items():
+                for error in report["errors"]:
+                    stats["pull"]["errors"].append(f"{adapter_name}: {error}")
+
+            applied, pulled_snapshots, held, errors = self.apply_pulled(space, org_tasks, snapshots)
+            stats["pull"]["applied"] = applied
+            stats["pull"]["held"] = len(held)
+            stats["pull"]["errors"].extend(errors)
+            if applied:
+                org_tasks = self._load_org_tasks(space)
         except Exception as e:
             stats["pull"]["errors"].append(str(e))
             stats["success"] = False
+            self.last_pull = {}  # don't advance cursors past unapplied changes
 
-        # TODO: Detect org-mode changes and push
-        # This requires comparing org files with last sync state
+        # Push org changes made since the last sync
+        basis = {**snapshots, **pulled_snapshots}
+        new_snapshots = dict(pulled_snapshots)
+        org_changes, baselines = diff_org_tasks(org_tasks, basis, skip=held)
+        for snapshot in baselines:
+            new_snapshots[snapshot["external_id"]] = snapshot
+
+        changes_by_adapter: Dict[str, List[TaskChange]] = {}
+        for change in org_changes:
+            task = change.org_task
+            adapter = self.adapters.get(task.external_id.split(":")[0])
+            if adapter is None or (only is not None and adapter.name not in only):
+                continue
+            if change.change_type == ChangeType.STATE_CHANGED and (
+                adapter.map_state_to_external(TaskState(change.old_state))
+                == adapter.map_state_to_external(task.state)
+            ):
+                # e.g. TODO -> NEXT: nothing to push, just record it
+                new_snapshots[task.external_id] = self._pushed_snapshot(
+                    task, basis.get(task.external_id), ["state"]
+                )
+                continue
+            changes_by_adapter.setdefault(adapter.name, []).append(change)
+
+        push_reports = []
+        for adapter_name, adapter_changes in changes_by_adapter.items():
+            started = time.monotonic()
+            result = self.push_all(adapter_changes)
+            push_reports.append((adapter_name, result, time.monotonic() - started))
+            stats["push"]["count"] += result.items_processed
+            stats["push"]["errors"].extend(f"{adapter_name}: {error}" for error in result.errors)
+            if result.success:
+                for change in adapter_changes:
+                    task = change.org_task
+                    new_snapshots[task.external_id] = self._pushed_snapshot(
+                        task, new_snapshots.get(task.external_id, basis.get(task.external_id)),
+                        change.changed_fields
+                    )
+
+        with self.history.transaction() as conn:
+            self.commit_pull(conn=conn)
+            self.snapshots.save_many(new_snapshots.values(), conn=conn)
+            for adapter_name, result, elapsed in push_reports:
+                self.history.record(
+                    "push",
+                    adapter_name,
+                    items_processed=result.items_processed,
+                    items_created=result.items_created,
+                    items_updated=result.items_updated,
+                    items_failed=result.items_failed,
+                    errors=result.errors,
+                    duration_ms=int(elapsed * 1000),
+                    conn=conn
+                )
 
         self._last_sync = datetime.now()
 
@@ -412,7 +945,7 @@ if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Datacore Sync Engine")
-    parser.add_argument("command", choices=["diagnostic", "pull", "push", "sync"],
+    parser.add_argument("command", choices=["diagnostic", "pull", "push", "sync", "schedule"],
                         help="Command to run")
     parser.add_argument("--verbose", "-v", action="store_true",
                         help="Verbose output")
@@ -434,3 +967,10 @@ if __name__ == "__main__":
     elif args.command == "sync":
         result = sync_all()
         print(f"Sync complete: {result}")
+
+    elif args.command == "schedule":
+        from sync.scheduler import run_scheduler
+        print("Background sync running (Ctrl-C to stop)")
+        totals = run_scheduler()
+        print(f"\nScheduler stopped: {totals['succeeded']} succeeded, {totals['failed']} failed, "
+              f"{totals['throttled']} throttled")
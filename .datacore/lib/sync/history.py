@@ -12,6 +12,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# Rollup granularity -> length of the ISO timestamp prefix naming its bucket
+# ("2025-12-09T14" for an hour, "2025-12-09" for a day)
+ROLLUP_BUCKETS = {"hour": 13, "day": 10}
+
 
 @dataclass
 class SyncHistoryEntry:
@@ -78,6 +82,26 @@ class SyncHistory:
                 )
             """)
 
+            # Per-bucket aggregates of runs removed by cleanup()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sync_rollups (
+                    granularity TEXT NOT NULL,
+                    bucket TEXT NOT NULL,
+                    direction TEXT NOT NULL,
+                    adapter TEXT NOT NULL,
+                    runs INTEGER NOT NULL,
+                    failed_runs INTEGER NOT NULL,
+                    items_processed INTEGER DEFAULT 0,
+                    items_created INTEGER DEFAULT 0,
+                    items_updated INTEGER DEFAULT 0,
+                    items_failed INTEGER DEFAULT 0,
+                    duration_total_ms INTEGER DEFAULT 0,
+                    duration_p50_ms INTEGER,
+                    duration_p95_ms INTEGER,
+                    PRIMARY KEY (granularity, bucket, direction, adapter)
+                )
+            """)
+
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_sync_history_timestamp
                 ON sync_history(timestamp DESC)
@@ -100,6 +124,34 @@ class SyncHistory:
         finally:
             conn.close()
 
+    @contextmanager
+    def transaction(self):
+        """
+        Open a write transaction shared by several calls.
+
+        Pass the yielded connection as `conn` to record(), set_state() or
+        set_cursor(); everything commits together or not at all.
+        """
+        with self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    @contextmanager
+    def _writer(self, conn=None):
+        """Use the caller's transaction, or a connection of our own."""
+        if conn is not None:
+            yield conn
+            return
+
+        with self._get_connection() as own_conn:
+            yield own_conn
+            own_conn.commit()
+
     def record(
         self,
         direction: str,
@@ -109,17 +161,22 @@ class SyncHistory:
         items_updated: int = 0,
         items_failed: int = 0,
         errors: List[str] = None,
-        duration_ms: int = 0
+        duration_ms: int = 0,
+        conn=None
     ) -> int:
         """
         Record a sync operation.
 
+        Args:
+            conn: Connection from transaction(), to record atomically with
+                other state
+
         Returns:
             ID of the new record.
         """
         import json
 
-        with self._get_connection() as conn:
+        with self._writer(conn) as conn:
             cursor = conn.execute("""
                 INSERT INTO sync_history
                 (timestamp, direction, adapter, items_processed, items_created,
@@ -136,7 +193,6 @@ class SyncHistory:
                 json.dumps(errors or []),
                 duration_ms
             ))
-            conn.commit()
             return cursor.lastrowid
 
     def get_last_sync(self, adapter: str = None, direction: str = None) -> Optional[datetime]:
@@ -229,15 +285,23 @@ class SyncHistory:
         """
         Get sync statistics for diagnostic.
 
+        Counts come from the remaining per-run rows plus the rollups of runs
+        already removed by cleanup(), so the cost is bounded by the
+        retention window rather than by how far back `days` reaches. Rolled-up
+        days after the window's first day count whole; on the first day only
+        hours after the cutoff's hour count (none once hourly rollups expire).
+
         Args:
             days: Number of days to look back
 
         Returns:
             Dict with statistics
         """
+        import json
         from datetime import timedelta
 
-        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        since = datetime.now() - timedelta(days=days)
+        cutoff = since.isoformat()
 
         stats = {
             "period_days": days,
@@ -248,33 +312,45 @@ class SyncHistory:
             "errors": []
         }
 
+        # Runs in the window: raw rows, then daily rollups of deleted rows
+        runs = """
+            SELECT direction, adapter, 1 AS runs, items_processed AS items,
+                   CASE WHEN items_failed > 0 THEN 1 ELSE 0 END AS failed
+            FROM sync_history
+            WHERE timestamp > ?
+            UNION ALL
+            SELECT direction, adapter, runs, items_processed AS items, failed_runs AS failed
+            FROM sync_rollups
+            WHERE (granularity = 'day' AND bucket > ?)
+               OR (granularity = 'hour' AND bucket > ? AND bucket < ?)
+        """
+        params = (
+            cutoff,
+            since.date().isoformat(),
+            cutoff[:ROLLUP_BUCKETS["hour"]],
+            (since.date() + timedelta(days=1)).isoformat(),
+        )
+
         with self._get_connection() as conn:
             # Aggregate by direction
-            for row in conn.execute("""
-                SELECT
-                    direction,
-                    COUNT(*) as count,
-                    SUM(items_processed) as items,
-                    SUM(CASE WHEN items_failed > 0 THEN 1 ELSE 0 END) as failed
-                FROM sync_history
-                WHERE timestamp > ?
+            for row in conn.execute(f"""
+                SELECT direction, SUM(runs) as count, SUM(items) as items, SUM(failed) as failed
+                FROM ({runs})
                 GROUP BY direction
-            """, (cutoff,)):
+            """, params):
                 direction = row["direction"]
+                if direction not in stats:
+                    continue
                 stats[direction]["success"] = row["count"] - row["failed"]
                 stats[direction]["failed"] = row["failed"]
                 stats[direction]["items"] = row["items"] or 0
 
             # By adapter
-            for row in conn.execute("""
-                SELECT
-                    adapter,
-                    COUNT(*) as count,
-                    SUM(items_processed) as items
-                FROM sync_history
-                WHERE timestamp > ?
+            for row in conn.execute(f"""
+                SELECT adapter, SUM(runs) as count, SUM(items) as items
+                FROM ({runs})
                 GROUP BY adapter
-            """, (cutoff,)):
+            """, params):
                 stats["by_adapter"][row["adapter"]] = {
                     "count": row["count"],
                     "items": row["items"] or 0
@@ -288,26 +364,73 @@ class SyncHistory:
             if row:
                 stats["last_sync"] = row["timestamp"]
 
-            # Recent errors
+            # Recent errors (only the newest few rows are decoded)
             for row in conn.execute("""
                 SELECT errors FROM sync_history
                 WHERE timestamp > ? AND errors != '[]'
                 ORDER BY timestamp DESC LIMIT 10
             """, (cutoff,)):
-                import json
-                errors = json.loads(row["errors"])
-                stats["errors"].extend(errors)
+                stats["errors"].extend(json.loads(row["errors"]))
 
         return stats
 
-    def set_state(self, key: str, value: str):
-        """Store sync state value."""
+    def get_rollups(
+        self,
+        granularity: str = "day",
+        days: int = 90,
+        adapter: str = None,
+        direction: str = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get rolled-up history buckets, oldest first.
+
+        Only runs removed by cleanup() are rolled up; newer runs are still
+        available from get_history().
+
+        Args:
+            granularity: "hour" or "day"
+            days: Number of days to look back
+            adapter: Filter by adapter
+            direction: Filter by direction
+
+        Returns:
+            List of bucket dicts (bucket, direction, adapter, runs,
+            failed_runs, items_*, duration_total_ms, duration_p50_ms,
+            duration_p95_ms)
+        """
+        from datetime import timedelta
+
+        if granularity not in ROLLUP_BUCKETS:
+            raise ValueError(f"Unknown rollup granularity: {granularity}")
+
+        since = (datetime.now() - timedelta(days=days)).isoformat()[:ROLLUP_BUCKETS[granularity]]
+
+        query = "SELECT * FROM sync_rollups WHERE granularity = ? AND bucket >= ?"
+        params = [granularity, since]
+
+        if adapter:
+            query += " AND adapter = ?"
+            params.append(adapter)
+
+        if direction:
+            query += " AND direction = ?"
+            params.append(direction)
+
+        query += " ORDER BY bucket, direction, adapter"
+
         with self._get_connection() as conn:
+            return [
+                {key: row[key] for key in row.keys() if key != "granularity"}
+                for row in conn.execute(query, params)
+            ]
+
+    def set_state(self, key: str, value: str, conn=None):
+        """Store sync state value."""
+        with self._writer(conn) as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO sync_state (key, value, updated_at)
                 VALUES (?, ?, ?)
             """, (key, value, datetime.now().isoformat()))
-            conn.commit()
 
     def get_state(self, key: str) -> Optional[str]:
         """Get sync state value."""
@@ -318,20 +441,86 @@ class SyncHistory:
             ).fetchone()
             return row["value"] if row else None
 
-    def cleanup(self, days: int = 30):
+    def set_cursor(self, adapter: str, cursor: Optional[str], conn=None):
+        """
+        Store an adapter's pull cursor (opaque to the engine).
+
+        Call with a connection from transaction() so the cursor advances in
+        the same commit as the pulled changes are recorded.
         """
-        Remove old history entries.
+        if cursor is None:
+            with self._writer(conn) as conn:
+                conn.execute("DELETE FROM sync_state WHERE key = ?", (f"cursor:{adapter}",))
+            return
+        self.set_state(f"cursor:{adapter}", cursor, conn=conn)
+
+    def get_cursor(self, adapter: str) -> Optional[str]:
+        """Get the cursor an adapter should resume pulling from."""
+        return self.get_state(f"cursor:{adapter}")
+
+    def cleanup(self, days: int = 30, hourly_days: int = 90) -> int:
+        """
+        Roll up and remove old history entries.
+
+        Entries from days entirely older than `days` are aggregated into
+        hourly and daily buckets (run and failure counts, item totals,
+        p50/p95 duration) and then deleted, in one transaction. Cutting at
+        midnight keeps every bucket complete, so a bucket is written once.
 
         Args:
             days: Remove entries older than this
+            hourly_days: Drop hourly rollups older than this (daily
+                rollups are kept)
+
+        Returns:
+            Number of entries removed.
         """
         from datetime import timedelta
 
-        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
-
-        with self._get_connection() as conn:
-            conn.execute(
+        cutoff = (datetime.now() - timedelta(days=days)).date().isoformat()
+        hourly_cutoff = (datetime.now() - timedelta(days=hourly_days)).date().isoformat()
+
+        with self.transaction() as conn:
+            for granularity, length in ROLLUP_BUCKETS.items():
+                # Nearest-rank percentiles: the duration at rank ceil(p * n)
+                conn.execute(f"""
+                    INSERT OR REPLACE INTO sync_rollups
+                    (granularity, bucket, direction, adapter, runs, failed_runs,
+                     items_processed, items_created, items_updated, items_failed,
+                     duration_total_ms, duration_p50_ms, duration_p95_ms)
+                    SELECT
+                        ?, bucket, direction, adapter, COUNT(*),
+                        SUM(CASE WHEN items_failed > 0 THEN 1 ELSE 0 END),
+                        SUM(items_processed), SUM(items_created),
+                        SUM(items_updated), SUM(items_failed),
+                        SUM(duration_ms),
+                        MIN(CASE WHEN rank * 100 >= n * 50 THEN duration_ms END),
+                        MIN(CASE WHEN rank * 100 >= n * 95 THEN duration_ms END)
+                    FROM (
+                        SELECT
+                            substr(timestamp, 1, {length}) AS bucket,
+                            direction, adapter, items_processed, items_created,
+                            items_updated, items_failed, duration_ms,
+                            ROW_NUMBER() OVER w AS rank,
+                            COUNT(*) OVER (PARTITION BY substr(timestamp, 1, {length}), direction, adapter) AS n
+                        FROM sync_history
+                        WHERE timestamp < ?
+                        WINDOW w AS (
+                            PARTITION BY substr(timestamp, 1, {length}), direction, adapter
+                            ORDER BY duration_ms
+                        )
+                    )
+                    GROUP BY bucket, direction, adapter
+                """, (granularity, cutoff))
+
+            removed = conn.execute(
                 "DELETE FROM sync_history WHERE timestamp < ?",
                 (cutoff,)
+            ).rowcount
+
+            conn.execute(
+                "DELETE FROM sync_rollups WHERE granularity = 'hour' AND bucket < ?",
+                (hourly_cutoff,)
             )
-            conn.commit()
+
+        return removed
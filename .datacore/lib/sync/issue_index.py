@@ -0,0 +1,268 @@
+"""
+Issue Index - Local cache of external issues for duplicate matching.
+
+DIP-0010: Task Sync Architecture
+
+Adapters refresh the index from their incremental pulls, so matching an
+org task against existing issues is an indexed lookup (exact normalized
+title) with a locally computed fuzzy fallback instead of one remote
+search per task.
+"""
+
+import os
+import re
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_FUZZY_THRESHOLD = 0.9
+
+
+def normalize_title(title: str) -> str:
+    """Normalize an issue title for matching."""
+    # Remove common prefixes like [TEST], [WIP], etc.
+    title = re.sub(r'^\[.*?\]\s*', '', title or '')
+    return re.sub(r'\s+', ' ', title).lower().strip()
+
+
+class IssueIndex:
+    """
+    Local index of external issues in the sync state database.
+
+    Usage:
+        index = IssueIndex()
+        index.upsert_many("github", [{...}, ...])
+        match = index.find_match("github", "Fix login bug", scopes=["owner/repo"])
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize issue index.
+
+        Args:
+            db_path: Path to database. If None, uses default location.
+        """
+        if db_path:
+            self.db_path = Path(db_path)
+        else:
+            data_dir = Path(os.environ.get("DATA_DIR", os.path.expanduser("~/Data")))
+            self.db_path = data_dir / ".datacore" / "state" / "sync_history.db"
+
+        self._ensure_tables()
+
+    def _ensure_tables(self):
+        """Ensure index tables exist."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS issue_index (
+                    external_id TEXT PRIMARY KEY,
+                    adapter TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    normalized_title TEXT NOT NULL,
+                    state TEXT,
+                    updated_at TEXT,
+                    url TEXT
+                )
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_issue_index_title
+                ON issue_index(adapter, normalized_title)
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_issue_index_scope
+                ON issue_index(adapter, scope, state)
+            """)
+
+            # Scopes (e.g. repos) that have had at least one full refresh
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS issue_index_scopes (
+                    adapter TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    refreshed_at TEXT NOT NULL,
+                    PRIMARY KEY (adapter, scope)
+                )
+            """)
+
+            conn.commit()
+
+    @contextmanager
+    def _get_connection(self):
+        """Get database connection with row factory."""
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def upsert_many(self, adapter: str, issues: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or update issues.
+
+        Each issue dict needs external_id, scope and title; state,
+        updated_at (datetime or ISO string) and url are optional.
+
+        Returns:
+            Number of issues written.
+        """
+        rows = []
+        for issue in issues:
+            updated_at = issue.get("updated_at")
+            if isinstance(updated_at, datetime):
+                updated_at = updated_at.isoformat()
+            rows.append((
+                issue["external_id"],
+                adapter,
+                issue["scope"],
+                issue["title"],
+                normalize_title(issue["title"]),
+                issue.get("state"),
+                updated_at,
+                issue.get("url"),
+            ))
+
+        if not rows:
+            return 0
+
+        with self._get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO issue_index
+                (external_id, adapter, scope, title, normalized_title, state, updated_at, url)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(external_id) DO UPDATE SET
+                    scope = excluded.scope,
+                    title = excluded.title,
+                    normalized_title = excluded.normalized_title,
+                    state = COALESCE(excluded.state, issue_index.state),
+                    updated_at = COALESCE(excluded.updated_at, issue_index.updated_at),
+                    url = COALESCE(excluded.url, issue_index.url)
+            """, rows)
+            conn.commit()
+
+        return len(rows)
+
+    def set_state(self, external_id: str, state: str):
+        """Update the cached state of one issue (e.g. after closing it)."""
+        with self._get_connection() as conn:
+            conn.execute(
+                "UPDATE issue_index SET state = ? WHERE external_id = ?",
+                (state, external_id)
+            )
+            conn.commit()
+
+    def mark_refreshed(self, adapter: str, scopes: Iterable[str]):
+        """Record that scopes have been fully pulled into the index."""
+        now = datetime.now().isoformat()
+        with self._get_connection() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO issue_index_scopes (adapter, scope, refreshed_at)
+                VALUES (?, ?, ?)
+            """, [(adapter, scope, now) for scope in scopes])
+            conn.commit()
+
+    def unrefreshed_scopes(self, adapter: str, scopes: Iterable[str]) -> List[str]:
+        """Return the scopes that have never been fully pulled."""
+        scopes = list(scopes)
+        with self._get_connection() as conn:
+            refreshed = {
+                row["scope"] for row in conn.execute(
+                    "SELECT scope FROM issue_index_scopes WHERE adapter = ?",
+                    (adapter,)
+                )
+            }
+        return [scope for scope in scopes if scope not in refreshed]
+
+    def find_match(
+        self,
+        adapter: str,
+        title: str,
+        scopes: Optional[List[str]] = None,
+        state: Optional[str] = "open",
+        threshold: float = DEFAULT_FUZZY_THRESHOLD
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the indexed issue best matching a title.
+
+        Exact normalized-title matches come from the title index. Without
+        one, the closest title within `scopes` scoring at least
+        `threshold` (difflib ratio) is returned.
+
+        Args:
+            adapter: Adapter name
+            title: Title to match
+            scopes: Limit to these scopes (None for all)
+            state: Only issues in this state (None for any)
+            threshold: Minimum fuzzy similarity, 0-1
+
+        Returns:
+            Issue dict (with a `score` key) or None
+        """
+        normalized = normalize_title(title)
+        if not normalized:
+            return None
+
+        filters = ["adapter = ?"]
+        params: List[Any] = [adapter]
+        if scopes is not None:
+            if not scopes:
+                return None
+            filters.append(f"scope IN ({','.join('?' * len(scopes))})")
+            params.extend(scopes)
+        if state is not None:
+            filters.append("state = ?")
+            params.append(state)
+        where = " AND ".join(filters)
+
+        with self._get_connection() as conn:
+            row = conn.execute(f"""
+                SELECT * FROM issue_index
+                WHERE {where} AND normalized_title = ?
+                ORDER BY updated_at DESC
+                LIMIT 1
+            """, params + [normalized]).fetchone()
+
+            if row:
+                return {**dict(row), "score": 1.0}
+
+            # Fuzzy fallback: similar lengths only, since ratio() is bounded
+            # by 2 * min(len) / (len_a + len_b)
+            max_len = int(len(normalized) * (2 - threshold) / threshold) + 1
+            min_len = int(len(normalized) * threshold / (2 - threshold))
+            candidates = conn.execute(f"""
+                SELECT * FROM issue_index
+                WHERE {where} AND length(normalized_title) BETWEEN ? AND ?
+            """, params + [min_len, max_len]).fetchall()
+
+        best = None
+        best_score = threshold
+        matcher = SequenceMatcher(b=normalized, autojunk=False)
+        for candidate in candidates:
+            matcher.set_seq1(candidate["normalized_title"])
+            if matcher.real_quick_ratio() < best_score or matcher.quick_ratio() < best_score:
+                continue
+            score = matcher.ratio()
+            if score >= best_score:
+                best, best_score = candidate, score
+
+        if best is None:
+            return None
+        return {**dict(best), "score": round(best_score, 3)}
+
+    def count(self, adapter: Optional[str] = None) -> int:
+        """Number of indexed issues."""
+        with self._get_connection() as conn:
+            if adapter:
+                row = conn.execute(
+                    "SELECT COUNT(*) FROM issue_index WHERE adapter = ?", (adapter,)
+                ).fetchone()
+            else:
+                row = conn.execute("SELECT COUNT(*) FROM issue_index").fetchone()
+        return row[0]
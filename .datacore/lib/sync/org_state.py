@@ -0,0 +1,313 @@
+"""
+Org State - Synced org tasks and their last-synced snapshots.
+
+DIP-0010: Task Sync Architecture
+
+Org-side change detection reads the indexed tasks table (kept current by
+the indexer and writeback write-through) and compares each task that has
+an EXTERNAL_ID with the snapshot taken when it was last synced. No org
+files are reparsed, and an unchanged task produces no change.
+"""
+
+import ast
+import json
+import os
+import re
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .adapters import OrgTask, TaskChange, ChangeType, TaskState, Priority
+from .conflict import field_hashes, org_field_values
+from .issue_index import normalize_title
+
+# Fields compared between an org task and its snapshot
+SNAPSHOT_FIELDS = ["state", "title", "priority", "deadline", "tags"]
+
+
+def _parse_properties(value: Optional[str]) -> Dict[str, str]:
+    """Decode tasks.properties (stored as a dict repr by org_parser)."""
+    if not value:
+        return {}
+    try:
+        properties = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return {}
+    return properties if isinstance(properties, dict) else {}
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse the date part of an indexed SCHEDULED/DEADLINE value."""
+    if not value:
+        return None
+    match = re.search(r"\d{4}-\d{2}-\d{2}", value)
+    return datetime.strptime(match.group(0), "%Y-%m-%d") if match else None
+
+
+def _link_target(value: Optional[str]) -> Optional[str]:
+    """Extract the URL from an org link ([[url][label]]) or return as-is."""
+    if not value:
+        return None
+    match = re.match(r"\[\[([^\]]+)\]", value)
+    return match.group(1) if match else value
+
+
+def row_to_org_task(row) -> OrgTask:
+    """Build an OrgTask from an indexed tasks row."""
+    properties = _parse_properties(row["properties"])
+    properties = {key.upper(): value for key, value in properties.items()}
+
+    state = TaskState(row["state"]) if row["state"] in TaskState.__members__ else TaskState.TODO
+    priority = Priority(row["priority"]) if row["priority"] in ("A", "B", "C") else None
+
+    tags = []
+    if row["tags"]:
+        tags.append(row["tags"])
+        names = [name for name in row["tags"].strip(":").split(":") if name]
+        if len(names) > 1:
+            tags.extend(f":{name}:" for name in names)
+
+    return OrgTask(
+        id=str(row["id"]),
+        title=row["heading"],
+        file_path=row["source_file"],
+        line_number=row["line_number"] or 0,
+        properties=properties,
+        external_id=properties.get("EXTERNAL_ID"),
+        external_url=_link_target(properties.get("EXTERNAL_URL")),
+        sync_status=properties.get("SYNC_STATUS"),
+        state=state,
+        priority=priority,
+        deadline=_parse_date(row["deadline"]),
+        scheduled=_parse_date(row["scheduled"]),
+        tags=tags,
+    )
+
+
+def load_synced_tasks(conn) -> Dict[str, OrgTask]:
+    """
+    Load indexed tasks that are linked to an external item.
+
+    Args:
+        conn: Connection to a space's knowledge.db
+
+    Returns:
+        Dict of external_id to OrgTask
+    """
+    tasks = {}
+    for row in conn.execute("""
+        SELECT * FROM tasks
+        WHERE properties LIKE '%EXTERNAL_ID%'
+        ORDER BY id
+    """):
+        task = row_to_org_task(row)
+        if task.external_id:
+            tasks[task.external_id] = task
+    return tasks
+
+
+def find_unlinked_tasks(conn, titles: Iterable[str]) -> Dict[str, OrgTask]:
+    """
+    Find open tasks without an external link whose titles match.
+
+    Args:
+        conn: Connection to a space's knowledge.db
+        titles: Titles to look for
+
+    Returns:
+        Dict of normalized title to OrgTask (first indexed task wins)
+    """
+    wanted = {normalize_title(title) for title in titles}
+    wanted.discard("")
+    if not wanted:
+        return {}
+
+    found = {}
+    for row in conn.execute("""
+        SELECT * FROM tasks
+        WHERE state NOT IN ('DONE', 'CANCELLED')
+          AND (properties IS NULL OR properties NOT LIKE '%EXTERNAL_ID%')
+        ORDER BY id
+    """):
+        normalized = normalize_title(row["heading"])
+        if normalized in wanted and normalized not in found:
+            found[normalized] = row_to_org_task(row)
+    return found
+
+
+def task_snapshot(task: OrgTask, external_hashes: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Comparable snapshot of the synced fields of an org task.
+
+    The snapshot is also the base for three-way conflict detection
+    (ConflictDetector.detect_three_way): its org values, plus hashes of the
+    external task's values under "external".
+
+    Args:
+        task: Org task as of this sync
+        external_hashes: conflict.field_hashes() of the external task's
+            values, if known; otherwise both sides are taken to agree
+    """
+    return {
+        "external_id": task.external_id,
+        "state": task.state.value,
+        "title": task.title,
+        "priority": task.priority.value if task.priority else None,
+        "deadline": task.deadline.strftime("%Y-%m-%d") if task.deadline else None,
+        "tags": task.tags[0] if task.tags else None,
+        "external": external_hashes or field_hashes(org_field_values(task)),
+    }
+
+
+def diff_org_tasks(
+    org_tasks: Dict[str, OrgTask],
+    snapshots: Dict[str, Dict[str, Any]],
+    skip: Optional[Set[str]] = None
+) -> Tuple[List[TaskChange], List[Dict[str, Any]]]:
+    """
+    Compute org-side changes since each task's last sync.
+
+    A task whose state changed yields a STATE_CHANGED change; other field
+    changes yield an UPDATED change (a task can produce both). Tasks with
+    no snapshot yet are returned as baselines: their current state is
+    recorded without pushing, since neither side is known to be newer.
+
+    Args:
+        org_tasks: external_id -> OrgTask (from load_synced_tasks)
+        snapshots: external_id -> snapshot (from SnapshotStore.load)
+        skip: external_ids to leave alone (e.g. just updated by a pull)
+
+    Returns:
+        Tuple of (changes to push, baseline snapshots to record)
+    """
+    skip = skip or set()
+    changes = []
+    baselines = []
+
+    for external_id, task in org_tasks.items():
+        if external_id in skip:
+            continue
+
+        current = task_snapshot(task)
+        previous = snapshots.get(external_id)
+        if previous is None:
+            baselines.append(current)
+            continue
+
+        changed = [name for name in SNAPSHOT_FIELDS if current[name] != previous.get(name)]
+        if not changed:
+            continue
+
+        other_fields = [name for name in changed if name != "state"]
+        if other_fields:
+            changes.append(TaskChange(
+                change_type=ChangeType.UPDATED,
+                org_task=task,
+                changed_fields=other_fields,
+            ))
+        if "state" in changed:
+            changes.append(TaskChange(
+                change_type=ChangeType.STATE_CHANGED,
+                org_task=task,
+                old_state=previous.get("state"),
+                new_state=current["state"],
+                changed_fields=["state"],
+            ))
+
+    return changes, baselines
+
+
+class SnapshotStore:
+    """
+    Last-synced state of each linked task, in the sync state database.
+
+    A snapshot is written whenever both sides are known to agree (after a
+    pull is applied or a push succeeds), so it is the common base for the
+    next comparison.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize snapshot store.
+
+        Args:
+            db_path: Path to database. If None, uses default location.
+        """
+        if db_path:
+            self.db_path = Path(db_path)
+        else:
+            data_dir = Path(os.environ.get("DATA_DIR", os.path.expanduser("~/Data")))
+            self.db_path = data_dir / ".datacore" / "state" / "sync_history.db"
+
+        self._ensure_tables()
+
+    def _ensure_tables(self):
+        """Ensure snapshot table exists."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sync_snapshots (
+                    external_id TEXT PRIMARY KEY,
+                    adapter TEXT NOT NULL,
+                    snapshot TEXT NOT NULL,
+                    synced_at TEXT NOT NULL
+                )
+            """)
+            conn.commit()
+
+    @contextmanager
+    def _get_connection(self):
+        """Get database connection with row factory."""
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Load all snapshots, keyed by external_id."""
+        with self._get_connection() as conn:
+            return {
+                row["external_id"]: json.loads(row["snapshot"])
+                for row in conn.execute("SELECT external_id, snapshot FROM sync_snapshots")
+            }
+
+    def save_many(self, snapshots: Iterable[Dict[str, Any]], conn=None):
+        """
+        Insert or replace snapshots.
+
+        Args:
+            snapshots: Dicts from task_snapshot()
+            conn: Connection from SyncHistory.transaction() on the same
+                database, to save atomically with cursors and history
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (
+                snapshot["external_id"],
+                snapshot["external_id"].split(":")[0],
+                json.dumps(snapshot, sort_keys=True),
+                now,
+            )
+            for snapshot in snapshots
+        ]
+        if not rows:
+            return
+
+        def write(connection):
+            connection.executemany("""
+                INSERT OR REPLACE INTO sync_snapshots (external_id, adapter, snapshot, synced_at)
+                VALUES (?, ?, ?, ?)
+            """, rows)
+
+        if conn is not None:
+            write(conn)
+            return
+
+        with self._get_connection() as own_conn:
+            write(own_conn)
+            own_conn.commit()
@@ -8,11 +8,178 @@ import os
 import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from .adapters import ExternalTask, OrgTask, TaskState, Priority
 
+Predicate = Callable[[ExternalTask], bool]
+
+# Dispatch key of a condition: ("label", name) or ("assignee", login) when
+# the condition can only match tasks with that label/assignee
+DispatchKey = Optional[Tuple[str, str]]
+
+_TOKEN_RE = re.compile(r"""\s*(?:('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")|(==|!=|\(|\))|([^\s()'"=!]+))""")
+
+
+def _tokenize(condition: str) -> List[Tuple[str, str]]:
+    """Split a condition into (kind, text) tokens: str, op, word."""
+    tokens = []
+    pos = 0
+    condition = condition.strip()
+    while pos < len(condition):
+        match = _TOKEN_RE.match(condition, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"Unexpected character at {pos}: {condition[pos:]!r}")
+        quoted, op, word = match.groups()
+        if quoted is not None:
+            tokens.append(("str", re.sub(r"\\(['\"])", r"\1", quoted[1:-1])))
+        elif op is not None:
+            tokens.append(("op", op))
+        else:
+            tokens.append(("word", word.lower()))
+        pos = match.end()
+    return tokens
+
+
+def _never(task: ExternalTask) -> bool:
+    return False
+
+
+def _always(task: ExternalTask) -> bool:
+    return True
+
+
+def _compile_atom(words: List[Tuple[str, str]]) -> Tuple[Predicate, DispatchKey]:
+    """
+    Compile one comparison.
+
+    Supported:
+        true | false | no external_id
+        labels contains 'X'
+        assignee == 'X' | assignee != 'X' | assignee is [not] null
+        milestone == 'X' | milestone != 'X' | milestone is [not] null
+        title matches 'regex' | title contains 'X'
+    """
+    texts = [text for _, text in words]
+    kinds = [kind for kind, _ in words]
+
+    if texts in (["true"], ["no", "external_id"]):
+        # "no external_id" is checked at caller level
+        return _always, None
+    if texts == ["false"]:
+        return _never, None
+
+    if len(words) == 3 and kinds[2] == "str":
+        field, op, value = texts
+        lowered = value.lower()
+
+        if field == "labels" and op == "contains":
+            return (lambda task: any(label.lower() == lowered for label in task.labels)), ("label", lowered)
+
+        if field in ("assignee", "milestone") and op in ("==", "!="):
+            def equals(task, field=field):
+                actual = getattr(task, field)
+                return actual is not None and actual.lower() == lowered
+            if op == "==":
+                key = ("assignee", lowered) if field == "assignee" else None
+                return equals, key
+            return (lambda task: not equals(task)), None
+
+        if field == "title" and op == "matches":
+            pattern = re.compile(value, re.IGNORECASE)
+            return (lambda task: pattern.search(task.title or "") is not None), None
+
+        if field == "title" and op == "contains":
+            return (lambda task: lowered in (task.title or "").lower()), None
+
+    if len(texts) in (3, 4) and texts[0] in ("assignee", "milestone") and texts[1] == "is" and texts[-1] == "null":
+        field = texts[0]
+        if len(texts) == 3:
+            return (lambda task: getattr(task, field) is None), None
+        if texts[2] == "not":
+            return (lambda task: getattr(task, field) is not None), None
+
+    raise ValueError(f"Unsupported condition: {' '.join(texts)!r}")
+
+
+class _ConditionParser:
+    """Recursive-descent parser: or > and > not > (group) | comparison."""
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _accept(self, kind: str, text: str) -> bool:
+        if self._peek() == (kind, text):
+            self.pos += 1
+            return True
+        return False
+
+    def parse(self) -> Tuple[Predicate, DispatchKey]:
+        result = self._or()
+        if self._peek() is not None:
+            raise ValueError(f"Unexpected {self._peek()[1]!r}")
+        return result
+
+    def _or(self) -> Tuple[Predicate, DispatchKey]:
+        parts = [self._and()]
+        while self._accept("word", "or"):
+            parts.append(self._and())
+        if len(parts) == 1:
+            return parts[0]
+        predicates = [predicate for predicate, _ in parts]
+        return (lambda task: any(p(task) for p in predicates)), None
+
+    def _and(self) -> Tuple[Predicate, DispatchKey]:
+        parts = [self._not()]
+        while self._accept("word", "and"):
+            parts.append(self._not())
+        if len(parts) == 1:
+            return parts[0]
+        predicates = [predicate for predicate, _ in parts]
+        # Every part must hold, so any part's key is a valid key for the whole
+        key = next((key for _, key in parts if key), None)
+        return (lambda task: all(p(task) for p in predicates)), key
+
+    def _not(self) -> Tuple[Predicate, DispatchKey]:
+        if self._accept("word", "not"):
+            predicate, _ = self._not()
+            return (lambda task: not predicate(task)), None
+        if self._accept("op", "("):
+            result = self._or()
+            if not self._accept("op", ")"):
+                raise ValueError("Missing ')'")
+            return result
+        return self._comparison()
+
+    def _comparison(self) -> Tuple[Predicate, DispatchKey]:
+        words = []
+        while True:
+            token = self._peek()
+            if token is None or token == ("op", ")") or (token[0] == "word" and token[1] in ("and", "or")):
+                break
+            words.append(token)
+            self.pos += 1
+        if not words:
+            raise ValueError("Expected a condition")
+        return _compile_atom(words)
+
+
+@lru_cache(maxsize=1024)
+def compile_condition(condition: str) -> Tuple[Predicate, DispatchKey]:
+    """
+    Compile a routing condition into a predicate and its dispatch key.
+
+    Conditions combine comparisons (see _compile_atom) with and/or/not
+    and parentheses. Raises ValueError for conditions that don't parse.
+    """
+    return _ConditionParser(_tokenize(condition)).parse()
+
 
 @dataclass
 class RoutingRule:
@@ -82,6 +249,60 @@ class TaskRouter:
                 ),
             ]
 
+        self._compile_rules()
+
+    def _compile_rules(self):
+        """
+        Compile rule conditions once and index them for dispatch.
+
+        Rules whose condition requires a label or assignee are indexed under
+        it, so route() only evaluates rules that can match the task. A rule
+        that doesn't compile is reported and never matches.
+        """
+        self._predicates: List[Predicate] = []
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._dispatch: Dict[str, Dict[str, Any]] = {}
+
+        for position, rule in enumerate(self.rules):
+            try:
+                predicate, key = compile_condition(rule.condition)
+            except (ValueError, re.error) as e:
+                print(f"Warning: Ignoring routing rule {rule.condition!r}: {e}")
+                predicate, key = _never, None
+            self._predicates.append(predicate)
+
+            index = self._index.setdefault(rule.source, {"always": [], "label": {}, "assignee": {}})
+            if key is None:
+                index["always"].append(position)
+            else:
+                index[key[0]].setdefault(key[1], []).append(position)
+
+    def _dispatch_table(self, adapter_name: str) -> Dict[str, Any]:
+        """Rule index for one adapter (its own rules merged with "*" rules)."""
+        table = self._dispatch.get(adapter_name)
+        if table is None:
+            table = {"always": [], "label": {}, "assignee": {}}
+            for source in {"*", adapter_name}:
+                index = self._index.get(source)
+                if index is None:
+                    continue
+                table["always"].extend(index["always"])
+                for kind in ("label", "assignee"):
+                    for value, positions in index[kind].items():
+                        table[kind].setdefault(value, []).extend(positions)
+            self._dispatch[adapter_name] = table
+        return table
+
+    def _candidate_rules(self, task: ExternalTask, adapter_name: str) -> List[int]:
+        """Positions of rules that may match a task, in rule order."""
+        table = self._dispatch_table(adapter_name)
+        candidates = list(table["always"])
+        for label in task.labels:
+            candidates.extend(table["label"].get(label.lower(), ()))
+        if task.assignee:
+            candidates.extend(table["assignee"].get(task.assignee.lower(), ()))
+        return sorted(set(candidates))
+
     def _parse_rules(self, rules_config: List[Dict]) -> List[RoutingRule]:
         """Parse routing rules from config."""
         rules = []
@@ -105,33 +326,17 @@ class TaskRouter:
             - "labels contains 'X'" - Task has label X
             - "assignee == 'X'" - Task assigned to X
             - "assignee is null" - Task unassigned
-        """
-        condition = condition.strip().lower()
+            - "milestone == 'X'", "milestone is null"
+            - "title matches 'regex'", "title contains 'X'"
+            - Any of these combined with and/or/not and parentheses
 
-        if condition == "true":
-            return True
-
-        # Labels contains
-        match = re.match(r"labels contains ['\"](.+)['\"]", condition)
-        if match:
-            label = match.group(1)
-            return any(l.lower() == label.lower() for l in task.labels)
-
-        # Assignee equals
-        match = re.match(r"assignee == ['\"](.+)['\"]", condition)
-        if match:
-            expected = match.group(1)
-            return task.assignee and task.assignee.lower() == expected.lower()
-
-        # Assignee is null
-        if condition == "assignee is null":
-            return task.assignee is None
-
-        # No external ID (new task)
-        if condition == "no external_id":
-            return True  # This is checked at caller level
-
-        return False
+        Unsupported conditions never match.
+        """
+        try:
+            predicate, _ = compile_condition(condition)
+        except (ValueError, re.error):
+            return False
+        return bool(predicate(task))
 
     def route(self, task: ExternalTask, adapter_name: str) -> Dict[str, Any]:
         """
@@ -148,13 +353,13 @@ class TaskRouter:
                 - category: heading to place under
                 - state: task state
         """
-        for rule in self.rules:
-            # Check source matches
-            if rule.source != "*" and rule.source != adapter_name:
-                continue
+        return self._first_match(task, self._candidate_rules(task, adapter_name))
 
-            # Check condition
-            if self._evaluate_condition(rule.condition, task):
+    def _first_match(self, task: ExternalTask, positions: List[int]) -> Dict[str, Any]:
+        """Routing of the first candidate rule matching a task."""
+        for position in positions:
+            if self._predicates[position](task):
+                rule = self.rules[position]
                 return {
                     "destination": rule.destination,
                     "tags": rule.tags,
@@ -170,7 +375,34 @@ class TaskRouter:
             "state": "TODO",
         }
 
-    def external_to_org(self, task: ExternalTask, adapter_name: str, external_id: str) -> OrgTask:
+    def route_many(self, tasks: Iterable[ExternalTask], adapter_name: str) -> List[Dict[str, Any]]:
+        """
+        Route a batch of tasks from one adapter.
+
+        Args:
+            tasks: External tasks to route
+            adapter_name: Name of source adapter
+
+        Returns:
+            Routing dicts (see route()), in task order
+        """
+        # Tasks sharing labels and assignee share their candidate rules
+        candidates: Dict[Tuple, List[int]] = {}
+        routings = []
+        for task in tasks:
+            key = (frozenset(label.lower() for label in task.labels), (task.assignee or "").lower())
+            if key not in candidates:
+                candidates[key] = self._candidate_rules(task, adapter_name)
+            routings.append(self._first_match(task, candidates[key]))
+        return routings
+
+    def external_to_org(
+        self,
+        task: ExternalTask,
+        adapter_name: str,
+        external_id: str,
+        routing: Optional[Dict[str, Any]] = None
+    ) -> OrgTask:
         """
         Convert external task to org task with routing.
 
@@ -178,11 +410,13 @@ class TaskRouter:
             task: External task
             adapter_name: Source adapter name
             external_id: Full external ID (e.g., "github:owner/repo#42")
+            routing: Result of route() for this task, if already known
 
         Returns:
             OrgTask ready for insertion
         """
-        routing = self.route(task, adapter_name)
+        if routing is None:
+            routing = self.route(task, adapter_name)
 
         # Determine state
         state_str = routing["state"]
@@ -247,3 +481,35 @@ class TaskRouter:
             Full path to org file
         """
         return self.data_dir / space / "org" / destination
+
+    def format_org_entry(self, task: OrgTask, level: int = 2) -> str:
+        """
+        Render an org task as a heading with its property drawer.
+
+        Args:
+            task: Task from external_to_org()
+            level: Heading level (2 lands under the file's last category)
+
+        Returns:
+            Org text for an append write
+        """
+        heading = f"{'*' * level} {task.state.value}"
+        if task.priority and task.priority.value:
+            heading += f" [#{task.priority.value}]"
+        heading += f" {task.title}"
+
+        tag_names = []
+        for tag in task.tags:
+            for name in tag.strip(":").split(":"):
+                if name and name not in tag_names:
+                    tag_names.append(name)
+        if tag_names:
+            heading += f"  :{':'.join(tag_names)}:"
+
+        lines = [heading]
+        if task.deadline:
+            lines.append(f"DEADLINE: <{task.deadline.strftime('%Y-%m-%d %a')}>")
+        lines.append(":PROPERTIES:")
+        lines.extend(f":{key}: {value}" for key, value in task.properties.items())
+        lines.append(":END:")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,287 @@
+"""
+Sync Scheduler - Background sync honoring sync.tasks.poll_interval.
+
+DIP-0010: Task Sync Architecture
+
+One long-running process keeps a configured SyncEngine and syncs each
+adapter on its own schedule:
+
+- Every adapter runs every poll_interval (sync.adapters.<name>.poll_interval,
+  else sync.tasks.poll_interval)
+- A failed run backs off exponentially (interval * 2^failures, capped at
+  backoff_max); a successful run resets the interval
+- Each delay is spread by +/- jitter so adapters don't fire in lockstep
+- A token bucket per adapter (rate_limit runs per hour, bursts of up to
+  `burst`) caps runs, including ones requested with trigger(); a
+  rate_limit of 0 or less turns it off. A throttled adapter is retried
+  once a token is due, but never sooner than its interval
+- SIGINT/SIGTERM or stop() let the current run finish, then exit
+
+Each run is recorded in SyncHistory (direction "sync") with its duration.
+Time is read from an injectable clock and waited for with an injectable
+sleep, so schedules can be tested without real time passing.
+"""
+
+import random
+import re
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Union
+
+DEFAULT_POLL_INTERVAL = 600.0   # seconds (10m)
+DEFAULT_BACKOFF_MAX = 3600.0    # seconds (1h)
+DEFAULT_JITTER = 0.1            # +/- fraction of each delay
+DEFAULT_RATE_LIMIT = 60.0       # runs per hour per adapter
+DEFAULT_BURST = 3
+
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_interval(value: Union[str, int, float, None], default: float = DEFAULT_POLL_INTERVAL) -> float:
+    """
+    Parse an interval setting ("30s", "10m", "1h", "1d" or seconds).
+
+    Returns:
+        Seconds, or `default` if the value is missing or unparseable
+    """
+    if value is None:
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*", str(value).lower())
+    if not match:
+        return default
+    return float(match.group(1)) * _UNITS[match.group(2) or "s"]
+
+
+class TokenBucket:
+    """Allows `capacity` runs at once, refilled at `rate` runs per second."""
+
+    def __init__(self, capacity: float, rate: float, now: float):
+        if rate <= 0:
+            raise ValueError(f"TokenBucket rate must be positive, got {rate}")
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = now
+
+    def _refill(self, now: float):
+        """Add tokens earned since the last update."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now: float) -> bool:
+        """Spend a token if one is available."""
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until a token is available (rate must be positive)."""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+@dataclass
+class AdapterSchedule:
+    """Scheduling state of one adapter."""
+    name: str
+    interval: float
+    bucket: Optional[TokenBucket]  # None: not rate limited
+    next_run: float
+    failures: int = 0
+    runs: int = 0
+
+
+class SyncScheduler:
+    """
+    Runs SyncEngine.sync() per adapter on a schedule until stopped.
+
+    Usage:
+        engine = SyncEngine()
+        engine.load_config()
+        SyncScheduler(engine).run()
+    """
+
+    def __init__(
+        self,
+        engine,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], Any]] = None,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            engine: Configured SyncEngine (adapters initialized)
+            clock: Monotonic time source in seconds
+            sleep: Wait up to the given seconds; may return early (default
+                waits on the scheduler's wakeup event)
+            rng: Random source for jitter
+        """
+        self.engine = engine
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._sleep = sleep or self._wait_for_wakeup
+
+        tasks_config = engine.config.get("sync", {}).get("tasks", {})
+        self.backoff_max = parse_interval(tasks_config.get("backoff_max"), DEFAULT_BACKOFF_MAX)
+        self.jitter = float(tasks_config.get("jitter", DEFAULT_JITTER))
+
+        now = self.clock()
+        self.schedules: Dict[str, AdapterSchedule] = {}
+        for adapter_name in engine.list_adapters():
+            adapter_config = engine.config.get("sync", {}).get("adapters", {}).get(adapter_name, {})
+
+            def setting(key, default):
+                return adapter_config.get(key, tasks_config.get(key, default))
+
+            interval = parse_interval(setting("poll_interval", None))
+            rate_limit = float(setting("rate_limit", DEFAULT_RATE_LIMIT))
+            burst = max(1.0, float(setting("burst", DEFAULT_BURST)))
+            self.schedules[adapter_name] = AdapterSchedule(
+                name=adapter_name,
+                interval=interval,
+                bucket=TokenBucket(burst, rate_limit / 3600, now) if rate_limit > 0 else None,
+                next_run=now,
+            )
+
+        self.totals = {"runs": 0, "succeeded": 0, "failed": 0, "throttled": 0}
+
+    def _wait_for_wakeup(self, timeout: float):
+        """Sleep until timeout, trigger() or stop()."""
+        self._wake.wait(timeout)
+        self._wake.clear()
+
+    def stop(self):
+        """Ask run() to exit once the current run finishes."""
+        self._stop.set()
+        self._wake.set()
+
+    def trigger(self, adapter_name: str):
+        """Run an adapter as soon as its rate limit allows."""
+        schedule = self.schedules.get(adapter_name)
+        if schedule:
+            schedule.next_run = self.clock()
+            self._wake.set()
+
+    def _delay(self, schedule: AdapterSchedule) -> float:
+        """Delay before an adapter's next run, with backoff and jitter."""
+        delay = schedule.interval
+        if schedule.failures:
+            delay = min(schedule.interval * 2 ** schedule.failures, max(self.backoff_max, schedule.interval))
+        if self.jitter:
+            delay *= 1 + self.rng.uniform(-self.jitter, self.jitter)
+        return max(0.0, delay)
+
+    def run_adapter(self, schedule: AdapterSchedule) -> Dict[str, Any]:
+        """
+        Sync one adapter now and schedule its next run.
+
+        Returns:
+            Dict with the run's success, errors and duration_ms
+        """
+        started = self.clock()
+        errors: List[str] = []
+        items = 0
+        try:
+            stats = self.engine.sync(only=[schedule.name])
+            report = self.engine.last_pull.get(schedule.name, {})
+            items = stats["pull"]["count"] + stats["push"]["count"]
+            errors = stats["pull"]["errors"] + stats["push"]["errors"]
+            failed = not stats["success"] or report.get("status") in ("error", "timeout") or bool(stats["push"]["errors"])
+        except Exception as e:
+            errors.append(str(e))
+            failed = True
+        duration_ms = int((self.clock() - started) * 1000)
+
+        schedule.runs += 1
+        schedule.failures = schedule.failures + 1 if failed else 0
+        schedule.next_run = self.clock() + self._delay(schedule)
+
+        self.totals["runs"] += 1
+        self.totals["failed" if failed else "succeeded"] += 1
+        try:
+            self.engine.history.record(
+                "sync",
+                schedule.name,
+                items_processed=items,
+                items_failed=1 if failed else 0,
+                errors=errors,
+                duration_ms=duration_ms
+            )
+        except Exception as e:
+            print(f"Warning: could not record {schedule.name} sync: {e}")
+
+        return {"success": not failed, "errors": errors, "duration_ms": duration_ms}
+
+    def tick(self) -> Optional[float]:
+        """
+        Run every adapter that is due (earliest first).
+
+        Returns:
+            Seconds until the next adapter is due, or None with no adapters
+        """
+        for schedule in sorted(self.schedules.values(), key=lambda s: s.next_run):
+            if self._stop.is_set():
+                break
+            now = self.clock()
+            if schedule.next_run > now:
+                continue
+            if schedule.bucket is not None and not schedule.bucket.take(now):
+                self.totals["throttled"] += 1
+                schedule.next_run = now + max(schedule.bucket.wait_time(now), schedule.interval)
+                continue
+            self.run_adapter(schedule)
+
+        if not self.schedules:
+            return None
+        return max(0.0, min(s.next_run for s in self.schedules.values()) - self.clock())
+
+    def run(self, max_runs: Optional[int] = None) -> Dict[str, int]:
+        """
+        Sync on schedule until stopped (SIGINT/SIGTERM, stop(), max_runs).
+
+        Returns:
+            Dict with run counts over the scheduler's lifetime
+        """
+        while not self._stop.is_set():
+            timeout = self.tick()
+            if timeout is None:
+                break
+            if max_runs is not None and self.totals["runs"] >= max_runs:
+                break
+            if self._stop.is_set():
+                break
+            self._sleep(timeout)
+
+        return dict(self.totals)
+
+
+def run_scheduler(data_dir: Optional[str] = None) -> Dict[str, int]:
+    """Load sync config and run the scheduler until interrupted."""
+    from sync.engine import SyncEngine
+
+    engine = SyncEngine(data_dir)
+    engine.load_config()
+    scheduler = SyncScheduler(engine)
+
+    def request_stop(signum, frame):
+        scheduler.stop()
+
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+    for schedule in scheduler.schedules.values():
+        print(f"  {schedule.name}: every {schedule.interval:.0f}s")
+    return scheduler.run()
@@ -5,15 +5,88 @@ DIP-0010: External Sync Architecture - Phase 3
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import sys
+from unittest.mock import patch
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from sync.adapters.base import OrgCalendarEntry
-from sync.adapters.google_calendar import GoogleCalendarAdapter, CalendarEvent
+from sync.adapters.base import OrgCalendarEntry, ChangeType
+from sync.adapters.google_calendar import (
+    GoogleCalendarAdapter,
+    CalendarEvent,
+    CalendarEventCache,
+)
+
+
+class FakeHttpError(Exception):
+    """Stand-in for googleapiclient.errors.HttpError."""
+
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.resp = type("Resp", (), {"status": status})()
+
+
+class FakeCalendarService:
+    """
+    Stand-in for the Calendar API service object.
+
+    Holds the calendar's events and hands out sync tokens; a token
+    returns only events changed after it was issued.
+    """
+
+    def __init__(self, page_size=2):
+        self.events_by_id = {}
+        self.version = 0
+        self.changed_at = {}
+        self.page_size = page_size
+        self.requests = []
+        self.expired_tokens = set()
+
+    def put(self, event_id, summary, start, hours=1, status="confirmed"):
+        self.version += 1
+        self.events_by_id[event_id] = {
+            "id": event_id,
+            "status": status,
+            "summary": summary,
+            "start": {"dateTime": start.isoformat()},
+            "end": {"dateTime": (start + timedelta(hours=hours)).isoformat()},
+            "created": "2025-12-01T09:00:00Z",
+            "updated": f"2025-12-01T09:00:{self.version:02d}Z",
+        }
+        self.changed_at[event_id] = self.version
+
+    def cancel(self, event_id):
+        self.version += 1
+        self.events_by_id[event_id]["status"] = "cancelled"
+        self.changed_at[event_id] = self.version
+
+    def events(self):
+        return self
+
+    def list(self, **params):
+        self.requests.append(params)
+        token = params.get("syncToken")
+        if token in self.expired_tokens:
+            raise FakeHttpError(410)
+
+        if token:
+            since = int(token.split("-")[1])
+            matching = [e for i, e in self.events_by_id.items() if self.changed_at[i] > since]
+        else:
+            matching = [e for e in self.events_by_id.values() if e["status"] != "cancelled"]
+
+        offset = int(params.get("pageToken") or 0)
+        page = matching[offset:offset + self.page_size]
+        result = {"items": page}
+        if offset + self.page_size < len(matching):
+            result["nextPageToken"] = str(offset + self.page_size)
+        else:
+            result["nextSyncToken"] = f"token-{self.version}"
+
+        return type("Request", (), {"execute": lambda _self: result})()
 
 
 class TestOrgCalendarEntry:
@@ -160,6 +233,180 @@ class TestGoogleCalendarAdapter:
         assert any("Location: Zoom" in line for line in lines)
         assert any("Attendees: team@example.com" in line for line in lines)
 
+    def test_sync_to_org_file_replaces_atomically(self, tmp_path):
+        """Test calendar.org is replaced whole with no temp files left."""
+        adapter = GoogleCalendarAdapter()
+        org_file = tmp_path / "calendar.org"
+        org_file.write_text("* Old content\n")
+
+        entry = OrgCalendarEntry(
+            id="test-1",
+            title="Weekly Sync",
+            timestamp=datetime(2025, 12, 11, 10, 0),
+        )
+
+        with patch.object(adapter, 'pull_events', return_value=[entry]):
+            count = adapter.sync_to_org_file(str(org_file))
+
+        assert count == 1
+        content = org_file.read_text()
+        assert "Old content" not in content
+        assert "** Weekly Sync" in content
+        assert [p.name for p in tmp_path.iterdir()] == ["calendar.org"]
+
+
+
+class TestCalendarIncrementalSync:
+    """Tests for sync-token pulls against a fake service."""
+
+    @pytest.fixture
+    def service(self):
+        service = FakeCalendarService(page_size=2)
+        soon = datetime.now().astimezone() + timedelta(days=1)
+        for i in range(5):
+            service.put(f"ev{i}", f"Event {i}", soon + timedelta(hours=i * 2))
+        return service
+
+    @pytest.fixture
+    def adapter(self, service, tmp_path):
+        adapter = GoogleCalendarAdapter(calendar_id="primary")
+        adapter._service = service
+        adapter.event_cache = CalendarEventCache(db_path=str(tmp_path / "state" / "sync.db"))
+        return adapter
+
+    def test_full_sync_follows_pages(self, adapter, service):
+        """First sync pages through everything and stores a token."""
+        entries = adapter.pull_events(days=7)
+
+        assert [e.title for e in entries] == [f"Event {i}" for i in range(5)]
+        assert len(service.requests) == 3
+        assert "timeMin" in service.requests[0]
+        assert service.requests[1]["pageToken"] == "2"
+        assert adapter.event_cache.get_sync_state("primary")[0] == "token-5"
+
+    def test_incremental_sync_downloads_only_changes(self, adapter, service):
+        """Later syncs send the token and apply just the delta."""
+        adapter.pull_events(days=7)
+        service.requests.clear()
+
+        service.put("ev1", "Event 1 (moved)", datetime.now().astimezone() + timedelta(days=2))
+        service.cancel("ev3")
+        entries = adapter.pull_events(days=7)
+
+        assert len(service.requests) == 1
+        assert service.requests[0]["syncToken"] == "token-5"
+        assert "timeMin" not in service.requests[0]
+        titles = [e.title for e in entries]
+        assert "Event 1 (moved)" in titles
+        assert "Event 3" not in titles
+        assert len(titles) == 4
+
+    def test_cursor_returns_exact_changes(self, adapter, service):
+        """pull_since_cursor yields each change once, cancellations as DELETED."""
+        changes, cursor = adapter.pull_since_cursor(None)
+        assert len(changes) == 5
+
+        changes, same_cursor = adapter.pull_since_cursor(cursor)
+        assert changes == []
+        assert same_cursor == cursor
+
+        service.cancel("ev0")
+        service.put("ev9", "New Event", datetime.now().astimezone() + timedelta(days=3))
+        changes, next_cursor = adapter.pull_since_cursor(cursor)
+
+        by_type = {c.change_type: c.calendar_entry.title for c in changes}
+        assert by_type == {ChangeType.DELETED: "Event 0", ChangeType.UPDATED: "New Event"}
+        assert int(next_cursor) > int(cursor)
+
+    def test_expired_token_triggers_full_resync(self, adapter, service):
+        """HTTP 410 discards the token; events deleted meanwhile are tombstoned."""
+        _, cursor = adapter.pull_since_cursor(None)
+
+        # Event removed without a visible cancellation, then token expires
+        del service.events_by_id["ev4"]
+        service.expired_tokens.add("token-5")
+        changes, _ = adapter.pull_since_cursor(cursor)
+
+        assert [(c.change_type, c.calendar_entry.title) for c in changes] == [
+            (ChangeType.DELETED, "Event 4")
+        ]
+        assert "timeMin" in service.requests[-1]
+
+    def test_org_file_rewritten_only_on_change(self, adapter, service, tmp_path):
+        """An unchanged event set leaves calendar.org untouched."""
+        org_file = tmp_path / "calendar.org"
+
+        assert adapter.sync_to_org_file(str(org_file), days=7) == 5
+        first = org_file.stat().st_mtime_ns
+        content = org_file.read_text()
+
+        assert adapter.sync_to_org_file(str(org_file), days=7) == 5
+        assert org_file.stat().st_mtime_ns == first
+        assert org_file.read_text() == content
+
+        service.put("ev2", "Event 2 renamed", datetime.now().astimezone() + timedelta(days=1, hours=4))
+        adapter.sync_to_org_file(str(org_file), days=7)
+        assert "Event 2 renamed" in org_file.read_text()
+
+    def test_engine_config_dict(self):
+        """SyncEngine passes the settings dict as config=."""
+        adapter = GoogleCalendarAdapter(config={"enabled": True, "calendar_id": "work@example.com"})
+
+        assert adapter.calendar_id == "work@example.com"
+        assert adapter.config["enabled"] is True
+
+    def test_full_sync_window_is_bounded(self, adapter, service):
+        """The full sync sends timeMax; an expiring window forces a resync."""
+        adapter.pull_events(days=7)
+        first = service.requests[0]
+        assert first["timeMin"] < first["timeMax"]
+
+        service.requests.clear()
+        adapter.lookahead_days = 400
+        adapter.pull_events(days=7)
+        assert "syncToken" not in service.requests[0]
+        assert "timeMax" in service.requests[0]
+
+    def test_tombstones_pruned_once_seen(self, adapter, service):
+        """A cancellation is kept until a cursor consumer moves past it."""
+        _, cursor = adapter.pull_since_cursor(None)
+        service.cancel("ev0")
+        changes, cursor = adapter.pull_since_cursor(cursor)
+        assert [c.change_type for c in changes] == [ChangeType.DELETED]
+
+        adapter.pull_since_cursor(cursor)
+
+        cache = adapter.event_cache
+        assert [r["event_id"] for r in cache.changed_since("primary", 0)
+                if r["status"] == "cancelled"] == []
+
+    def test_tombstones_expire(self, adapter, service):
+        """Tombstones past retention are pruned without a consumer."""
+        adapter.pull_events(days=7)
+        service.cancel("ev0")
+        adapter.pull_events(days=7)
+        cache = adapter.event_cache
+        assert any(r["status"] == "cancelled" for r in cache.changed_since("primary", 0))
+
+        assert cache.prune_tombstones("primary", retention=timedelta(0)) == 1
+        assert not any(r["status"] == "cancelled" for r in cache.changed_since("primary", 0))
+
+    def test_pull_changes_since(self, adapter, service):
+        """pull_changes(since) returns updates and cancellations after since."""
+        adapter.pull_events(days=7)
+        since = datetime.now().astimezone()
+
+        service.cancel("ev2")
+        service.put("ev9", "New Event", datetime.now().astimezone() + timedelta(days=3))
+        service.events_by_id["ev9"]["updated"] = (
+            datetime.now(timezone.utc) + timedelta(seconds=1)
+        ).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+        changes = adapter.pull_changes(since)
+
+        assert sorted((c.change_type.value, c.calendar_entry.title) for c in changes) == [
+            (ChangeType.DELETED.value, "Event 2"), (ChangeType.UPDATED.value, "New Event")
+        ]
 
 class TestCalendarAdapterIntegration:
     """Integration tests (require valid credentials)."""
@@ -22,7 +22,9 @@ from sync.conflict import (
     ConflictDetector,
     ConflictResolver,
     ConflictQueue,
+    ThreeWayResult,
 )
+from sync.org_state import task_snapshot
 from sync.adapters.base import OrgTask, ExternalTask, TaskState, Priority
 
 
@@ -141,6 +143,82 @@ class TestConflictDetector:
         assert len(conflict.fields) >= 2
 
 
+class TestThreeWayDetection:
+    """Tests for three-way detection against the last-synced snapshot."""
+
+    def setup_method(self):
+        """Set up a synced pair and its base."""
+        self.detector = ConflictDetector()
+        self.org_task = OrgTask(
+            id="1", title="Test Task", state=TaskState.TODO, priority=Priority.B,
+            external_id="github:owner/repo#1",
+        )
+        self.base = task_snapshot(self.org_task)
+
+    def external(self, **overrides) -> ExternalTask:
+        """External task matching the base unless overridden."""
+        defaults = {
+            "id": "1",
+            "title": "Test Task",
+            "state": "open",
+            "url": "https://github.com/owner/repo/issues/1",
+            "created_at": datetime.now() - timedelta(days=1),
+            "updated_at": datetime.now(),
+            "labels": ["priority-medium"],
+        }
+        defaults.update(overrides)
+        return ExternalTask(**defaults)
+
+    def test_unchanged(self):
+        """Neither side changed: nothing to apply."""
+        result = self.detector.detect_three_way(self.org_task, self.external(), self.base)
+
+        assert isinstance(result, ThreeWayResult)
+        assert (result.to_org, result.to_external, result.conflict) == ({}, {}, None)
+
+    def test_external_only_change_goes_to_org(self):
+        """A field changed only externally is applied to org, not a conflict."""
+        result = self.detector.detect_three_way(self.org_task, self.external(title="Renamed"), self.base)
+
+        assert result.to_org == {"title": "Renamed"}
+        assert result.conflict is None
+
+    def test_org_only_change_goes_to_external(self):
+        """A field changed only in org is pushed, not a conflict."""
+        self.org_task.state = TaskState.DONE
+
+        result = self.detector.detect_three_way(self.org_task, self.external(), self.base)
+
+        assert result.to_external == {"state": "DONE"}
+        assert result.to_org == {}
+        assert result.conflict is None
+
+    def test_both_sides_changed_is_conflict(self):
+        """A field changed differently on both sides is a conflict with its base value."""
+        self.org_task.title = "Org title"
+
+        result = self.detector.detect_three_way(self.org_task, self.external(title="GitHub title"), self.base)
+
+        [conflict_field] = result.conflict.fields
+        assert conflict_field.conflict_type == ConflictType.TITLE
+        assert conflict_field.last_synced_value == "Test Task"
+
+    def test_same_change_on_both_sides(self):
+        """Both sides making the same change agree: nothing to do."""
+        self.org_task.state = TaskState.DONE
+
+        result = self.detector.detect_three_way(self.org_task, self.external(state="closed"), self.base)
+
+        assert result.conflict is None
+        assert result.to_org == {}
+
+    def test_batch_without_base_falls_back_to_two_way(self):
+        """Never-synced pairs are compared two-way; differences are conflicts."""
+        results = self.detector.detect_batch([(self.org_task, self.external(title="Other"))], {})
+
+        assert [r.conflict is not None for r in results] == [True]
+
+
 class TestConflictResolver:
     """Tests for ConflictResolver."""
 
@@ -323,6 +401,95 @@ class TestConflictQueue:
         assert stats["unresolved"] == 1
         assert "by_type" in stats
 
+    def test_repeat_conflict_updates_open_row(self):
+        """The same item conflicting again refreshes its open conflict."""
+        first_id = self.queue.add(self.create_conflict())
+        again = self.create_conflict()
+        again.fields.append(ConflictField(
+            field_name="title",
+            conflict_type=ConflictType.TITLE,
+            org_value="Org title",
+            external_value="GitHub title"
+        ))
+
+        assert self.queue.add(again) == first_id
+
+        [stored] = self.queue.get_unresolved()
+        assert [f.field_name for f in stored.fields] == ["state", "title"]
+        assert self.queue.get_stats()["by_type"] == {"state": 1, "title": 1}
+
+    def test_unresolved_ordered_by_last_detection(self):
+        """A conflict detected again sorts ahead of newer ones seen once."""
+        older = self.create_conflict()
+        older.detected_at = datetime(2026, 1, 1, 9, 0)
+        self.queue.add(older)
+
+        newer = self.create_conflict()
+        newer.external_id = "github:owner/repo#2"
+        newer.detected_at = datetime(2026, 1, 2, 9, 0)
+        self.queue.add(newer)
+
+        again = self.create_conflict()
+        again.detected_at = datetime(2026, 1, 3, 9, 0)
+        self.queue.add(again)
+
+        assert [c.external_id for c in self.queue.get_unresolved()] == [
+            "github:owner/repo#1", "github:owner/repo#2"
+        ]
+
+    def test_new_conflict_after_resolve(self):
+        """Once resolved, a new conflict for the item gets a new row."""
+        first_id = self.queue.add(self.create_conflict())
+        self.queue.resolve(first_id, ConflictStrategy.ORG_WINS)
+
+        assert self.queue.add(self.create_conflict()) != first_id
+
+    def test_unresolved_by_type_and_adapter(self):
+        """Unresolved conflicts filter and count by field type and adapter."""
+        self.queue.add(self.create_conflict())
+        self.queue.add(Conflict(
+            external_id="asana:123",
+            fields=[ConflictField("title", ConflictType.TITLE, "a", "b")]
+        ))
+
+        by_type = self.queue.get_unresolved(conflict_type=ConflictType.TITLE)
+        by_adapter = self.queue.get_unresolved(adapter="github")
+        stats = self.queue.get_stats()
+
+        assert [c.external_id for c in by_type] == ["asana:123"]
+        assert [c.external_id for c in by_adapter] == ["github:owner/repo#1"]
+        assert stats["by_adapter"] == {"asana": 1, "github": 1}
+
+    def test_cleanup_removes_old_resolved(self):
+        """Cleanup removes old resolved conflicts and their field rows."""
+        conflict_id = self.queue.add(self.create_conflict())
+        self.queue.resolve(conflict_id, ConflictStrategy.ORG_WINS)
+
+        assert self.queue.cleanup(days=-1) == 1
+        assert self.queue.get_by_external_id("github:owner/repo#1") is None
+        assert self.queue.get_stats()["by_type"] == {}
+
+    def test_migrates_duplicate_rows(self):
+        """Duplicates queued by older versions collapse to the newest."""
+        import sqlite3
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DROP INDEX idx_conflicts_open")
+        for detected_at in ("2025-12-01T00:00:00", "2025-12-02T00:00:00"):
+            conn.execute("""
+                INSERT INTO sync_conflicts (external_id, detected_at, conflict_data)
+                VALUES ('github:owner/repo#1', ?, ?)
+            """, (detected_at, '{"fields": [{"field_name": "state", "conflict_type": "state", '
+                               '"org_value": "DONE", "external_value": "open"}]}'))
+        conn.commit()
+        conn.close()
+
+        queue = ConflictQueue(db_path=self.db_path)
+
+        [conflict] = queue.get_unresolved()
+        assert conflict.detected_at == datetime(2025, 12, 2)
+        assert queue.get_stats()["by_type"] == {"state": 1}
+        assert queue.get_stats()["by_adapter"] == {"github": 1}
+
 
 class TestConflictIntegration:
     """Integration tests for conflict resolution flow."""
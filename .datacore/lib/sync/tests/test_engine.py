@@ -6,6 +6,7 @@ DIP-0010: Task Sync Architecture
 
 import os
 import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -16,8 +17,12 @@ import pytest
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import zettel_db
+import sync.engine
+from org_parser import index_org_file
 from sync.engine import SyncEngine
 from sync.adapters import TaskChange, ChangeType, ExternalTask, SyncResult
+from sync.adapters.github import GitHubAdapter
 
 
 class TestSyncEngineInit:
@@ -135,6 +140,120 @@ class TestSyncEnginePull:
         assert len(changes) == 1
         assert changes[0].external_task.title == "Test Issue"
 
+    def _slow_adapter(self, delay, title, started=None):
+        adapter = MagicMock()
+        adapter.is_configured.return_value = True
+        adapter.pull_errors = []
+
+        def pull(since):
+            if started is not None:
+                started.append(time.monotonic())
+            time.sleep(delay)
+            return [TaskChange(
+                change_type=ChangeType.UPDATED,
+                external_task=ExternalTask(
+                    id=title, title=title, state="open", url="",
+                    created_at=datetime.now(), updated_at=datetime.now(),
+                ),
+            )]
+
+        adapter.pull_changes.side_effect = pull
+        return adapter
+
+    def test_pull_all_runs_adapters_concurrently(self, tmp_path):
+        """Total pull time is about the slowest adapter, not the sum."""
+        engine = SyncEngine(data_dir=str(tmp_path))
+        for name in ("a", "b", "c"):
+            engine.adapters[name] = self._slow_adapter(0.3, name)
+
+        start = time.monotonic()
+        changes = engine.pull_all()
+        elapsed = time.monotonic() - start
+
+        assert sorted(c.external_task.title for c in changes) == ["a", "b", "c"]
+        assert elapsed < 0.8
+        assert all(r["status"] == "ok" for r in engine.last_pull.values())
+
+    def test_pull_all_respects_concurrency_limit(self, tmp_path):
+        """No more than pull_concurrency adapters run at once."""
+        engine = SyncEngine(data_dir=str(tmp_path))
+        engine.config = {"sync": {"tasks": {"pull_concurrency": 1}}}
+        started = []
+        for name in ("a", "b"):
+            engine.adapters[name] = self._slow_adapter(0.2, name, started)
+
+        engine.pull_all()
+
+        assert started[1] - started[0] >= 0.15
+
+    def test_pull_all_timeout_returns_partial_results(self, tmp_path):
+        """An adapter past its deadline is reported; others still return."""
+        engine = SyncEngine(data_dir=str(tmp_path))
+        engine.config = {"sync": {
+            "tasks": {"pull_timeout": 5},
+            "adapters": {"slow": {"pull_timeout": 0.2}},
+        }}
+        engine.adapters["fast"] = self._slow_adapter(0, "fast")
+        engine.adapters["slow"] = self._slow_adapter(1.0, "slow")
+
+        start = time.monotonic()
+        changes = engine.pull_all()
+        elapsed = time.monotonic() - start
+
+        assert [c.external_task.title for c in changes] == ["fast"]
+        assert elapsed < 0.8
+        assert engine.last_pull["fast"]["status"] == "ok"
+        assert engine.last_pull["slow"]["status"] == "timeout"
+
+    def test_pull_all_deadline_starts_with_pull(self, tmp_path):
+        """An adapter queued behind the concurrency limit gets its full timeout."""
+        engine = SyncEngine(data_dir=str(tmp_path))
+        engine.config = {"sync": {"tasks": {"pull_concurrency": 1, "pull_timeout": 0.5}}}
+        for name in ("a", "b"):
+            engine.adapters[name] = self._slow_adapter(0.3, name)
+
+        changes = engine.pull_all()
+
+        assert [c.external_task.title for c in changes] == ["a", "b"]
+        assert all(r["status"] == "ok" for r in engine.last_pull.values())
+
+    def test_pull_all_timeout_frees_slot(self, tmp_path):
+        """A hung adapter doesn't keep queued adapters from running."""
+        engine = SyncEngine(data_dir=str(tmp_path))
+        engine.config = {"sync": {
+            "tasks": {"pull_concurrency": 1, "pull_timeout": 5},
+            "adapters": {"hung": {"pull_timeout": 0.2}},
+        }}
+        engine.adapters["hung"] = self._slow_adapter(2.0, "hung")
+        engine.adapters["fast"] = self._slow_adapter(0, "fast")
+
+        start = time.monotonic()
+        changes = engine.pull_all()
+
+        assert time.monotonic() - start < 1.0
+        assert [c.external_task.title for c in changes] == ["fast"]
+        assert engine.last_pull["hung"]["status"] == "timeout"
+
+    def test_pull_all_reports_adapter_errors(self, tmp_path):
+        """Failed and partially failed adapters are reported per adapter."""
+        engine = SyncEngine(data_dir=str(tmp_path))
+
+        broken = MagicMock()
+        broken.is_configured.return_value = True
+        broken.pull_changes.side_effect = RuntimeError("boom")
+        engine.adapters["broken"] = broken
+
+        partial = self._slow_adapter(0, "partial")
+        partial.pull_errors = ["test/other: rate limited"]
+        engine.adapters["partial"] = partial
+
+        changes = engine.pull_all()
+
+        assert len(changes) == 1
+        assert engine.last_pull["broken"]["status"] == "error"
+        assert engine.last_pull["broken"]["errors"] == ["boom"]
+        assert engine.last_pull["partial"]["status"] == "partial"
+
 
 class TestSyncEnginePush:
     """Test push operations."""
@@ -216,6 +335,258 @@ class TestSyncEngineSync:
         assert "push" in stats
         assert "timestamp" in stats
 
+    def test_sync_reports_pull_errors(self, tmp_path):
+        """Adapter pull failures surface in sync stats."""
+        engine = SyncEngine(data_dir=str(tmp_path))
+
+        broken = MagicMock()
+        broken.is_configured.return_value = True
+        broken.pull_since_cursor.side_effect = RuntimeError("boom")
+        engine.adapters["github"] = broken
+
+        stats = engine.sync()
+
+        assert stats["pull"]["errors"] == ["github: boom"]
+        assert stats["pull"]["adapters"]["github"]["status"] == "error"
+
+
+
+NEXT_ACTIONS = """#+TITLE: Next Actions
+
+* Work
+** TODO Fix login bug
+:PROPERTIES:
+:EXTERNAL_ID: github:o/a#1
+:END:
+** TODO Write docs
+"""
+
+INBOX = """#+TITLE: Inbox
+
+* Inbox
+"""
+
+
+def issue(number, title, state="open"):
+    """A pulled issue as the GitHub adapter returns it."""
+    return ExternalTask(
+        id=str(number),
+        title=title,
+        state=state,
+        url=f"https://github.com/o/a/issues/{number}",
+        created_at=datetime(2025, 12, 1),
+        updated_at=datetime(2025, 12, 9),
+        raw={"owner": "o", "repo": "a"},
+    )
+
+
+class TestSyncEnginePipeline:
+    """Test routing pulls into org and pushing org changes."""
+
+    @pytest.fixture
+    def engine(self, tmp_path, monkeypatch):
+        """Engine over an indexed temp space with a stubbed GitHub adapter."""
+        db_path = tmp_path / "knowledge.db"
+        monkeypatch.setattr(zettel_db, "get_db_path", lambda space=None: db_path)
+        monkeypatch.setattr(sync.engine, "get_db_path", lambda space=None: db_path)
+        zettel_db.init_database("personal")
+
+        org_dir = tmp_path / "0-personal" / "org"
+        org_dir.mkdir(parents=True)
+        for name, content in [("next_actions.org", NEXT_ACTIONS), ("inbox.org", INBOX)]:
+            (org_dir / name).write_text(content)
+            index_org_file(org_dir / name, "personal")
+
+        adapter = GitHubAdapter({"repos": [{"owner": "o", "repo": "a"}]})
+        adapter.pulled = []
+        adapter.pull_since_cursor = MagicMock(side_effect=lambda cursor: (
+            [TaskChange(change_type=ChangeType.UPDATED, external_task=task) for task in adapter.pulled],
+            "c1"
+        ))
+        adapter.push_changes = MagicMock(return_value=SyncResult(success=True, items_processed=1))
+
+        engine = SyncEngine(data_dir=str(tmp_path))
+        engine.adapters["github"] = adapter
+        engine.org_dir = org_dir
+        return engine
+
+    def test_noop_sync_writes_and_pushes_nothing(self, engine):
+        """With nothing changed, no file is written and nothing is pushed."""
+        engine.sync()  # baseline
+        before = {p: p.stat().st_mtime_ns for p in engine.org_dir.iterdir()}
+
+        stats = engine.sync()
+
+        assert {p: p.stat().st_mtime_ns for p in engine.org_dir.iterdir()} == before
+        engine.adapters["github"].push_changes.assert_not_called()
+        assert stats["pull"]["applied"] == 0
+        assert stats["push"]["count"] == 0
+
+    def test_org_state_change_is_pushed(self, engine):
+        """Closing a linked task in org pushes one state change."""
+        engine.sync()
+        conn = zettel_db.get_connection("personal")
+        conn.execute("UPDATE tasks SET state = 'DONE' WHERE heading = 'Fix login bug'")
+        conn.commit()
+        conn.close()
+
+        engine.sync()
+        engine.sync()
+
+        push = engine.adapters["github"].push_changes
+        push.assert_called_once()
+        [change] = push.call_args[0][0]
+        assert change.change_type == ChangeType.STATE_CHANGED
+        assert change.org_task.external_id == "github:o/a#1"
+
+    def test_closed_issue_marks_task_done(self, engine):
+        """A pulled close is written back to the linked org task."""
+        engine.sync()
+        engine.adapters["github"].pulled = [issue(1, "Fix login bug", state="closed")]
+
+        stats = engine.sync()
+
+        assert stats["pull"]["applied"] == 1
+        assert "** DONE Fix login bug" in (engine.org_dir / "next_actions.org").read_text()
+        assert engine.history.get_cursor("github") == "c1"
+        engine.adapters["github"].push_changes.assert_not_called()
+
+    def test_new_issue_is_linked_or_appended(self, engine):
+        """New issues link to a same-titled task, or are appended to the inbox."""
+        engine.adapters["github"].pulled = [issue(2, "Write docs"), issue(3, "Brand new")]
+
+        engine.sync()
+
+        next_actions = (engine.org_dir / "next_actions.org").read_text()
+        inbox = (engine.org_dir / "inbox.org").read_text()
+        assert ":EXTERNAL_ID: github:o/a#2" in next_actions
+        assert "** TODO Brand new" in inbox
+        assert ":EXTERNAL_ID: github:o/a#3" in inbox
+        assert set(engine.snapshots.load()) == {"github:o/a#1", "github:o/a#2", "github:o/a#3"}
+
+    def test_external_rename_is_applied_without_push(self, engine):
+        """A title changed only on GitHub is written to org and not pushed back."""
+        engine.sync()
+        engine.adapters["github"].pulled = [issue(1, "Fix login bug on Safari")]
+
+        stats = engine.sync()
+        engine.adapters["github"].pulled = []
+        engine.sync()
+
+        assert stats["pull"]["applied"] == 1
+        assert "** TODO Fix login bug on Safari" in (engine.org_dir / "next_actions.org").read_text()
+        engine.adapters["github"].push_changes.assert_not_called()
+
+    def test_org_change_survives_unrelated_pull(self, engine):
+        """An org-only rename is still pushed when the same issue is pulled unchanged."""
+        engine.sync()
+        conn = zettel_db.get_connection("personal")
+        conn.execute("UPDATE tasks SET heading = 'Fix the login bug' WHERE heading = 'Fix login bug'")
+        conn.commit()
+        conn.close()
+        engine.adapters["github"].pulled = [issue(1, "Fix login bug")]
+
+        engine.sync()
+
+        [change] = engine.adapters["github"].push_changes.call_args[0][0]
+        assert change.changed_fields == ["title"]
+
+    def test_conflicting_task_is_held(self, engine):
+        """Both sides renamed with no resolver: nothing is written or pushed."""
+        engine.sync()
+        conn = zettel_db.get_connection("personal")
+        conn.execute("UPDATE tasks SET heading = 'Org title' WHERE heading = 'Fix login bug'")
+        conn.commit()
+        conn.close()
+        engine.adapters["github"].pulled = [issue(1, "GitHub title")]
+
+        stats = engine.sync()
+
+        assert stats["pull"]["held"] == 1
+        assert "GitHub title" not in (engine.org_dir / "next_actions.org").read_text()
+        engine.adapters["github"].push_changes.assert_not_called()
+        assert engine.snapshots.load()["github:o/a#1"]["title"] == "Fix login bug"
+
+class TestSyncEngineCursors:
+    """Test persisted pull cursors."""
+
+    def _adapter(self, cursors):
+        """Adapter returning one change per pull and cursor `n`."""
+        adapter = MagicMock()
+        adapter.is_configured.return_value = True
+        adapter.pull_errors = []
+        seen = []
+
+        def pull(cursor):
+            seen.append(cursor)
+            return [TaskChange(change_type=ChangeType.UPDATED)], cursors[len(seen) - 1]
+
+        adapter.pull_since_cursor.side_effect = pull
+        return adapter, seen
+
+    def test_sync_resumes_from_persisted_cursor(self, tmp_path):
+        """A new engine (new process) resumes where the last sync ended."""
+        adapter, seen = self._adapter(["c1", "c2"])
+
+        engine = SyncEngine(data_dir=str(tmp_path))
+        engine.adapters["github"] = adapter
+        engine.sync()
+
+        restarted = SyncEngine(data_dir=str(tmp_path))
+        restarted.adapters["github"] = adapter
+        restarted.sync()
+
+        assert seen == [None, "c1"]
+        assert restarted.history.get_cursor("github") == "c2"
+        assert len(restarted.history.get_history(adapter="github")) == 2
+
+    def test_uncommitted_pull_is_repeated(self, tmp_path):
+        """Cursor only advances once the pull is committed."""
+        adapter, seen = self._adapter(["c1", "c1"])
+
+        engine = SyncEngine(data_dir=str(tmp_path))
+        engine.adapters["github"] = adapter
+
+        # Crash after pulling, before applying and committing
+        engine.pull_all(resume=True)
+        assert engine.history.get_cursor("github") is None
+
+        engine.pull_all(resume=True)
+        engine.commit_pull()
+
+        assert seen == [None, None]
+        assert engine.history.get_cursor("github") == "c1"
+
+    def test_failed_adapter_keeps_cursor(self, tmp_path):
+        """A failing adapter's cursor is left alone; others advance."""
+        engine = SyncEngine(data_dir=str(tmp_path))
+        engine.history.set_cursor("broken", "old")
+
+        good, _ = self._adapter(["g1"])
+        broken = MagicMock()
+        broken.is_configured.return_value = True
+        broken.pull_since_cursor.side_effect = RuntimeError("boom")
+        engine.adapters["good"] = good
+        engine.adapters["broken"] = broken
+
+        engine.sync()
+
+        assert engine.history.get_cursor("good") == "g1"
+        assert engine.history.get_cursor("broken") == "old"
+
+    def test_sync_only_selected_adapters(self, tmp_path):
+        """sync(only=...) pulls and advances just the named adapters."""
+        first, first_seen = self._adapter(["a1"])
+        second, second_seen = self._adapter(["b1"])
+        engine = SyncEngine(data_dir=str(tmp_path))
+        engine.adapters["first"] = first
+        engine.adapters["second"] = second
+
+        engine.sync(only=["second"])
+
+        assert (first_seen, second_seen) == ([], [None])
+        assert engine.history.get_cursor("first") is None
+        assert engine.history.get_cursor("second") == "b1"
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
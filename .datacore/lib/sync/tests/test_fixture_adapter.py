@@ -0,0 +1,110 @@
+"""
+Tests for the fixture adapter and sync benchmark.
+
+DIP-0010: Task Sync Architecture
+"""
+
+from pathlib import Path
+
+import pytest
+
+# Add lib to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import zettel_db
+from sync.adapters import get_adapter
+from sync.adapters.fixture import (
+    FixtureAdapter,
+    synthetic_issues,
+    synthetic_events,
+    record_changes,
+    load_changes,
+)
+from sync.benchmark import STAGES, run_benchmark
+
+
+class TestSyntheticStreams:
+    """Test generated workloads."""
+
+    def test_issues_are_deterministic(self):
+        """The same seed yields the same issues."""
+        first = synthetic_issues(50, seed=3)
+        second = synthetic_issues(50, seed=3)
+
+        assert [(t.id, t.state, t.labels, t.assignee) for t in first] == \
+               [(t.id, t.state, t.labels, t.assignee) for t in second]
+        assert [t.id for t in first] == [str(n) for n in range(1, 51)]
+
+    def test_events_have_start_times(self):
+        """Events carry their start as due_date."""
+        events = synthetic_events(10)
+
+        assert all(event.due_date for event in events)
+
+
+class TestFixtureAdapter:
+    """Test replaying streams."""
+
+    def test_registered(self):
+        """The adapter can be enabled from settings like any other."""
+        assert get_adapter("fixture") is FixtureAdapter
+
+    def test_cursor_pages_through_stream(self):
+        """Resumed pulls continue from the cursor until the stream is consumed."""
+        adapter = FixtureAdapter({"synthetic": {"count": 5}, "page_size": 2})
+
+        pages = []
+        cursor = None
+        for _ in range(4):
+            changes, cursor = adapter.pull_since_cursor(cursor)
+            pages.append([c.external_task.id for c in changes])
+
+        assert pages == [["1", "2"], ["3", "4"], ["5"], []]
+        assert adapter.external_id_for(adapter.changes[0].external_task) == "fixture:1"
+
+    def test_record_and_replay(self, tmp_path):
+        """Recorded changes replay with the same tasks."""
+        path = tmp_path / "stream.json"
+        original = FixtureAdapter({"synthetic": {"count": 3, "kind": "events"}})
+
+        record_changes(original.changes, path)
+        replayed = FixtureAdapter({"path": str(path)})
+
+        assert [c.external_task for c in replayed.changes] == [c.external_task for c in original.changes]
+        assert [c.timestamp for c in load_changes(path)] == [c.timestamp for c in original.changes]
+
+    def test_push_is_recorded(self):
+        """Pushed changes are kept for inspection."""
+        adapter = FixtureAdapter({"synthetic": {"count": 2}})
+        changes = adapter.pull_changes()
+
+        result = adapter.push_changes(changes)
+
+        assert result.success
+        assert result.items_processed == 2
+        assert adapter.pushed == changes
+
+
+class TestSyncBenchmark:
+    """Smoke test of the end-to-end benchmark."""
+
+    def test_small_run_reports_every_stage(self, tmp_path):
+        """A small workload runs the whole pipeline and restores the space."""
+        original_path = zettel_db.SPACES["personal"]["path"]
+
+        report = run_benchmark(issues=200, data_dir=tmp_path)
+
+        assert list(report["stages"]) == STAGES + ["other"]
+        assert report["stages"]["writeback"]["calls"] == 2
+        assert "peak_kib" in report["stages"]["detect"]
+        assert report["sync"]["pulled"] == 200
+        assert report["sync"]["applied"] > 0
+        assert report["sync"]["pushed"] == report["workload"]["org_edits"]
+        assert report["sync"]["errors"] == []
+        assert zettel_db.SPACES["personal"]["path"] == original_path
+        assert "(external)" in (tmp_path / "0-personal" / "org" / "next_actions.org").read_text()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
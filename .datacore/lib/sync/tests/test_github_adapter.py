@@ -5,7 +5,8 @@ DIP-0010: Task Sync Architecture
 """
 
 import json
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -15,6 +16,15 @@ import pytest
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path, monkeypatch):
+    """Keep the issue index database out of the real ~/Data."""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+
+from sync.adapters import github as github_module
 from sync.adapters.github import GitHubAdapter
 from sync.adapters import OrgTask, TaskState, Priority, ChangeType
 
@@ -142,6 +152,7 @@ class TestGitHubAdapterPull:
     def test_pull_changes_open_issues(self, mock_run_gh):
         """Pulls open issues correctly."""
         adapter = GitHubAdapter({
+            "api": "rest",
             "repos": [{"owner": "test", "repo": "repo"}]
         })
 
@@ -172,6 +183,225 @@ class TestGitHubAdapterPull:
         assert changes[0].change_type == ChangeType.UPDATED
         assert changes[0].external_task.title == "Test Issue"
 
+    def _issue(self, repo, number):
+        return {
+            "number": number,
+            "title": f"{repo} issue {number}",
+            "state": "OPEN",
+            "url": f"https://github.com/test/{repo}/issues/{number}",
+            "createdAt": "2025-12-09T10:00:00Z",
+            "updatedAt": "2025-12-09T11:00:00Z",
+            "body": "",
+            "labels": [],
+            "assignees": []
+        }
+
+    def test_pull_changes_repos_concurrently(self):
+        """Multi-repo pull takes about as long as the slowest repo."""
+        repos = [f"repo{i}" for i in range(4)]
+        adapter = GitHubAdapter({
+            "api": "rest",
+            "repos": [{"owner": "test", "repo": r} for r in repos]
+        })
+
+        def run_gh(args, timeout=30):
+            repo = args[args.index("-R") + 1].split("/")[1]
+            time.sleep(0.2)
+            if "open" in args:
+                return True, json.dumps([self._issue(repo, 1)]), ""
+            return True, "[]", ""
+
+        with patch.object(adapter, "_run_gh", side_effect=run_gh):
+            start = time.monotonic()
+            changes = adapter.pull_changes()
+            elapsed = time.monotonic() - start
+
+        # 4 repos x 2 calls x 0.2s = 1.6s serially
+        assert elapsed < 1.0
+        assert [c.external_task.raw["repo"] for c in changes] == repos
+        assert adapter.pull_errors == []
+
+    def test_pull_changes_partial_failure(self):
+        """A failing repo is recorded and the others still return."""
+        adapter = GitHubAdapter({
+            "api": "rest",
+            "repos": [{"owner": "test", "repo": "good"}, {"owner": "test", "repo": "bad"}]
+        })
+
+        def run_gh(args, timeout=30):
+            if "test/bad" in args:
+                return False, "", "HTTP 502"
+            if "open" in args:
+                return True, json.dumps([self._issue("good", 1)]), ""
+            return True, "[]", ""
+
+        with patch.object(adapter, "_run_gh", side_effect=run_gh):
+            changes = adapter.pull_changes()
+
+        assert len(changes) == 1
+        assert adapter.pull_errors == ["test/bad: HTTP 502"]
+
+
+
+class RecordedGh:
+    """Stand-in for `gh api graphql` replaying recorded responses."""
+
+    def __init__(self, name):
+        with open(FIXTURES / "github_graphql.json") as f:
+            self.responses = json.load(f)[name]
+        self.queries = []
+
+    def __call__(self, args, timeout=30):
+        assert args[:2] == ["api", "graphql"]
+        self.queries.append(args[-1].split("=", 1)[1])
+        return True, json.dumps(self.responses[len(self.queries) - 1]), ""
+
+
+class TestGitHubAdapterGraphQL:
+    """Test GraphQL pulls against recorded responses."""
+
+    def _adapter(self, *repos):
+        return GitHubAdapter({
+            "repos": [{"owner": "datacore-one", "repo": r} for r in repos]
+        })
+
+    def test_pull_batches_repos_and_follows_cursors(self):
+        """One request covers all repos; only unfinished repos are re-paged."""
+        adapter = self._adapter("datacore", "calendar")
+        gh = RecordedGh("multi_repo_paged")
+
+        with patch.object(adapter, "_run_gh", side_effect=gh):
+            changes = adapter.pull_changes()
+
+        assert len(gh.queries) == 2
+        assert "r0:" in gh.queries[0] and "r1:" in gh.queries[0]
+        assert "r1:" not in gh.queries[1]
+        assert 'after: "Y3Vyc29yOjI="' in gh.queries[1]
+
+        assert [c.external_task.id for c in changes] == ["11", "12", "13", "3"]
+        first = changes[0].external_task
+        assert first.labels == ["ai-task"]
+        assert first.assignee == "alice"
+        assert changes[3].change_type == ChangeType.CLOSED
+        assert changes[3].external_task.raw["repo"] == "calendar"
+        assert adapter.pull_errors == []
+
+    def test_pull_since_filters_server_side(self):
+        """`since` is sent as filterBy and boundary issues are dropped."""
+        adapter = self._adapter("datacore", "calendar")
+        gh = RecordedGh("multi_repo_paged")
+        since = datetime(2025, 12, 9, 10, 0, tzinfo=timezone.utc)
+
+        with patch.object(adapter, "_run_gh", side_effect=gh):
+            changes = adapter.pull_changes(since)
+
+        assert 'filterBy: {since: "2025-12-09T10:00:00Z"}' in gh.queries[0]
+        # Issue 11 was updated exactly at `since` (filterBy is inclusive)
+        assert [c.external_task.id for c in changes] == ["12", "13", "3"]
+
+    def test_missing_repo_is_partial_failure(self):
+        """A repo the API cannot resolve is reported; others still return."""
+        adapter = self._adapter("datacore", "gone")
+        gh = RecordedGh("missing_repo")
+
+        with patch.object(adapter, "_run_gh", side_effect=gh):
+            changes = adapter.pull_changes()
+
+        assert [c.external_task.id for c in changes] == ["11"]
+        assert len(adapter.pull_errors) == 1
+        assert adapter.pull_errors[0].startswith("datacore-one/gone: Could not resolve")
+
+    def test_repos_split_across_requests(self):
+        """repos_per_query bounds how many repos share a request."""
+        adapter = GitHubAdapter({
+            "repos_per_query": 1,
+            "repos": [{"owner": "test", "repo": "a"}, {"owner": "test", "repo": "b"}],
+        })
+        empty = {"data": {"r0": {"issues": {
+            "pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": []
+        }}}}
+
+        with patch.object(adapter, "_run_gh", return_value=(True, json.dumps(empty), "")) as mock_run_gh:
+            adapter.pull_changes()
+
+        assert mock_run_gh.call_count == 2
+        assert adapter.pull_errors == []
+
+
+
+class TestGitHubAdapterCursor:
+    """Test per-repo pull cursors."""
+
+    def _issue(self, repo, number, updated):
+        return {
+            "number": number,
+            "title": f"{repo} issue {number}",
+            "state": "OPEN",
+            "url": f"https://github.com/test/{repo}/issues/{number}",
+            "createdAt": "2025-12-01T10:00:00Z",
+            "updatedAt": updated,
+            "body": "",
+            "labels": [],
+            "assignees": []
+        }
+
+    def test_cursor_tracks_newest_issue_per_repo(self):
+        """Each repo resumes from its own newest updatedAt."""
+        adapter = GitHubAdapter({
+            "api": "rest",
+            "repos": [{"owner": "test", "repo": "a"}, {"owner": "test", "repo": "b"}]
+        })
+        issues = {
+            "a": [self._issue("a", 1, "2025-12-09T10:00:00Z"), self._issue("a", 2, "2025-12-09T12:00:00Z")],
+            "b": [self._issue("b", 1, "2025-12-08T09:00:00Z")],
+        }
+
+        def run_gh(args, timeout=30):
+            repo = args[args.index("-R") + 1].split("/")[1]
+            return True, json.dumps(issues[repo] if "open" in args else []), ""
+
+        with patch.object(adapter, "_run_gh", side_effect=run_gh):
+            changes, cursor = adapter.pull_since_cursor(None)
+
+        assert len(changes) == 3
+        assert json.loads(cursor) == {
+            "test/a": "2025-12-09T12:00:00+00:00",
+            "test/b": "2025-12-08T09:00:00+00:00",
+        }
+
+        # Nothing newer: same cursor, no changes
+        with patch.object(adapter, "_run_gh", side_effect=run_gh):
+            changes, next_cursor = adapter.pull_since_cursor(cursor)
+
+        assert changes == []
+        assert json.loads(next_cursor) == json.loads(cursor)
+
+    def test_failed_repo_keeps_position(self):
+        """A repo that fails does not advance; the others do."""
+        adapter = GitHubAdapter({
+            "api": "rest",
+            "repos": [{"owner": "test", "repo": "a"}, {"owner": "test", "repo": "b"}]
+        })
+        cursor = json.dumps({
+            "test/a": "2025-12-01T00:00:00+00:00",
+            "test/b": "2025-12-01T00:00:00+00:00",
+        })
+
+        def run_gh(args, timeout=30):
+            if "test/b" in args:
+                return False, "", "HTTP 502"
+            if "open" in args:
+                return True, json.dumps([self._issue("a", 1, "2025-12-09T10:00:00Z")]), ""
+            return True, "[]", ""
+
+        with patch.object(adapter, "_run_gh", side_effect=run_gh):
+            changes, next_cursor = adapter.pull_since_cursor(cursor)
+
+        assert len(changes) == 1
+        assert json.loads(next_cursor) == {
+            "test/a": "2025-12-09T10:00:00+00:00",
+            "test/b": "2025-12-01T00:00:00+00:00",
+        }
 
 class TestGitHubAdapterPush:
     """Test push operations."""
@@ -249,22 +479,27 @@ class TestGitHubAdapterMapping:
 class TestGitHubAdapterSearch:
     """Test duplicate detection."""
 
-    @patch.object(GitHubAdapter, "_run_gh")
-    def test_find_matching_task_exact_match(self, mock_run_gh):
-        """Finds issue with exact title match."""
+    def _indexed_adapter(self, *issues):
         adapter = GitHubAdapter({
             "repos": [{"owner": "test", "repo": "repo"}]
         })
+        adapter.issue_index.upsert_many("github", [
+            {
+                "external_id": f"github:test/repo#{number}",
+                "scope": "test/repo",
+                "title": title,
+                "state": state,
+                "url": f"https://github.com/test/repo/issues/{number}",
+            }
+            for number, title, state in issues
+        ])
+        adapter.issue_index.mark_refreshed("github", ["test/repo"])
+        return adapter
 
-        mock_run_gh.return_value = (
-            True,
-            json.dumps([{
-                "number": 42,
-                "title": "Test Task",
-                "url": "https://github.com/test/repo/issues/42"
-            }]),
-            ""
-        )
+    @patch.object(GitHubAdapter, "_run_gh")
+    def test_find_matching_task_exact_match(self, mock_run_gh):
+        """Finds issue with exact title match."""
+        adapter = self._indexed_adapter((42, "Test Task", "open"))
 
         task = OrgTask(
             id="local-1",
@@ -276,15 +511,12 @@ class TestGitHubAdapterSearch:
 
         assert ref is not None
         assert ref.external_id == "github:test/repo#42"
+        mock_run_gh.assert_not_called()
 
     @patch.object(GitHubAdapter, "_run_gh")
     def test_find_matching_task_no_match(self, mock_run_gh):
         """Returns None when no match found."""
-        adapter = GitHubAdapter({
-            "repos": [{"owner": "test", "repo": "repo"}]
-        })
-
-        mock_run_gh.return_value = (True, json.dumps([]), "")
+        adapter = self._indexed_adapter((42, "Test Task", "open"))
 
         task = OrgTask(
             id="local-1",
@@ -295,6 +527,78 @@ class TestGitHubAdapterSearch:
         ref = adapter.find_matching_task(task)
 
         assert ref is None
+        mock_run_gh.assert_not_called()
+
+    @patch.object(GitHubAdapter, "_run_gh")
+    def test_find_matching_task_fuzzy(self, mock_run_gh):
+        """Near-identical titles match; closed issues do not."""
+        adapter = self._indexed_adapter(
+            (7, "[WIP] Migrate sync history to  SQLite", "open"),
+            (8, "Fix calendar token refresh", "closed"),
+        )
+
+        ref = adapter.find_matching_task(OrgTask(
+            id="local-1", title="Migrate sync history to sqlite.", state=TaskState.TODO
+        ))
+        assert ref.external_id == "github:test/repo#7"
+
+        ref = adapter.find_matching_task(OrgTask(
+            id="local-2", title="Fix calendar token refresh", state=TaskState.TODO
+        ))
+        assert ref is None
+
+    def test_unindexed_repo_is_pulled_once(self):
+        """A repo never pulled is fetched in full once, then served locally."""
+        adapter = GitHubAdapter({
+            "repos": [{"owner": "datacore-one", "repo": "datacore"},
+                      {"owner": "datacore-one", "repo": "calendar"}]
+        })
+        gh = RecordedGh("multi_repo_paged")
+
+        with patch.object(adapter, "_run_gh", side_effect=gh):
+            first = adapter.find_matching_task(OrgTask(
+                id="local-1", title="Release 1.2", state=TaskState.TODO
+            ))
+            second = adapter.find_matching_task(OrgTask(
+                id="local-2", title="Document adapters", state=TaskState.TODO
+            ))
+
+        assert first.external_id == "github:datacore-one/datacore#13"
+        assert second.external_id == "github:datacore-one/datacore#12"
+        assert len(gh.queries) == 2  # both pages of the single refresh
+        assert adapter.issue_index.count("github") == 4
+
+    @patch.object(GitHubAdapter, "_run_gh")
+    def test_failed_refresh_backs_off(self, mock_run_gh):
+        """A repo whose refresh fails isn't re-pulled on every lookup."""
+        adapter = GitHubAdapter({"repos": [{"owner": "test", "repo": "repo"}]})
+        mock_run_gh.return_value = (False, "", "HTTP 502")
+        task = OrgTask(id="local-1", title="Test Task", state=TaskState.TODO)
+
+        assert adapter.find_matching_task(task) is None
+        calls = mock_run_gh.call_count
+        assert calls > 0
+
+        assert adapter.find_matching_task(task) is None
+        assert mock_run_gh.call_count == calls
+
+        later = time.monotonic() + github_module.REFRESH_RETRY_INTERVAL
+        with patch.object(github_module.time, "monotonic", return_value=later):
+            adapter.find_matching_task(task)
+        assert mock_run_gh.call_count > calls
+
+    @patch.object(GitHubAdapter, "_run_gh")
+    def test_created_and_closed_issues_update_index(self, mock_run_gh):
+        """Issues created or closed by push are reflected without a pull."""
+        adapter = self._indexed_adapter()
+        mock_run_gh.return_value = (True, "https://github.com/test/repo/issues/50", "")
+
+        task = OrgTask(id="local-1", title="New Task", state=TaskState.TODO)
+        ref = adapter.create_task(task)
+        assert adapter.find_matching_task(task).external_id == ref.external_id
+
+        adapter.close_task(ref)
+        assert adapter.find_matching_task(task) is None
 
 
 if __name__ == "__main__":
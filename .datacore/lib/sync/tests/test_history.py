@@ -233,6 +233,47 @@ class TestSyncHistoryState:
         assert history.get_state("key") == "value2"
 
 
+class TestSyncHistoryCursors:
+    """Test adapter cursors and shared transactions."""
+
+    def test_set_get_cursor(self, tmp_path):
+        """Cursors are stored per adapter and can be cleared."""
+        history = SyncHistory(db_path=str(tmp_path / "sync_history.db"))
+
+        history.set_cursor("github", '{"o/a": "2025-12-09T10:00:00+00:00"}')
+        history.set_cursor("calendar", "token-1")
+
+        assert history.get_cursor("github") == '{"o/a": "2025-12-09T10:00:00+00:00"}'
+        assert history.get_cursor("calendar") == "token-1"
+
+        history.set_cursor("calendar", None)
+        assert history.get_cursor("calendar") is None
+
+    def test_transaction_commits_together(self, tmp_path):
+        """Cursor and history row are written in one commit."""
+        history = SyncHistory(db_path=str(tmp_path / "sync_history.db"))
+
+        with history.transaction() as conn:
+            history.set_cursor("github", "c1", conn=conn)
+            history.record("pull", "github", items_processed=3, conn=conn)
+
+        assert history.get_cursor("github") == "c1"
+        assert history.get_history(adapter="github")[0].items_processed == 3
+
+    def test_transaction_rolls_back(self, tmp_path):
+        """A failure inside the transaction leaves the old cursor."""
+        history = SyncHistory(db_path=str(tmp_path / "sync_history.db"))
+        history.set_cursor("github", "c1")
+
+        with pytest.raises(RuntimeError):
+            with history.transaction() as conn:
+                history.set_cursor("github", "c2", conn=conn)
+                history.record("pull", "github", conn=conn)
+                raise RuntimeError("crash while applying")
+
+        assert history.get_cursor("github") == "c1"
+        assert history.get_history() == []
+
 class TestSyncHistoryCleanup:
     """Test history cleanup."""
 
@@ -260,6 +301,82 @@ class TestSyncHistoryCleanup:
         entries = history.get_history(days=60)
         assert len(entries) == 1  # Only recent entry remains
 
+    def _insert_runs(self, db_path, runs):
+        """Insert (timestamp, direction, items_failed, duration_ms) rows directly."""
+        conn = sqlite3.connect(str(db_path))
+        conn.executemany("""
+            INSERT INTO sync_history (timestamp, direction, adapter, items_processed, items_failed, duration_ms)
+            VALUES (?, ?, 'github', 1, ?, ?)
+        """, runs)
+        conn.commit()
+        conn.close()
+
+    def test_cleanup_rolls_up_before_deleting(self, tmp_path):
+        """Removed entries are kept as hourly and daily buckets with percentiles."""
+        db_path = tmp_path / "sync_history.db"
+        history = SyncHistory(db_path=str(db_path))
+        day = (datetime.now() - timedelta(days=45)).replace(hour=9, minute=0)
+        self._insert_runs(db_path, [
+            ((day + timedelta(minutes=i)).isoformat(), "pull", 1 if i == 0 else 0, (i + 1) * 100)
+            for i in range(20)
+        ] + [((day + timedelta(hours=2)).isoformat(), "pull", 0, 50)])
+
+        assert history.cleanup(days=30) == 21
+
+        [daily] = history.get_rollups("day", days=60)
+        assert daily["bucket"] == day.date().isoformat()
+        assert (daily["runs"], daily["failed_runs"], daily["items_processed"]) == (21, 1, 21)
+        assert (daily["duration_p50_ms"], daily["duration_p95_ms"]) == (1000, 1900)
+
+        hourly = history.get_rollups("hour", days=60)
+        assert [h["runs"] for h in hourly] == [20, 1]
+        assert (hourly[0]["duration_p50_ms"], hourly[0]["duration_p95_ms"]) == (1000, 1900)
+        assert history.get_history(days=60) == []
+
+    def test_stats_include_rolled_up_days(self, tmp_path):
+        """Stats over a long window count rolled-up runs as well as recent ones."""
+        db_path = tmp_path / "sync_history.db"
+        history = SyncHistory(db_path=str(db_path))
+        self._insert_runs(db_path, [
+            ((datetime.now() - timedelta(days=45)).isoformat(), "pull", 1, 100),
+            ((datetime.now() - timedelta(days=40)).isoformat(), "push", 0, 100),
+        ])
+        history.record(direction="pull", adapter="github", items_processed=1)
+
+        history.cleanup(days=30)
+        stats = history.get_stats(days=60)
+
+        assert stats["pull"] == {"success": 1, "failed": 1, "items": 2}
+        assert stats["push"] == {"success": 1, "failed": 0, "items": 1}
+        assert stats["by_adapter"]["github"] == {"count": 3, "items": 3}
+        assert history.get_stats(days=7)["pull"]["items"] == 1
+
+    def test_stats_window_edge_day(self, tmp_path):
+        """On the window's first rolled-up day, only hours after the cutoff count."""
+        db_path = tmp_path / "sync_history.db"
+        history = SyncHistory(db_path=str(db_path))
+        start = (datetime.now() - timedelta(days=40)).replace(minute=30)
+        self._insert_runs(db_path, [
+            ((start - timedelta(hours=1)).isoformat(), "pull", 0, 10),
+            ((start + timedelta(hours=1)).isoformat(), "pull", 0, 10),
+            ((start + timedelta(days=1)).isoformat(), "pull", 0, 10),
+        ])
+        history.cleanup(days=30)
+
+        # The run an hour before the cutoff is left out, even on the same day
+        assert history.get_stats(days=40)["pull"]["items"] == 2
+
+    def test_old_hourly_rollups_are_dropped(self, tmp_path):
+        """Hourly buckets expire after hourly_days; daily buckets remain."""
+        db_path = tmp_path / "sync_history.db"
+        history = SyncHistory(db_path=str(db_path))
+        self._insert_runs(db_path, [((datetime.now() - timedelta(days=100)).isoformat(), "pull", 0, 10)])
+
+        history.cleanup(days=30, hourly_days=90)
+
+        assert history.get_rollups("hour", days=365) == []
+        assert len(history.get_rollups("day", days=365)) == 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,91 @@
+"""
+Tests for IssueIndex.
+
+DIP-0010: Task Sync Architecture
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add lib to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sync.issue_index import IssueIndex, normalize_title
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Create an index in a temp database."""
+    return IssueIndex(db_path=str(tmp_path / "sync.db"))
+
+
+def issue(number, title, scope="o/a", state="open"):
+    return {
+        "external_id": f"github:{scope}#{number}",
+        "scope": scope,
+        "title": title,
+        "state": state,
+        "updated_at": datetime(2025, 12, 9, 10, 0),
+        "url": f"https://github.com/{scope}/issues/{number}",
+    }
+
+
+class TestNormalizeTitle:
+    """Test title normalization."""
+
+    def test_strips_prefix_case_and_spacing(self):
+        """Bracket prefixes, case and repeated whitespace are ignored."""
+        assert normalize_title("[WIP]  Fix   Login ") == "fix login"
+
+    def test_empty(self):
+        """Handles empty and None titles."""
+        assert normalize_title("") == ""
+        assert normalize_title(None) == ""
+
+
+class TestIssueIndex:
+    """Test index storage and matching."""
+
+    def test_upsert_updates_existing(self, index):
+        """Re-upserting an issue replaces its title and state."""
+        index.upsert_many("github", [issue(1, "Old title")])
+        index.upsert_many("github", [issue(1, "New title", state="closed")])
+
+        assert index.count("github") == 1
+        assert index.find_match("github", "Old title") is None
+        match = index.find_match("github", "New title", state="closed")
+        assert match["external_id"] == "github:o/a#1"
+        assert match["score"] == 1.0
+
+    def test_match_limited_to_scopes(self, index):
+        """Only issues in the requested scopes are candidates."""
+        index.upsert_many("github", [issue(1, "Shared title", scope="o/a"),
+                                     issue(2, "Shared title", scope="o/b")])
+
+        match = index.find_match("github", "Shared title", scopes=["o/b"])
+
+        assert match["external_id"] == "github:o/b#2"
+        assert index.find_match("github", "Shared title", scopes=[]) is None
+
+    def test_fuzzy_threshold(self, index):
+        """Fuzzy matches honour the similarity threshold."""
+        index.upsert_many("github", [issue(1, "Add weekly review template")])
+
+        assert index.find_match("github", "Add weekly review templates")["score"] < 1.0
+        assert index.find_match("github", "Add monthly review template", threshold=0.95) is None
+        assert index.find_match("github", "Something else entirely") is None
+
+    def test_refreshed_scopes(self, index):
+        """Scopes are unrefreshed until marked."""
+        assert index.unrefreshed_scopes("github", ["o/a", "o/b"]) == ["o/a", "o/b"]
+
+        index.mark_refreshed("github", ["o/a"])
+
+        assert index.unrefreshed_scopes("github", ["o/a", "o/b"]) == ["o/b"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
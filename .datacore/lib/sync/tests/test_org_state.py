@@ -0,0 +1,142 @@
+"""
+Tests for org-side change detection.
+
+DIP-0010: Task Sync Architecture
+"""
+
+from pathlib import Path
+
+import pytest
+
+# Add lib to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import zettel_db
+from org_parser import index_org_file
+from sync.adapters import ChangeType, TaskState, Priority
+from sync.org_state import (
+    SnapshotStore,
+    load_synced_tasks,
+    find_unlinked_tasks,
+    diff_org_tasks,
+    task_snapshot,
+)
+
+ORG = """#+TITLE: Next Actions
+
+* Work
+** TODO [#A] Fix login bug  :dev:web:
+DEADLINE: <2025-12-20 Sat>
+:PROPERTIES:
+:EXTERNAL_ID: github:o/a#1
+:EXTERNAL_URL: [[https://github.com/o/a/issues/1][o/a#1]]
+:END:
+** NEXT Write docs
+:PROPERTIES:
+:EXTERNAL_ID: github:o/a#2
+:END:
+** TODO Unlinked task
+"""
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    """Index an org file into a temp space database."""
+    db_path = tmp_path / "knowledge.db"
+    monkeypatch.setattr(zettel_db, "get_db_path", lambda space=None: db_path)
+    zettel_db.init_database("personal")
+
+    org_file = tmp_path / "next_actions.org"
+    org_file.write_text(ORG)
+    index_org_file(org_file, "personal")
+
+    conn = zettel_db.get_connection("personal")
+    yield conn
+    conn.close()
+
+
+class TestLoadSyncedTasks:
+    """Test reading linked tasks from the index."""
+
+    def test_loads_linked_tasks(self, conn):
+        """Only tasks with an EXTERNAL_ID are loaded, with their fields."""
+        tasks = load_synced_tasks(conn)
+
+        assert set(tasks) == {"github:o/a#1", "github:o/a#2"}
+        task = tasks["github:o/a#1"]
+        assert task.title == "Fix login bug"
+        assert task.state == TaskState.TODO
+        assert task.priority == Priority.A
+        assert task.deadline.strftime("%Y-%m-%d") == "2025-12-20"
+        assert task.external_url == "https://github.com/o/a/issues/1"
+        assert ":dev:" in task.tags
+
+    def test_finds_unlinked_by_title(self, conn):
+        """Open unlinked tasks are found by normalized title."""
+        found = find_unlinked_tasks(conn, ["unlinked  TASK", "Fix login bug"])
+
+        assert list(found) == ["unlinked task"]
+        assert found["unlinked task"].external_id is None
+
+
+class TestDiffOrgTasks:
+    """Test snapshot diffing."""
+
+    def test_unchanged_tasks_produce_nothing(self, conn):
+        """Tasks matching their snapshots yield no changes."""
+        tasks = load_synced_tasks(conn)
+        snapshots = {eid: task_snapshot(task) for eid, task in tasks.items()}
+
+        changes, baselines = diff_org_tasks(tasks, snapshots)
+
+        assert changes == []
+        assert baselines == []
+
+    def test_first_sync_records_baselines(self, conn):
+        """Tasks without a snapshot become baselines, not pushes."""
+        tasks = load_synced_tasks(conn)
+
+        changes, baselines = diff_org_tasks(tasks, {})
+
+        assert changes == []
+        assert {b["external_id"] for b in baselines} == set(tasks)
+
+    def test_detects_state_and_field_changes(self, conn):
+        """State changes and other field changes are reported separately."""
+        tasks = load_synced_tasks(conn)
+        snapshots = {eid: task_snapshot(task) for eid, task in tasks.items()}
+        snapshots["github:o/a#1"].update(state="DONE", title="Old title")
+
+        changes, _ = diff_org_tasks(tasks, snapshots)
+
+        assert [c.change_type for c in changes] == [ChangeType.UPDATED, ChangeType.STATE_CHANGED]
+        assert changes[0].changed_fields == ["title"]
+        assert (changes[1].old_state, changes[1].new_state) == ("DONE", "TODO")
+
+    def test_skip(self, conn):
+        """Skipped tasks are neither diffed nor baselined."""
+        tasks = load_synced_tasks(conn)
+
+        changes, baselines = diff_org_tasks(tasks, {}, skip={"github:o/a#1"})
+
+        assert [b["external_id"] for b in baselines] == ["github:o/a#2"]
+
+
+class TestSnapshotStore:
+    """Test snapshot persistence."""
+
+    def test_save_and_load(self, tmp_path, conn):
+        """Snapshots round-trip and are replaced on save."""
+        store = SnapshotStore(db_path=str(tmp_path / "sync.db"))
+        task = load_synced_tasks(conn)["github:o/a#2"]
+
+        store.save_many([task_snapshot(task)])
+        task.state = TaskState.DONE
+        store.save_many([task_snapshot(task)])
+
+        assert store.load() == {"github:o/a#2": task_snapshot(task)}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -123,6 +123,89 @@ class TestConditionEvaluation:
         assert router._evaluate_condition("assignee is null", assigned) is False
 
 
+def make_task(**kwargs):
+    """ExternalTask with defaults for condition tests."""
+    fields = {
+        "id": "1",
+        "title": "Test",
+        "state": "open",
+        "url": "https://test.com",
+        "created_at": datetime.now(),
+        "updated_at": datetime.now(),
+    }
+    fields.update(kwargs)
+    return ExternalTask(**fields)
+
+
+class TestCompoundConditions:
+    """Test and/or/not, title and milestone conditions."""
+
+    def test_and_or_not(self):
+        """Boolean operators combine comparisons with grouping."""
+        router = TaskRouter({})
+        task = make_task(labels=["bug", "ui"], assignee="alice")
+
+        assert router._evaluate_condition("labels contains 'bug' and assignee == 'alice'", task) is True
+        assert router._evaluate_condition("labels contains 'bug' and not labels contains 'ui'", task) is False
+        assert router._evaluate_condition(
+            "(labels contains 'docs' or labels contains 'ui') and assignee is not null", task
+        ) is True
+
+    def test_title_and_milestone(self):
+        """Title regex and milestone comparisons."""
+        router = TaskRouter({})
+        task = make_task(title="[RFC] Sync scheduler", milestone="v2.0")
+
+        assert router._evaluate_condition("title matches '^\\[rfc\\]'", task) is True
+        assert router._evaluate_condition("milestone == 'V2.0'", task) is True
+        assert router._evaluate_condition("milestone is null", task) is False
+
+    def test_invalid_condition_never_matches(self):
+        """Unparseable rules are ignored rather than failing the router."""
+        router = TaskRouter({"routing": [
+            {"condition": "labels contains 'bug' and (", "destination": "bugs.org"},
+            {"condition": "true", "destination": "inbox.org"},
+        ]})
+
+        assert router.route(make_task(labels=["bug"]), "github")["destination"] == "inbox.org"
+
+
+class TestRuleDispatch:
+    """Test indexed dispatch keeps first-match-wins semantics."""
+
+    def test_rule_order_preserved_across_indexes(self):
+        """Indexed and unindexed rules are tried in configured order."""
+        router = TaskRouter({"routing": [
+            {"condition": "title matches 'urgent'", "destination": "urgent.org"},
+            {"condition": "labels contains 'bug'", "destination": "bugs.org"},
+            {"source": "linear", "condition": "labels contains 'bug'", "destination": "linear.org"},
+            {"condition": "assignee == 'alice' and labels contains 'x'", "destination": "alice.org"},
+            {"condition": "true", "destination": "inbox.org"},
+        ]})
+
+        assert router.route(make_task(title="urgent fix", labels=["bug"]), "github")["destination"] == "urgent.org"
+        assert router.route(make_task(labels=["BUG"]), "github")["destination"] == "bugs.org"
+        assert router.route(make_task(labels=["x"], assignee="Alice"), "github")["destination"] == "alice.org"
+        assert router.route(make_task(labels=["x"], assignee="bob"), "github")["destination"] == "inbox.org"
+
+    def test_route_many_matches_route(self):
+        """Batch routing gives the same result as routing one by one."""
+        router = TaskRouter({})
+        tasks = [
+            make_task(labels=["ai-task"]),
+            make_task(labels=["priority-high"]),
+            make_task(labels=["ai-task"], title="Other"),
+            make_task(),
+        ]
+
+        batch = router.route_many(tasks, "github")
+
+        assert batch == [router.route(task, "github") for task in tasks]
+        assert [r["destination"] for r in batch] == [
+            "next_actions.org", "next_actions.org", "next_actions.org", "inbox.org"
+        ]
+
+
 class TestTaskRouting:
     """Test task routing logic."""
 
@@ -267,6 +350,31 @@ class TestExternalToOrg:
         assert ":AI:research:" in org_task.tags
 
 
+class TestFormatOrgEntry:
+    """Test rendering routed tasks as org text."""
+
+    def test_heading_and_drawer(self):
+        """Renders state, priority, merged tags and properties."""
+        router = TaskRouter({})
+        task = ExternalTask(
+            id="42",
+            title="Research topic",
+            state="open",
+            url="https://github.com/test/repo/issues/42",
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            labels=["ai-task", "ai-research", "priority-high"]
+        )
+        org_task = router.external_to_org(task, "github", "github:test/repo#42")
+
+        lines = router.format_org_entry(org_task, level=3).splitlines()
+
+        assert lines[0] == "*** TODO [#A] Research topic  :AI:research:"
+        assert lines[1] == ":PROPERTIES:"
+        assert ":EXTERNAL_ID: github:test/repo#42" in lines
+        assert lines[-1] == ":END:"
+
+
 class TestOrgFilePath:
     """Test org file path resolution."""
 
@@ -0,0 +1,231 @@
+"""
+Tests for the background sync scheduler.
+
+DIP-0010: Task Sync Architecture
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add lib to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sync.history import SyncHistory
+from sync.scheduler import SyncScheduler, TokenBucket, parse_interval
+
+
+class FakeClock:
+    """Clock whose sleep advances time instantly."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_engine(tmp_path, adapters=("github",), tasks=None, adapter_config=None, outcomes=None):
+    """Stub engine whose sync() returns (or raises) the queued outcomes in turn."""
+    engine = MagicMock()
+    engine.config = {"sync": {
+        "tasks": {"poll_interval": "10m", "jitter": 0, **(tasks or {})},
+        "adapters": adapter_config or {},
+    }}
+    engine.list_adapters.return_value = list(adapters)
+    engine.history = SyncHistory(db_path=str(tmp_path / "sync_history.db"))
+    engine.last_pull = {}
+    outcomes = list(outcomes or [])
+    engine.calls = []
+
+    def sync(only):
+        engine.calls.append(list(only))
+        outcome = outcomes.pop(0) if outcomes else True
+        if isinstance(outcome, Exception):
+            raise outcome
+        return {
+            "success": outcome,
+            "pull": {"count": 1, "errors": [] if outcome else ["boom"]},
+            "push": {"count": 0, "errors": []},
+        }
+
+    engine.sync.side_effect = sync
+    return engine
+
+
+class TestParseInterval:
+    """Test interval settings."""
+
+    def test_units(self):
+        """Suffixes s/m/h/d and bare numbers are seconds."""
+        assert parse_interval("30s") == 30
+        assert parse_interval("10m") == 600
+        assert parse_interval("1h") == 3600
+        assert parse_interval(45) == 45
+        assert parse_interval("soon", default=5) == 5
+
+
+class TestTokenBucket:
+    """Test the per-adapter rate limit."""
+
+    def test_burst_then_refill(self):
+        """A full bucket allows a burst, then one run per refill period."""
+        bucket = TokenBucket(capacity=2, rate=1 / 60, now=0)
+
+        assert bucket.take(0) and bucket.take(0)
+        assert not bucket.take(0)
+        assert bucket.wait_time(0) == pytest.approx(60)
+        assert bucket.take(60)
+
+    def test_rejects_non_positive_rate(self):
+        """A bucket that never refills is a configuration error."""
+        with pytest.raises(ValueError):
+            TokenBucket(capacity=1, rate=0, now=0)
+
+
+class TestSyncScheduler:
+    """Test scheduling with a fake clock and stub engine."""
+
+    def test_runs_every_poll_interval(self, tmp_path):
+        """Each adapter runs at start, then every poll_interval."""
+        clock = FakeClock()
+        engine = make_engine(tmp_path)
+        scheduler = SyncScheduler(engine, clock=clock, sleep=clock.sleep)
+
+        totals = scheduler.run(max_runs=3)
+
+        assert totals["runs"] == 3
+        assert clock.sleeps == [600, 600]
+        assert engine.calls == [["github"]] * 3
+
+    def test_per_adapter_interval(self, tmp_path):
+        """Adapters override poll_interval and are synced separately."""
+        clock = FakeClock()
+        engine = make_engine(tmp_path, adapters=("github", "calendar"),
+                             adapter_config={"calendar": {"poll_interval": "5m"}})
+        scheduler = SyncScheduler(engine, clock=clock, sleep=clock.sleep)
+
+        scheduler.run(max_runs=3)
+
+        assert engine.calls == [["github"], ["calendar"], ["calendar"]]
+        assert clock.sleeps == [300]
+
+    def test_failures_back_off_exponentially(self, tmp_path):
+        """Failed runs double the delay up to backoff_max; success resets it."""
+        clock = FakeClock()
+        engine = make_engine(tmp_path, tasks={"backoff_max": "30m"},
+                             outcomes=[False, RuntimeError("down"), False, True])
+        scheduler = SyncScheduler(engine, clock=clock, sleep=clock.sleep)
+
+        totals = scheduler.run(max_runs=5)
+
+        assert clock.sleeps == [1200, 1800, 1800, 600]
+        assert (totals["succeeded"], totals["failed"]) == (2, 3)
+
+    def test_jitter_spreads_delay(self, tmp_path):
+        """Delays vary within +/- jitter of the interval."""
+        clock = FakeClock()
+        engine = make_engine(tmp_path, tasks={"jitter": 0.1})
+        scheduler = SyncScheduler(engine, clock=clock, sleep=clock.sleep)
+
+        scheduler.run(max_runs=20)
+
+        assert all(540 <= delay <= 660 for delay in clock.sleeps)
+        assert len(set(clock.sleeps)) > 1
+
+    def test_rate_limit_throttles_runs(self, tmp_path):
+        """Runs beyond the token bucket wait for a token."""
+        clock = FakeClock()
+        engine = make_engine(tmp_path, tasks={"poll_interval": "1m", "rate_limit": 30, "burst": 1})
+        scheduler = SyncScheduler(engine, clock=clock, sleep=clock.sleep)
+
+        totals = scheduler.run(max_runs=3)
+
+        # One token every 2 minutes: runs at 0, 2m, 4m despite the 1m interval
+        assert totals["throttled"] == 2
+        assert clock.now - 1000.0 == pytest.approx(240)
+
+    def test_throttled_run_advances_next_run(self, tmp_path):
+        """A throttled adapter is rescheduled at least an interval ahead."""
+        clock = FakeClock()
+        engine = make_engine(tmp_path, tasks={"poll_interval": "1m", "rate_limit": 60, "burst": 1})
+        scheduler = SyncScheduler(engine, clock=clock, sleep=clock.sleep)
+        scheduler.tick()
+
+        scheduler.trigger("github")
+        assert scheduler.tick() == pytest.approx(60)
+
+        assert scheduler.totals == {"runs": 1, "succeeded": 1, "failed": 0, "throttled": 1}
+        assert scheduler.schedules["github"].next_run == pytest.approx(clock.now + 60)
+
+    @pytest.mark.parametrize("rate_limit", [0, -5])
+    def test_non_positive_rate_limit_is_unlimited(self, tmp_path, rate_limit):
+        """rate_limit <= 0 disables throttling instead of spinning."""
+        clock = FakeClock()
+        engine = make_engine(tmp_path, tasks={"poll_interval": "1m", "rate_limit": rate_limit, "burst": 1})
+        scheduler = SyncScheduler(engine, clock=clock, sleep=clock.sleep)
+
+        totals = scheduler.run(max_runs=3)
+
+        assert totals["throttled"] == 0
+        assert clock.sleeps == [pytest.approx(60)] * 2
+
+    def test_runs_are_recorded(self, tmp_path):
+        """Each run is recorded in history with its outcome and duration."""
+        clock = FakeClock()
+        engine = make_engine(tmp_path)
+
+        def slow_sync(only):
+            clock.now += 2.5
+            return {"success": True, "pull": {"count": 1, "errors": []}, "push": {"count": 0, "errors": []}}
+
+        engine.sync.side_effect = slow_sync
+        scheduler = SyncScheduler(engine, clock=clock, sleep=clock.sleep)
+
+        scheduler.run(max_runs=1)
+
+        [entry] = engine.history.get_history(direction="sync")
+        assert entry.adapter == "github"
+        assert entry.duration_ms == 2500
+        assert entry.items_failed == 0
+
+    def test_stop_finishes_current_run(self, tmp_path):
+        """stop() during a run lets it finish, then run() returns."""
+        clock = FakeClock()
+        engine = make_engine(tmp_path, adapters=("github", "calendar"))
+        scheduler = SyncScheduler(engine, clock=clock, sleep=clock.sleep)
+
+        def stopping_sync(only):
+            scheduler.stop()
+            return {"success": True, "pull": {"count": 0, "errors": []}, "push": {"count": 0, "errors": []}}
+
+        engine.sync.side_effect = stopping_sync
+
+        totals = scheduler.run()
+
+        assert totals["runs"] == 1
+        assert clock.sleeps == []
+
+    def test_trigger_runs_adapter_early(self, tmp_path):
+        """trigger() makes an adapter due now."""
+        clock = FakeClock()
+        engine = make_engine(tmp_path)
+        scheduler = SyncScheduler(engine, clock=clock, sleep=clock.sleep)
+        scheduler.tick()
+
+        clock.now += 60
+        scheduler.trigger("github")
+
+        assert scheduler.tick() == pytest.approx(600)
+        assert scheduler.totals["runs"] == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
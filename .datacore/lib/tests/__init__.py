@@ -0,0 +1 @@
+"""Library tests."""
@@ -0,0 +1,21 @@
+"""
+Shared fixtures for library tests.
+"""
+
+from pathlib import Path
+
+import pytest
+
+# Add lib to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import zettel_db
+
+
+@pytest.fixture
+def space(tmp_path, monkeypatch):
+    """The personal space, pointed at an empty indexed database under tmp_path."""
+    monkeypatch.setitem(zettel_db.SPACES["personal"], "path", tmp_path / "0-personal")
+    zettel_db.init_database("personal")
+    return "personal"
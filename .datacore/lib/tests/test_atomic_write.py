@@ -0,0 +1,159 @@
+"""
+Tests for atomic writes and the crash-recovery intent log.
+
+DIP-0004: Knowledge Database
+"""
+
+import os
+import sqlite3
+import subprocess
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# Add lib to path
+import sys
+LIB = Path(__file__).parent.parent
+sys.path.insert(0, str(LIB))
+
+from atomic_write import atomic_write, complete_intent, recover_intents
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def crash_during_write(tmp_path: Path, target: Path, content: str, crash_at: str):
+    """Run a logged atomic_write in a child process that dies at `crash_at`.
+
+    crash_at: 'temp' (temp file partly written), 'replace' (before the
+    rename) or 'complete' (after the rename, before complete_intent).
+    """
+    script = textwrap.dedent(f"""
+        import os, sqlite3, sys
+        sys.path.insert(0, {str(LIB)!r})
+        import atomic_write
+
+        crash_at = {crash_at!r}
+        if crash_at == 'temp':
+            # Torn write: only part of the data reached the temp file
+            atomic_write.os.fsync = lambda fd: (os.ftruncate(fd, 2), os._exit(3))
+        elif crash_at == 'replace':
+            atomic_write.os.replace = lambda src, dst: os._exit(3)
+
+        conn = sqlite3.connect({str(tmp_path / "intents.db")!r})
+        atomic_write.atomic_write({str(target)!r}, {content!r}, conn=conn, payload={{'task': 7}})
+        os._exit(3)  # 'complete': crash before complete_intent
+    """)
+    result = subprocess.run([sys.executable, "-c", script])
+    assert result.returncode == 3
+
+
+class TestAtomicWrite:
+    """Test plain atomic replacement."""
+
+    def test_replaces_content_and_keeps_mode(self, tmp_path):
+        """Content is replaced, mode preserved, no temp files left."""
+        target = tmp_path / "next_actions.org"
+        target.write_text("old\n")
+        os.chmod(target, 0o600)
+
+        atomic_write(target, "new\n")
+
+        assert target.read_text() == "new\n"
+        assert (target.stat().st_mode & 0o777) == 0o600
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_symlink_is_kept(self, tmp_path):
+        """Writing through a symlink replaces the file it points to."""
+        real = tmp_path / "real.org"
+        real.write_text("old\n")
+        link = tmp_path / "link.org"
+        link.symlink_to(real)
+
+        atomic_write(link, "new\n")
+
+        assert link.is_symlink()
+        assert real.read_text() == "new\n"
+
+    def test_logged_write_completes(self, tmp_path):
+        """A completed intent leaves nothing to recover."""
+        target = tmp_path / "inbox.org"
+        target.write_text("old\n")
+        conn = connect(tmp_path / "intents.db")
+
+        intent_id = atomic_write(target, "new\n", conn=conn, payload={"task": 1})
+        complete_intent(conn, intent_id)
+        conn.commit()
+
+        assert recover_intents(conn) == []
+
+
+class TestCrashRecovery:
+    """Test recovery of writes interrupted by a crash."""
+
+    def test_crash_while_writing_temp(self, tmp_path):
+        """The intent exists before the temp file, so a partial temp is cleaned up."""
+        target = tmp_path / "inbox.org"
+        target.write_text("old\n")
+
+        crash_during_write(tmp_path, target, "new\n", crash_at="temp")
+        leftovers = [p.name for p in tmp_path.glob(".inbox.org.*.tmp")]
+        recovered = recover_intents(connect(tmp_path / "intents.db"))
+
+        assert len(leftovers) == 1
+        assert [(r["payload"], r["applied"]) for r in recovered] == [({"task": 7}, False)]
+        assert target.read_text() == "old\n"
+        assert list(tmp_path.glob(".inbox.org.*.tmp")) == []
+
+    def test_crash_before_replace_is_replayed(self, tmp_path):
+        """A complete temp file over an unchanged target is renamed into place."""
+        target = tmp_path / "inbox.org"
+        target.write_text("old\n")
+
+        crash_during_write(tmp_path, target, "new\n", crash_at="replace")
+        assert target.read_text() == "old\n"
+
+        handled = []
+        recovered = recover_intents(
+            connect(tmp_path / "intents.db"),
+            on_recover=lambda cursor, intent: handled.append(intent["payload"]),
+        )
+
+        assert target.read_text() == "new\n"
+        assert recovered[0]["applied"] is True
+        assert handled == [{"task": 7}]
+        assert list(tmp_path.glob(".inbox.org.*.tmp")) == []
+
+    def test_crash_before_replace_after_edit_rolls_back(self, tmp_path):
+        """A target edited after the crash is never overwritten."""
+        target = tmp_path / "inbox.org"
+        target.write_text("old\n")
+
+        crash_during_write(tmp_path, target, "new\n", crash_at="replace")
+        target.write_text("edited by hand\n")
+        recovered = recover_intents(connect(tmp_path / "intents.db"))
+
+        assert target.read_text() == "edited by hand\n"
+        assert recovered[0]["applied"] is False
+        assert list(tmp_path.glob(".inbox.org.*.tmp")) == []
+
+    def test_crash_after_replace(self, tmp_path):
+        """The rename happened but the DB wasn't told: recovered as applied."""
+        target = tmp_path / "inbox.org"
+        target.write_text("old\n")
+
+        crash_during_write(tmp_path, target, "new\n", crash_at="complete")
+        conn = connect(tmp_path / "intents.db")
+        recovered = recover_intents(conn)
+
+        assert target.read_text() == "new\n"
+        assert [(r["payload"], r["applied"]) for r in recovered] == [({"task": 7}, True)]
+        assert recover_intents(conn) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
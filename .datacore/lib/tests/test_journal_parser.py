@@ -0,0 +1,84 @@
+"""
+Tests for parallel journal parsing.
+
+DIP-0004: Knowledge Database
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Add lib to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import journal_parser
+from journal_parser import PARALLEL_PARSE_THRESHOLD, compute_checksum, parse_journal_files
+
+
+def write_journal(directory: Path, day: int) -> Path:
+    """A journal for 2026-01-<day> with `day % 3 + 1` sessions."""
+    path = directory / f"2026-01-{day:02d}.md"
+    sessions = "\n".join(
+        f"## Session: Work {n}\n**Goal:** Ship part {n}\n\n**Accomplished:**\n- Part {n} done\n"
+        for n in range(day % 3 + 1)
+    )
+    path.write_text(f"---\ndate: 2026-01-{day:02d}\n---\n# Journal\n\n{sessions}")
+    return path
+
+
+@pytest.fixture
+def journals(tmp_path):
+    """Enough journals to take the process-pool path."""
+    return [write_journal(tmp_path, day) for day in range(1, PARALLEL_PARSE_THRESHOLD + 5)]
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    """Records ProcessPoolExecutor construction in parse_journal_files."""
+    created = []
+
+    class RecordingPool(ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            created.append(kwargs.get('max_workers'))
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(journal_parser, "ProcessPoolExecutor", RecordingPool)
+    return created
+
+
+class TestParseJournalFiles:
+    """Test serial and process-pool parsing."""
+
+    def test_pool_matches_serial(self, journals, pools):
+        """Parallel results equal serial ones, in input order."""
+        serial = list(parse_journal_files(journals, "personal", workers=1))
+        parallel = list(parse_journal_files(journals, "personal", workers=2))
+
+        assert pools == [2]
+        assert [p['source_file'] for p in parallel] == [str(path) for path in journals]
+        assert parallel == serial
+        assert [p['session_count'] for p in parallel] == [day % 3 + 1 for day in range(1, len(journals) + 1)]
+
+    def test_small_sets_stay_serial(self, journals, pools):
+        """Below the threshold no pool is started."""
+        parsed = list(parse_journal_files(journals[:PARALLEL_PARSE_THRESHOLD - 1], "personal", workers=2))
+
+        assert pools == []
+        assert len(parsed) == PARALLEL_PARSE_THRESHOLD - 1
+
+    def test_pool_skips_unchanged_and_reports_errors(self, journals, pools, tmp_path):
+        """Unchanged files are skipped and unreadable ones reported, not raised."""
+        unchanged = {str(path): compute_checksum(path.read_text()) for path in journals[:5]}
+        missing = tmp_path / "2026-02-01.md"
+
+        parsed = list(parse_journal_files(journals + [missing], "personal", unchanged, workers=2))
+
+        assert pools == [2]
+        assert [p['source_file'] for p in parsed] == [str(path) for path in journals[5:]] + [str(missing)]
+        assert 'error' in parsed[-1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
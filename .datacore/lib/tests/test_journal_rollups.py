@@ -0,0 +1,90 @@
+"""
+Tests for journal rollup range queries.
+
+DIP-0004: Knowledge Database
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add lib to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import zettel_db
+from journal_parser import index_journal_files
+from journal_rollups import get_rollup_totals
+
+
+@pytest.fixture
+def journal_space(space, tmp_path):
+    """Journals every other day from 2026-01-20 to 2026-04-12, indexed."""
+    paths = []
+    day = date(2026, 1, 20)
+    while day <= date(2026, 4, 12):
+        sessions = "\n".join(
+            f"## Session: Work {n}\n**Accomplished:**\n" + "".join(f"- Item {i}\n" for i in range(n + 1))
+            for n in range(day.day % 3 + 1)
+        )
+        path = tmp_path / f"{day.isoformat()}.md"
+        path.write_text(f"---\ndate: {day.isoformat()}\n---\n# Journal {day.day}\n\n{sessions}")
+        paths.append(path)
+        day += timedelta(days=2)
+
+    index_journal_files(paths, space, workers=1)
+    return space
+
+
+def raw_totals(space, date_from, date_to):
+    """Sum the raw journal rows in [date_from, date_to]."""
+    conn = zettel_db.get_connection(space)
+    where = "j.date >= COALESCE(?, '') AND j.date <= COALESCE(?, '9999')"
+    params = (date_from, date_to)
+    journals, words = conn.execute(
+        f"SELECT COUNT(*), COALESCE(SUM(word_count), 0) FROM journal_entries j WHERE {where}", params
+    ).fetchone()
+    sessions = conn.execute(
+        f"SELECT COUNT(*) FROM sessions s JOIN journal_entries j ON s.journal_id = j.id WHERE {where}", params
+    ).fetchone()[0]
+    accomplishments = conn.execute(f"""
+        SELECT COUNT(*) FROM accomplishments a
+        JOIN sessions s ON a.session_id = s.id
+        JOIN journal_entries j ON s.journal_id = j.id
+        WHERE {where}
+    """, params).fetchone()[0]
+    conn.close()
+    return {
+        'journal_count': journals,
+        'total_words': words,
+        'session_count': sessions,
+        'accomplishment_count': accomplishments,
+    }
+
+
+class TestRollupTotals:
+    """Test that month and day buckets combine to the raw row sums."""
+
+    @pytest.mark.parametrize("date_from, date_to", [
+        ("2026-01-25", "2026-04-05"),   # partial months at both ends
+        ("2026-01-31", "2026-03-01"),   # a single day at each end
+        ("2026-02-01", "2026-03-31"),   # whole months only
+        ("2026-02-10", "2026-02-20"),   # inside one month
+        ("2026-02-01", "2026-02-28"),   # exactly one month
+        (None, "2026-02-15"),
+        ("2026-03-15", None),
+        (None, None),
+    ])
+    def test_matches_raw_rows(self, journal_space, date_from, date_to):
+        """Totals over any range equal the raw journal rows."""
+        totals = get_rollup_totals(date_from, date_to, space=journal_space)
+        raw = raw_totals(journal_space, date_from, date_to)
+
+        assert raw['journal_count'] > 0
+        assert {key: totals[key] for key in raw} == raw
+        assert sum(totals['by_session_type'].values()) == raw['session_count']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,130 @@
+"""
+Tests for habit tracking: logbook and repeater parsing, streaks, bitmaps.
+
+DIP-0004: Knowledge Database
+"""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+# Add lib to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from org_parser import (
+    compute_habit_stats,
+    decode_completion_bitmap,
+    parse_logbook,
+    parse_repeater,
+)
+
+
+class TestParseLogbook:
+    """Test :LOGBOOK: drawer parsing."""
+
+    def test_state_changes(self):
+        """State lines are parsed; CLOCK lines are skipped."""
+        lines = [
+            "** TODO Exercise",
+            "   :LOGBOOK:",
+            '   - State "DONE"       from "TODO"       [2026-01-03 Sat 07:10]',
+            "   CLOCK: [2026-01-02 Fri 07:00]--[2026-01-02 Fri 07:30] =>  0:30",
+            '   - State "DONE"       [2026-01-02 Fri 07:05]',
+            "   :END:",
+            "Body",
+        ]
+
+        changes, end = parse_logbook(lines, 1)
+
+        assert changes == [
+            {'state': 'DONE', 'from_state': 'TODO', 'timestamp': '2026-01-03 Sat 07:10'},
+            {'state': 'DONE', 'from_state': None, 'timestamp': '2026-01-02 Fri 07:05'},
+        ]
+        assert lines[end] == "Body"
+
+    def test_no_logbook(self):
+        """Other content before a drawer means no logbook."""
+        changes, end = parse_logbook(["Notes", ":LOGBOOK:", ":END:"], 0)
+
+        assert (changes, end) == ([], 0)
+
+
+class TestParseRepeater:
+    """Test repeater cookies."""
+
+    @pytest.mark.parametrize("timestamp, expected", [
+        ("<2026-01-05 Mon .+1d>", (".+1d", 1)),
+        ("<2026-01-05 Mon ++2w>", ("++2w", 14)),
+        ("<2026-01-05 Mon +1m>", ("+1m", 30)),
+        ("<2026-01-05 Mon>", (None, 1)),
+        (None, (None, 1)),
+    ])
+    def test_interval(self, timestamp, expected):
+        """Cookies map to an interval in days; no cookie means daily."""
+        assert parse_repeater(timestamp) == expected
+
+
+class TestHabitStats:
+    """Test streaks and the completion bitmap."""
+
+    def test_streaks(self):
+        """Current streak ends at the last completion; longest is kept."""
+        stats = compute_habit_stats([
+            "2026-01-01", "2026-01-02", "2026-01-03", "2026-01-04",
+            "2026-01-07", "2026-01-08",
+        ])
+
+        assert stats['streak'] == 2
+        assert stats['longest_streak'] == 4
+        assert stats['total_completions'] == 6
+        assert stats['last_completion'] == "2026-01-08"
+        assert stats['bitmap_start'] == "2026-01-01"
+
+    def test_duplicates_and_order(self):
+        """Repeated and unsorted dates count once."""
+        stats = compute_habit_stats(["2026-01-02", "2026-01-01", "2026-01-02"])
+
+        assert (stats['streak'], stats['longest_streak'], stats['total_completions']) == (2, 2, 2)
+
+    def test_interval_keeps_streak(self):
+        """Gaps up to the repeater interval don't break a streak."""
+        completions = ["2026-01-01", "2026-01-08", "2026-01-15", "2026-01-23"]
+
+        assert compute_habit_stats(completions, interval_days=7)['streak'] == 1
+        assert compute_habit_stats(completions, interval_days=7)['longest_streak'] == 3
+        assert compute_habit_stats(completions, interval_days=8)['streak'] == 4
+
+    def test_empty(self):
+        """No completions, no stats."""
+        stats = compute_habit_stats([])
+
+        assert stats['streak'] == stats['total_completions'] == 0
+        assert stats['completion_bitmap'] is None
+        assert decode_completion_bitmap(None, None, date(2026, 1, 1), days=3) == [0, 0, 0]
+
+    def test_bitmap_round_trip(self):
+        """Decoding the bitmap gives back the completion days."""
+        completions = ["2025-12-30", "2026-01-01", "2026-01-02", "2026-01-05"]
+        stats = compute_habit_stats(completions)
+
+        history = decode_completion_bitmap(
+            stats['completion_bitmap'], stats['bitmap_start'], date(2026, 1, 6), days=10
+        )
+
+        assert history == [0, 0, 1, 0, 1, 1, 0, 0, 1, 0]
+
+    def test_bitmap_window_after_start(self):
+        """A window starting after bitmap_start drops the older days."""
+        stats = compute_habit_stats(["2026-01-01", "2026-01-03", "2026-01-04"])
+
+        history = decode_completion_bitmap(
+            stats['completion_bitmap'], stats['bitmap_start'], date(2026, 1, 4), days=2
+        )
+
+        assert history == [1, 1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,203 @@
+"""
+Tests for the query_library result cache and the daily briefing.
+
+DIP-0004: Knowledge Database
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add lib to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import zettel_db
+import query_library
+from queryd import ConnectionPool
+
+
+@pytest.fixture
+def cache():
+    query_library.clear_cache()
+    yield query_library._cache
+    query_library.clear_cache()
+
+
+def add_task(space, state="TODO", heading="Task"):
+    conn = zettel_db.get_connection(space)
+    conn.execute("INSERT INTO tasks (state, heading, source_file) VALUES (?, ?, 'next_actions.org')",
+                 (state, heading))
+    conn.commit()
+    conn.close()
+
+
+class TestQueryCache:
+    """Test caching and invalidation of query results."""
+
+    def test_repeated_calls_hit(self, space, cache):
+        """Identical calls between writes are served from the cache."""
+        add_task(space)
+
+        first = query_library.get_task_stats(space)
+        second = query_library.get_task_stats(space=space)
+
+        assert first == second == {"by_state": {"TODO": 1}, "total": 1, "ai_delegated": 0, "overdue": 0}
+        assert (cache.misses, cache.hits) == (1, 1)
+
+    def test_commit_invalidates(self, space, cache):
+        """A write from another connection changes the result."""
+        query_library.get_task_stats(space)
+        add_task(space, state="NEXT")
+
+        assert query_library.get_task_stats(space)["by_state"] == {"NEXT": 1}
+        assert cache.hits == 0
+
+    def test_rebuilt_database_invalidates(self, space, cache):
+        """Replacing the database file (rebuild) is noticed by the probe."""
+        add_task(space)
+        assert query_library.get_task_stats(space)["total"] == 1
+
+        zettel_db.get_db_path(space).unlink()
+        zettel_db.init_database(space)
+        add_task(space, state="WAITING")
+        add_task(space, state="WAITING")
+
+        assert query_library.get_task_stats(space)["by_state"] == {"WAITING": 2}
+
+    def test_results_are_copies(self, space, cache):
+        """Modifying a returned result doesn't change later results."""
+        add_task(space, heading="Original")
+
+        tasks = query_library.get_actionable_tasks(space)
+        tasks[0]["heading"] = "Changed"
+        tasks.append({})
+        stats = query_library.get_task_stats(space)
+        stats["by_state"]["TODO"] = 99
+
+        assert [t["heading"] for t in query_library.get_actionable_tasks(space)] == ["Original"]
+        assert query_library.get_task_stats(space)["by_state"] == {"TODO": 1}
+
+    def test_lru_eviction(self, space, cache, monkeypatch):
+        """Least recently used results are evicted past max_entries."""
+        monkeypatch.setattr(cache, "max_entries", 2)
+
+        for days in (1, 2, 3):
+            query_library.get_recent_sessions(days, space)
+
+        assert cache.stats()["entries"] == 2
+        assert cache.evictions == 1
+
+
+def days_ago(n):
+    return (date.today() - timedelta(days=n)).isoformat()
+
+
+@pytest.fixture
+def briefing_space(space, cache):
+    """Tasks in every briefing state, a project, and sessions over three weeks."""
+    conn = zettel_db.get_connection(space)
+    conn.execute("INSERT INTO projects (id, name, status, source_file) VALUES (1, 'Launch', 'active', 'p.org')")
+    conn.execute("INSERT INTO projects (id, name, status, source_file) VALUES (2, 'Old', 'done', 'p.org')")
+    tasks = [
+        ("NEXT", "Write spec", "A", None, None, 1),
+        ("TODO", "Research", "B", ":AI:research:", days_ago(10), 1),
+        ("TODO", "Draft post", None, ":AI:", days_ago(1), None),
+        ("TODO", "Plan", "C", None, days_ago(-3), 1),
+        ("WAITING", "Review", None, None, days_ago(2), None),
+        ("DONE", "Shipped", "A", None, days_ago(5), 1),
+        ("CANCELLED", "Dropped", None, ":AI:", days_ago(5), None),
+    ]
+    for i in range(25):
+        tasks.append(("TODO", f"Chore {i:02d}", "C", None, None, None))
+    conn.executemany("""
+        INSERT INTO tasks (state, heading, priority, tags, scheduled, project_id, source_file, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, 'next_actions.org', '2026-01-01')
+    """, tasks)
+    for journal_id, ago in enumerate([1, 3, 20], start=1):
+        conn.execute("INSERT INTO journal_entries (id, date, source_file) VALUES (?, ?, 'j.md')",
+                     (journal_id, days_ago(ago)))
+        conn.execute("INSERT INTO sessions (id, journal_id, title) VALUES (?, ?, ?)",
+                     (journal_id, journal_id, f"Session {ago}d ago"))
+        conn.execute("INSERT INTO accomplishments (session_id, description) VALUES (?, ?)",
+                     (journal_id, f"Done {ago}d ago"))
+    conn.commit()
+    conn.close()
+    return space
+
+
+class TestGetBriefing:
+    """Test the single-snapshot briefing against the per-section queries."""
+
+    def test_matches_per_section_queries(self, briefing_space):
+        """Every section and task_stats equal the individual functions."""
+        briefing = query_library.get_briefing(briefing_space)
+        expected = query_library._briefing_multi_call(briefing_space)
+
+        assert briefing['date'] == date.today().isoformat()
+        for section, rows in expected.items():
+            assert briefing[section] == rows, section
+        assert [s['title'] for s in briefing['sessions']] == ["Session 1d ago", "Session 3d ago"]
+        assert len(briefing['overdue']) == 3
+
+    def test_past_date(self, briefing_space):
+        """Sessions after `date` are left out and overdue is as of `date`."""
+        briefing = query_library.get_briefing(briefing_space, date=days_ago(2))
+
+        assert [s['title'] for s in briefing['sessions']] == ["Session 3d ago"]
+        assert [a['description'] for a in briefing['accomplishments']] == ["Done 3d ago"]
+        assert [t['heading'] for t in briefing['overdue']] == ["Research", "Review"]
+        assert briefing['task_stats']['overdue'] == 1
+
+    def test_actionable_limit(self, briefing_space):
+        """actionable_limit caps the actionable section only."""
+        briefing = query_library.get_briefing(briefing_space, actionable_limit=5)
+
+        assert len(briefing['actionable']) == 5
+        assert briefing['actionable'][0]['heading'] == "Write spec"
+        assert len(query_library.get_briefing(briefing_space)['actionable']) == 20
+
+    def test_warm_connection_left_idle(self, briefing_space, monkeypatch):
+        """A pooled connection is outside any transaction afterwards."""
+        pool = ConnectionPool(zettel_db.get_connection, zettel_db.get_db_path)
+        monkeypatch.setattr(query_library, "get_connection", pool.get_connection)
+        try:
+            query_library.get_briefing(briefing_space)
+
+            conn = pool.get_connection(briefing_space)
+            assert not conn.in_transaction
+            add_task(briefing_space, state="NEXT", heading="Fresh")
+            assert conn.execute("SELECT COUNT(*) FROM tasks WHERE heading = 'Fresh'").fetchone()[0] == 1
+        finally:
+            pool.close_all()
+
+
+class TestTradingWindow:
+    """Test that rollup and raw-row trading queries cover the same days."""
+
+    def test_stats_match_entries(self, space, cache):
+        """Entries on and just before the window start count the same in both."""
+        from journal_rollups import rebuild_rollups
+
+        conn = zettel_db.get_connection(space)
+        boundary = conn.execute("SELECT date('now', '-30 days')").fetchone()[0]
+        before = conn.execute("SELECT date('now', '-31 days')").fetchone()[0]
+        for journal_id, day in enumerate([before, boundary], start=1):
+            conn.execute("INSERT INTO journal_entries (id, date, source_file) VALUES (?, ?, 'j.md')",
+                         (journal_id, day))
+            conn.execute("INSERT INTO trading_entries (journal_id, date, pnl_realized) VALUES (?, ?, 10)",
+                         (journal_id, day))
+        conn.commit()
+        conn.close()
+        rebuild_rollups(space)
+
+        entries = query_library.get_trading_entries(30, space)
+        stats = query_library.get_trading_stats(30, space)
+
+        assert [e['date'] for e in entries] == [boundary]
+        assert (stats['entry_count'], stats['total_pnl']) == (1, 10)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,196 @@
+"""
+Tests for the query daemon.
+
+DIP-0004: Knowledge Database
+"""
+
+import json
+import socket
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add lib to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import journal_rollups
+import org_parser
+import query_library
+import queryd
+import zettel_db
+
+
+def add_task(space, state="TODO", heading="Task"):
+    conn = zettel_db.get_connection(space)
+    conn.execute("INSERT INTO tasks (state, heading, source_file) VALUES (?, ?, 'next_actions.org')",
+                 (state, heading))
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def restore_connections(monkeypatch):
+    """Undo the server's routing of module connections through its pool."""
+    for module in (query_library, journal_rollups, org_parser):
+        monkeypatch.setattr(module, "get_connection", module.get_connection)
+    query_library.clear_cache()
+
+
+@pytest.fixture
+def server(space, restore_connections):
+    server = queryd.QueryServer()
+    yield server
+    server.pool.close_all()
+
+
+def request(server, method, params=None, raw=None):
+    """Response object for one request line."""
+    line = raw if raw is not None else json.dumps(
+        {"jsonrpc": "2.0", "id": 7, "method": method, "params": params}
+    ).encode()
+    return server.handle(line)
+
+
+class TestDispatch:
+    """Test request handling without a socket."""
+
+    def test_runs_query(self, server, space):
+        """Keyword and positional params call the query function."""
+        add_task(space, state="NEXT", heading="Ship it")
+
+        by_name = request(server, "get_actionable_tasks", {"space": space, "limit": 5})
+        by_position = request(server, "get_task_stats", [space])
+
+        assert by_name["id"] == 7
+        assert [t["heading"] for t in by_name["result"]] == ["Ship it"]
+        assert by_position["result"]["by_state"] == {"NEXT": 1}
+
+    def test_streamed_results_are_lists(self, server, space):
+        """iter_* queries are sent as lists of objects."""
+        add_task(space, heading="Sync one")
+        add_task(space, heading="Sync two")
+
+        response = request(server, "iter_search_tasks", {"query": "Sync", "space": space, "limit": 1})
+
+        assert [row["heading"] for row in response["result"]] == ["Sync one"]
+
+    def test_unknown_method(self, server):
+        """Unknown and private names are not found."""
+        assert request(server, "nope")["error"]["code"] == queryd.METHOD_NOT_FOUND
+        assert request(server, "_copy_result", [1])["error"]["code"] == queryd.METHOD_NOT_FOUND
+
+    def test_invalid_params(self, server, space):
+        """Params that don't fit the signature are rejected before running."""
+        unknown = request(server, "get_ai_tasks", {"space": space, "bogus": 1})
+        too_many = request(server, "get_task_stats", [space, 1, 2])
+        wrong_type = request(server, "get_task_stats", "personal")
+
+        assert unknown["error"]["code"] == queryd.INVALID_PARAMS
+        assert too_many["error"]["code"] == queryd.INVALID_PARAMS
+        assert wrong_type["error"]["code"] == queryd.INVALID_PARAMS
+
+    def test_malformed_requests(self, server):
+        """Bad JSON and non-request objects get protocol errors."""
+        assert request(server, None, raw=b"{not json")["error"]["code"] == queryd.PARSE_ERROR
+        assert request(server, None, raw=b'{"id": 1}')["error"]["code"] == queryd.INVALID_REQUEST
+
+    def test_query_errors_are_internal(self, server):
+        """Exceptions inside a query are reported, not raised."""
+        response = request(server, "get_task_stats", {"space": "nowhere"})
+
+        assert response["error"]["code"] == queryd.INTERNAL_ERROR
+        assert "Unknown space" in response["error"]["message"]
+
+    def test_ping_and_shutdown(self, server):
+        """ping reports counters; shutdown stops the loop."""
+        ping = request(server, "queryd.ping", {})["result"]
+        request(server, "queryd.shutdown", {})
+
+        assert ping["requests"] == 1
+        assert "cache" in ping
+        assert server.stopping
+
+
+class TestConnectionPool:
+    """Test warm connections."""
+
+    def test_reuses_connection(self, server, space):
+        """Queries share one connection per space."""
+        first = server.pool.get_connection(space)
+        first.close()
+
+        assert server.pool.get_connection(space) is first
+
+    def test_reconnects_after_rebuild(self, server, space):
+        """A replaced database file is reopened instead of queried stale."""
+        add_task(space)
+        assert request(server, "get_task_stats", [space])["result"]["total"] == 1
+        warm = server.pool.get_connection(space)
+
+        zettel_db.get_db_path(space).unlink()
+        zettel_db.init_database(space)
+        add_task(space, state="WAITING")
+        add_task(space, state="WAITING")
+
+        assert server.pool.get_connection(space) is not warm
+        assert request(server, "get_task_stats", [space])["result"]["by_state"] == {"WAITING": 2}
+
+
+class TestClient:
+    """Test the thin client."""
+
+    def test_falls_back_without_daemon(self, space, restore_connections, tmp_path):
+        """No socket: the query runs in-process."""
+        add_task(space, heading="Direct")
+
+        result = queryd.call("get_actionable_tasks", space=space, sock_path=tmp_path / "none.sock")
+
+        assert [t["heading"] for t in result] == ["Direct"]
+
+    def test_falls_back_on_stale_socket(self, space, restore_connections, tmp_path):
+        """A socket file nobody listens on is treated as no daemon."""
+        path = tmp_path / "stale.sock"
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()
+
+        assert not queryd.daemon_running(path)
+        assert queryd.call("get_task_stats", space, sock_path=path)["total"] == 0
+
+    def test_direct_unknown_method(self, space, restore_connections, tmp_path):
+        """Unknown queries raise QueryError in direct mode too."""
+        with pytest.raises(queryd.QueryError) as error:
+            queryd.call("nope", sock_path=tmp_path / "none.sock")
+
+        assert error.value.code == queryd.METHOD_NOT_FOUND
+
+    def test_round_trip_through_daemon(self, space, restore_connections, tmp_path):
+        """Queries go through a running daemon, which stops on shutdown."""
+        add_task(space, heading="Served")
+        path = tmp_path / "q.sock"
+        totals = {}
+        thread = threading.Thread(target=lambda: totals.update(queryd.serve(path)))
+        thread.start()
+        for _ in range(100):
+            if queryd.daemon_running(path):
+                break
+            time.sleep(0.02)
+
+        result = queryd.call("get_actionable_tasks", space=space, sock_path=path)
+        with pytest.raises(queryd.QueryError) as error:
+            queryd.call("get_ai_tasks", space=space, bogus=1, sock_path=path)
+        queryd.call("queryd.shutdown", sock_path=path)
+        thread.join(timeout=5)
+
+        assert [t["heading"] for t in result] == ["Served"]
+        assert error.value.code == queryd.INVALID_PARAMS
+        assert not thread.is_alive()
+        assert not path.exists()
+        assert totals["requests"] >= 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
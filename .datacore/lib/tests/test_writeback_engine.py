@@ -0,0 +1,352 @@
+"""
+Tests for the writeback engine.
+
+DIP-0004: Knowledge Database
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add lib to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import zettel_db
+import writeback_engine
+from org_parser import index_org_file
+from writeback_engine import (
+    _percentile,
+    apply_write_op,
+    claim_pending_writes,
+    coalesce_writes,
+    execute_pending_writes,
+    find_heading,
+    get_pending_status,
+    queue_writes,
+    recover_writeback_intents,
+    set_task_property,
+)
+
+
+def write(write_id, operation, record_id=1, heading="Task", **changes):
+    """A pending_writes row as execute_pending_writes hands it to coalescing."""
+    return {
+        "id": write_id,
+        "operation": operation,
+        "table_name": "tasks",
+        "record_id": record_id,
+        "changes": {"heading": heading, **changes},
+    }
+
+
+class TestCoalesceWrites:
+    """Test merging of pending writes for one file."""
+
+    def test_state_chain_collapses(self):
+        """TODO -> NEXT -> DONE on one heading becomes one TODO -> DONE op."""
+        ops = coalesce_writes([
+            write(1, "update_state", old_state="TODO", new_state="NEXT"),
+            write(2, "update_state", old_state="NEXT", new_state="WAITING"),
+            write(3, "update_state", old_state="WAITING", new_state="DONE"),
+        ])
+
+        assert len(ops) == 1
+        assert (ops[0]["changes"]["old_state"], ops[0]["changes"]["new_state"]) == ("TODO", "DONE")
+        assert ops[0]["write_ids"] == [1, 2, 3]
+
+    def test_round_trip_is_no_op(self):
+        """A chain ending where it started applies as no change."""
+        [op] = coalesce_writes([
+            write(1, "update_state", old_state="TODO", new_state="DONE"),
+            write(2, "update_state", old_state="DONE", new_state="TODO"),
+        ])
+
+        lines = ["* TODO Task"]
+        assert apply_write_op(lines, op, []) == (True, "No net change")
+        assert lines == ["* TODO Task"]
+
+    def test_broken_chain_stays_separate(self):
+        """A write whose old state doesn't follow the chain is not merged."""
+        ops = coalesce_writes([
+            write(1, "update_state", old_state="TODO", new_state="NEXT"),
+            write(2, "update_state", old_state="TODO", new_state="DONE"),
+        ])
+
+        assert [op["write_ids"] for op in ops] == [[1], [2]]
+
+    def test_property_keeps_last_value(self):
+        """Repeated property updates keep the last value."""
+        ops = coalesce_writes([
+            write(1, "update_property", property="EFFORT", new_value="1:00"),
+            write(2, "update_property", property="OWNER", new_value="me"),
+            write(3, "update_property", property="EFFORT", new_value="2:00"),
+        ])
+
+        assert [(op["changes"]["property"], op["changes"]["new_value"]) for op in ops] == [
+            ("EFFORT", "2:00"), ("OWNER", "me")
+        ]
+        assert ops[0]["write_ids"] == [1, 3]
+
+    def test_duplicate_headings_stay_apart(self):
+        """Same heading text on two records is two ops."""
+        ops = coalesce_writes([
+            write(1, "update_state", record_id=10, heading="Review", old_state="TODO", new_state="NEXT"),
+            write(2, "update_state", record_id=11, heading="Review", old_state="NEXT", new_state="DONE"),
+        ])
+
+        assert len(ops) == 2
+
+    def test_appends_kept_in_order(self):
+        """Appends are never merged."""
+        ops = coalesce_writes([
+            write(1, "append", content="* TODO One"),
+            write(2, "append", content="* TODO Two"),
+        ])
+
+        assert [op["changes"]["content"] for op in ops] == ["* TODO One", "* TODO Two"]
+
+
+class TestFindHeading:
+    """Test locating headings."""
+
+    LINES = [
+        "* Work",
+        "** TODO Review",
+        "** TODO Other",
+        "** TODO Another",
+        "** TODO Yet another",
+        "** TODO Review",
+    ]
+
+    def test_indexed_line_wins(self):
+        """The indexed line is used when its heading matches."""
+        assert find_heading(self.LINES, "Review", line_number=6) == 5
+        assert find_heading(self.LINES, "Review", line_number=2) == 1
+
+    def test_duplicate_resolves_to_nearest(self):
+        """After a shift, the occurrence nearest the indexed line is found."""
+        shifted = ["#+TITLE: Tasks"] + self.LINES
+
+        assert find_heading(shifted, "Review", line_number=6) == 6
+        assert find_heading(shifted, "Review", line_number=2) == 2
+
+    def test_missing_heading(self):
+        """Unknown titles are not found."""
+        assert find_heading(self.LINES, "Nope", line_number=2) is None
+
+
+class TestApplyWriteOp:
+    """Test applying ops with line-shift tracking."""
+
+    def test_insert_shifts_later_headings(self):
+        """A drawer inserted above a duplicate heading shifts its indexed line."""
+        lines = [
+            "* TODO Review",
+            "* TODO Review",
+        ]
+        updates = []
+
+        apply_write_op(lines, {
+            "operation": "update_property", "table_name": "tasks", "record_id": 1,
+            "changes": {"heading": "Review", "property": "OWNER", "new_value": "me", "line_number": 1},
+        }, updates)
+        success, _ = apply_write_op(lines, {
+            "operation": "update_state", "table_name": "tasks", "record_id": 2,
+            "changes": {"heading": "Review", "old_state": "TODO", "new_state": "DONE", "line_number": 2},
+        }, updates)
+
+        assert success
+        assert lines[0] == "* TODO Review"
+        assert lines[-1] == "* DONE Review"
+        assert [u["type"] for u in updates].count("shift") == 3
+
+    def test_append_starts_new_line(self):
+        """Appended content starts on its own line."""
+        lines = ["* Inbox", "** TODO Old"]
+        updates = []
+
+        apply_write_op(lines, {
+            "operation": "append", "table_name": "tasks", "record_id": None,
+            "changes": {"content": "** TODO New"},
+        }, updates)
+
+        assert lines == ["* Inbox", "** TODO Old", "** TODO New"]
+        assert updates == [{"type": "append", "lines": 1}]
+
+
+class TestSetTaskProperty:
+    """Test property drawer edits."""
+
+    def test_new_drawer_at_body_level(self):
+        """A new drawer is indented to the heading's body."""
+        lines = ["** TODO Task", "Notes"]
+
+        set_task_property(lines, 0, "OWNER", "me")
+
+        assert lines == ["** TODO Task", "   :PROPERTIES:", "   :OWNER: me", "   :END:", "Notes"]
+
+    def test_new_drawer_follows_planning_line(self):
+        """A new drawer goes after the planning line, at its indent."""
+        lines = ["* TODO Task", "SCHEDULED: <2026-01-05 Mon>"]
+
+        set_task_property(lines, 0, "OWNER", "me")
+
+        assert lines[2:] == [":PROPERTIES:", ":OWNER: me", ":END:"]
+
+
+class TestExecutePendingWrites:
+    """Test grouped execution against an indexed file."""
+
+    def test_one_rewrite_per_file(self, space, tmp_path):
+        """Queued writes for one file apply together and update the index."""
+        org_file = tmp_path / "next_actions.org"
+        org_file.write_text("* Work\n** TODO Review\n** TODO Review\n** TODO Ship\n")
+        index_org_file(org_file, space)
+
+        conn = zettel_db.get_connection(space)
+        rows = conn.execute("SELECT id, heading FROM tasks ORDER BY line_number").fetchall()
+        conn.close()
+        first, second, ship = (row["id"] for row in rows)
+
+        queue_writes(space, [
+            {"table_name": "tasks", "record_id": first, "target_file": str(org_file),
+             "operation": "update_state", "changes": {"heading": "Review", "old_state": "TODO", "new_state": "NEXT"}},
+            {"table_name": "tasks", "record_id": ship, "target_file": str(org_file),
+             "operation": "update_state", "changes": {"heading": "Ship", "old_state": "TODO", "new_state": "NEXT"}},
+            {"table_name": "tasks", "record_id": ship, "target_file": str(org_file),
+             "operation": "update_state", "changes": {"heading": "Ship", "old_state": "NEXT", "new_state": "DONE"}},
+        ])
+
+        results = execute_pending_writes(space)
+
+        assert [status for _, status, _ in results] == ["completed"] * 3
+        assert org_file.read_text() == "* Work\n** NEXT Review\n** TODO Review\n** DONE Ship\n"
+        conn = zettel_db.get_connection(space)
+        states = {row["id"]: row["state"] for row in conn.execute("SELECT id, state FROM tasks")}
+        conn.close()
+        assert states == {first: "NEXT", second: "TODO", ship: "DONE"}
+
+
+
+class TestClaims:
+    """Test that each pending write is applied by one runner only."""
+
+    def queue(self, space, tmp_path, **kwargs):
+        org_file = tmp_path / "inbox.org"
+        org_file.write_text("* Inbox\n")
+        return org_file, queue_writes(space, [
+            {"table_name": "files", "record_id": 0, "target_file": str(org_file),
+             "operation": "append", "changes": {"content": "** TODO New\n"}},
+        ], **kwargs)
+
+    def statuses(self, space):
+        conn = zettel_db.get_connection(space)
+        rows = conn.execute("SELECT id, status FROM pending_writes").fetchall()
+        conn.close()
+        return {row["id"]: row["status"] for row in rows}
+
+    def test_claim_is_exclusive(self, space, tmp_path):
+        """A claimed write is not claimed or applied again."""
+        org_file, [write_id] = self.queue(space, tmp_path)
+        conn = zettel_db.get_connection(space)
+
+        assert [row["id"] for row in claim_pending_writes(conn)] == [write_id]
+        assert claim_pending_writes(conn) == []
+        conn.close()
+
+        assert execute_pending_writes(space) == []
+        assert org_file.read_text() == "* Inbox\n"
+        assert self.statuses(space) == {write_id: "running"}
+
+    def test_queued_claimed(self, space, tmp_path):
+        """Writes queued with claim=True are applied only by their owner."""
+        org_file, [write_id] = self.queue(space, tmp_path, claim=True)
+
+        assert execute_pending_writes(space) == []
+        assert execute_pending_writes(space, [write_id], claimed=True) == [
+            (write_id, "completed", "Content appended")
+        ]
+        assert org_file.read_text() == "* Inbox\n** TODO New\n"
+        assert self.statuses(space) == {write_id: "completed"}
+
+    def test_claimed_requires_ids(self, space):
+        """claimed=True without write_ids is rejected up front."""
+        with pytest.raises(ValueError, match="requires write_ids"):
+            execute_pending_writes(space, claimed=True)
+
+    def test_stale_claim_released(self, space, tmp_path):
+        """Claims left by a crashed runner go back to pending after the timeout."""
+        _, [write_id] = self.queue(space, tmp_path, claim=True)
+        conn = zettel_db.get_connection(space)
+
+        recover_writeback_intents(conn)
+        assert self.statuses(space) == {write_id: "running"}
+
+        recover_writeback_intents(conn, older_than=0)
+        conn.close()
+        assert self.statuses(space) == {write_id: "pending"}
+
+    def test_failure_unclaims(self, space, tmp_path, monkeypatch):
+        """A write that raises is released for the next run."""
+        _, [write_id] = self.queue(space, tmp_path)
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(writeback_engine, "atomic_write", fail)
+
+        assert execute_pending_writes(space) == [(write_id, "failed", "disk full")]
+        assert self.statuses(space) == {write_id: "pending"}
+
+    def test_claimed_failure_recorded(self, space, tmp_path, monkeypatch):
+        """A claimed write that raises fails for its owner to retry."""
+        _, [write_id] = self.queue(space, tmp_path, claim=True)
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(writeback_engine, "atomic_write", fail)
+
+        assert execute_pending_writes(space, [write_id], claimed=True) == [(write_id, "failed", "disk full")]
+        assert self.statuses(space) == {write_id: "failed"}
+
+
+class TestPendingStatus:
+    """Test queue metrics."""
+
+    def test_percentile_nearest_rank(self):
+        """Nearest rank: the smallest value with at least pct% at or below it."""
+        assert _percentile([1, 2, 3, 4, 5, 6], 50) == 3
+        assert _percentile(list(range(1, 11)), 50) == 5
+        assert _percentile(list(range(1, 11)), 95) == 10
+        assert _percentile(list(range(1, 101)), 99) == 99
+        assert _percentile([7], 1) == 7
+        assert _percentile([], 50) is None
+
+    def test_latency_percentiles(self, space):
+        """Apply latency of completed writes is reported as p50/p95/p99."""
+        conn = zettel_db.get_connection(space)
+        writeback_engine.ensure_writeback_schema(conn, space)
+        now = datetime.now()
+        for seconds in range(1, 11):
+            applied = now - timedelta(minutes=5)
+            conn.execute("""
+                INSERT INTO pending_writes
+                (table_name, record_id, operation, target_file, status, created_at, applied_at)
+                VALUES ('tasks', 1, 'update_state', 'next_actions.org', 'completed', ?, ?)
+            """, ((applied - timedelta(seconds=seconds)).isoformat(), applied.isoformat()))
+        conn.commit()
+        conn.close()
+
+        latency = get_pending_status(space)["latency_ms"]
+
+        assert latency["samples"] == 10
+        assert latency["p50"] == pytest.approx(5000, abs=1)
+        assert latency["p95"] == pytest.approx(10000, abs=1)
+        assert latency["p99"] == pytest.approx(10000, abs=1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
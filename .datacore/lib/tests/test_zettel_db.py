@@ -0,0 +1,76 @@
+"""
+Tests for streamed, keyset-paginated queries.
+
+DIP-0004: Knowledge Database
+"""
+
+from pathlib import Path
+
+import pytest
+
+# Add lib to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import zettel_db
+
+
+@pytest.fixture
+def linked_space(space):
+    """Twelve notes; note 1 is linked from notes 2-4; five unresolved targets."""
+    conn = zettel_db.get_connection(space)
+    for n in range(1, 13):
+        conn.execute("INSERT INTO files (id, path, space, type, title, is_stub) VALUES (?, ?, ?, 'zettel', ?, 0)",
+                     (f"f{n:02d}", f"zettels/{n}.md", space, f"Note {n}"))
+    for n in range(2, 5):
+        conn.execute("INSERT INTO links (source_id, target_id, target_title, resolved) VALUES (?, 'f01', 'Note 1', 1)",
+                     (f"f{n:02d}",))
+    for n in range(10):
+        conn.execute("INSERT INTO links (source_id, target_title, resolved) VALUES (?, ?, 0)",
+                     (f"f{n % 3 + 1:02d}", f"Missing {n % 5}"))
+    conn.commit()
+    conn.close()
+    return space
+
+
+class TestIterRows:
+    """Test keyset pagination."""
+
+    def test_pages_cover_all_rows(self, linked_space):
+        """Small pages yield the same rows as one large page."""
+        everything = [row.id for row in zettel_db.iter_orphans(linked_space)]
+        paged = [row.id for row in zettel_db.iter_rows(
+            linked_space, "SELECT f.id FROM files f WHERE f.id != 'f01' {keyset}", key="f.id", page_size=5
+        )]
+
+        assert everything == [f"f{n:02d}" for n in range(2, 13)]
+        assert paged == everything
+
+    def test_resume_after_key(self, linked_space):
+        """after= continues after the last row seen; limit= caps the total."""
+        first = list(zettel_db.iter_orphans(linked_space, limit=4))
+        rest = list(zettel_db.iter_orphans(linked_space, after=first[-1].id, limit=100))
+
+        assert [row.id for row in first] == ["f02", "f03", "f04", "f05"]
+        assert rest[0].id == "f06"
+        assert len(first) + len(rest) == 11
+        assert rest[0].title == "Note 6"
+
+    def test_keyset_after_grouping_parameters(self, linked_space):
+        """Resuming grouped unresolved links keeps min_refs applied."""
+        titles = [row.target_title for row in zettel_db.iter_unresolved_links(linked_space, min_refs=2)]
+        resumed = list(zettel_db.iter_unresolved_links(linked_space, min_refs=2, after="Missing 1"))
+
+        assert titles == [f"Missing {n}" for n in range(5)]
+        assert [row.target_title for row in resumed] == ["Missing 2", "Missing 3", "Missing 4"]
+        assert all(row.reference_count == 2 for row in resumed)
+
+    def test_get_orphans_matches_stream(self, linked_space):
+        """The list API returns the streamed rows as dicts."""
+        assert zettel_db.get_orphans(linked_space) == [
+            row._asdict() for row in zettel_db.iter_orphans(linked_space)
+        ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -8,7 +8,10 @@ Maintains file-as-source-of-truth while allowing programmatic updates.
 Key Concepts:
 - pending_writes table queues changes
 - Conflict detection via checksum comparison
-- Atomic writes with backup
+- Writes grouped per file and coalesced (one read-modify-write per file)
+- Headings located by indexed line number + heading hash, not file scans
+- Write-through: indexed task rows updated in the same transaction
+- Atomic writes (temp + fsync + rename) with a crash-recovery intent log
 - Supports org-mode task updates and note modifications
 
 Schema (from zettel_db.py):
@@ -22,21 +25,52 @@ Usage:
     python writeback_engine.py --status            # Show pending writes status
     python writeback_engine.py --queue TASK_ID     # Queue a task update
     python writeback_engine.py --clear-failed      # Clear failed writes
+    python writeback_engine.py --worker            # Apply writes continuously
 """
 
+import ast
 import json
+import math
 import re
+import select
+import signal
+import socket
 import sys
 import hashlib
-import shutil
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any, Tuple
 
 # Add lib to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from zettel_db import get_connection, SPACES, DATA_ROOT
+from zettel_db import get_connection, get_db_path, migrate_pending_writes, SPACES, DATA_ROOT
+from org_parser import parse_heading, heading_checksum, parse_effort, parse_org_file
+from atomic_write import atomic_write, complete_intent, recover_intents
+
+
+# Queue priority (lower runs first): state changes the user sees in their
+# agenda go ahead of bookkeeping properties and appends
+WRITE_PRIORITY_VISIBLE = 0
+WRITE_PRIORITY_STATE = 1
+WRITE_PRIORITY_DEFAULT = 2
+VISIBLE_STATES = {'NEXT', 'DONE', 'WAITING', 'CANCELLED'}
+
+# Background worker (see run_worker)
+WORKER_SOCKET = DATA_ROOT / '.datacore' / 'state' / 'writeback.sock'
+WORKER_POLL_INTERVAL = 30.0   # seconds between polls without a wakeup
+WORKER_DEBOUNCE = 2.0         # file must be quiet this long before flushing
+WORKER_MAX_DELAY = 30.0       # ...unless its oldest write is this old
+BACKPRESSURE_DEPTH = 500      # past this many pending writes, skip debounce
+
+# A runner claims writes (status 'running') before applying them, so the
+# worker and sync never apply the same write twice. Claims and write
+# intents older than this are left by a crashed runner and are recovered.
+WRITE_CLAIM_TIMEOUT = 300.0
+
+_schema_checked = set()
 
 
 def compute_checksum(content: str) -> str:
@@ -76,56 +110,290 @@ def detect_conflict(file_path: Path, space: str = None) -> bool:
     return stored != current
 
 
+def write_priority(operation: str, changes: Dict[str, Any] = None) -> int:
+    """Default queue priority for a write (lower runs first)."""
+    if operation == 'update_state':
+        if (changes or {}).get('new_state') in VISIBLE_STATES:
+            return WRITE_PRIORITY_VISIBLE
+        return WRITE_PRIORITY_STATE
+    return WRITE_PRIORITY_DEFAULT
+
+
+def ensure_writeback_schema(conn, space: str):
+    """Migrate pending_writes once per process for DBs created earlier."""
+    if space in _schema_checked:
+        return
+    migrate_pending_writes(conn.cursor())
+    conn.commit()
+    _schema_checked.add(space)
+
+
 def queue_write(
     space: str,
     table_name: str,
     record_id: int,
     target_file: str,
     operation: str,
-    changes: Dict[str, Any] = None
+    changes: Dict[str, Any] = None,
+    priority: int = None
 ) -> int:
     """Queue a write operation for later processing.
 
+    Wakes the background worker, if one is running.
+
     Args:
         space: Which space database to use
         table_name: Source table (tasks, files, etc.)
         record_id: ID of the record being updated
         target_file: File path to write to
-        operation: Type of change (update_state, update_property, append)
+        operation: Type of change (update_state, update_property, update_heading, append)
         changes: Dict with change details (old_value, new_value, etc.)
+        priority: Queue priority, lower first (default: write_priority())
 
     Returns:
         ID of the queued write
     """
+    return queue_writes(space, [{
+        'table_name': table_name,
+        'record_id': record_id,
+        'target_file': target_file,
+        'operation': operation,
+        'changes': changes,
+        'priority': priority,
+    }])[0]
+
+
+def queue_writes(space: str, writes: List[Dict[str, Any]], claim: bool = False) -> List[int]:
+    """Queue several writes in one transaction, waking the worker once.
+
+    Args:
+        space: Which space database to use
+        writes: Dicts with the queue_write() arguments (table_name,
+            record_id, target_file, operation, changes, priority)
+        claim: Queue them already claimed by the caller, who applies them
+            with execute_pending_writes(space, ids, claimed=True); the
+            worker is not woken and never picks them up
+
+    Returns:
+        IDs of the queued writes, in order
+    """
+    if not writes:
+        return []
+
     conn = get_connection(space)
+    ensure_writeback_schema(conn, space)
     cursor = conn.cursor()
 
-    changes_json = json.dumps(changes) if changes else None
+    now = datetime.now().isoformat()
+    status = 'running' if claim else 'pending'
+    write_ids = []
+    for write in writes:
+        changes = write.get('changes')
+        priority = write.get('priority')
+        if priority is None:
+            priority = write_priority(write['operation'], changes)
+
+        cursor.execute("""
+            INSERT INTO pending_writes
+            (table_name, record_id, operation, changes, target_file, status, priority,
+             created_at, claimed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            write['table_name'],
+            write['record_id'],
+            write['operation'],
+            json.dumps(changes) if changes else None,
+            write['target_file'],
+            status,
+            priority,
+            now,
+            now if claim else None
+        ))
+        write_ids.append(cursor.lastrowid)
 
-    cursor.execute("""
-        INSERT INTO pending_writes
-        (table_name, record_id, operation, changes, target_file, status)
-        VALUES (?, ?, ?, ?, ?, 'pending')
-    """, (
-        table_name,
-        record_id,
-        operation,
-        changes_json,
-        target_file
-    ))
-
-    write_id = cursor.lastrowid
     conn.commit()
     conn.close()
 
-    return write_id
+    if not claim:
+        notify_worker()
+
+    return write_ids
+
+
+def find_heading(
+    lines: List[str],
+    heading_text: str,
+    line_number: int = None,
+    checksum: str = None
+) -> Optional[int]:
+    """Locate a heading in org lines.
+
+    Seeks straight to the indexed line and verifies it with the per-heading
+    hash (see org_parser.heading_checksum). Only on a mismatch does it fall
+    back to searching outward from that line for the same title, so a
+    duplicated heading resolves to the occurrence nearest the indexed one.
+
+    Returns:
+        0-based line index, or None if not found
+    """
+    def title_matches(idx: int) -> bool:
+        if not lines[idx].startswith('*'):
+            return False
+        heading = parse_heading(lines[idx])
+        return heading is not None and heading['title'] == heading_text
+
+    if line_number and 0 < line_number <= len(lines):
+        idx = line_number - 1
+        heading = parse_heading(lines[idx]) if lines[idx].startswith('*') else None
+        if heading:
+            if checksum and heading_checksum(heading['level'], heading['title']) == checksum:
+                return idx
+            if heading['title'] == heading_text:
+                return idx
+
+    if not lines:
+        return None
+
+    start = min(max((line_number or 1) - 1, 0), len(lines) - 1)
+    for distance in range(len(lines)):
+        before, after = start - distance, start + distance
+        if before < 0 and after >= len(lines):
+            break
+        if before >= 0 and title_matches(before):
+            return before
+        if distance and after < len(lines) and title_matches(after):
+            return after
+
+    return None
+
+
+def set_task_state(
+    lines: List[str],
+    idx: int,
+    old_state: str,
+    new_state: str
+) -> Tuple[bool, str]:
+    """Change the state of the heading at lines[idx] (in place).
+
+    Returns:
+        Tuple of (success, message/error)
+    """
+    heading = parse_heading(lines[idx])
+    if (heading['state'] or '') != (old_state or ''):
+        return False, f"State mismatch: expected {old_state}, found {heading['state']}"
+
+    if old_state:
+        new_line = re.sub(rf'^(\*+\s+){re.escape(old_state)}\b', rf'\g<1>{new_state}', lines[idx], count=1)
+    else:
+        new_line = re.sub(r'^(\*+\s+)', rf'\g<1>{new_state} ', lines[idx], count=1)
+
+    if new_line == lines[idx]:
+        return False, "No changes made"
+
+    lines[idx] = new_line
+    return True, f"Updated: {old_state} -> {new_state}"
+
+
+def set_task_heading(
+    lines: List[str],
+    idx: int,
+    changes: Dict[str, Any]
+) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    """Change the title and/or priority of the heading at lines[idx] (in place).
+
+    `changes` may hold 'new_title' and 'new_priority' (None or '' removes
+    the priority cookie); state and tags are kept.
+
+    Returns:
+        Tuple of (success, message/error, parsed new heading or None)
+    """
+    heading = parse_heading(lines[idx])
+    title = changes.get('new_title') or heading['title']
+    priority = changes['new_priority'] if 'new_priority' in changes else heading['priority']
+
+    parts = ['*' * heading['level']]
+    if heading['state']:
+        parts.append(heading['state'])
+    if priority:
+        parts.append(f"[#{priority}]")
+    parts.append(title)
+    new_line = ' '.join(parts)
+    if heading['tags']:
+        new_line += f"  {heading['tags']}"
+
+    if new_line == lines[idx]:
+        return True, "No net change", None
+
+    lines[idx] = new_line
+    return True, "Updated heading", parse_heading(new_line)
+
+
+def set_task_property(
+    lines: List[str],
+    idx: int,
+    property_name: str,
+    new_value: str
+) -> Tuple[bool, str, Optional[int]]:
+    """Set a property in the drawer of the heading at lines[idx] (in place).
+
+    A heading without a drawer gets one, after its planning line if any.
+
+    Returns:
+        Tuple of (success, message/error, indexes of inserted lines)
+    """
+    # Find property drawer
+    props_start = None
+    props_end = None
+    for i in range(idx + 1, min(idx + 20, len(lines))):
+        line = lines[i].strip()
+        if line == ':PROPERTIES:':
+            props_start = i
+        elif line == ':END:' and props_start is not None:
+            props_end = i
+            break
+        elif line.startswith('*'):  # Next heading, no properties
+            break
+
+    if props_start is None:
+        # Indent like the planning line, else to the heading's body level
+        heading = parse_heading(lines[idx])
+        indent = ' ' * ((heading['level'] if heading else 0) + 1)
+        at = idx + 1
+        planning = at < len(lines) and re.match(r'(\s*)(SCHEDULED|DEADLINE|CLOSED):', lines[at])
+        if planning:
+            indent = planning.group(1)
+            at += 1
+        lines[at:at] = [
+            f"{indent}:PROPERTIES:",
+            f"{indent}:{property_name}: {new_value}",
+            f"{indent}:END:",
+        ]
+        return True, f"Added property {property_name}", [at, at, at]
+
+    if props_end is None:
+        return False, "Unterminated property drawer", []
+
+    # Find and update property
+    prop_pattern = rf'^(\s*:{re.escape(property_name)}:\s*)(.*)$'
+    for i in range(props_start + 1, props_end):
+        match = re.match(prop_pattern, lines[i], re.IGNORECASE)
+        if match:
+            lines[i] = f"{match.group(1)}{new_value}"
+            return True, f"Updated property {property_name}", []
+
+    # Add property before :END:, indented like the drawer
+    indent = re.match(r'\s*', lines[props_end]).group(0)
+    lines.insert(props_end, f"{indent}:{property_name}: {new_value}")
+    return True, f"Updated property {property_name}", [props_end]
 
 
 def update_org_task_state(
     file_path: Path,
     heading_text: str,
     old_state: str,
-    new_state: str
+    new_state: str,
+    line_number: int = None,
+    checksum: str = None
 ) -> Tuple[bool, str]:
     """Update a task state in an org file.
 
@@ -134,53 +402,33 @@ def update_org_task_state(
         heading_text: The heading text to find
         old_state: Expected current state (for verification)
         new_state: New state to set
+        line_number: Indexed line of the heading (tasks.line_number)
+        checksum: Indexed heading hash (tasks.checksum)
 
     Returns:
         Tuple of (success, message/error)
     """
     with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+        lines = f.read().split('\n')
 
-    # Build pattern to find the task
-    # Format: ** TODO/DONE/etc heading_text
-    escaped_heading = re.escape(heading_text)
-    pattern = rf'^(\*+\s+){old_state}(\s+{escaped_heading})'
-
-    match = re.search(pattern, content, re.MULTILINE)
-    if not match:
-        # Try without state for new tasks
-        pattern_no_state = rf'^(\*+\s+)({escaped_heading})'
-        match = re.search(pattern_no_state, content, re.MULTILINE)
-        if not match:
-            return False, f"Task not found: {heading_text}"
-
-    # Replace the state
-    new_content = re.sub(
-        pattern,
-        rf'\g<1>{new_state}\g<2>',
-        content,
-        count=1,
-        flags=re.MULTILINE
-    )
+    idx = find_heading(lines, heading_text, line_number, checksum)
+    if idx is None:
+        return False, f"Task not found: {heading_text}"
 
-    if new_content == content:
-        return False, "No changes made"
-
-    # Write back with backup
-    backup_path = file_path.with_suffix('.org.bak')
-    shutil.copy2(file_path, backup_path)
-
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    success, message = set_task_state(lines, idx, old_state, new_state)
+    if success:
+        atomic_write(file_path, '\n'.join(lines))
 
-    return True, f"Updated: {old_state} -> {new_state}"
+    return success, message
 
 
 def update_org_task_property(
     file_path: Path,
     heading_text: str,
     property_name: str,
-    new_value: str
+    new_value: str,
+    line_number: int = None,
+    checksum: str = None
 ) -> Tuple[bool, str]:
     """Update a property in an org task's property drawer.
 
@@ -189,180 +437,625 @@ def update_org_task_property(
         heading_text: The heading text to find
         property_name: Property to update (e.g., 'UPDATED')
         new_value: New property value
+        line_number: Indexed line of the heading (tasks.line_number)
+        checksum: Indexed heading hash (tasks.checksum)
 
     Returns:
         Tuple of (success, message/error)
     """
     with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    # Find the heading
-    heading_idx = None
-    for i, line in enumerate(lines):
-        if heading_text in line and line.strip().startswith('*'):
-            heading_idx = i
-            break
+        lines = f.read().split('\n')
 
-    if heading_idx is None:
+    idx = find_heading(lines, heading_text, line_number, checksum)
+    if idx is None:
         return False, f"Heading not found: {heading_text}"
 
-    # Find property drawer
-    props_start = None
-    props_end = None
-    for i in range(heading_idx + 1, min(heading_idx + 20, len(lines))):
-        line = lines[i].strip()
-        if line == ':PROPERTIES:':
-            props_start = i
-        elif line == ':END:' and props_start is not None:
-            props_end = i
-            break
-        elif line.startswith('*'):  # Next heading, no properties
-            break
+    success, message, _ = set_task_property(lines, idx, property_name, new_value)
+    if success:
+        atomic_write(file_path, '\n'.join(lines))
 
-    if props_start is None:
-        return False, "No property drawer found"
+    return success, message
 
-    # Find and update property
-    prop_pattern = rf'^(\s*:{property_name}:\s*)(.*)$'
-    found = False
-    for i in range(props_start + 1, props_end):
-        match = re.match(prop_pattern, lines[i], re.IGNORECASE)
-        if match:
-            lines[i] = f"{match.group(1)}{new_value}\n"
-            found = True
-            break
 
-    if not found:
-        # Add property before :END:
-        indent = '  '  # Standard org indent
-        lines.insert(props_end, f"{indent}:{property_name}: {new_value}\n")
+def coalesce_writes(writes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Merge redundant pending writes for one file into a minimal op list.
 
-    # Write back with backup
-    backup_path = file_path.with_suffix('.org.bak')
-    shutil.copy2(file_path, backup_path)
+    Ops are keyed by record and heading, so duplicate headings stay apart.
 
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.writelines(lines)
+    - State chains on a heading collapse (TODO -> NEXT -> DONE becomes
+      TODO -> DONE); a chain ending where it started is a no-op
+    - Repeated property updates on a heading keep the last value
+    - Appends are kept in order
 
-    return True, f"Updated property {property_name}"
+    Args:
+        writes: pending_writes rows (dicts, changes already decoded), oldest first
 
+    Returns:
+        List of ops: {'operation', 'changes', 'write_ids', 'table_name', 'record_id'}
+    """
+    ops = []
+    state_ops = {}
+    property_ops = {}
+
+    for write in writes:
+        operation = write['operation']
+        changes = dict(write['changes'])
+
+        if operation == 'update_state':
+            key = (write['record_id'], changes.get('heading', ''))
+            previous = state_ops.get(key)
+            if previous and previous['changes'].get('new_state') == changes.get('old_state'):
+                previous['changes']['new_state'] = changes.get('new_state')
+                previous['write_ids'].append(write['id'])
+                continue
+
+        elif operation == 'update_property':
+            key = (write['record_id'], changes.get('heading', ''), changes.get('property', ''))
+            previous = property_ops.get(key)
+            if previous:
+                previous['changes']['new_value'] = changes.get('new_value', '')
+                previous['write_ids'].append(write['id'])
+                continue
+
+        op = {
+            'operation': operation,
+            'changes': changes,
+            'write_ids': [write['id']],
+            'table_name': write['table_name'],
+            'record_id': write['record_id'],
+        }
+        if operation == 'update_state':
+            state_ops[key] = op
+        elif operation == 'update_property':
+            property_ops[key] = op
 
-def process_pending_write(write_id: int, space: str) -> Tuple[bool, str]:
-    """Process a single pending write.
+        ops.append(op)
+
+    return ops
+
+
+def apply_write_op(
+    lines: List[str],
+    op: Dict[str, Any],
+    updates: List[Dict[str, Any]]
+) -> Tuple[bool, str]:
+    """Apply one coalesced op to file lines in place.
+
+    Index changes implied by a successful op are appended to `updates`
+    (see apply_index_updates). Line insertions recorded there earlier in
+    the batch shift indexed line numbers to where the heading is now.
 
     Returns:
         Tuple of (success, message)
     """
-    conn = get_connection(space)
-    cursor = conn.cursor()
+    operation = op['operation']
+    changes = op['changes']
+    task_id = op['record_id'] if op['table_name'] == 'tasks' else None
+
+    if operation == 'append':
+        before = len(lines)
+        appended = changes.get('content', '')
+        if lines and lines[-1] != '' and not appended.startswith('\n'):
+            appended = '\n' + appended  # start on a line of its own
+        # Text lands on the trailing empty line, if any, so count that too
+        reused = 1 if lines and lines[-1] == '' else 0
+        content = '\n'.join(lines) + appended
+        lines[:] = content.split('\n')
+        updates.append({'type': 'append', 'lines': len(lines) - before + reused})
+        return True, "Content appended"
+
+    if operation not in ('update_state', 'update_property', 'update_heading'):
+        return False, f"Unknown operation: {operation}"
+
+    if operation == 'update_state' and changes.get('old_state') == changes.get('new_state'):
+        return True, "No net change"
+
+    line_number = changes.get('line_number')
+    if line_number:
+        for update in updates:
+            if update['type'] == 'shift' and update['at'] <= line_number - 1:
+                line_number += 1
+
+    heading_text = changes.get('heading', '')
+    idx = find_heading(lines, heading_text, line_number, changes.get('checksum'))
+    if idx is None:
+        return False, f"Task not found: {heading_text}"
 
-    cursor.execute("""
-        SELECT * FROM pending_writes WHERE id = ?
-    """, (write_id,))
+    if operation == 'update_state':
+        success, message = set_task_state(
+            lines, idx,
+            changes.get('old_state', ''),
+            changes.get('new_state', '')
+        )
+        if success and task_id:
+            updates.append({'type': 'state', 'task_id': task_id, 'state': changes.get('new_state')})
+        return success, message
+
+    if operation == 'update_heading':
+        success, message, heading = set_task_heading(lines, idx, changes)
+        if heading and task_id:
+            updates.append({
+                'type': 'heading',
+                'task_id': task_id,
+                'title': heading['title'],
+                'priority': heading['priority'],
+                'checksum': heading_checksum(heading['level'], heading['title']),
+            })
+        return success, message
 
-    write = cursor.fetchone()
-    if not write:
-        conn.close()
-        return False, f"Write {write_id} not found"
+    success, message, inserted = set_task_property(
+        lines, idx,
+        changes.get('property', ''),
+        changes.get('new_value', '')
+    )
+    updates.extend({'type': 'shift', 'at': at} for at in inserted)
+    if success and task_id:
+        updates.append({
+            'type': 'property',
+            'task_id': task_id,
+            'property': changes.get('property', ''),
+            'value': changes.get('new_value', ''),
+        })
+    return success, message
 
-    if write['status'] != 'pending':
-        conn.close()
-        return False, f"Write {write_id} not pending (status: {write['status']})"
 
-    target_path = Path(write['target_file'])
+def appended_task_updates(
+    target_path: Path,
+    lines: List[str],
+    updates: List[Dict[str, Any]],
+    space: str
+) -> List[Dict[str, Any]]:
+    """Index updates for task headings added by append ops.
+
+    Appends always land at the end of the file, so only the tail is
+    turned into new task rows; existing rows keep their IDs.
+    """
+    appended = sum(u['lines'] for u in updates if u['type'] == 'append')
+    if not appended:
+        return []
+
+    first_line = len(lines) - appended
+    parsed = parse_org_file(target_path, space, content='\n'.join(lines))
+
+    new_tasks = []
+    for task in parsed['tasks']:
+        if task['line_number'] <= first_line:
+            continue
+        parent = parsed['tasks'][task['parent_index']] if task['parent_index'] is not None else None
+        new_tasks.append({
+            'type': 'insert_task',
+            'space': space,
+            'task': {
+                'state': task['state'],
+                'title': task['title'],
+                'level': task['level'],
+                'priority': task['priority'],
+                'scheduled': task['scheduled'],
+                'deadline': task['deadline'],
+                'closed': task['closed'],
+                'category': task['category'],
+                'effort': task['effort'],
+                'tags': task['tags'],
+                'properties': str(task['properties']) if task['properties'] else None,
+                'line_number': task['line_number'],
+                'checksum': task['checksum'],
+                'parent_line': parent['line_number'] if parent else None,
+            },
+        })
+    return new_tasks
+
+
+def _parse_stored_properties(value: Optional[str]) -> Dict[str, str]:
+    """Decode tasks.properties (stored as a dict repr by org_parser)."""
+    if not value:
+        return {}
+    try:
+        properties = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return {}
+    return properties if isinstance(properties, dict) else {}
+
+
+def apply_index_updates(cursor, source_file: str, updates: List[Dict[str, Any]]):
+    """Write through the changes made to a file into its indexed rows.
+
+    Keeps tasks (state, heading, properties, category/effort), line numbers of
+    tasks/habits/inbox entries after inserted lines, and appended tasks in
+    step with the file, so no reparse is needed. Runs on `cursor` inside
+    the caller's transaction.
+    """
+    now = datetime.now().isoformat()
+
+    for update in updates:
+        if update['type'] == 'shift':
+            # Inserted line at 0-based index `at` pushes down lines numbered > at
+            for table in ['tasks', 'habits', 'inbox_entries']:
+                cursor.execute(f"""
+                    UPDATE {table} SET line_number = line_number + 1
+                    WHERE source_file = ? AND line_number > ?
+                """, (source_file, update['at']))
+
+        elif update['type'] == 'state':
+            cursor.execute("""
+                UPDATE tasks SET state = ?, updated_at = ?
+                WHERE id = ? AND source_file = ?
+            """, (update['state'], now, update['task_id'], source_file))
+
+        elif update['type'] == 'heading':
+            cursor.execute("""
+                UPDATE tasks SET heading = ?, priority = ?, checksum = ?, updated_at = ?
+                WHERE id = ? AND source_file = ?
+            """, (update['title'], update['priority'], update['checksum'], now,
+                  update['task_id'], source_file))
+
+        elif update['type'] == 'property':
+            cursor.execute("SELECT properties FROM tasks WHERE id = ?", (update['task_id'],))
+            row = cursor.fetchone()
+            if not row:
+                continue
+
+            properties = _parse_stored_properties(row['properties'])
+            key = next(
+                (k for k in properties if k.upper() == update['property'].upper()),
+                update['property']
+            )
+            properties[key] = update['value']
+
+            cursor.execute("""
+                UPDATE tasks
+                SET properties = ?, category = ?, effort = ?, updated_at = ?
+                WHERE id = ? AND source_file = ?
+            """, (
+                str(properties),
+                properties.get('CATEGORY'),
+                parse_effort(properties['EFFORT']) if 'EFFORT' in properties else None,
+                now,
+                update['task_id'],
+                source_file
+            ))
+
+        elif update['type'] == 'insert_task':
+            task = update['task']
+            parent_id = None
+            if task['parent_line']:
+                cursor.execute(
+                    "SELECT id FROM tasks WHERE source_file = ? AND line_number = ?",
+                    (source_file, task['parent_line'])
+                )
+                parent = cursor.fetchone()
+                parent_id = parent['id'] if parent else None
+
+            cursor.execute("""
+                INSERT INTO tasks
+                (state, heading, level, priority, scheduled, deadline, closed_at,
+                 category, effort, tags, properties, parent_id, space, source_file,
+                 line_number, checksum, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                task['state'], task['title'], task['level'], task['priority'],
+                task['scheduled'], task['deadline'], task['closed'],
+                task['category'], task['effort'], task['tags'], task['properties'],
+                parent_id, update['space'], source_file,
+                task['line_number'], task['checksum'], now, now
+            ))
+
+
+def load_task_locations(cursor, writes: List[Dict[str, Any]]):
+    """Attach indexed line_number/checksum of each task write's heading.
+
+    Writes queued for the tasks table carry only the heading text; the
+    index tells us where that heading is.
+    """
+    task_ids = [w['record_id'] for w in writes if w['table_name'] == 'tasks']
+    if not task_ids:
+        return
+
+    cursor.execute(f"""
+        SELECT id, line_number, checksum FROM tasks
+        WHERE id IN ({','.join('?' * len(task_ids))})
+    """, task_ids)
+    locations = {row['id']: row for row in cursor.fetchall()}
+
+    for write in writes:
+        location = locations.get(write['record_id']) if write['table_name'] == 'tasks' else None
+        if location:
+            write['changes'].setdefault('line_number', location['line_number'])
+            write['changes'].setdefault('checksum', location['checksum'])
+
+
+def plan_file_writes(
+    cursor,
+    target_file: str,
+    writes: List[Dict[str, Any]],
+    space: str = None
+) -> Tuple[List[Tuple[int, str, str]], Optional[str], Optional[str], List[Dict[str, Any]]]:
+    """Apply all pending writes for one file to its content in memory.
+
+    The file is read and checked for conflicts once and every coalesced op
+    is applied at its indexed line. Nothing is written to disk or DB.
+
+    Returns:
+        Tuple of (results as (write_id, status, message), new content or
+        None if unchanged, checksum of the content read, index updates)
+    """
+    target_path = Path(target_file)
+
     if not target_path.exists():
-        # Mark as failed
-        cursor.execute("""
-            UPDATE pending_writes
-            SET status = 'failed', error_message = ?, applied_at = ?
-            WHERE id = ?
-        """, (f"File not found: {target_path}", datetime.now().isoformat(), write_id))
-        conn.commit()
-        conn.close()
-        return False, f"File not found: {target_path}"
+        message = f"File not found: {target_path}"
+        return [(w['id'], 'failed', message) for w in writes], None, None, []
 
-    # Check for conflict
-    if detect_conflict(target_path, space):
-        cursor.execute("""
-            UPDATE pending_writes
-            SET status = 'conflict', error_message = ?, applied_at = ?
-            WHERE id = ?
-        """, ("File modified since last index", datetime.now().isoformat(), write_id))
-        conn.commit()
-        conn.close()
-        return False, "Conflict: file modified since last index"
+    with open(target_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    base_checksum = compute_checksum(content)
 
-    # Parse changes
-    changes = json.loads(write['changes']) if write['changes'] else {}
+    cursor.execute(
+        "SELECT checksum FROM file_checksums WHERE path = ?",
+        (str(target_path),)
+    )
+    row = cursor.fetchone()
 
-    # Process based on operation type
-    success = False
-    message = ""
+    if row and row['checksum'] != base_checksum:
+        message = "Conflict: file modified since last index"
+        return [(w['id'], 'conflict', message) for w in writes], None, base_checksum, []
 
-    operation = write['operation']
+    load_task_locations(cursor, writes)
 
-    if operation == 'update_state':
-        # Update org task state
-        success, message = update_org_task_state(
-            target_path,
-            changes.get('heading', ''),
-            changes.get('old_state', ''),
-            changes.get('new_state', '')
-        )
+    results = []
+    lines = content.split('\n')
+    updates = []
+    for op in coalesce_writes(writes):
+        success, message = apply_write_op(lines, op, updates)
+        if success and len(op['write_ids']) > 1:
+            message = f"{message} (coalesced {len(op['write_ids'])} writes)"
+        status = 'completed' if success else 'failed'
+        results.extend((write_id, status, message) for write_id in op['write_ids'])
 
-    elif operation == 'update_property':
-        success, message = update_org_task_property(
-            target_path,
-            changes.get('heading', ''),
-            changes.get('property', ''),
-            changes.get('new_value', '')
-        )
+    updates.extend(appended_task_updates(target_path, lines, updates, space))
 
-    elif operation == 'append':
-        # Append content to file
-        try:
-            with open(target_path, 'a', encoding='utf-8') as f:
-                f.write(changes.get('content', ''))
-            success = True
-            message = "Content appended"
-        except Exception as e:
-            success = False
-            message = str(e)
+    new_content = '\n'.join(lines)
+    if new_content == content:
+        return results, None, base_checksum, []
+    return results, new_content, base_checksum, updates
 
-    else:
-        message = f"Unknown operation: {operation}"
 
-    # Update write status
+def record_file_writes(
+    cursor,
+    target_file: str,
+    results: List[Tuple[int, str, str]],
+    new_checksum: str = None,
+    updates: List[Dict[str, Any]] = None
+):
+    """Record write outcomes, index updates and the file's new checksum.
+
+    Only rows still claimed are updated; the caller owns the transaction.
+    """
     now = datetime.now().isoformat()
-    if success:
-        # Update file checksum
-        new_checksum = get_file_checksum(target_path)
+
+    if updates:
+        apply_index_updates(cursor, str(target_file), updates)
+
+    if new_checksum:
         cursor.execute("""
             INSERT OR REPLACE INTO file_checksums (path, checksum, indexed_at, modified_at)
             VALUES (?, ?, ?, ?)
-        """, (str(target_path), new_checksum, now, now))
+        """, (str(target_file), new_checksum, now, now))
 
-        cursor.execute("""
-            UPDATE pending_writes
-            SET status = 'completed', applied_at = ?
-            WHERE id = ?
-        """, (now, write_id))
-    else:
-        cursor.execute("""
-            UPDATE pending_writes
-            SET status = 'failed', error_message = ?, applied_at = ?
-            WHERE id = ?
-        """, (message, now, write_id))
+    cursor.executemany("""
+        UPDATE pending_writes
+        SET status = ?, error_message = ?, applied_at = ?
+        WHERE id = ? AND status = 'running'
+    """, [
+        (status, None if status == 'completed' else message, now, write_id)
+        for write_id, status, message in results
+    ])
+
+
+def recover_writeback_intents(conn, older_than: float = WRITE_CLAIM_TIMEOUT) -> int:
+    """Replay or roll back file writes interrupted by a crash.
+
+    A write that reached disk has its statuses, index updates and checksum
+    recorded from the intent payload; one that did not is released back
+    to pending and retried. Only intents and claims older than
+    `older_than` seconds are touched, so another runner's writes in
+    flight are left alone.
 
+    Returns number of recovered intents.
+    """
+    def on_recover(cursor, intent):
+        payload = intent['payload'] or {}
+        if intent['applied'] and 'results' in payload:
+            record_file_writes(
+                cursor,
+                intent['path'],
+                [tuple(result) for result in payload['results']],
+                payload.get('checksum'),
+                payload.get('updates')
+            )
+
+    recovered = recover_intents(conn, on_recover=on_recover, older_than=older_than)
+
+    stale = (datetime.now() - timedelta(seconds=older_than)).isoformat()
+    conn.execute("""
+        UPDATE pending_writes SET status = 'pending', claimed_at = NULL
+        WHERE status = 'running' AND claimed_at <= ?
+    """, (stale,))
     conn.commit()
+
+    return len(recovered)
+
+
+def claim_pending_writes(conn, write_ids: List[int] = None) -> List[Dict[str, Any]]:
+    """Atomically mark pending writes 'running' and return them.
+
+    A write is claimed by exactly one runner, so the worker and sync
+    never both apply it.
+
+    Args:
+        conn: Space DB connection with no uncommitted work
+        write_ids: Restrict to these writes (default: all pending)
+
+    Returns:
+        Claimed pending_writes rows as dicts, in queue order
+    """
+    cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
+
+    query = "SELECT * FROM pending_writes WHERE status = 'pending'"
+    params = []
+    if write_ids is not None:
+        query += f" AND id IN ({','.join('?' * len(write_ids))})"
+        params = list(write_ids)
+    query += " ORDER BY created_at, id"
+    rows = [dict(row) for row in cursor.execute(query, params).fetchall()]
+
+    now = datetime.now().isoformat()
+    cursor.executemany(
+        "UPDATE pending_writes SET status = 'running', claimed_at = ? WHERE id = ? AND status = 'pending'",
+        [(now, row['id']) for row in rows]
+    )
+    conn.commit()
+
+    for row in rows:
+        row['status'] = 'running'
+        row['claimed_at'] = now
+    return rows
+
+
+def execute_pending_writes(
+    space: str,
+    write_ids: List[int] = None,
+    claimed: bool = False
+) -> List[Tuple[int, str, str]]:
+    """Apply pending writes for a space, grouped and coalesced per file.
+
+    Writes are claimed first (see claim_pending_writes); ones another
+    runner has already claimed are skipped and not reported.
+    Files are processed in priority order. Each file gets one
+    read-modify-write. The new content is written
+    atomically under an intent log entry; statuses, checksum and intent
+    removal then commit together, so a crash at any point is recovered
+    on the next run. A failure on one file does not hold back the others.
+
+    Args:
+        space: Space database to process
+        write_ids: Restrict to these writes (default: all pending)
+        claimed: The writes were queued with queue_writes(claim=True) and
+            `write_ids` are already claimed by the caller
+
+    Returns:
+        List of (write_id, status, message), in queue order per file
+    """
+    if claimed and write_ids is None:
+        raise ValueError("claimed=True requires write_ids")
+
+    conn = get_connection(space)
+    ensure_writeback_schema(conn, space)
+    cursor = conn.cursor()
+
+    recover_writeback_intents(conn)
+
+    if claimed:
+        cursor.execute(f"""
+            SELECT * FROM pending_writes
+            WHERE status = 'running' AND id IN ({','.join('?' * len(write_ids))})
+            ORDER BY created_at, id
+        """, list(write_ids))
+        rows = [dict(row) for row in cursor.fetchall()]
+    else:
+        rows = claim_pending_writes(conn, write_ids)
+
+    by_file: Dict[str, List[Dict[str, Any]]] = {}
+    for write in rows:
+        write['changes'] = json.loads(write['changes']) if write['changes'] else {}
+        by_file.setdefault(write['target_file'], []).append(write)
+
+    # Files holding the most urgent write go first; writes within a file
+    # stay in queue order so coalescing sees them chronologically
+    ordered_files = sorted(
+        by_file.items(),
+        key=lambda item: min(
+            w['priority'] if w['priority'] is not None else WRITE_PRIORITY_DEFAULT
+            for w in item[1]
+        )
+    )
+
+    results = []
+    try:
+        for target_file, writes in ordered_files:
+            try:
+                file_results, new_content, base_checksum, updates = plan_file_writes(
+                    cursor, target_file, writes, space
+                )
+
+                intent_id = None
+                new_checksum = None
+                if new_content is not None:
+                    new_checksum = compute_checksum(new_content)
+                    intent_id = atomic_write(
+                        target_file,
+                        new_content,
+                        conn=conn,
+                        payload={'results': file_results, 'checksum': new_checksum, 'updates': updates},
+                        base_checksum=base_checksum
+                    )
+
+                cursor.execute("BEGIN IMMEDIATE")
+                record_file_writes(cursor, target_file, file_results, new_checksum, updates)
+                complete_intent(cursor, intent_id)
+                conn.commit()
+
+                results.extend(file_results)
+            except Exception as e:
+                conn.rollback()
+                file_results = [(w['id'], 'failed', str(e)) for w in writes]
+                if claimed:
+                    # The caller owns these writes and retries them itself
+                    record_file_writes(cursor, target_file, file_results)
+                else:
+                    # Unclaim so the next run retries them
+                    conn.executemany(
+                        "UPDATE pending_writes SET status = 'pending', claimed_at = NULL "
+                        "WHERE id = ? AND status = 'running'",
+                        [(w['id'],) for w in writes]
+                    )
+                conn.commit()
+                results.extend(file_results)
+    finally:
+        conn.close()
+
+    return results
+
+
+def process_pending_write(write_id: int, space: str) -> Tuple[bool, str]:
+    """Process a single pending write.
+
+    Returns:
+        Tuple of (success, message)
+    """
+    conn = get_connection(space)
+    cursor = conn.cursor()
+    cursor.execute("SELECT status FROM pending_writes WHERE id = ?", (write_id,))
+    write = cursor.fetchone()
     conn.close()
 
-    return success, message
+    if not write:
+        return False, f"Write {write_id} not found"
+
+    if write['status'] != 'pending':
+        return False, f"Write {write_id} not pending (status: {write['status']})"
+
+    for _, status, message in execute_pending_writes(space, [write_id]):
+        return status == 'completed', message
+
+    return False, f"Write {write_id} not found"
 
 
 def process_all_pending(space: str = None) -> Dict[str, int]:
     """Process all pending writes.
 
+    Writes are grouped by target file and coalesced, so each file is read
+    once and atomically rewritten at most once per run.
+
     Returns dict with counts.
     """
     stats = {
@@ -375,25 +1068,13 @@ def process_all_pending(space: str = None) -> Dict[str, int]:
     spaces_to_process = [space] if space else list(SPACES.keys())
 
     for sp in spaces_to_process:
-        conn = get_connection(sp)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT id FROM pending_writes WHERE status = 'pending'
-            ORDER BY created_at
-        """)
-
-        pending_ids = [row['id'] for row in cursor.fetchall()]
-        conn.close()
-
-        for write_id in pending_ids:
-            success, message = process_pending_write(write_id, sp)
+        for write_id, status, message in execute_pending_writes(sp):
             stats['processed'] += 1
 
-            if success:
+            if status == 'completed':
                 stats['succeeded'] += 1
                 print(f"  [OK] Write {write_id}: {message}")
-            elif 'conflict' in message.lower():
+            elif status == 'conflict':
                 stats['conflicts'] += 1
                 print(f"  [CONFLICT] Write {write_id}: {message}")
             else:
@@ -403,20 +1084,209 @@ def process_all_pending(space: str = None) -> Dict[str, int]:
     return stats
 
 
-def get_pending_status(space: str = None) -> Dict[str, Any]:
-    """Get status of pending writes."""
+def notify_worker():
+    """Wake the background worker (no-op if none is listening)."""
+    if not hasattr(socket, 'AF_UNIX'):
+        return
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.setblocking(False)
+            sock.sendto(b'wake', str(WORKER_SOCKET))
+    except OSError:
+        pass  # No worker running, or its buffer is full (already awake)
+
+
+def select_ready_writes(
+    space: str,
+    debounce: float = WORKER_DEBOUNCE,
+    max_delay: float = WORKER_MAX_DELAY
+) -> Tuple[List[int], int]:
+    """Pick pending writes whose file has been quiet for `debounce` seconds.
+
+    A file that keeps receiving writes is still flushed once its oldest
+    pending write is `max_delay` old. Past BACKPRESSURE_DEPTH pending
+    writes, debounce is skipped so the queue drains.
+
+    Returns:
+        Tuple of (ready write IDs, number of writes left waiting)
+    """
+    now = datetime.now()
+    quiet_since = (now - timedelta(seconds=debounce)).isoformat()
+    overdue_since = (now - timedelta(seconds=max_delay)).isoformat()
+
+    conn = get_connection(space)
+    ensure_writeback_schema(conn, space)
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        SELECT target_file, COUNT(*) as count,
+               MIN(created_at) as oldest, MAX(created_at) as newest,
+               GROUP_CONCAT(id) as ids
+        FROM pending_writes
+        WHERE status = 'pending'
+        GROUP BY target_file
+    """)
+    files = cursor.fetchall()
+    conn.close()
+
+    depth = sum(row['count'] for row in files)
+    draining = depth >= BACKPRESSURE_DEPTH
+
+    ready = []
+    waiting = 0
+    for row in files:
+        if draining or row['newest'] <= quiet_since or row['oldest'] <= overdue_since:
+            ready.extend(int(write_id) for write_id in row['ids'].split(','))
+        else:
+            waiting += row['count']
+
+    return ready, waiting
+
+
+def _bind_worker_socket() -> Optional[socket.socket]:
+    """Bind the wakeup socket; None if unsupported or another worker owns it."""
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+
+    WORKER_SOCKET.parent.mkdir(parents=True, exist_ok=True)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        sock.bind(str(WORKER_SOCKET))
+    except OSError:
+        # Stale socket from a dead worker refuses datagrams; a live one accepts
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as probe:
+                probe.sendto(b'ping', str(WORKER_SOCKET))
+            sock.close()
+            raise RuntimeError(f"Another writeback worker is running ({WORKER_SOCKET})")
+        except (ConnectionRefusedError, FileNotFoundError):
+            WORKER_SOCKET.unlink(missing_ok=True)
+            sock.bind(str(WORKER_SOCKET))
+
+    sock.setblocking(False)
+    return sock
+
+
+def run_worker(
+    space: str = None,
+    poll_interval: float = WORKER_POLL_INTERVAL,
+    debounce: float = WORKER_DEBOUNCE,
+    max_delay: float = WORKER_MAX_DELAY,
+    stop_event: threading.Event = None
+) -> Dict[str, int]:
+    """Apply pending writes continuously until stopped.
+
+    Sleeps until woken by queue_write() (Unix socket) or `poll_interval`
+    elapses, then applies every write whose file has settled (see
+    select_ready_writes) in priority order. Stops on SIGINT/SIGTERM or
+    when `stop_event` is set.
+
+    Returns dict with counts over the worker's lifetime.
+    """
+    stop = stop_event or threading.Event()
+    totals = {'cycles': 0, 'processed': 0, 'succeeded': 0, 'failed': 0, 'conflicts': 0}
+
+    sock = _bind_worker_socket()
+
+    def request_stop(signum, frame):
+        stop.set()
+        notify_worker()
+
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+    spaces = [space] if space else list(SPACES.keys())
+
+    try:
+        while not stop.is_set():
+            timeout = poll_interval
+
+            for sp in spaces:
+                if not get_db_path(sp).exists():
+                    continue
+
+                ready, waiting = select_ready_writes(sp, debounce, max_delay)
+                if waiting:
+                    timeout = min(timeout, debounce)
+                if not ready:
+                    continue
+
+                started = time.monotonic()
+                results = execute_pending_writes(sp, ready)
+                counts = {'completed': 0, 'failed': 0, 'conflict': 0}
+                for _, status, _ in results:
+                    counts[status] = counts.get(status, 0) + 1
+
+                totals['processed'] += len(results)
+                totals['succeeded'] += counts['completed']
+                totals['failed'] += counts['failed']
+                totals['conflicts'] += counts['conflict']
+                print(f"  [{sp}] applied {counts['completed']}/{len(results)} writes "
+                      f"({counts['failed']} failed, {counts['conflict']} conflicts) "
+                      f"in {(time.monotonic() - started) * 1000:.0f}ms")
+
+            totals['cycles'] += 1
+            if stop.is_set():
+                break
+
+            if sock is not None:
+                readable, _, _ = select.select([sock], [], [], timeout)
+                if readable:
+                    # Drain queued wakeups; one cycle handles them all
+                    while True:
+                        try:
+                            sock.recv(64)
+                        except BlockingIOError:
+                            break
+            else:
+                stop.wait(timeout)
+    finally:
+        if sock is not None:
+            sock.close()
+            WORKER_SOCKET.unlink(missing_ok=True)
+
+    return totals
+
+
+def _percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(pct * len(sorted_values) / 100), 1) - 1
+    return round(sorted_values[min(rank, len(sorted_values) - 1)], 1)
+
+
+def get_pending_status(space: str = None, window_hours: int = 24) -> Dict[str, Any]:
+    """Get status of pending writes.
+
+    Includes queue metrics for the worker: depth by priority, age of the
+    oldest pending write, and apply latency percentiles and failure count
+    over the last `window_hours`.
+    """
     status = {
         'pending': 0,
         'completed': 0,
         'failed': 0,
         'conflicts': 0,
+        'running': 0,
         'recent_failed': [],
+        'queue_depth': 0,
+        'by_priority': {},
+        'oldest_pending_seconds': None,
+        'latency_ms': {'p50': None, 'p95': None, 'p99': None, 'samples': 0},
+        'window_failures': 0,
     }
 
+    now = datetime.now()
+    window_start = (now - timedelta(hours=window_hours)).isoformat()
+    latencies = []
+
     spaces_to_check = [space] if space else list(SPACES.keys())
 
     for sp in spaces_to_check:
         conn = get_connection(sp)
+        ensure_writeback_schema(conn, sp)
         cursor = conn.cursor()
 
         # Count by status
@@ -435,6 +1305,41 @@ def get_pending_status(space: str = None) -> Dict[str, Any]:
                 status['failed'] += row['count']
             elif row['status'] == 'conflict':
                 status['conflicts'] += row['count']
+            elif row['status'] == 'running':
+                status['running'] += row['count']
+
+        # Queue depth by priority and oldest pending write
+        cursor.execute("""
+            SELECT priority, COUNT(*) as count, MIN(created_at) as oldest
+            FROM pending_writes
+            WHERE status = 'pending'
+            GROUP BY priority
+        """)
+
+        for row in cursor.fetchall():
+            priority = row['priority'] if row['priority'] is not None else WRITE_PRIORITY_DEFAULT
+            status['by_priority'][priority] = status['by_priority'].get(priority, 0) + row['count']
+            status['queue_depth'] += row['count']
+            try:
+                age = (now - datetime.fromisoformat(row['oldest'])).total_seconds()
+            except (TypeError, ValueError):
+                continue
+            if status['oldest_pending_seconds'] is None or age > status['oldest_pending_seconds']:
+                status['oldest_pending_seconds'] = round(age, 1)
+
+        # Apply latency and failures in window
+        cursor.execute("""
+            SELECT (julianday(applied_at) - julianday(created_at)) * 86400000.0 as latency_ms
+            FROM pending_writes
+            WHERE status = 'completed' AND applied_at >= ?
+        """, (window_start,))
+        latencies.extend(row['latency_ms'] for row in cursor.fetchall() if row['latency_ms'] is not None)
+
+        cursor.execute("""
+            SELECT COUNT(*) FROM pending_writes
+            WHERE status IN ('failed', 'conflict') AND applied_at >= ?
+        """, (window_start,))
+        status['window_failures'] += cursor.fetchone()[0]
 
         # Get recent failures
         cursor.execute("""
@@ -456,6 +1361,14 @@ def get_pending_status(space: str = None) -> Dict[str, Any]:
 
         conn.close()
 
+    latencies.sort()
+    status['latency_ms'] = {
+        'p50': _percentile(latencies, 50),
+        'p95': _percentile(latencies, 95),
+        'p99': _percentile(latencies, 99),
+        'samples': len(latencies),
+    }
+
     return status
 
 
@@ -521,10 +1434,22 @@ def print_status(status: Dict[str, Any]):
     print("WRITE-BACK STATUS")
     print("=" * 50)
     print(f"Pending:    {status['pending']}")
+    print(f"Running:    {status['running']}")
     print(f"Completed:  {status['completed']}")
     print(f"Failed:     {status['failed']}")
     print(f"Conflicts:  {status['conflicts']}")
 
+    print("\nQueue:")
+    by_priority = ', '.join(f"p{p}={n}" for p, n in sorted(status['by_priority'].items()))
+    print(f"  Depth:          {status['queue_depth']}" + (f" ({by_priority})" if by_priority else ""))
+    if status['oldest_pending_seconds'] is not None:
+        print(f"  Oldest pending: {status['oldest_pending_seconds']:.0f}s")
+    latency = status['latency_ms']
+    if latency['samples']:
+        print(f"  Latency (ms):   p50={latency['p50']} p95={latency['p95']} "
+              f"p99={latency['p99']} (n={latency['samples']})")
+    print(f"  Failures (24h): {status['window_failures']}")
+
     if status['recent_failed']:
         print("\nRecent Failures:")
         for fail in status['recent_failed']:
@@ -540,6 +1465,11 @@ if __name__ == "__main__":
     parser.add_argument('--status', action='store_true', help='Show pending writes status')
     parser.add_argument('--clear-failed', action='store_true', help='Clear failed writes')
     parser.add_argument('--queue', type=int, metavar='TASK_ID', help='Queue task completion')
+    parser.add_argument('--worker', action='store_true', help='Run background writeback worker')
+    parser.add_argument('--poll', type=float, default=WORKER_POLL_INTERVAL,
+                        help='Worker poll interval in seconds')
+    parser.add_argument('--debounce', type=float, default=WORKER_DEBOUNCE,
+                        help='Seconds a file must be quiet before its writes are applied')
     parser.add_argument('--space', '-s', choices=list(SPACES.keys()), help='Space to operate on')
 
     args = parser.parse_args()
@@ -549,6 +1479,16 @@ if __name__ == "__main__":
         stats = process_all_pending(args.space)
         print(f"\nResults: {stats['succeeded']} succeeded, {stats['failed']} failed, {stats['conflicts']} conflicts")
 
+    elif args.worker:
+        print(f"Writeback worker listening on {WORKER_SOCKET} (Ctrl-C to stop)")
+        try:
+            totals = run_worker(args.space, poll_interval=args.poll, debounce=args.debounce)
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"\nWorker stopped: {totals['succeeded']} succeeded, {totals['failed']} failed, "
+              f"{totals['conflicts']} conflicts")
+
     elif args.status:
         status = get_pending_status(args.space)
         print_status(status)
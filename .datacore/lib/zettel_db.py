@@ -20,8 +20,8 @@ Usage:
     python zettel_db.py sync [--space SPACE] [--full]
     python zettel_db.py stats [--space SPACE] [--json]
     python zettel_db.py search <query> [--space SPACE] [--type TYPE]
-    python zettel_db.py unresolved [--space SPACE]
-    python zettel_db.py orphans [--space SPACE]
+    python zettel_db.py unresolved [--space SPACE] [--limit N] [--after TITLE]
+    python zettel_db.py orphans [--space SPACE] [--limit N] [--after ID]
     python zettel_db.py validate [--fix]
 """
 
@@ -29,6 +29,7 @@ import sqlite3
 import os
 import json
 import hashlib
+from collections import namedtuple
 from pathlib import Path
 from datetime import datetime, date
 
@@ -36,6 +37,9 @@ from datetime import datetime, date
 DATA_ROOT = Path.home() / "Data"
 ROOT_DB_PATH = DATA_ROOT / ".datacore" / "knowledge.db"
 
+# Rows fetched per keyset page by iter_rows()
+STREAM_PAGE_SIZE = 500
+
 # Space configurations - ALL content locations
 SPACES = {
     'personal': {
@@ -227,6 +231,77 @@ def get_connection(space=None):
     return conn
 
 
+_ROW_TYPES = {}
+
+
+def _row_type(cursor):
+    """Namedtuple class for the columns of a cursor's result."""
+    columns = tuple(d[0] for d in cursor.description)
+    if columns not in _ROW_TYPES:
+        _ROW_TYPES[columns] = namedtuple('Row', columns, rename=True)
+    return _ROW_TYPES[columns]
+
+
+def iter_rows(space, sql, params=(), key='id', after=None, limit=None, page_size=STREAM_PAGE_SIZE):
+    """Stream query rows as namedtuples, one keyset page at a time.
+
+    `sql` is a SELECT whose first column is the unique `key` expression and
+    whose WHERE clause contains a {keyset} placeholder after all of its own
+    ? placeholders; this function adds "AND key > ?" there and appends
+    ORDER BY key and LIMIT. Each page is a
+    separate statement, so no read transaction is held between pages and
+    memory stays bounded by page_size.
+
+    Args:
+        space: Space database (None for root)
+        sql: Query template
+        params: Parameters for the query's own placeholders
+        key: Column expression to paginate on (e.g. 'f.id')
+        after: Resume after this key (the first column of the last row seen)
+        limit: Stop after this many rows (None = all)
+        page_size: Rows fetched per statement
+    """
+    conn = get_connection(space)
+    try:
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            keyset = f"AND {key} > ?" if after is not None else ""
+            page_params = tuple(params) + ((after,) if after is not None else ()) + (size,)
+            cursor = conn.execute(
+                sql.format(keyset=keyset) + f" ORDER BY {key} LIMIT ?", page_params
+            )
+            row_type = _row_type(cursor)
+            rows = cursor.fetchall()
+            for row in rows:
+                yield row_type(*row)
+            if len(rows) < size:
+                return
+            after = rows[-1][0]
+            if remaining is not None:
+                remaining -= len(rows)
+    finally:
+        conn.close()
+
+
+def migrate_pending_writes(cursor):
+    """Add writeback queue columns to pending_writes (idempotent)."""
+    # Writeback priority (lower runs first; see writeback_engine.write_priority)
+    try:
+        cursor.execute("ALTER TABLE pending_writes ADD COLUMN priority INTEGER DEFAULT 2")
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+    # When a runner claimed the write (status 'running'; see
+    # writeback_engine.claim_pending_writes)
+    try:
+        cursor.execute("ALTER TABLE pending_writes ADD COLUMN claimed_at TEXT")
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_pending_queue ON pending_writes(status, priority, created_at)"
+    )
+
+
 def init_database(space=None):
     """Initialize the database schema."""
     conn = get_connection(space)
@@ -440,6 +515,26 @@ def init_database(space=None):
         )
     """)
 
+    # Habit indexing columns (migration for existing DBs)
+    # completion_bitmap: bit i set = completed on bitmap_start + i days
+    for column_def in [
+        "line_number INTEGER",
+        "repeater TEXT",
+        "interval_days INTEGER DEFAULT 1",
+        "last_repeat TEXT",
+        "longest_streak INTEGER DEFAULT 0",
+        "bitmap_start TEXT",
+        "completion_bitmap BLOB",
+        "updated_at TEXT",
+    ]:
+        try:
+            cursor.execute(f"ALTER TABLE habits ADD COLUMN {column_def}")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_habits_source ON habits(source_file)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_habits_space ON habits(space)")
+
     # =========================================================================
     # JOURNAL TABLES (DIP-0004 Phase 2)
     # =========================================================================
@@ -539,6 +634,50 @@ def init_database(space=None):
     """)
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_trading_date ON trading_entries(date)")
 
+    # Journal provenance: every derived row records its source journal file
+    # so reindexing a journal can replace exactly its rows (migration for existing DBs)
+    for table in ['sessions', 'accomplishments', 'files_modified', 'decisions', 'trading_entries']:
+        try:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN source_file TEXT")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_source ON {table}(source_file)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_journal_source ON journal_entries(source_file)")
+
+    # Journal rollups (day/week/month buckets, refreshed on journal reindex)
+    # Averages are stored as sum + count so buckets can be combined
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS journal_rollups (
+            period TEXT NOT NULL,
+            period_start TEXT NOT NULL,
+            journal_count INTEGER DEFAULT 0,
+            session_count INTEGER DEFAULT 0,
+            total_words INTEGER DEFAULT 0,
+            accomplishment_count INTEGER DEFAULT 0,
+            trading_count INTEGER DEFAULT 0,
+            pnl_total REAL DEFAULT 0,
+            imr_sum REAL DEFAULT 0,
+            imr_count INTEGER DEFAULT 0,
+            phs_sum REAL DEFAULT 0,
+            phs_count INTEGER DEFAULT 0,
+            emotional_sum REAL DEFAULT 0,
+            emotional_count INTEGER DEFAULT 0,
+            violation_count INTEGER DEFAULT 0,
+            updated_at TEXT,
+            PRIMARY KEY (period, period_start)
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS journal_rollup_session_types (
+            period TEXT NOT NULL,
+            period_start TEXT NOT NULL,
+            session_type TEXT NOT NULL,
+            session_count INTEGER DEFAULT 0,
+            PRIMARY KEY (period, period_start, session_type)
+        )
+    """)
+
     # =========================================================================
     # SYSTEM TABLES (DIP-0004 Phase 3)
     # =========================================================================
@@ -678,6 +817,7 @@ def init_database(space=None):
         )
     """)
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_pending_status ON pending_writes(status)")
+    migrate_pending_writes(cursor)
 
     # File change detection
     cursor.execute("""
@@ -938,32 +1078,44 @@ def get_unresolved_links(space=None, min_refs=1):
     return results
 
 
-def get_orphans(space=None, file_type=None):
-    """Find files with no incoming links."""
-    conn = get_connection(space)
-    cursor = conn.cursor()
+def iter_unresolved_links(space=None, min_refs=1, after=None, limit=None):
+    """Stream unresolved link targets with reference counts, by target title.
 
-    if file_type:
-        cursor.execute("""
-            SELECT f.id, f.title, f.path, f.space, f.type, f.maturity
-            FROM files f
-            LEFT JOIN links l ON f.id = l.target_id
-            WHERE l.target_id IS NULL
-              AND f.is_stub = 0
-              AND f.type = ?
-        """, (file_type,))
-    else:
-        cursor.execute("""
-            SELECT f.id, f.title, f.path, f.space, f.type, f.maturity
-            FROM files f
-            LEFT JOIN links l ON f.id = l.target_id
-            WHERE l.target_id IS NULL
-              AND f.is_stub = 0
-        """)
+    Yields (target_title, reference_count, from_spaces) namedtuples;
+    pass the last target_title as `after` to resume.
+    """
+    # min_refs is inlined: the keyset parameter must be the last placeholder
+    return iter_rows(space, f"""
+        SELECT l.target_title, COUNT(*) as reference_count,
+               GROUP_CONCAT(DISTINCT f.space) as from_spaces
+        FROM links l
+        JOIN files f ON l.source_id = f.id
+        WHERE l.resolved = 0 {{keyset}}
+        GROUP BY l.target_title
+        HAVING COUNT(*) >= {int(min_refs)}
+    """, key='l.target_title', after=after, limit=limit)
 
-    results = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    return results
+
+def iter_orphans(space=None, file_type=None, after=None, limit=None):
+    """Stream files with no incoming links, by file id.
+
+    Yields (id, title, path, space, type, maturity) namedtuples; pass
+    the last id as `after` to resume.
+    """
+    type_filter = "AND f.type = ?" if file_type else ""
+    return iter_rows(space, f"""
+        SELECT f.id, f.title, f.path, f.space, f.type, f.maturity
+        FROM files f
+        LEFT JOIN links l ON f.id = l.target_id
+        WHERE l.target_id IS NULL
+          AND f.is_stub = 0
+          {type_filter} {{keyset}}
+    """, (file_type,) if file_type else (), key='f.id', after=after, limit=limit)
+
+
+def get_orphans(space=None, file_type=None):
+    """Find files with no incoming links."""
+    return [row._asdict() for row in iter_orphans(space, file_type)]
 
 
 def sync_to_root(space):
@@ -1031,12 +1183,21 @@ def sync_all_to_root():
 
 if __name__ == "__main__":
     import argparse
+    import shlex
+
+    def positive_int(value):
+        number = int(value)
+        if number < 1:
+            raise argparse.ArgumentTypeError("must be at least 1")
+        return number
 
     parser = argparse.ArgumentParser(description="Knowledge Database Manager")
     parser.add_argument('command', choices=['init', 'init-all', 'stats', 'search', 'unresolved', 'orphans', 'sync', 'sync-all'])
     parser.add_argument('query', nargs='?', help='Search query (for search command)')
     parser.add_argument('--space', '-s', choices=list(SPACES.keys()), help='Space to operate on (omit for root)')
     parser.add_argument('--type', '-t', help='Filter by file type (zettel, page, journal, etc.)')
+    parser.add_argument('--limit', '-n', type=positive_int, help='Rows per page (unresolved, orphans)')
+    parser.add_argument('--after', help='Resume after this key (printed as "Next page")')
 
     args = parser.parse_args()
 
@@ -1094,16 +1255,31 @@ if __name__ == "__main__":
             print()
 
     elif args.command == "unresolved":
-        results = get_unresolved_links(args.space)
-        print("\n=== Unresolved Links ===")
-        for r in results[:50]:
-            print(f"  [{r['reference_count']}x] {r['target_title']} (from: {r['from_spaces']})")
+        if args.after is None and args.limit is None:
+            results = get_unresolved_links(args.space)
+            print("\n=== Unresolved Links ===")
+            for r in results[:50]:
+                print(f"  [{r['reference_count']}x] {r['target_title']} (from: {r['from_spaces']})")
+        else:
+            # Page through all targets by title; one extra row tells if there's more
+            limit = args.limit if args.limit is not None else 50
+            print("\n=== Unresolved Links (by title) ===")
+            for i, r in enumerate(iter_unresolved_links(args.space, after=args.after, limit=limit + 1)):
+                if i == limit:
+                    print(f"\nNext page: --after {shlex.quote(last)}")
+                    break
+                print(f"  [{r.reference_count}x] {r.target_title} (from: {r.from_spaces})")
+                last = r.target_title
 
     elif args.command == "orphans":
-        results = get_orphans(args.space, args.type)
-        print(f"\n=== Orphan Files ({len(results)}) ===")
-        for r in results[:30]:
-            print(f"  [{r['space']}/{r['type']}] {r['title']}")
+        limit = args.limit if args.limit is not None else 30
+        print("\n=== Orphan Files ===")
+        for i, r in enumerate(iter_orphans(args.space, args.type, after=args.after, limit=limit + 1)):
+            if i == limit:
+                print(f"\nNext page: --after {shlex.quote(last)}")
+                break
+            print(f"  [{r.space}/{r.type}] {r.title}")
+            last = r.id
 
     elif args.command == "sync":
         if not args.space:
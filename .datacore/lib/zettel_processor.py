@@ -33,6 +33,7 @@ from zettel_db import (
     get_connection, init_database, get_db_path, detect_file_type,
     detect_author, SPACES, DATA_ROOT, sync_to_root
 )
+from atomic_write import atomic_write
 
 
 def parse_frontmatter(content):
@@ -458,8 +459,7 @@ Based on references, this zettel should cover:
 *Auto-generated stub. Expand with actual content.*
 """
 
-    with open(stub_path, 'w', encoding='utf-8') as f:
-        f.write(stub_content)
+    atomic_write(stub_path, stub_content)
 
     print(f"  Created stub: {stub_path.name}")
     return stub_path
@@ -558,8 +558,7 @@ def inject_backlinks(file_path, space=None):
     else:
         new_content = body
 
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    atomic_write(path, new_content)
 
     return True
 